@@ -145,10 +145,116 @@ def make_version_dynamic(init_file: Path) -> None:
     print(f"✓ Rewrote __version__ in {init_file} to import from kinde_sdk._version")
 
 
+# ---------------------------------------------------------------------------
+# Post-generation lazy imports
+# ---------------------------------------------------------------------------
+
+_CLASS_IMPORT_LINE = re.compile(
+    r"^from (?P<module>[\w.]+) import (?P<name>\w+)(?: as (?P=name))?\s*$",
+    re.MULTILINE,
+)
+
+# "# import models into model package" style comments above the imports
+_IMPORT_GROUP_COMMENT = re.compile(r"^# import (?:apis|models) into \w+ package\n", re.MULTILINE)
+
+_LAZY_MARKER = "_LAZY_IMPORTS = {"
+
+
+def make_imports_lazy(init_file: Path, *module_prefixes: str) -> None:
+    """Turn the generated eager class imports in an ``__init__.py`` into lazy ones.
+
+    The generated ``__init__.py`` files import every API class and every
+    model up front, which makes ``import kinde_sdk.management`` load a few
+    hundred modules. Each ``from <prefix>... import Name`` line is
+    replaced by an entry in a ``_LAZY_IMPORTS`` table, and a module-level
+    ``__getattr__`` (PEP 562) imports the class on first access. The
+    original imports are kept under ``if TYPE_CHECKING:`` so type checkers
+    and IDEs still see every name.
+
+    Idempotent: a no-op if the file already has a ``_LAZY_IMPORTS`` table.
+
+    Args:
+        init_file: Path to the generated ``__init__.py``.
+        *module_prefixes: Only imports from modules starting with one of
+            these prefixes (e.g. ``"kinde_sdk.management.models."``) are
+            made lazy.
+    """
+    if not init_file.exists():
+        print(f"⚠️  Cannot make imports lazy: {init_file} does not exist")
+        return
+
+    text = init_file.read_text(encoding="utf-8")
+
+    if _LAZY_MARKER in text:
+        print(f"✓ {init_file} already uses lazy imports")
+        return
+
+    matches = [
+        m for m in _CLASS_IMPORT_LINE.finditer(text)
+        if m.group("module").startswith(module_prefixes)
+    ]
+    if not matches:
+        print(f"⚠️  No imports from {', '.join(module_prefixes)} found in {init_file}")
+        return
+
+    entries = "\n".join(
+        f'    "{m.group("name")}": "{m.group("module")}",' for m in matches
+    )
+    type_checking_imports = "\n".join(
+        f'    from {m.group("module")} import {m.group("name")} as {m.group("name")}'
+        for m in matches
+    )
+    # Without an explicit __all__, "import *" would only see the names already loaded
+    define_all = "" if re.search(r"^__all__\s*=", text, re.MULTILINE) else (
+        "\n"
+        "# Names exported by \"from ... import *\", including the lazily imported ones\n"
+        "__all__ = sorted(\n"
+        "    {name for name in globals() if not name.startswith(\"_\") and name != \"TYPE_CHECKING\"}\n"
+        "    | set(_LAZY_IMPORTS)\n"
+        ")\n"
+    )
+    lazy_block = (
+        "import importlib as _importlib\n"
+        "from typing import TYPE_CHECKING\n"
+        "\n"
+        "# Imported on first access by __getattr__ below, to keep the package import fast\n"
+        f"{_LAZY_MARKER}\n{entries}\n}}\n"
+        "\n"
+        "if TYPE_CHECKING:\n"
+        f"{type_checking_imports}\n"
+        "\n"
+        "\n"
+        "def __getattr__(name):\n"
+        "    module = _LAZY_IMPORTS.get(name)\n"
+        "    if module is None:\n"
+        '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")\n'
+        "    value = getattr(_importlib.import_module(module), name)\n"
+        "    globals()[name] = value\n"
+        "    return value\n"
+        "\n"
+        "\n"
+        "def __dir__():\n"
+        "    return sorted(set(globals()) | set(_LAZY_IMPORTS))\n"
+        "\n"
+    )
+
+    # Drop the eager imports and put the lazy block where the first one was
+    first = matches[0].start()
+    for m in reversed(matches):
+        end = m.end() + 1 if text[m.end():m.end() + 1] == "\n" else m.end()
+        text = text[:m.start()] + text[end:]
+    text = text[:first] + lazy_block + text[first:]
+    text = _IMPORT_GROUP_COMMENT.sub("", text).rstrip("\n") + "\n" + define_all
+
+    init_file.write_text(text, encoding="utf-8")
+    print(f"✓ Made {len(matches)} imports lazy in {init_file}")
+
+
 __all__ = [
     "DYNAMIC_VERSION_IMPORT",
     "PACKAGE_VERSION_PLACEHOLDER",
     "SDK_VERSION",
+    "make_imports_lazy",
     "make_version_dynamic",
     "read_sdk_version",
 ]
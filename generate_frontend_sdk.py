@@ -9,6 +9,7 @@ from pathlib import Path
 from _sdk_generator_utils import (
     PACKAGE_VERSION_PLACEHOLDER,
     SDK_VERSION,
+    make_imports_lazy,
     make_version_dynamic as _make_version_dynamic,
 )
 
@@ -287,6 +288,13 @@ with tempfile.TemporaryDirectory() as temp_dir:
         # kinde_sdk._version, so the sub-package never drifts from the SDK.
         make_version_dynamic(os.path.join(OUTPUT_DIR, "__init__.py"))
 
+        # Import API classes and models on first access rather than at
+        # package import time (see make_imports_lazy).
+        package_name = "kinde_sdk.frontend"
+        make_imports_lazy(Path(OUTPUT_DIR) / "__init__.py", f"{package_name}.api.", f"{package_name}.models.")
+        make_imports_lazy(Path(OUTPUT_DIR) / "api" / "__init__.py", f"{package_name}.api.")
+        make_imports_lazy(Path(OUTPUT_DIR) / "models" / "__init__.py", f"{package_name}.models.")
+
         # Preserve custom imports
         preserve_custom_imports()
         
@@ -28,6 +28,7 @@ from _sdk_generator_utils import (
     DYNAMIC_VERSION_IMPORT,
     PACKAGE_VERSION_PLACEHOLDER,
     SDK_VERSION,
+    make_imports_lazy,
     make_version_dynamic,
 )
 
@@ -69,10 +70,13 @@ SDK_CONFIG = {
         "",
         "# Custom imports for Kinde Management Client",
         "from .management_client import ManagementClient",
+        "from .async_management_client import AsyncManagementClient",
         "from .management_token_manager import ManagementTokenManager",
+        "from .bulk import BulkExecutor, BulkItemResult, BulkResult",
         "",
         "# Extend __all__ with custom exports (preserves generator-populated entries)",
-        "__all__.extend(['ManagementClient', 'ManagementTokenManager'])",
+        "__all__.extend(['ManagementClient', 'AsyncManagementClient', 'ManagementTokenManager',",
+        "                'BulkExecutor', 'BulkItemResult', 'BulkResult'])",
         ""
     ],
     "test_path": "testv2/testv2_management/test_management_client.py"
@@ -797,6 +801,14 @@ def generate_single_sdk(skip_tests: bool, no_diff: bool) -> bool:
     # from kinde_sdk._version, so this sub-package never drifts from the SDK.
     make_version_dynamic(Path(config["output_dir"]) / "__init__.py")
 
+    # Step 2c: Import API classes and models on first access rather than at
+    # package import time (hundreds of modules; see make_imports_lazy).
+    output_dir = Path(config["output_dir"])
+    package_name = config["package_name"]
+    make_imports_lazy(output_dir / "__init__.py", f"{package_name}.api.", f"{package_name}.models.")
+    make_imports_lazy(output_dir / "api" / "__init__.py", f"{package_name}.api.")
+    make_imports_lazy(output_dir / "models" / "__init__.py", f"{package_name}.models.")
+
     # Step 3: Add custom imports
     add_custom_imports(config)
     
@@ -3,6 +3,7 @@ from fastapi import FastAPI, Request
 from fastapi.responses import RedirectResponse, HTMLResponse
 from kinde_sdk.core.framework.framework_interface import FrameworkInterface
 from kinde_sdk.auth.oauth import OAuth
+from kinde_sdk.core.async_http import close_async_client
 from ..middleware.framework_middleware import FrameworkMiddleware
 import os
 import uuid
@@ -62,6 +63,9 @@ class FastAPIFramework(FrameworkInterface):
             
             # Register Kinde routes
             self._register_kinde_routes()
+
+            # Release pooled OAuth connections when the app shuts down
+            self.app.add_event_handler("shutdown", close_async_client)
             
             self._initialized = True
     
@@ -119,10 +123,10 @@ class FastAPIFramework(FrameworkInterface):
         """
         # Helper function to get current user
         async def get_current_user():
-            if not self._oauth.is_authenticated():
+            if not await self._oauth.is_authenticated_async():
                 return None
             try:
-                return self._oauth.get_user_info()
+                return await self._oauth.get_user_info_async()
             except ValueError:
                 return None
         
@@ -234,9 +238,9 @@ class FastAPIFramework(FrameworkInterface):
         @self.app.get("/user")
         async def get_user():
             """Get the current user's information."""
-            if not self._oauth.is_authenticated():
+            if not await self._oauth.is_authenticated_async():
                 return RedirectResponse(url=await self._oauth.login())
-            return self._oauth.get_user_info()
+            return await self._oauth.get_user_info_async()
     
     def can_auto_detect(self) -> bool:
         """
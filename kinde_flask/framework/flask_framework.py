@@ -3,6 +3,7 @@ from flask import Flask, request, redirect, session
 from flask_session import Session
 from kinde_sdk.core.framework.framework_interface import FrameworkInterface
 from kinde_sdk.auth.oauth import OAuth
+from kinde_sdk.core.async_http import closing_async_client
 from ..middleware.framework_middleware import FrameworkMiddleware
 import os
 import uuid
@@ -151,7 +152,8 @@ class FlaskFramework(FrameworkInterface):
         Run an async coroutine in a new event loop, then close it.
         
         This helper ensures consistent event loop handling across all routes.
-        Clears the event loop reference before closing to prevent use-after-close issues.
+        Clears the event loop reference before closing to prevent use-after-close issues,
+        and closes the loop's async HTTP client so its connections are not leaked.
         
         Args:
             coro: The coroutine to run
@@ -161,7 +163,7 @@ class FlaskFramework(FrameworkInterface):
         """
         loop = asyncio.new_event_loop()
         try:
-            return loop.run_until_complete(coro)
+            return loop.run_until_complete(closing_async_client(coro))
         finally:
             asyncio.set_event_loop(None)
             loop.close()
@@ -1,5 +1,7 @@
 from .oauth import OAuth
 from .token_manager import TokenManager
+from .token_verifier import TokenVerifier, JwksKeyCache
+from .refresh_lease import RefreshLease, FileRefreshLease
 from .user_session import UserSession
 from .api_options import ApiOptions
 from .permissions import permissions
@@ -9,5 +11,7 @@ from .feature_flags import feature_flags
 from .portals import portals
 from .tokens import tokens
 from .roles import roles
+from .authorization import authorization, AuthorizationSnapshot
+from .policy import AllOf, AnyOf, Flag, Permission, Policy, Role, evaluate_policy
 
-__all__ = ["OAuth", "TokenManager", "UserSession", "permissions", "ApiOptions", "claims", "async_claims", "feature_flags", "portals", "tokens", "roles"]
+__all__ = ["OAuth", "TokenManager", "TokenVerifier", "JwksKeyCache", "RefreshLease", "FileRefreshLease", "UserSession", "permissions", "ApiOptions", "claims", "async_claims", "feature_flags", "portals", "tokens", "roles", "authorization", "AuthorizationSnapshot", "Policy", "AllOf", "AnyOf", "Permission", "Role", "Flag", "evaluate_policy"]
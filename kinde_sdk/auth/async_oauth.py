@@ -24,6 +24,10 @@ class AsyncOAuth(BaseOAuth):
         """Check if the user is authenticated (sync method)."""
         return self._sync_oauth.is_authenticated()
     
+    async def is_authenticated_async(self) -> bool:
+        """Check if the user is authenticated, refreshing tokens without blocking."""
+        return await self._sync_oauth.is_authenticated_async()
+    
     async def get_user_info_async(self) -> Dict[str, Any]:
         """
         Get user information asynchronously.
@@ -40,7 +44,7 @@ class AsyncOAuth(BaseOAuth):
             raise KindeConfigurationException("No user ID found in session")
             
         # Get token manager for the user
-        token_manager = self._sync_oauth._session_manager.get_token_manager(user_id)
+        token_manager = await self._sync_oauth._session_manager.get_token_manager_async(user_id)
         if not token_manager:
             raise KindeConfigurationException("No token manager found for user")
         
@@ -0,0 +1,119 @@
+"""
+Request-scoped authorization context.
+
+Every ``permissions``/``roles``/``feature_flags``/``claims`` helper needs the
+current user's token manager and claims. Resolving them means looking up the
+framework, reading the user id from the session and taking the UserSession
+lock. An AuthContext captures that once; while a request is bound to
+``FrameworkContext`` it is stored there and shared by every helper call made
+during the request.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+
+from .claim_index import ClaimIndex, FeatureFlag
+from .token_manager import TokenManager
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+class AuthContext:
+    """
+    Immutable snapshot of the current user's authorization state.
+
+    Claims and their indexes are read from the token manager the first time
+    they are needed and then reused.
+    """
+
+    __slots__ = ("_user_id", "_token_manager", "_claims", "_index", "__weakref__")
+
+    def __init__(self, user_id: str, token_manager: Any):
+        """
+        Initialize the context.
+
+        Args:
+            user_id: The current user's ID
+            token_manager: The user's token manager
+        """
+        object.__setattr__(self, "_user_id", user_id)
+        object.__setattr__(self, "_token_manager", token_manager)
+        object.__setattr__(self, "_claims", {})
+        object.__setattr__(self, "_index", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("AuthContext is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("AuthContext is immutable")
+
+    @property
+    def user_id(self) -> str:
+        """The current user's ID."""
+        return self._user_id
+
+    @property
+    def token_manager(self) -> Any:
+        """The current user's token manager."""
+        return self._token_manager
+
+    @property
+    def index(self) -> ClaimIndex:
+        """Lookup indexes over the access token claims."""
+        if self._index is None:
+            if isinstance(self._token_manager, TokenManager):
+                # Built once per token by TokenManager.set_tokens
+                index = self._token_manager.get_claim_index()
+            else:
+                index = ClaimIndex(self._token_manager.get_claims("access_token"))
+            object.__setattr__(self, "_index", index)
+        return self._index
+
+    @property
+    def claims(self) -> Mapping[str, Any]:
+        """Read-only access token claims."""
+        return self.get_claims("access_token")
+
+    def get_claims(self, token_type: str = "access_token") -> Mapping[str, Any]:
+        """
+        Get the read-only claims of a token.
+
+        Args:
+            token_type: "access_token" or "id_token"
+
+        Returns:
+            Mapping[str, Any]: The claims, or an empty mapping if not available
+        """
+        if token_type == "access_token":
+            return self.index.claims
+        claims = self._claims.get(token_type)
+        if claims is None:
+            raw = self._token_manager.get_claims(token_type)
+            claims = MappingProxyType(dict(raw)) if isinstance(raw, dict) and raw else _EMPTY
+            self._claims[token_type] = claims
+        return claims
+
+    @property
+    def org_code(self) -> Optional[str]:
+        """The organization code of the access token."""
+        return self.index.org_code
+
+    @property
+    def permissions(self) -> FrozenSet[str]:
+        """Permission keys granted by the access token."""
+        return self.index.permissions
+
+    @property
+    def roles(self) -> Mapping[str, Dict[str, Any]]:
+        """Roles of the access token, keyed by role key."""
+        return self.index.roles
+
+    @property
+    def feature_flags(self) -> Mapping[str, FeatureFlag]:
+        """Parsed feature flags of the access token, keyed by flag code."""
+        return self.index.feature_flags
+
+    @property
+    def invalid_flags(self) -> FrozenSet[str]:
+        """Codes of feature flags whose value does not match their type."""
+        return self.index.invalid_flags
@@ -0,0 +1,130 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from kinde_sdk.frontend.api.billing_api import BillingApi
+
+from .api_options import ApiOptions
+from .base_auth import BaseAuth
+from .claim_index import FeatureFlag
+from .entitlements import Entitlements
+from .feature_flags import feature_flags
+from .permissions import Permissions, permissions
+from .roles import roles
+
+
+class AuthorizationSnapshot:
+    """The current user's permissions, roles, feature flags and entitlements at one point in time."""
+
+    def __init__(
+            self,
+            org_code: Optional[str],
+            permissions: List[Any],
+            roles: List[Dict[str, Any]],
+            feature_flags: Dict[str, FeatureFlag],
+            entitlements: Optional[List[Any]] = None
+            ):
+        """
+        Initialize the snapshot.
+
+        Args:
+            org_code: The organization code the data belongs to
+            permissions: Permission keys (or Account API permission objects)
+            roles: Role dicts with "id", "key", "name", ...
+            feature_flags: FeatureFlag objects by flag code
+            entitlements: Entitlements, or None if they were not requested
+        """
+        self.org_code = org_code
+        self.permissions = permissions
+        self.roles = roles
+        self.feature_flags = feature_flags
+        self.entitlements = entitlements
+        self._permission_keys = Permissions._permission_keys(permissions)
+        self._role_keys = frozenset(role.get("key") for role in roles if isinstance(role, dict))
+
+    def has_permission(self, permission_key: str) -> bool:
+        """Check whether the snapshot grants a permission."""
+        return permission_key in self._permission_keys
+
+    def has_role(self, role_key: str) -> bool:
+        """Check whether the snapshot includes a role."""
+        return role_key in self._role_keys
+
+    def get_flag_value(self, flag_code: str, default_value: Any = None) -> Any:
+        """Get a feature flag's value, or default_value if the flag is not set."""
+        flag = self.feature_flags.get(flag_code)
+        return flag.value if flag is not None else default_value
+
+
+class Authorization(BaseAuth):
+    async def get_authorization_snapshot(
+            self,
+            options: Optional[ApiOptions] = None,
+            include_entitlements: bool = True
+            ) -> AuthorizationSnapshot:
+        """
+        Get the current user's permissions, roles, feature flags and entitlements.
+
+        The lookups run concurrently. With force_api enabled this means the
+        Account API calls overlap, so the snapshot takes as long as the slowest
+        call rather than the sum of all of them. Entitlements always come from
+        the Account API.
+
+        Args:
+            options: Optional ApiOptions object. If provided and force_api=True,
+                    fetches roles, permissions and flags from the API instead of token claims.
+            include_entitlements: Whether to fetch the user's entitlements
+
+        Returns:
+            AuthorizationSnapshot: The combined result. Lookups that fail are
+            logged and left empty, as with the individual helpers.
+        """
+        lookups = {
+            "permissions": permissions.get_permissions(options),
+            "roles": roles.get_roles(options),
+            "feature flags": feature_flags.get_all_flags(options),
+        }
+        if include_entitlements:
+            lookups["entitlements"] = self._get_entitlements()
+        results = dict(zip(lookups, await asyncio.gather(*lookups.values(), return_exceptions=True)))
+
+        # One failing lookup (e.g. a malformed flag claim) leaves only its part empty
+        for name, result in results.items():
+            if isinstance(result, Exception):
+                self._logger.error(f"Failed to get {name} for authorization snapshot: {str(result)}")
+                results[name] = [] if name == "entitlements" else {}
+
+        permission_result = results["permissions"]
+        role_result = results["roles"]
+        return AuthorizationSnapshot(
+            org_code=permission_result.get("orgCode") or role_result.get("orgCode"),
+            permissions=permission_result.get("permissions") or [],
+            roles=role_result.get("roles") or [],
+            feature_flags=results["feature flags"],
+            entitlements=results.get("entitlements"),
+        )
+
+    async def _get_entitlements(self) -> List[Any]:
+        """
+        Fetch all of the current user's entitlements without blocking the event loop.
+
+        Returns:
+            List[Any]: The entitlements, or an empty list if unavailable
+        """
+        billing_api = self._create_authenticated_api_client(BillingApi)
+        if not billing_api:
+            return []
+        auth_context = self._get_auth_context()
+        try:
+            client = Entitlements.from_billing_api(
+                billing_api,
+                user_id=auth_context.user_id if auth_context else None,
+                org_code=auth_context.org_code if auth_context else None,
+                use_cache=True,
+            )
+            return await asyncio.to_thread(client.get_all_entitlements)
+        except Exception as e:
+            self._logger.error(f"Failed to fetch entitlements from API: {str(e)}")
+            return []
+
+# Create a singleton instance
+authorization = Authorization()
@@ -1,7 +1,13 @@
+import asyncio
 from typing import Optional, Any
 import logging
+from urllib.parse import urlparse
 from kinde_sdk.core.framework.framework_factory import FrameworkFactory
+from kinde_sdk.core.framework.framework_context import FrameworkContext
+from kinde_sdk.core.frontend_client_pool import frontend_client_pool
+from kinde_sdk.core.account_api_cache import account_api_cache
 from kinde_sdk.auth.user_session import UserSession
+from kinde_sdk.auth.auth_context import AuthContext
 
 class BaseAuth:
     """
@@ -21,13 +27,20 @@ class BaseAuth:
             self._framework = FrameworkFactory.get_framework_instance()
         return self._framework
 
-    def _get_token_manager(self) -> Optional[Any]:
+    def _get_auth_context(self) -> Optional[AuthContext]:
         """
-        Get the token manager for the current user.
+        Get the authorization context of the current user.
+        
+        While a request is bound to FrameworkContext, the context is built on
+        first use and reused by every later call during that request.
         
         Returns:
-            Optional[Any]: The token manager if available, None otherwise
+            Optional[AuthContext]: The context if a user is signed in, None otherwise
         """
+        auth_context = FrameworkContext.get_auth_context()
+        if auth_context is not None:
+            return auth_context
+
         framework = self._get_framework()
         if not framework:
             return None
@@ -36,7 +49,26 @@ class BaseAuth:
         if not user_id:
             return None
 
-        return self._session_manager.get_token_manager(user_id)
+        token_manager = self._session_manager.get_token_manager(user_id)
+        if not token_manager:
+            return None
+
+        auth_context = AuthContext(user_id, token_manager)
+        if FrameworkContext.get_request() is not None:
+            FrameworkContext.set_auth_context(auth_context)
+        return auth_context
+
+    def _get_token_manager(self) -> Optional[Any]:
+        """
+        Get the token manager for the current user.
+        
+        Returns:
+            Optional[Any]: The token manager if available, None otherwise
+        """
+        auth_context = self._get_auth_context()
+        if not auth_context:
+            return None
+        return auth_context.token_manager
 
     def _get_force_api_setting(self) -> bool:
         """
@@ -54,6 +86,9 @@ class BaseAuth:
         """
         Create an authenticated API client for the current user.
         
+        The API instance shares a pooled connection per Kinde host; the
+        user's access token is added to each request.
+        
         Args:
             api_class: The API class to instantiate (e.g., FeatureFlagsApi, RolesApi, PermissionsApi)
             
@@ -75,16 +110,84 @@ class BaseAuth:
             self._logger.error("No access token available for API call")
             return None
         
-        # Create API client with the user's access token
-        from kinde_sdk.frontend.configuration import Configuration
-        from kinde_sdk.frontend.api_client import ApiClient
+        # Send the user's token on the shared connection pool for this Kinde host
+        api_client = frontend_client_pool.authenticated_client(
+            access_token, host=self._get_api_host(token_manager)
+        )
         
-        # Create configuration with the access token
-        config = Configuration()
-        config.access_token = access_token
+        # Create and return the specific API class with the pooled client
+        return api_class(api_client=api_client)
+
+    def _fetch_account_api(self, api_class, method_name: str) -> Optional[Any]:
+        """
+        Call an Account API endpoint for the current user, through the shared
+        response cache (see kinde_sdk.core.account_api_cache). The cache is
+        off unless configured, so by default every call reads from the server.
         
-        # Create API client with the configuration
-        api_client = ApiClient(configuration=config)
+        Args:
+            api_class: The API class (e.g., FeatureFlagsApi, RolesApi, PermissionsApi)
+            method_name: The method returning the user's data (e.g., "get_feature_flags")
+            
+        Returns:
+            Optional[Any]: The API response, or None if no authenticated client is available
+            
+        Raises:
+            Exception: If the API call fails
+        """
+        api_instance = self._create_authenticated_api_client(api_class)
+        if not api_instance:
+            return None
+        
+        fetch = getattr(api_instance, method_name)
+        token_manager = self._get_token_manager()
+        user_id = getattr(token_manager, "user_id", None)
+        if user_id is None:
+            return fetch()
+        
+        try:
+            claims = token_manager.get_claims()
+            org_code = claims.get("org_code") if isinstance(claims, dict) else None
+        except Exception:
+            org_code = None
+        
+        key = account_api_cache.make_key(user_id, org_code, method_name)
+        return account_api_cache.get_or_fetch(key, fetch)
+
+    async def _fetch_account_api_async(self, api_class, method_name: str) -> Optional[Any]:
+        """
+        Call an Account API endpoint for the current user without blocking the
+        event loop.
+        
+        The blocking call runs in a worker thread on the shared connection
+        pool, so concurrent calls (e.g. with asyncio.gather) overlap.
+        
+        Args:
+            api_class: The API class (e.g., FeatureFlagsApi, RolesApi, PermissionsApi)
+            method_name: The method returning the user's data (e.g., "get_feature_flags")
+            
+        Returns:
+            Optional[Any]: The API response, or None if no authenticated client is available
+            
+        Raises:
+            Exception: If the API call fails
+        """
+        return await asyncio.to_thread(self._fetch_account_api, api_class, method_name)
+
+    @staticmethod
+    def _get_api_host(token_manager) -> Optional[str]:
+        """
+        Get the Kinde host the Account API is called on, from the token URL.
         
-        # Create and return the specific API class with the configured client
-        return api_class(api_client=api_client) 
\ No newline at end of file
+        Args:
+            token_manager: The current user's token manager
+            
+        Returns:
+            Optional[str]: The base URL (e.g. "https://example.kinde.com"), or None if unknown
+        """
+        token_url = getattr(token_manager, "token_url", None)
+        if not isinstance(token_url, str):
+            return None
+        parsed = urlparse(token_url)
+        if not parsed.scheme or not parsed.netloc:
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}"
@@ -0,0 +1,139 @@
+"""
+Lookup indexes over access token claims.
+
+Permissions and roles arrive as lists and feature flags in the compact
+``{"t": ..., "v": ...}`` encoding. A ClaimIndex is built once per token (when
+TokenManager.set_tokens decodes it) so permission, role and flag checks are
+constant-time reads instead of list scans and re-parsing on every call.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Generic, Mapping, Optional, TypeVar
+
+T = TypeVar('T')
+
+# Token type codes of feature flags
+FLAG_TYPES = {
+    "s": "string",
+    "b": "boolean",
+    "i": "integer"
+}
+
+
+class FeatureFlag(Generic[T]):
+    """A feature flag. Read-only, so one instance can be shared by every lookup."""
+
+    __slots__ = ("_code", "_type", "_value", "_is_default")
+
+    def __init__(self, code: str, type: str, value: T, is_default: bool = False):
+        self._code = code
+        self._type = type
+        self._value = value
+        self._is_default = is_default
+
+    @property
+    def code(self) -> str:
+        return self._code
+
+    @property
+    def type(self) -> str:
+        return self._type
+
+    @property
+    def value(self) -> T:
+        return self._value
+
+    @property
+    def is_default(self) -> bool:
+        return self._is_default
+
+
+def parse_flag_value(flag_data: Dict[str, Any]) -> FeatureFlag:
+    """
+    Parse a feature flag from the token format.
+
+    Args:
+        flag_data: The raw flag data from the token ({"t": ..., "v": ..., "code": ...})
+
+    Returns:
+        FeatureFlag object with parsed value
+
+    Raises:
+        ValueError: If flag_data is not a dict or the value does not match its type
+    """
+    if not isinstance(flag_data, dict):
+        raise ValueError("flag_data must be a dictionary")
+
+    # Extract raw type and value
+    flag_type = flag_data.get("t", "")
+    raw_value = flag_data.get("v")
+
+    # Convert value based on type
+    try:
+        if flag_type == "s":
+            # None → empty string
+            value = str(raw_value) if raw_value is not None else ""
+        elif flag_type == "b":
+            value = bool(raw_value)
+        elif flag_type == "i":
+            # None → zero
+            value = int(raw_value) if raw_value is not None else 0
+        else:
+            # Unknown type code: return raw as-is
+            value = raw_value
+    except (TypeError, ValueError) as e:
+        raise ValueError(
+            f"Cannot convert flag value {raw_value!r} to type {flag_type!r}: {e}"
+        )
+
+    return FeatureFlag(
+        code=flag_data.get("code", ""),
+        type=FLAG_TYPES.get(flag_type, "unknown"),
+        value=value,
+        is_default=False
+    )
+
+
+class ClaimIndex:
+    """
+    Read-only indexes over one token's claims.
+
+    The (immutable) FeatureFlag objects are shared by every lookup on the same token.
+    """
+
+    __slots__ = ("source", "claims", "org_code", "permissions", "roles", "feature_flags", "invalid_flags")
+
+    def __init__(self, claims: Optional[Mapping[str, Any]]):
+        """
+        Build the indexes.
+
+        Args:
+            claims: The decoded token claims (None or non-dict values give empty indexes)
+        """
+        if not isinstance(claims, dict):
+            claims = {}
+        self.source = claims
+        self.claims: Mapping[str, Any] = MappingProxyType(claims)
+        self.org_code: Optional[str] = claims.get("org_code")
+        self.permissions = frozenset(
+            p for p in claims.get("permissions") or () if isinstance(p, str)
+        )
+
+        roles = {}
+        for role in claims.get("roles") or ():
+            if isinstance(role, dict) and role.get("key") is not None:
+                roles.setdefault(role["key"], role)
+        self.roles: Mapping[str, Dict[str, Any]] = MappingProxyType(roles)
+
+        flags = {}
+        invalid = set()
+        raw_flags = claims.get("feature_flags")
+        if isinstance(raw_flags, dict):
+            for code, flag_data in raw_flags.items():
+                try:
+                    flags[code] = parse_flag_value({**flag_data, "code": code})
+                except (TypeError, ValueError):
+                    # Left to the caller so the error surfaces on lookup, as before
+                    invalid.add(code)
+        self.feature_flags: Mapping[str, FeatureFlag] = MappingProxyType(flags)
+        self.invalid_flags = frozenset(invalid)
@@ -17,15 +17,14 @@ class Claims(BaseAuth):
                 "value": Any
             }
         """
-        token_manager = self._get_token_manager()
-        if not token_manager:
+        auth_context = self._get_auth_context()
+        if not auth_context:
             return {
                 "name": claim_name,
                 "value": None
             }
 
-        claims = token_manager.get_claims(token_type)
-        value = claims.get(claim_name)
+        value = auth_context.get_claims(token_type).get(claim_name)
 
         return {
             "name": claim_name,
@@ -42,11 +41,11 @@ class Claims(BaseAuth):
         Returns:
             Dict containing all claims from the token
         """
-        token_manager = self._get_token_manager()
-        if not token_manager:
+        auth_context = self._get_auth_context()
+        if not auth_context:
             return {}
 
-        return token_manager.get_claims(token_type)
+        return dict(auth_context.get_claims(token_type))
 
 # Create a singleton instance
 claims = Claims() 
\ No newline at end of file
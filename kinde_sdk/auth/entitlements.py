@@ -1,69 +1,253 @@
-from typing import Optional, List
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple
+
+import jwt
+
 from kinde_sdk.frontend.models.get_entitlement_response import GetEntitlementResponse
 from kinde_sdk.frontend.models.get_entitlements_response_data_entitlements_inner import GetEntitlementsResponseDataEntitlementsInner
 from kinde_sdk.frontend.api.billing_api import BillingApi
-from kinde_sdk.frontend.configuration import Configuration
-from kinde_sdk.frontend.api_client import ApiClient
+from kinde_sdk.core.account_api_cache import account_api_cache
+from kinde_sdk.core.frontend_client_pool import frontend_client_pool
+from kinde_sdk.core.helpers import hash_string
+
+logger = logging.getLogger("kinde_sdk")
+
+# Account API cache endpoint name of the full entitlements list
+_CACHE_ENDPOINT = "get_entitlements"
+
 
 class Entitlements:
     """Client for Kinde Account API entitlements endpoints."""
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(self, base_url: str, token: str, use_cache: bool = False):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: Base URL of the Kinde domain
+            token: The user's access token
+            use_cache: Cache the full entitlements list per customer (the
+                token's user and organization) in the shared Account API
+                cache, see kinde_sdk.core.account_api_cache
+        """
         self.base_url = base_url.rstrip('/')
         self.token = token
-        
-        # Configure the API client
-        configuration = Configuration(
-            host=self.base_url,
-            access_token=self.token
-        )
-        
-        # Create the API client
-        api_client = ApiClient(configuration)
-        
+
+        # Send the token on the shared connection pool for this Kinde host
+        api_client = frontend_client_pool.authenticated_client(self.token, host=self.base_url)
+
         # Create the billing API client
         self.billing_api = BillingApi(api_client)
+        self._cache_key = self._token_cache_key(token) if use_cache else None
+
+    @classmethod
+    def from_billing_api(
+            cls,
+            billing_api: BillingApi,
+            user_id: Optional[str] = None,
+            org_code: Optional[str] = None,
+            use_cache: bool = False
+            ) -> "Entitlements":
+        """
+        Create a client that uses an existing BillingApi, e.g. one sharing the
+        pooled Account API connection (see BaseAuth._create_authenticated_api_client).
+
+        Args:
+            billing_api: The configured BillingApi
+            user_id: The user the entitlements belong to (required for caching)
+            org_code: The user's organization
+            use_cache: Cache the full entitlements list per user and organization
+
+        Returns:
+            Entitlements: The client
+        """
+        entitlements = cls.__new__(cls)
+        entitlements.base_url = None
+        entitlements.token = None
+        entitlements.billing_api = billing_api
+        api_client = getattr(billing_api, "api_client", None)
+        host = getattr(getattr(api_client, "configuration", None), "host", None)
+        entitlements._cache_key = (
+            account_api_cache.make_key(user_id, org_code, f"{_CACHE_ENDPOINT}|{host}")
+            if use_cache and user_id else None
+        )
+        return entitlements
+
+    def _token_cache_key(self, token: str) -> Optional[Tuple]:
+        """
+        Build the cache key for the token's entitlements.
+
+        The token's signature is not verified here, so its claims cannot
+        select the entry on their own: the key includes a hash of the token,
+        so a forged token carrying another user's ``sub`` misses their entry.
+        ``sub`` and ``org_code`` stay in the key so invalidating a user's
+        entries (e.g. on logout) still applies.
+        """
+        try:
+            claims = jwt.decode(token, options={"verify_signature": False})
+        except Exception as e:
+            logger.debug(f"Entitlements cache disabled, cannot read token claims: {e}")
+            return None
+        if not claims.get("sub"):
+            return None
+        return account_api_cache.make_key(
+            claims["sub"], claims.get("org_code"), f"{_CACHE_ENDPOINT}|{self.base_url}|{hash_string(token)}"
+        )
 
     def get_all_entitlements(self) -> List[GetEntitlementsResponseDataEntitlementsInner]:
         """
         Returns all entitlements by automatically paging through all available pages.
-        
+
         Returns:
             List of all entitlements across all pages.
         """
-        all_entitlements: List[GetEntitlementsResponseDataEntitlementsInner] = []
+        if self._cache_key is None:
+            return list(self._iter_uncached(None, prefetch=False))
+        return list(account_api_cache.get_or_fetch(
+            self._cache_key, lambda: tuple(self._iter_uncached(None, prefetch=False))
+        ))
+
+    def iter_entitlements(
+            self,
+            page_size: Optional[int] = None,
+            prefetch: bool = True
+            ) -> Iterator[GetEntitlementsResponseDataEntitlementsInner]:
+        """
+        Yield entitlements as pages arrive.
+
+        With prefetch, the next page is requested in a background thread
+        while the caller processes the current one.
+
+        Args:
+            page_size: Number of entitlements per page (API default if None)
+            prefetch: Whether to fetch the next page ahead of time
+
+        Yields:
+            Each entitlement, in order
+        """
+        if self._cache_key is not None:
+            cached = account_api_cache.get(self._cache_key)
+            if cached is not None:
+                yield from cached
+                return
+
+        collected = []
+        for entitlement in self._iter_uncached(page_size, prefetch):
+            collected.append(entitlement)
+            yield entitlement
+
+        # Only a complete walk is cached
+        if self._cache_key is not None:
+            account_api_cache.put(self._cache_key, tuple(collected))
+
+    async def aiter_entitlements(
+            self,
+            page_size: Optional[int] = None,
+            prefetch: bool = True
+            ) -> AsyncIterator[GetEntitlementsResponseDataEntitlementsInner]:
+        """
+        Yield entitlements as pages arrive, without blocking the event loop.
+
+        Args:
+            page_size: Number of entitlements per page (API default if None)
+            prefetch: Whether to fetch the next page while the caller
+                processes the current one
+
+        Yields:
+            Each entitlement, in order
+        """
+        if self._cache_key is not None:
+            cached = account_api_cache.get(self._cache_key)
+            if cached is not None:
+                for entitlement in cached:
+                    yield entitlement
+                return
+
+        collected = []
         starting_after = None
-        prev_cursor = object()  # sentinel
-        has_more = True
-        
-        while has_more:
-            # Use the generated API client
-            result = self.billing_api.get_entitlements(
-                page_size=None,  # Use default page size
-                starting_after=starting_after
-            )
-            
-            # Add entitlements from current page to our list
-            if result.data and result.data.entitlements:
-                all_entitlements.extend(result.data.entitlements)
-            
-            # Check if there are more pages
-            if result.metadata:
-                # Handle both boolean and string values for has_more
-                has_more_value = result.metadata.has_more
-                if isinstance(has_more_value, str):
-                    has_more = has_more_value.lower() == 'true'
+        pending: Optional[asyncio.Future] = None
+        try:
+            result = await asyncio.to_thread(self._fetch_page, page_size, starting_after)
+            while True:
+                entitlements, has_more, next_cursor = self._read_page(result, starting_after)
+                if has_more and prefetch:
+                    pending = asyncio.ensure_future(asyncio.to_thread(self._fetch_page, page_size, next_cursor))
+                for entitlement in entitlements:
+                    collected.append(entitlement)
+                    yield entitlement
+                if not has_more:
+                    break
+                starting_after = next_cursor
+                if pending is not None:
+                    result, pending = await pending, None
                 else:
-                    has_more = bool(has_more_value)
-                next_cursor = result.metadata.next_page_starting_after
-                # break if cursor didn't advance to avoid infinite loop
-                if has_more and (next_cursor is None or next_cursor == starting_after):
-                    has_more = False
-                prev_cursor, starting_after = starting_after, next_cursor
-            else:
-                has_more = False
-        
-        return all_entitlements
+                    result = await asyncio.to_thread(self._fetch_page, page_size, starting_after)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        if self._cache_key is not None:
+            account_api_cache.put(self._cache_key, tuple(collected))
+
+    def _iter_uncached(self, page_size: Optional[int], prefetch: bool) -> Iterator[Any]:
+        """Page through the API, optionally fetching the next page in the background."""
+        executor = None
+        pending = None
+        starting_after = None
+        try:
+            result = self._fetch_page(page_size, starting_after)
+            while True:
+                entitlements, has_more, next_cursor = self._read_page(result, starting_after)
+                if has_more and prefetch:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kinde-entitlements")
+                    pending = executor.submit(self._fetch_page, page_size, next_cursor)
+                yield from entitlements
+                if not has_more:
+                    break
+                starting_after = next_cursor
+                if pending is not None:
+                    result, pending = pending.result(), None
+                else:
+                    result = self._fetch_page(page_size, starting_after)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _fetch_page(self, page_size: Optional[int], starting_after: Optional[str]):
+        # Use the generated API client
+        return self.billing_api.get_entitlements(
+            page_size=page_size,
+            starting_after=starting_after
+        )
+
+    @staticmethod
+    def _read_page(result, starting_after: Optional[str]) -> Tuple[List[Any], bool, Optional[str]]:
+        """
+        Get a page's entitlements and whether and where the next page starts.
+
+        Returns:
+            Tuple of (entitlements, has_more, next cursor)
+        """
+        entitlements = list(result.data.entitlements) if result.data and result.data.entitlements else []
+        if not result.metadata:
+            return entitlements, False, None
+
+        # Handle both boolean and string values for has_more
+        has_more_value = result.metadata.has_more
+        if isinstance(has_more_value, str):
+            has_more = has_more_value.lower() == 'true'
+        else:
+            has_more = bool(has_more_value)
+        next_cursor = result.metadata.next_page_starting_after
+        # stop if the cursor didn't advance to avoid an infinite loop
+        if has_more and (next_cursor is None or next_cursor == starting_after):
+            has_more = False
+        return entitlements, has_more, next_cursor
 
     def get_entitlement(self, key: str) -> GetEntitlementResponse:
         """
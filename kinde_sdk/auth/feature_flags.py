@@ -1,18 +1,12 @@
-from typing import Dict, Any, Optional, TypeVar, Generic
+from typing import Dict, Any, Iterable, Optional, TypeVar
 
 from kinde_sdk.auth.api_options import ApiOptions
 from kinde_sdk.frontend.api.feature_flags_api import FeatureFlagsApi
 from .base_auth import BaseAuth
+from .claim_index import FeatureFlag, parse_flag_value
 
 T = TypeVar('T')
 
-class FeatureFlag(Generic[T]):
-    def __init__(self, code: str, type: str, value: T, is_default: bool = False):
-        self.code = code
-        self.type = type
-        self.value = value
-        self.is_default = is_default
-
 class FeatureFlags(BaseAuth):
     def _parse_flag_value(
             self, 
@@ -29,44 +23,7 @@ class FeatureFlags(BaseAuth):
         Returns:
             FeatureFlag object with parsed value
         """
-        if not isinstance(flag_data, dict):
-            raise ValueError("flag_data must be a dictionary")
-
-        # Extract raw type and value
-        flag_type = flag_data.get("t", "")
-        raw_value = flag_data.get("v")
-        
-        # Map token type codes to Python types
-        type_map = {
-            "s": "string",
-            "b": "boolean",
-            "i": "integer"
-        }
-        
-        # Convert value based on type
-        try:
-            if flag_type == "s":
-                # None → empty string
-                value = str(raw_value) if raw_value is not None else ""
-            elif flag_type == "b":
-                value = bool(raw_value)
-            elif flag_type == "i":
-                # None → zero
-                value = int(raw_value) if raw_value is not None else 0
-            else:
-                # Unknown type code: return raw as-is
-                value = raw_value
-        except (TypeError, ValueError) as e:
-            raise ValueError(
-                f"Cannot convert flag value {raw_value!r} to type {flag_type!r}: {e}"
-            )
-            
-        return FeatureFlag(
-            code=flag_data.get("code", ""),
-            type=type_map.get(flag_type, "unknown"),
-            value=value,
-            is_default=False
-        )
+        return parse_flag_value(flag_data)
 
     async def get_flag(
             self, 
@@ -111,8 +68,8 @@ class FeatureFlags(BaseAuth):
                 result = {**result, "code": flag_code}
             return self._parse_flag_value(result)
 
-        token_manager = self._get_token_manager()
-        if not token_manager:
+        auth_context = self._get_auth_context()
+        if not auth_context:
             return FeatureFlag(
                 code=flag_code,
                 type="unknown",
@@ -120,9 +77,12 @@ class FeatureFlags(BaseAuth):
                 is_default=True
             )
 
-        claims = token_manager.get_claims()
-        feature_flags = claims.get("feature_flags", {})
-        
+        # Flags are parsed once per token
+        flag = auth_context.feature_flags.get(flag_code)
+        if flag is not None:
+            return flag
+
+        feature_flags = auth_context.claims.get("feature_flags") or {}
         if flag_code not in feature_flags:
             return FeatureFlag(
                 code=flag_code,
@@ -161,18 +121,76 @@ class FeatureFlags(BaseAuth):
                 for code, data in flags.items()
             }
     
-        token_manager = self._get_token_manager()
-        if not token_manager:
+        auth_context = self._get_auth_context()
+        if not auth_context:
             return {}
 
-        claims = token_manager.get_claims()
-        feature_flags = claims.get("feature_flags", {})
-        
+        if not auth_context.invalid_flags:
+            return dict(auth_context.feature_flags)
+
+        # Reparse so the invalid flag raises
+        feature_flags = auth_context.claims.get("feature_flags") or {}
         return {
-            code: self._parse_flag_value(flag_data)
+            code: self._parse_flag_value({**flag_data, "code": code})
             for code, flag_data in feature_flags.items()
         }
     
+    async def get_flags(
+            self,
+            flag_codes: Iterable[str],
+            defaults: Optional[Dict[str, Any]] = None,
+            options: Optional[ApiOptions] = None
+            ) -> Dict[str, FeatureFlag]:
+        """
+        Get several feature flags at once.
+        
+        All flags are resolved from one claims snapshot, or from a single
+        Account API call when force_api is enabled.
+        
+        Args:
+            flag_codes: The codes of the feature flags to retrieve
+            defaults: Optional default values by flag code, used for missing flags
+            options: Optional ApiOptions object. If provided and force_api=True,
+                    fetches flags from the API instead of token claims.
+        
+        Returns:
+            Dict mapping each requested flag code to a FeatureFlag object
+        
+        Raises:
+            ValueError: If a requested flag's value does not match its type
+        """
+        defaults = defaults or {}
+
+        # Check SDK-level force_api setting first, then fall back to options parameter
+        force_api = self._get_force_api_setting()
+        if options and options.force_api:
+            force_api = True
+
+        invalid_flags = frozenset()
+        if force_api:
+            flags = await self.get_all_flags(ApiOptions(force_api=True))
+        else:
+            auth_context = self._get_auth_context()
+            flags = auth_context.feature_flags if auth_context else {}
+            if auth_context:
+                invalid_flags = auth_context.invalid_flags
+
+        result = {}
+        for code in flag_codes:
+            flag = flags.get(code)
+            if flag is None:
+                if code in invalid_flags:
+                    # Reparse so the invalid flag raises
+                    self._parse_flag_value({**auth_context.claims["feature_flags"][code], "code": code})
+                flag = FeatureFlag(
+                    code=code,
+                    type="unknown",
+                    value=defaults.get(code),
+                    is_default=True
+                )
+            result[code] = flag
+        return result
+
     async def _call_account_api(self, flag_code: Optional[str] = None) -> Dict[str, Any]:
         """
         Calls the Kinde Account API to get feature flags.
@@ -180,12 +198,10 @@ class FeatureFlags(BaseAuth):
         Otherwise, returns all flags as a dict.
         """
         try:
-            # Create authenticated API client using shared method
-            feature_flags_api = self._create_authenticated_api_client(FeatureFlagsApi)
-            if not feature_flags_api:
+            # Fetch through the shared per-user response cache
+            response = await self._fetch_account_api_async(FeatureFlagsApi, "get_feature_flags")
+            if response is None:
                 return {}
-            
-            response = feature_flags_api.get_feature_flags()
         except Exception as e:
             # Log error and return empty result
             if hasattr(self, '_logger'):
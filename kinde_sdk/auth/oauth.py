@@ -1,5 +1,4 @@
 import os
-import requests
 import logging
 import time
 from typing import Any, Dict, Optional
@@ -12,6 +11,8 @@ from kinde_sdk.core.framework.framework_factory import FrameworkFactory
 from .config_loader import load_config
 from .enums import IssuerRouteTypes, PromptTypes
 from .login_options import LoginOptions
+from kinde_sdk.core.async_http import async_post
+from kinde_sdk.core.openid_discovery import openid_discovery_cache
 from kinde_sdk.core.helpers import generate_random_string, generate_pkce_pair, get_user_details as helper_get_user_details, get_user_details_sync
 from kinde_sdk.core.exceptions import (
     KindeConfigurationException,
@@ -168,6 +169,21 @@ class OAuth:
         self._logger.debug(f"self._session_manager: {self._session_manager}")
         return self._session_manager.is_authenticated(user_id)
 
+    async def is_authenticated_async(self) -> bool:
+        """
+        Check if the user is authenticated without blocking the event loop.
+
+        An expired access token is refreshed over the async HTTP client.
+
+        Returns:
+            bool: True if the user is authenticated, False otherwise
+        """
+        user_id = self._framework.get_user_id()
+        if not user_id:
+            self._logger.debug("No user ID found in session")
+            return False
+        return await self._session_manager.is_authenticated_async(user_id)
+
     def get_user_info(self) -> Dict[str, Any]:
         """
         Get the user information from the session.
@@ -200,43 +216,83 @@ class OAuth:
         self._logger.info(f"Get the claims from the token manager {user_details}")
         return user_details
 
-    def _set_api_endpoints(self):
-        """Set API endpoints based on the host URL."""
-        # Attempt to fetch OpenID Configuration first
-        try:
-            self._fetch_openid_configuration()
-        except Exception as e:
-            self.auth_url = f"{self.host}/oauth2/auth"
-            self.token_url = f"{self.host}/oauth2/token"
-            self.logout_url = f"{self.host}/logout"
-            self.userinfo_url = f"{self.host}/oauth2/userinfo"
-
-    def _fetch_openid_configuration(self):
+    async def get_user_info_async(self) -> Dict[str, Any]:
         """
-        Fetch OpenID Configuration and update endpoints accordingly.
-        """
-        import requests
-        
-        # Construct the OpenID Configuration URL
-        openid_config_url = f"{self.host}/.well-known/openid-configuration"
+        Get the user information from the session without blocking the event loop.
         
-        # Make the request
-        response = requests.get(openid_config_url)
-        
-        if response.status_code == 200:
-            config = response.json()
+        Returns:
+            Dict[str, Any]: The user information
             
-            # Update endpoints with the values from the configuration
-            self.auth_url = config.get("authorization_endpoint", f"{self.host}/oauth2/auth")
-            self.token_url = config.get("token_endpoint", f"{self.host}/oauth2/token")
-            self.logout_url = config.get("end_session_endpoint", f"{self.host}/logout")
-            self.userinfo_url = config.get("userinfo_endpoint", f"{self.host}/oauth2/userinfo")
+        Raises:
+            KindeConfigurationException: If no user ID is found in session
+        """
+        user_id = self._framework.get_user_id()
+        if not user_id:
+            raise KindeConfigurationException("No user ID found in session")
             
-        else:
-            self.auth_url = f"{self.host}/oauth2/auth"
-            self.token_url = f"{self.host}/oauth2/token"
-            self.logout_url = f"{self.host}/logout"
-            self.userinfo_url = f"{self.host}/oauth2/userinfo"
+        token_manager = await self._session_manager.get_token_manager_async(user_id)
+        if not token_manager:
+            raise KindeConfigurationException("No token manager found for user")
+        
+        return await helper_get_user_details(
+            userinfo_url=self.userinfo_url,
+            token_manager=token_manager,
+            logger=self._logger
+        )
+
+    def _set_api_endpoints(self):
+        """
+        Set API endpoints based on the host URL.
+
+        Endpoints come from the shared OpenID discovery cache, so constructing
+        a client never waits on the network. Until the host's discovery
+        document has been fetched in the background, the standard Kinde
+        endpoint paths are used.
+        """
+        self._endpoint_overrides: Dict[str, str] = {}
+        openid_discovery_cache.get(self.host)
+
+    def _get_endpoint(self, name: str) -> str:
+        override = self._endpoint_overrides.get(name)
+        if override is not None:
+            return override
+        return openid_discovery_cache.get_endpoints(self.host)[name]
+
+    @property
+    def auth_url(self) -> str:
+        """The authorization endpoint."""
+        return self._get_endpoint("auth_url")
+
+    @auth_url.setter
+    def auth_url(self, value: str) -> None:
+        self._endpoint_overrides["auth_url"] = value
+
+    @property
+    def token_url(self) -> str:
+        """The token endpoint."""
+        return self._get_endpoint("token_url")
+
+    @token_url.setter
+    def token_url(self, value: str) -> None:
+        self._endpoint_overrides["token_url"] = value
+
+    @property
+    def logout_url(self) -> str:
+        """The end session endpoint."""
+        return self._get_endpoint("logout_url")
+
+    @logout_url.setter
+    def logout_url(self, value: str) -> None:
+        self._endpoint_overrides["logout_url"] = value
+
+    @property
+    def userinfo_url(self) -> str:
+        """The userinfo endpoint."""
+        return self._get_endpoint("userinfo_url")
+
+    @userinfo_url.setter
+    def userinfo_url(self, value: str) -> None:
+        self._endpoint_overrides["userinfo_url"] = value
 
     async def generate_auth_url(
         self,
@@ -332,12 +388,16 @@ class OAuth:
         # Generate state if not provided
         state = login_options.get(LoginOptions.STATE, generate_random_string(32))
         search_params["state"] = state
-        self._session_manager.storage_manager.setItems("user:state", {"value": state})
         
         # Generate nonce if not provided
         nonce = login_options.get(LoginOptions.NONCE, generate_random_string(16))
         search_params["nonce"] = nonce
-        self._session_manager.storage_manager.setItems("user:nonce", {"value": nonce})
+        
+        # Login state is stored in one batch below
+        login_state = {
+            "user:state": {"value": state},
+            "user:nonce": {"value": nonce},
+        }
         
         # Handle PKCE
         code_verifier = ""
@@ -348,7 +408,9 @@ class OAuth:
             pkce_data = await generate_pkce_pair(52)  # Use 52 chars to match JS implementation
             code_verifier = pkce_data["code_verifier"]
             search_params["code_challenge"] = pkce_data["code_challenge"]
-            self._session_manager.storage_manager.setItems("user:code_verifier", {"value": code_verifier})
+            login_state["user:code_verifier"] = {"value": code_verifier}
+        
+        await self._session_manager.storage_manager.set_many_async(login_state)
         
         # Set code challenge method
         code_challenge_method = login_options.get(LoginOptions.CODE_CHALLENGE_METHOD, "S256")
@@ -472,14 +534,14 @@ class OAuth:
         if user_id:
             # Get ID token before logging out if not provided in options
             if "id_token_hint" not in logout_options and user_id:
-                token_manager = self._session_manager.get_token_manager(user_id)
+                token_manager = await self._session_manager.get_token_manager_async(user_id)
                 if token_manager:
                     id_token = token_manager.get_id_token()
                     if id_token:
                         logout_options["id_token_hint"] = id_token
             
             # Perform logout (clear session)
-            self._session_manager.logout(user_id)
+            await self._session_manager.logout_async(user_id)
         
         # Generate logout URL
         params = {
@@ -515,9 +577,12 @@ class OAuth:
         Returns:
             Dict with user and token information
         """
+        storage_manager = self._session_manager.storage_manager
+        stored = await storage_manager.get_many_async(["user:state", "user:code_verifier"])
+        
         # Verify state if provided
         if state:
-            stored_state = self._session_manager.storage_manager.get("user:state")
+            stored_state = stored.get("user:state")
             self._logger.warning(f"stored_state: {stored_state}, state: {state}")
             if not stored_state or state != stored_state.get("value"):
                 self._logger.error(f"State mismatch: received {state}, stored {stored_state}")
@@ -525,12 +590,16 @@ class OAuth:
         
         # Get code verifier for PKCE
         code_verifier = None
-        stored_code_verifier = self._session_manager.storage_manager.get("user:code_verifier")
+        stored_code_verifier = stored.get("user:code_verifier")
         if stored_code_verifier:
             code_verifier = stored_code_verifier.get("value")
-            
-            # Clean up the used code verifier
-            self._session_manager.storage_manager.delete("user:code_verifier")
+        
+        # Login state is single use: clean up the code verifier, state and nonce
+        # in one batch before the exchange
+        used_keys = ["user:code_verifier", "user:nonce"]
+        if state:
+            used_keys.append("user:state")
+        await storage_manager.delete_many_async(used_keys)
         
         # Exchange code for tokens
         try:
@@ -548,10 +617,10 @@ class OAuth:
         }
         
         # Store session data
-        self._session_manager.set_user_data(user_id, user_info, token_data)
+        await self._session_manager.set_user_data_async(user_id, user_info, token_data)
         
         # Get user details using the token
-        token_manager = self._session_manager.get_token_manager(user_id)
+        token_manager = await self._session_manager.get_token_manager_async(user_id)
         if not token_manager:
             raise KindeRetrieveException("Failed to get token manager")
         
@@ -565,13 +634,6 @@ class OAuth:
             logger=self._logger
         )
         
-        # Clean up state
-        if state:
-            self._session_manager.storage_manager.delete("user:state")
-        
-        # Clean up nonce
-        self._session_manager.storage_manager.delete("user:nonce")
-        
         return {
             "tokens": token_data,
             "user": user_details
@@ -605,7 +667,7 @@ class OAuth:
         
         self._logger.debug(f"[Exchange code for tokens] [{self.token_url}] [{data}]")
 
-        response = requests.post(self.token_url, data=data)
+        response = await async_post(self.token_url, data=data)
         self._logger.debug(f"[Exchange code for tokens] [{response.status_code}] [{response.text}]")
         if response.status_code != 200:
             raise KindeTokenException(f"Token exchange failed: {response.text}")
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any
 
 from .api_options import ApiOptions
 from .base_auth import BaseAuth
@@ -36,22 +36,18 @@ class Permissions(BaseAuth):
         if force_api:
             return await self._call_account_api(permission_key)
         
-        token_manager = self._get_token_manager()
-        if not token_manager:
+        auth_context = self._get_auth_context()
+        if not auth_context:
             return {
                 "permissionKey": permission_key,
                 "orgCode": None,
                 "isGranted": False
             }
 
-        claims = token_manager.get_claims()
-        permissions = claims.get("permissions", [])
-        org_code = claims.get("org_code")
-
         return {
             "permissionKey": permission_key,
-            "orgCode": org_code,
-            "isGranted": permission_key in permissions
+            "orgCode": auth_context.org_code,
+            "isGranted": permission_key in auth_context.permissions
         }
 
     async def get_permissions(
@@ -81,22 +77,74 @@ class Permissions(BaseAuth):
         if force_api:
             return await self._call_account_api()
     
-        token_manager = self._get_token_manager()
-        if not token_manager:
+        auth_context = self._get_auth_context()
+        if not auth_context:
             return {
                 "orgCode": None,
                 "permissions": []
             }
 
-        claims = token_manager.get_claims()
-        permissions = claims.get("permissions", [])
-        org_code = claims.get("org_code")
-
         return {
-            "orgCode": org_code,
-            "permissions": permissions
+            "orgCode": auth_context.org_code,
+            "permissions": auth_context.claims.get("permissions", [])
         }
     
+    async def get_permissions_for(
+            self,
+            permission_keys: Iterable[str],
+            options: Optional[ApiOptions] = None
+            ) -> Dict[str, Any]:
+        """
+        Check several permissions for the current user at once.
+        
+        All keys are resolved from one claims snapshot, or from a single
+        Account API call when force_api is enabled.
+        
+        Args:
+            permission_keys: The permission keys to check (e.g. ["create:todos", "read:todos"])
+            options: Optional ApiOptions object. If provided and force_api=True,
+                    fetches permissions from the API instead of token claims.
+        
+        Returns:
+            Dict containing the organization code and whether each permission is granted:
+            {
+                "orgCode": Optional[str],
+                "permissions": Dict[str, bool]
+            }
+        """
+        # Check SDK-level force_api setting first, then fall back to options parameter
+        force_api = self._get_force_api_setting()
+        if options and options.force_api:
+            force_api = True
+        
+        if force_api:
+            result = await self._call_account_api()
+            org_code = result.get("orgCode")
+            granted = self._permission_keys(result.get("permissions"))
+        else:
+            auth_context = self._get_auth_context()
+            org_code = auth_context.org_code if auth_context else None
+            granted = auth_context.permissions if auth_context else frozenset()
+        
+        return {
+            "orgCode": org_code,
+            "permissions": {key: key in granted for key in permission_keys}
+        }
+
+    @staticmethod
+    def _permission_keys(permissions: Optional[Iterable[Any]]) -> FrozenSet[str]:
+        """Get the keys of permissions given as strings, API models or dicts."""
+        keys = set()
+        for permission in permissions or ():
+            if isinstance(permission, str):
+                keys.add(permission)
+            elif isinstance(permission, dict):
+                keys.add(permission.get("key"))
+            else:
+                keys.add(getattr(permission, "key", None))
+        keys.discard(None)
+        return frozenset(keys)
+
     async def _call_account_api(self, permission_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Calls the Kinde Account API to get permissions.
@@ -104,14 +152,12 @@ class Permissions(BaseAuth):
         Otherwise, returns all permissions as a dict.
         """
         try:
-            # Create authenticated API client using shared method
-            permissions_api = self._create_authenticated_api_client(PermissionsApi)
-            if not permissions_api:
+            # Fetch through the shared per-user response cache
+            response = await self._fetch_account_api_async(PermissionsApi, "get_user_permissions")
+            if response is None:
                 if permission_key is None:
                     return {"orgCode": None, "permissions": []}
                 return {"permissionKey": permission_key, "orgCode": None, "isGranted": False}
-            
-            response = permissions_api.get_user_permissions()
         except Exception as e:
             # Log error and return empty result
             if hasattr(self, '_logger'):
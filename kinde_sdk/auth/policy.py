@@ -0,0 +1,152 @@
+"""
+Boolean authorization policies over permissions, roles and feature flags.
+
+A policy combines checks with AllOf/AnyOf (or ``&``/``|``)::
+
+    policy = Permission("read:todos") & (Role("admin") | Flag("beta_access"))
+    if await evaluate_policy(policy):
+        ...
+
+evaluate_policy collects every key the policy refers to and resolves each
+kind with one batch call (Permissions.get_permissions_for, Roles.has_roles,
+FeatureFlags.get_flags), so a policy costs at most one claims read, or one
+Account API call per kind when force_api is enabled.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Set
+
+from .api_options import ApiOptions
+from .feature_flags import feature_flags
+from .permissions import permissions
+from .roles import roles
+
+
+class Policy(ABC):
+    """Base class of policy expressions."""
+
+    def __and__(self, other: "Policy") -> "AllOf":
+        return AllOf(self, other)
+
+    def __or__(self, other: "Policy") -> "AnyOf":
+        return AnyOf(self, other)
+
+    @abstractmethod
+    def _collect(self, required: Dict[str, Set[str]]) -> None:
+        """Add the permission, role and flag keys this policy needs to ``required``."""
+        pass
+
+    @abstractmethod
+    def _evaluate(self, results: Dict[str, Dict[str, Any]]) -> bool:
+        """Evaluate the policy against the batch results."""
+        pass
+
+
+class Permission(Policy):
+    """Granted if the user has the permission."""
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def _collect(self, required: Dict[str, Set[str]]) -> None:
+        required["permissions"].add(self.key)
+
+    def _evaluate(self, results: Dict[str, Dict[str, Any]]) -> bool:
+        return results["permissions"][self.key]
+
+    def __repr__(self) -> str:
+        return f"Permission({self.key!r})"
+
+
+class Role(Policy):
+    """Granted if the user has the role."""
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def _collect(self, required: Dict[str, Set[str]]) -> None:
+        required["roles"].add(self.key)
+
+    def _evaluate(self, results: Dict[str, Dict[str, Any]]) -> bool:
+        return results["roles"][self.key]
+
+    def __repr__(self) -> str:
+        return f"Role({self.key!r})"
+
+
+class Flag(Policy):
+    """Granted if the feature flag has the expected value (True by default)."""
+
+    def __init__(self, code: str, value: Any = True):
+        self.code = code
+        self.value = value
+
+    def _collect(self, required: Dict[str, Set[str]]) -> None:
+        required["flags"].add(self.code)
+
+    def _evaluate(self, results: Dict[str, Dict[str, Any]]) -> bool:
+        flag = results["flags"][self.code]
+        return not flag.is_default and flag.value == self.value
+
+    def __repr__(self) -> str:
+        return f"Flag({self.code!r}, {self.value!r})"
+
+
+class AllOf(Policy):
+    """Granted if every sub-policy is granted."""
+
+    def __init__(self, *policies: Policy):
+        self.policies = policies
+
+    def _collect(self, required: Dict[str, Set[str]]) -> None:
+        for policy in self.policies:
+            policy._collect(required)
+
+    def _evaluate(self, results: Dict[str, Dict[str, Any]]) -> bool:
+        return all(policy._evaluate(results) for policy in self.policies)
+
+    def __repr__(self) -> str:
+        return f"AllOf({', '.join(map(repr, self.policies))})"
+
+
+class AnyOf(Policy):
+    """Granted if at least one sub-policy is granted."""
+
+    def __init__(self, *policies: Policy):
+        self.policies = policies
+
+    def _collect(self, required: Dict[str, Set[str]]) -> None:
+        for policy in self.policies:
+            policy._collect(required)
+
+    def _evaluate(self, results: Dict[str, Dict[str, Any]]) -> bool:
+        return any(policy._evaluate(results) for policy in self.policies)
+
+    def __repr__(self) -> str:
+        return f"AnyOf({', '.join(map(repr, self.policies))})"
+
+
+async def evaluate_policy(policy: Policy, options: Optional[ApiOptions] = None) -> bool:
+    """
+    Evaluate a policy for the current user.
+
+    Args:
+        policy: The policy expression
+        options: Optional ApiOptions object. If provided and force_api=True,
+                checks are resolved from the Account API instead of token claims.
+
+    Returns:
+        bool: True if the policy is granted
+    """
+    required: Dict[str, Set[str]] = {"permissions": set(), "roles": set(), "flags": set()}
+    policy._collect(required)
+
+    results: Dict[str, Dict[str, Any]] = {"permissions": {}, "roles": {}, "flags": {}}
+    if required["permissions"]:
+        results["permissions"] = (await permissions.get_permissions_for(required["permissions"], options))["permissions"]
+    if required["roles"]:
+        results["roles"] = (await roles.has_roles(required["roles"], options))["roles"]
+    if required["flags"]:
+        results["flags"] = await feature_flags.get_flags(required["flags"], options=options)
+
+    return policy._evaluate(results)
@@ -2,8 +2,8 @@ from typing import Dict, Any, Optional
 import logging
 import urllib.parse
 from urllib.parse import urlparse
-import httpx
 from enum import Enum
+from kinde_sdk.core.async_http import async_get
 from kinde_sdk.core.framework.framework_factory import FrameworkFactory
 from kinde_sdk.auth.user_session import UserSession
 
@@ -101,25 +101,24 @@ class Portals:
         
         url = f"{sanitized_domain}/account_api/v1/portal_link?{params}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            
-            if not response.is_success:
-                raise Exception(f"Failed to fetch portal URL: {response.status_code} {response.reason_phrase}")
-            
-            result = response.json()
-            if not result.get("url") or not isinstance(result["url"], str):
-                raise Exception("Invalid URL received from API")
-            
-            try:
-                portal_url = urlparse(result["url"])
-                return {"url": result["url"]}
-            except Exception as e:
-                self._logger.error(f"Error parsing URL: {e}")
-                raise Exception(f"Invalid URL format received from API: {result['url']}") from e
+        response = await async_get(
+            url,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        
+        if not response.is_success:
+            raise Exception(f"Failed to fetch portal URL: {response.status_code} {response.reason_phrase}")
+        
+        result = response.json()
+        if not result.get("url") or not isinstance(result["url"], str):
+            raise Exception("Invalid URL received from API")
+        
+        try:
+            portal_url = urlparse(result["url"])
+            return {"url": result["url"]}
+        except Exception as e:
+            self._logger.error(f"Error parsing URL: {e}")
+            raise Exception(f"Invalid URL format received from API: {result['url']}") from e
 
 # Create a singleton instance
 portals = Portals() 
\ No newline at end of file
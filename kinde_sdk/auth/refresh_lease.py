@@ -0,0 +1,117 @@
+"""
+Cross-process coordination for refresh token use.
+
+Refresh tokens are rotated on use, so two workers refreshing the same refresh
+token at once will see one of them fail with ``invalid_grant``. A
+RefreshLease lets only one worker refresh a given refresh token at a time; the
+others wait for the rotated tokens to show up in shared session storage.
+"""
+
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshLease(ABC):
+    """
+    Interface for a short-lived, exclusive lease on a refresh token.
+
+    Implementations backed by a shared store (a lock file, Redis ``SET NX PX``,
+    a database row, ...) make refreshes single-flight across processes.
+    Keys are opaque hashes of the refresh token, never the token itself.
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, ttl: float) -> bool:
+        """
+        Try to take the lease without blocking.
+
+        Args:
+            key (str): The lease key.
+            ttl (float): Seconds after which an unreleased lease is considered abandoned.
+
+        Returns:
+            bool: True if the lease was acquired, False if another holder has it.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """
+        Release a lease previously acquired by this holder.
+
+        Args:
+            key (str): The lease key.
+        """
+        pass
+
+
+class NullRefreshLease(RefreshLease):
+    """
+    Lease that is always granted.
+
+    Used by default: refreshes are still single-flight within a process
+    (see TokenManager.refresh_access_token), but not across processes.
+    """
+
+    def acquire(self, key: str, ttl: float) -> bool:
+        return True
+
+    def release(self, key: str) -> None:
+        pass
+
+
+class FileRefreshLease(RefreshLease):
+    """
+    Lease backed by lock files, for multiple worker processes on one host.
+
+    A lease is a file created with ``O_CREAT | O_EXCL`` in a shared directory.
+    Files older than their TTL are treated as abandoned (e.g. the holder
+    crashed) and are taken over.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the lease.
+
+        Args:
+            directory: Directory for lock files. Defaults to a ``kinde_refresh_leases``
+                directory under the system temp dir.
+        """
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "kinde_refresh_leases")
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.lock")
+
+    def acquire(self, key: str, ttl: float) -> bool:
+        path = self._path(key)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    return False
+                # Abandoned lease: remove it and race for a fresh one
+                logger.warning(f"Taking over abandoned refresh lease {key}")
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except FileExistsError:
+                return False
+        with os.fdopen(fd, "w") as lock_file:
+            lock_file.write(str(os.getpid()))
+        return True
+
+    def release(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
 from .api_options import ApiOptions
 from .base_auth import BaseAuth
@@ -37,8 +37,8 @@ class Roles(BaseAuth):
         if force_api:
             return await self._call_account_api(role_key)
         
-        token_manager = self._get_token_manager()
-        if not token_manager:
+        auth_context = self._get_auth_context()
+        if not auth_context:
             return {
                 "id": None,
                 "key": role_key,
@@ -49,16 +49,8 @@ class Roles(BaseAuth):
                 "isGranted": False
             }
 
-        claims = token_manager.get_claims()
-        roles = claims.get("roles", [])
-        org_code = claims.get("org_code")
-
-        # Find the specific role
-        role_info = None
-        for role in roles:
-            if isinstance(role, dict) and role.get('key') == role_key:
-                role_info = role
-                break
+        org_code = auth_context.org_code
+        role_info = auth_context.roles.get(role_key)
 
         if role_info:
             return {
@@ -114,22 +106,60 @@ class Roles(BaseAuth):
         if force_api:
             return await self._call_account_api()
     
-        token_manager = self._get_token_manager()
-        if not token_manager:
+        auth_context = self._get_auth_context()
+        if not auth_context:
             return {
                 "orgCode": None,
                 "roles": []
             }
 
-        claims = token_manager.get_claims()
-        roles = claims.get("roles", [])
-        org_code = claims.get("org_code")
-
         return {
-            "orgCode": org_code,
-            "roles": roles
+            "orgCode": auth_context.org_code,
+            "roles": auth_context.claims.get("roles", [])
         }
     
+    async def has_roles(
+            self,
+            role_keys: Iterable[str],
+            options: Optional[ApiOptions] = None
+            ) -> Dict[str, Any]:
+        """
+        Check several roles for the current user at once.
+        
+        All keys are resolved from one claims snapshot, or from a single
+        Account API call when force_api is enabled.
+        
+        Args:
+            role_keys: The role keys to check (e.g. ["admin", "user"])
+            options: Optional ApiOptions object. If provided and force_api=True,
+                    fetches roles from the API instead of token claims.
+        
+        Returns:
+            Dict containing the organization code and whether the user has each role:
+            {
+                "orgCode": Optional[str],
+                "roles": Dict[str, bool]
+            }
+        """
+        # Check SDK-level force_api setting first, then fall back to options parameter
+        force_api = self._get_force_api_setting()
+        if options and options.force_api:
+            force_api = True
+        
+        if force_api:
+            result = await self._call_account_api()
+            org_code = result.get("orgCode")
+            granted = {role.get("key") for role in result.get("roles") or ()}
+        else:
+            auth_context = self._get_auth_context()
+            org_code = auth_context.org_code if auth_context else None
+            granted = auth_context.roles if auth_context else {}
+        
+        return {
+            "orgCode": org_code,
+            "roles": {key: key in granted for key in role_keys}
+        }
+
     async def _call_account_api(self, role_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Calls the Kinde Account API to get roles.
@@ -137,9 +167,9 @@ class Roles(BaseAuth):
         Otherwise, returns all roles as a dict.
         """
         try:
-            # Create authenticated API client using shared method
-            roles_api = self._create_authenticated_api_client(RolesApi)
-            if not roles_api:
+            # Fetch through the shared per-user response cache
+            response = await self._fetch_account_api_async(RolesApi, "get_user_roles")
+            if response is None:
                 if role_key is None:
                     return {"orgCode": None, "roles": []}
                 return {
@@ -151,8 +181,6 @@ class Roles(BaseAuth):
                     "orgCode": None,
                     "isGranted": False,
                 }
-            
-            response = roles_api.get_user_roles()
         except Exception as e:
             self._logger.error(f"Failed to fetch roles from API: {str(e)}")
             if role_key is None:
@@ -49,6 +49,10 @@ class SmartOAuth(BaseOAuth):
             self._warn_async_context("is_authenticated")
         return self._sync_oauth.is_authenticated()
     
+    async def is_authenticated_async(self) -> bool:
+        """Check if the user is authenticated asynchronously."""
+        return await self._async_oauth.is_authenticated_async()
+    
     def get_user_info(self) -> Dict[str, Any]:
         """Get user information synchronously."""
         if self._is_async_context():
@@ -1,14 +1,62 @@
+import asyncio
 import time
 import requests
 import threading
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 import jwt
 
+from kinde_sdk.core.async_http import async_post, raise_for_status
+from kinde_sdk.core.framework.framework_context import FrameworkContext
+from kinde_sdk.core.helpers import hash_string
+from kinde_sdk.core.http_client import http_client
+from kinde_sdk.core.refresh_scheduler import TokenRefreshScheduler, get_refresh_scheduler
+from kinde_sdk.core.verified_token_cache import verified_token_cache
+from .refresh_lease import RefreshLease, NullRefreshLease
+from .claim_index import ClaimIndex
+
 class TokenManager:
     _instances = {}
     _lock = threading.Lock()  # Add a lock for thread safety
 
+    # Cross-process coordination of refresh token use (process-local by default)
+    _refresh_lease: RefreshLease = NullRefreshLease()
+    REFRESH_LEASE_TTL = 30  # Seconds; also the token endpoint timeout
+    REFRESH_POLL_INTERVAL = 0.1  # Seconds between checks for tokens refreshed elsewhere
+
+    # Seconds before expires_at at which an access token is treated as expired
+    EXPIRY_SKEW = 0
+    # Renews tokens ahead of expiry when set (see enable_background_refresh)
+    _refresh_scheduler: Optional[TokenRefreshScheduler] = None
+
+    @classmethod
+    def enable_background_refresh(cls, scheduler: Optional[TokenRefreshScheduler] = None) -> None:
+        """
+        Renew access tokens in the background before they expire.
+
+        Tokens stored with a refresh token are then renewed at a fraction of
+        their lifetime, so get_access_token stays an in-memory read.
+
+        Args:
+            scheduler: The scheduler to use. Defaults to the shared scheduler.
+        """
+        cls._refresh_scheduler = scheduler or get_refresh_scheduler()
+
+    @classmethod
+    def disable_background_refresh(cls) -> None:
+        """Stop scheduling background refreshes for new tokens."""
+        cls._refresh_scheduler = None
+
+    @classmethod
+    def set_refresh_lease(cls, lease: Optional[RefreshLease]) -> None:
+        """
+        Set the lease used to make refreshes single-flight across processes.
+
+        Args:
+            lease: The lease implementation, or None to restore the process-local default.
+        """
+        cls._refresh_lease = lease or NullRefreshLease()
+
     @classmethod
     def reset_instances(cls):
         """Reset all token manager instances - useful for testing"""
@@ -36,6 +84,10 @@ class TokenManager:
         self.lock = threading.Lock()  # Add a lock for thread safety
         self.redirect_uri = None  # Initialize the redirect_uri attribute
         self.force_api = False  # Initialize force_api setting
+        self._refresh_lock = threading.Lock()  # Serializes refreshes for this user
+        self._token_loader = None  # Reads tokens persisted by other processes
+        self._token_saver = None  # Persists refreshed tokens for other processes
+        self._claim_index = None  # Lookup indexes over the access token claims
         self.initialized = True
 
     def set_force_api(self, force_api: bool):
@@ -48,11 +100,12 @@ class TokenManager:
 
     def set_tokens(self, token_data: Dict[str, Any]):
         """ Store tokens with expiration. """
+        expires_in = token_data.get("expires_in", 3600)
         with self.lock:
             # Update existing tokens instead of creating new dict
             self.tokens.update({
                 "access_token": token_data.get("access_token"),
-                "expires_at": time.time() + token_data.get("expires_in", 3600),
+                "expires_at": time.time() + expires_in,
             })
             
             # Store refresh token if available
@@ -70,6 +123,7 @@ class TokenManager:
                 except Exception as e:
                     logging.error(f"Failed to decode access token claims: {str(e)}")
                     self.tokens["access_token_claims"] = {}
+                self._claim_index = ClaimIndex(self.tokens["access_token_claims"])
                 
             # Store ID token if available
             if "id_token" in token_data:
@@ -86,6 +140,42 @@ class TokenManager:
                     logging.error(f"Failed to decode ID token claims: {str(e)}")
                     self.tokens["id_token_claims"] = {}
 
+            can_refresh = "refresh_token" in self.tokens
+
+        # Claims read earlier in this request are out of date
+        FrameworkContext.clear_auth_context()
+
+        scheduler = self._refresh_scheduler
+        if scheduler is not None and can_refresh:
+            scheduler.schedule(self._refresh_schedule_key(), self._background_refresh, expires_in)
+
+    def _refresh_schedule_key(self) -> str:
+        return f"user:{self.user_id}"
+
+    def _background_refresh(self) -> None:
+        """Refresh callback run by the background scheduler."""
+        if "refresh_token" in self.tokens:
+            self.refresh_access_token()
+
+    def set_token_persistence(
+            self,
+            loader: Optional[Callable[[], Optional[Dict[str, Any]]]],
+            saver: Optional[Callable[[Dict[str, Any]], None]]
+            ):
+        """
+        Connect this token manager to shared session storage.
+
+        Refreshed tokens are handed to ``saver``, and ``loader`` is used to
+        pick up tokens another process refreshed while this one waited on
+        the refresh lease.
+
+        Args:
+            loader: Returns the currently persisted tokens, or None
+            saver: Persists the given tokens
+        """
+        self._token_loader = loader
+        self._token_saver = saver
+
     def set_redirect_uri(self, redirect_uri: str):
         """Set the redirect URI for token exchange."""
         self.redirect_uri = redirect_uri
@@ -112,8 +202,8 @@ class TokenManager:
         if code_verifier:
             data["code_verifier"] = code_verifier
             
-        response = requests.post(self.token_url, data=data)
-        response.raise_for_status()
+        response = await async_post(self.token_url, data=data)
+        raise_for_status(response)
         token_data = response.json()
         
         self.set_tokens(token_data)
@@ -121,43 +211,219 @@ class TokenManager:
     
     def get_access_token(self):
         """ Get a valid access token. Refresh if expired. """
+        access_token = self._valid_access_token()
+        if access_token is not None:
+            return access_token
+
+        # Refresh outside self.lock so readers are not blocked behind the network call
+        return self.refresh_access_token()
+
+    async def get_access_token_async(self):
+        """
+        Get a valid access token, refreshing it without blocking the event loop.
+
+        Returns:
+            str: The access token
+        """
+        access_token = self._valid_access_token()
+        if access_token is not None:
+            return access_token
+        return await self.refresh_access_token_async()
+
+    def _valid_access_token(self) -> Optional[str]:
+        """
+        Get the access token if it does not need a refresh.
+
+        Returns:
+            Optional[str]: The access token, or None if it must be refreshed
+
+        Raises:
+            ValueError: If there is no access token, or it expired and cannot be refreshed
+        """
         with self.lock:
             if not self.tokens or "access_token" not in self.tokens:
                 raise ValueError("No access token available")
                 
             # Check if token is expired
-            # if time.time() >= self.tokens["expires_at"]:
-            if time.time() >= self.tokens.get("expires_at", 0):
-                # Try to refresh token if available
-                if "refresh_token" in self.tokens:
-                    return self.refresh_access_token()
-                else:
-                    raise ValueError("Access token expired and no refresh token available")
-                
-            return self.tokens["access_token"]
+            if time.time() + self.EXPIRY_SKEW < self.tokens.get("expires_at", 0):
+                return self.tokens["access_token"]
+
+            if "refresh_token" not in self.tokens:
+                raise ValueError("Access token expired and no refresh token available")
+        return None
 
     def refresh_access_token(self):
-        """ Use the refresh token to get a new access token. """
-        if "refresh_token" not in self.tokens:
-            raise ValueError("No refresh token available")
+        """
+        Use the refresh token to get a new access token.
+
+        Refreshes are single-flight: concurrent callers for this user wait for
+        one in-flight refresh and then share its result, and the configured
+        RefreshLease keeps other processes from using the same refresh token
+        at the same time.
+        """
+        stale_access_token = self.tokens.get("access_token")
+
+        with self._refresh_lock:
+            refreshed, refresh_token = self._pending_refresh(stale_access_token)
+            if refreshed is not None:
+                return refreshed
+
+            lease_key = hash_string(refresh_token)
+            deadline = time.time() + self.REFRESH_LEASE_TTL
+            while not self._refresh_lease.acquire(lease_key, self.REFRESH_LEASE_TTL):
+                # Another process is refreshing; wait for it to publish the rotated tokens
+                if self._adopt_persisted_tokens(stale_access_token):
+                    return self.tokens["access_token"]
+                if time.time() >= deadline:
+                    logging.warning("Timed out waiting for refresh lease, refreshing without it")
+                    return self._request_refresh(refresh_token, stale_access_token)
+                time.sleep(self.REFRESH_POLL_INTERVAL)
+
+            try:
+                # The lease holder before us may have just finished
+                if self._adopt_persisted_tokens(stale_access_token):
+                    return self.tokens["access_token"]
+                return self._request_refresh(refresh_token, stale_access_token)
+            finally:
+                self._refresh_lease.release(lease_key)
+
+    async def refresh_access_token_async(self):
+        """
+        Use the refresh token to get a new access token without blocking the event loop.
+
+        Shares the single-flight lock and RefreshLease with refresh_access_token,
+        so sync and async callers never use the same refresh token twice. The
+        token endpoint is called over the shared async client, and the lock,
+        lease and token store are waited on with asyncio.sleep.
+        """
+        stale_access_token = self.tokens.get("access_token")
+
+        while not self._refresh_lock.acquire(blocking=False):
+            await asyncio.sleep(self.REFRESH_POLL_INTERVAL)
+        try:
+            refreshed, refresh_token = self._pending_refresh(stale_access_token)
+            if refreshed is not None:
+                return refreshed
 
+            lease_key = hash_string(refresh_token)
+            deadline = time.time() + self.REFRESH_LEASE_TTL
+            while not self._refresh_lease.acquire(lease_key, self.REFRESH_LEASE_TTL):
+                if await asyncio.to_thread(self._adopt_persisted_tokens, stale_access_token):
+                    return self.tokens["access_token"]
+                if time.time() >= deadline:
+                    logging.warning("Timed out waiting for refresh lease, refreshing without it")
+                    return await self._request_refresh_async(refresh_token, stale_access_token)
+                await asyncio.sleep(self.REFRESH_POLL_INTERVAL)
+
+            try:
+                if await asyncio.to_thread(self._adopt_persisted_tokens, stale_access_token):
+                    return self.tokens["access_token"]
+                return await self._request_refresh_async(refresh_token, stale_access_token)
+            finally:
+                self._refresh_lease.release(lease_key)
+        finally:
+            self._refresh_lock.release()
+
+    def _pending_refresh(self, stale_access_token: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Check, under the refresh lock, whether a refresh is still needed.
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: The access token if another caller
+            already refreshed it, otherwise None and the refresh token to use
+
+        Raises:
+            ValueError: If there is no refresh token
+        """
+        # Another caller may have completed the refresh while we waited
+        with self.lock:
+            if (self.tokens.get("access_token") != stale_access_token
+                    and time.time() < self.tokens.get("expires_at", 0)):
+                return self.tokens["access_token"], None
+
+            if "refresh_token" not in self.tokens:
+                raise ValueError("No refresh token available")
+            return None, self.tokens["refresh_token"]
+
+    def _refresh_request_data(self, refresh_token: str) -> Dict[str, str]:
+        """Build the token endpoint form for a refresh token grant."""
         data = {
             "grant_type": "refresh_token",
-            "refresh_token": self.tokens["refresh_token"],
+            "refresh_token": refresh_token,
             "client_id": self.client_id,
         }
         
         # Add client secret if available
         if self.client_secret:
             data["client_secret"] = self.client_secret
-            
-        response = requests.post(self.token_url, data=data)
-        response.raise_for_status()
+        return data
+
+    def _request_refresh(self, refresh_token: str, stale_access_token: Optional[str]) -> str:
+        """Call the token endpoint with the refresh token and store the result."""
+        data = self._refresh_request_data(refresh_token)
+        response = http_client.post(self.token_url, data=data, timeout=self.REFRESH_LEASE_TTL)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            # A rotated refresh token fails with invalid_grant if another process
+            # already used it; prefer the tokens that process persisted
+            if self._adopt_persisted_tokens(stale_access_token):
+                return self.tokens["access_token"]
+            raise
         token_data = response.json()
         
         self.set_tokens(token_data)
+        self._persist_tokens()
         return self.tokens["access_token"]
 
+    async def _request_refresh_async(self, refresh_token: str, stale_access_token: Optional[str]) -> str:
+        """Async variant of _request_refresh over the shared async client."""
+        data = self._refresh_request_data(refresh_token)
+        response = await async_post(self.token_url, data=data, timeout=self.REFRESH_LEASE_TTL)
+        try:
+            raise_for_status(response)
+        except requests.HTTPError:
+            if await asyncio.to_thread(self._adopt_persisted_tokens, stale_access_token):
+                return self.tokens["access_token"]
+            raise
+        token_data = response.json()
+
+        self.set_tokens(token_data)
+        await asyncio.to_thread(self._persist_tokens)
+        return self.tokens["access_token"]
+
+    def _persist_tokens(self) -> None:
+        """Save the current tokens through the token saver, if one is set."""
+        if self._token_saver:
+            try:
+                self._token_saver(self.tokens)
+            except Exception as e:
+                logging.error(f"Failed to persist refreshed tokens: {str(e)}")
+
+    def _adopt_persisted_tokens(self, stale_access_token: Optional[str]) -> bool:
+        """
+        Adopt tokens refreshed by another process, if any.
+
+        Returns:
+            bool: True if valid tokens other than the stale ones were adopted
+        """
+        if not self._token_loader:
+            return False
+        try:
+            persisted = self._token_loader()
+        except Exception as e:
+            logging.error(f"Failed to load persisted tokens: {str(e)}")
+            return False
+
+        if (not persisted
+                or persisted.get("access_token") in (None, stale_access_token)
+                or time.time() >= persisted.get("expires_at", 0)):
+            return False
+
+        with self.lock:
+            self.tokens = dict(persisted)
+        return True
+
     def get_id_token(self):
         """Get the ID token if available."""
         return self.tokens.get("id_token")
@@ -187,6 +453,23 @@ class TokenManager:
             
         return claims
     
+    def get_claim_index(self) -> ClaimIndex:
+        """Get the lookup indexes over the access token claims.
+        
+        The indexes are built once per access token, when it is set.
+        
+        Returns:
+            ClaimIndex: The indexes (empty if there is no access token).
+        """
+        claims = self.tokens.get("access_token_claims")
+        index = self._claim_index
+        # Tokens may also be replaced wholesale (loaded from storage, revoked)
+        if index is None or index.source is not claims:
+            index = ClaimIndex(claims)
+            if isinstance(claims, dict):
+                self._claim_index = index
+        return index
+
     def get_claim(self, key: str, token_type: str = "access_token"):
         """Get a specific claim from the specified token type.
         
@@ -202,10 +485,20 @@ class TokenManager:
         value = claims.get(key)
         return {"name": key, "value": value}
     
-    def revoke_token(self):
-        """ Revoke the current access token. """
+    def _prepare_revocation(self) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Stop using the current access token locally and build the revocation request.
+
+        Returns:
+            The revocation URL and form data, or None if there is no token to revoke
+        """
         if "access_token" not in self.tokens:
-            return  # No token to revoke
+            return None  # No token to revoke
+
+        # A revoked token must not keep passing cached verification
+        verified_token_cache.invalidate(self.tokens["access_token"])
+        if self._refresh_scheduler is not None:
+            self._refresh_scheduler.cancel(self._refresh_schedule_key())
             
         revoke_url = f"{self.token_url.replace('/token', '/revoke')}"
         data = {
@@ -216,11 +509,34 @@ class TokenManager:
         # Add client secret if available
         if self.client_secret:
             data["client_secret"] = self.client_secret
+        return revoke_url, data
+
+    def revoke_token(self):
+        """ Revoke the current access token. """
+        revocation = self._prepare_revocation()
+        if revocation is None:
+            return
+        revoke_url, data = revocation
             
         try:
-            response = requests.post(revoke_url, data=data)
+            response = http_client.post(revoke_url, data=data)
             response.raise_for_status()
         except Exception:
             pass  # Best effort revocation
             
         self.tokens = {}  # Clear stored tokens
+
+    async def revoke_token_async(self):
+        """ Revoke the current access token without blocking the event loop. """
+        revocation = self._prepare_revocation()
+        if revocation is None:
+            return
+        revoke_url, data = revocation
+
+        try:
+            response = await async_post(revoke_url, data=data)
+            raise_for_status(response)
+        except Exception:
+            pass  # Best effort revocation
+
+        self.tokens = {}  # Clear stored tokens
@@ -0,0 +1,243 @@
+"""
+Local verification of Kinde access tokens.
+
+This module verifies JWT access tokens in-process against the signing keys
+published at the issuer's ``/.well-known/jwks.json`` endpoint. Keys are cached
+by ``kid`` so that, once warm, verification needs no network round-trip.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import jwt
+import requests
+
+from kinde_sdk.core.exceptions import KindeTokenException
+from kinde_sdk.core.http_client import http_client
+from kinde_sdk.core.verified_token_cache import VerifiedTokenCache, verified_token_cache
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_issuer(domain_or_issuer: str) -> str:
+    """
+    Normalize a Kinde domain or issuer URL into the issuer form used in tokens.
+
+    Args:
+        domain_or_issuer: Either a bare domain (e.g. "example.kinde.com") or a URL
+
+    Returns:
+        str: The issuer URL without a trailing slash (e.g. "https://example.kinde.com")
+    """
+    issuer = domain_or_issuer.strip().rstrip("/")
+    if not issuer.startswith(("http://", "https://")):
+        issuer = f"https://{issuer}"
+    return issuer
+
+
+class JwksKeyCache:
+    """
+    Thread-safe cache of JSON Web Keys fetched from a JWKS endpoint.
+
+    Keys are indexed by ``kid``. The whole key set is re-fetched when the TTL
+    expires, or when a token references a ``kid`` that is not in the cache
+    (which is how key rotation shows up). Refreshes triggered by unknown keys
+    are rate-limited so that tokens with bogus ``kid`` values cannot be used to
+    hammer the JWKS endpoint.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl: float = 3600,
+        min_refresh_interval: float = 30,
+        timeout: float = 10,
+    ):
+        """
+        Initialize the key cache.
+
+        Args:
+            jwks_url: URL of the JWKS document
+            ttl: Seconds before the cached key set is considered stale
+            min_refresh_interval: Minimum seconds between refreshes caused by unknown ``kid`` values
+            timeout: Timeout in seconds for the JWKS request
+        """
+        self.jwks_url = jwks_url
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._keys: Dict[Optional[str], jwt.PyJWK] = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    def _fetch_keys(self) -> Dict[Optional[str], jwt.PyJWK]:
+        """Fetch and parse the JWKS document."""
+        try:
+            response = http_client.get(self.jwks_url, timeout=self.timeout)
+            response.raise_for_status()
+            jwks = response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise KindeTokenException(f"Failed to fetch JWKS from {self.jwks_url}: {str(e)}") from e
+
+        keys: Dict[Optional[str], jwt.PyJWK] = {}
+        for jwk_data in jwks.get("keys", []):
+            # Only signing keys are relevant for token verification
+            if jwk_data.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[jwk_data.get("kid")] = jwt.PyJWK(jwk_data)
+            except jwt.PyJWKError as e:
+                logger.warning(f"Skipping unusable JWK {jwk_data.get('kid')!r}: {str(e)}")
+
+        if not keys:
+            raise KindeTokenException(f"No usable signing keys found at {self.jwks_url}")
+        return keys
+
+    def _refresh(self) -> None:
+        """Replace the cached keys. Must be called with the lock held."""
+        self._keys = self._fetch_keys()
+        self._fetched_at = time.time()
+
+    def refresh(self) -> None:
+        """Force a refresh of the cached key set."""
+        with self._lock:
+            self._refresh()
+
+    def clear(self) -> None:
+        """Drop all cached keys."""
+        with self._lock:
+            self._keys = {}
+            self._fetched_at = 0.0
+
+    def get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        """
+        Get the signing key for a ``kid``, fetching the key set if needed.
+
+        Args:
+            kid: The key ID from the token header. May be None if the
+                key set contains exactly one key.
+
+        Returns:
+            jwt.PyJWK: The matching key
+
+        Raises:
+            KindeTokenException: If the key cannot be found or the JWKS cannot be fetched
+        """
+        with self._lock:
+            now = time.time()
+            if not self._keys or now - self._fetched_at >= self.ttl:
+                self._refresh()
+            elif kid not in self._keys and now - self._fetched_at >= self.min_refresh_interval:
+                # Unknown kid usually means the signing key was rotated
+                logger.debug(f"Unknown kid {kid!r}, refreshing JWKS")
+                self._refresh()
+
+            key = self._keys.get(kid)
+            if key is None and kid is None and len(self._keys) == 1:
+                key = next(iter(self._keys.values()))
+            if key is None:
+                raise KindeTokenException(f"No signing key found for kid {kid!r}")
+            return key
+
+
+class TokenVerifier:
+    """
+    Verifies Kinde access tokens locally using the issuer's JWKS.
+
+    Checks the signature, ``iss``, ``aud`` (when an audience is configured),
+    ``exp`` and ``nbf`` without contacting the authorization server, except to
+    fetch signing keys on first use, on TTL expiry, or on key rotation.
+    Successful results are kept in a VerifiedTokenCache, so a token that is
+    presented repeatedly is only verified once.
+
+    Example:
+        ```python
+        verifier = TokenVerifier("example.kinde.com", audience="https://api.example.com")
+        claims = verifier.verify(bearer_token)
+        ```
+    """
+
+    DEFAULT_ALGORITHMS = ("RS256",)
+
+    def __init__(
+        self,
+        domain: str,
+        audience: Optional[Union[str, Iterable[str]]] = None,
+        algorithms: Optional[Iterable[str]] = None,
+        leeway: float = 0,
+        key_cache: Optional[JwksKeyCache] = None,
+        jwks_ttl: float = 3600,
+        cache: Optional[VerifiedTokenCache] = verified_token_cache,
+    ):
+        """
+        Initialize the verifier.
+
+        Args:
+            domain: Kinde domain or issuer URL (e.g. "example.kinde.com")
+            audience: Expected audience(s). If None, ``aud`` is not checked.
+            algorithms: Accepted signing algorithms (defaults to RS256)
+            leeway: Clock skew tolerance in seconds for ``exp`` and ``nbf``
+            key_cache: Optional pre-configured key cache (e.g. shared between verifiers)
+            jwks_ttl: TTL for the key cache created when ``key_cache`` is not given
+            cache: Cache for verified claims. Defaults to the shared
+                ``verified_token_cache``; pass None to disable caching.
+        """
+        self.issuer = normalize_issuer(domain)
+        self.audience = audience if audience is None or isinstance(audience, str) else list(audience)
+        self.algorithms: List[str] = list(algorithms or self.DEFAULT_ALGORITHMS)
+        self.leeway = leeway
+        self.key_cache = key_cache or JwksKeyCache(f"{self.issuer}/.well-known/jwks.json", ttl=jwks_ttl)
+        self.cache = cache
+        # Cached claims are only valid for the same issuer/audience/algorithms
+        self._cache_context = f"jwks|{self.issuer}|{self.audience}|{','.join(self.algorithms)}"
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Verify a token and return its claims.
+
+        Args:
+            token: The raw JWT
+
+        Returns:
+            Dict[str, Any]: The verified claims
+
+        Raises:
+            KindeTokenException: If the token is malformed, expired, not yet
+                valid, has the wrong issuer or audience, or has an invalid signature
+        """
+        if self.cache is not None:
+            claims = self.cache.get(token, self._cache_context)
+            if claims is not None:
+                return claims
+
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError as e:
+            raise KindeTokenException(f"Invalid token header: {str(e)}") from e
+
+        if header.get("alg") not in self.algorithms:
+            raise KindeTokenException(f"Unsupported token algorithm: {header.get('alg')!r}")
+
+        signing_key = self.key_cache.get_signing_key(header.get("kid"))
+
+        try:
+            claims = jwt.decode(
+                token,
+                key=signing_key.key,
+                algorithms=self.algorithms,
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.leeway,
+                options={
+                    "require": ["exp", "iss"],
+                    "verify_aud": self.audience is not None,
+                },
+            )
+        except jwt.PyJWTError as e:
+            raise KindeTokenException(f"Token verification failed: {str(e)}") from e
+
+        if self.cache is not None:
+            self.cache.set(token, claims, self._cache_context)
+        return claims
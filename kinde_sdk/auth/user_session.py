@@ -1,8 +1,14 @@
 from .token_manager import TokenManager
+import logging
 import threading
 import time
 from typing import Dict, Any, Optional
 from kinde_sdk.core.storage.storage_manager import StorageManager
+from kinde_sdk.core.storage.framework_aware_storage import FrameworkAwareStorage
+from kinde_sdk.core.account_api_cache import account_api_cache
+from kinde_sdk.core.framework.framework_context import FrameworkContext
+
+logger = logging.getLogger(__name__)
 
 class UserSession:
     def __init__(self):
@@ -13,47 +19,100 @@ class UserSession:
     def set_user_data(self, user_id: str, user_info: Dict[str, Any], token_data: Dict[str, Any]):
         """Store user session details and associate tokens."""
         with self.lock:  # Acquire the lock
-            if user_id not in self.user_sessions:
-                # Create new token manager
-                token_manager = TokenManager(
-                    user_id, 
-                    user_info["client_id"], 
-                    user_info.get("client_secret"),  # May be None for PKCE flow
-                    user_info["token_url"]
-                )
-                
-                # Set redirect URI if available
-                if "redirect_uri" in user_info:
-                    token_manager.set_redirect_uri(user_info["redirect_uri"])
-                
-                self.user_sessions[user_id] = {
-                    "user_info": user_info,
-                    "token_manager": token_manager
-                }
-            else:
-                # Update existing user info
-                self.user_sessions[user_id]["user_info"] = user_info
-            
-            # Set tokens in token manager
-            self.user_sessions[user_id]["token_manager"].set_tokens(token_data)
+            self._update_session(user_id, user_info, token_data)
             
             # Save to persistent storage
             self._save_to_storage(user_id)
+
+    async def set_user_data_async(self, user_id: str, user_info: Dict[str, Any], token_data: Dict[str, Any]):
+        """Store user session details and associate tokens without blocking the event loop."""
+        with self.lock:
+            self._update_session(user_id, user_info, token_data)
+            serialized_data = self._serialize_session(user_id)
+        
+        # Save outside the lock, so other coroutines are not blocked on it
+        if serialized_data:
+            await self.storage_manager.setItems_async(user_id, serialized_data)
+
+    def _update_session(self, user_id: str, user_info: Dict[str, Any], token_data: Dict[str, Any]):
+        """Create or update the in-memory session; the caller holds self.lock."""
+        if user_id not in self.user_sessions:
+            # Create new token manager
+            token_manager = TokenManager(
+                user_id, 
+                user_info["client_id"], 
+                user_info.get("client_secret"),  # May be None for PKCE flow
+                user_info["token_url"]
+            )
+            
+            # Set redirect URI if available
+            if "redirect_uri" in user_info:
+                token_manager.set_redirect_uri(user_info["redirect_uri"])
+
+            self._connect_token_persistence(user_id, token_manager)
+            
+            self.user_sessions[user_id] = {
+                "user_info": user_info,
+                "token_manager": token_manager
+            }
+        else:
+            # Update existing user info
+            self.user_sessions[user_id]["user_info"] = user_info
+        
+        # Set tokens in token manager
+        self.user_sessions[user_id]["token_manager"].set_tokens(token_data)
+
+    def _serialize_session(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get the session data to store; token manager can't be directly serialized."""
+        session_data = self.user_sessions.get(user_id)
+        if not session_data:
+            return None
+        return {
+            "user_info": session_data["user_info"],
+            "tokens": session_data["token_manager"].tokens,
+        }
     
     def _save_to_storage(self, user_id: str):
         """Save session data to storage."""
-        session_data = self.user_sessions.get(user_id)
-        if session_data:
-            # We need to serialize the session data
-            # Token manager can't be directly serialized
-            serialized_data = {
-                "user_info": session_data["user_info"],
-                "tokens": session_data["token_manager"].tokens,
-            }
+        serialized_data = self._serialize_session(user_id)
+        if serialized_data:
             # Store with user: prefix to make it user-specific but device-independent
             # if you want device-specific sessions, remove the "user:" prefix
             self.storage_manager.setItems(user_id, serialized_data)
 
+    def _connect_token_persistence(self, user_id: str, token_manager: TokenManager) -> None:
+        """
+        Let the token manager persist refreshed tokens and pick up tokens
+        refreshed by other processes sharing the same storage.
+        """
+        def load_tokens() -> Optional[Dict[str, Any]]:
+            if not self._storage_reachable():
+                return None
+            session_data = self.storage_manager.get(user_id)
+            return session_data.get("tokens") if session_data else None
+
+        def save_tokens(tokens: Dict[str, Any]) -> None:
+            if not self._storage_reachable():
+                logger.debug(f"Not persisting refreshed tokens for {user_id}: session storage needs a request")
+                return
+            # Refreshes run on request and scheduler threads; read the session under the lock
+            with self.lock:
+                serialized_data = self._serialize_session(user_id)
+            if serialized_data:
+                self.storage_manager.setItems(user_id, serialized_data)
+
+        token_manager.set_token_persistence(load_tokens, save_tokens)
+
+    def _storage_reachable(self) -> bool:
+        """
+        Whether session storage can be used from the current thread.
+
+        Framework session storages read and write the current request's
+        session, so a background token refresh has nothing to persist to.
+        """
+        storage = self.storage_manager.storage
+        return not isinstance(storage, FrameworkAwareStorage) or FrameworkContext.get_request() is not None
+
     def reset(self):
         """Reset all session data - useful for testing"""
         with self.lock:
@@ -68,9 +127,37 @@ class UserSession:
         if user_id in self.user_sessions:
             return True
             
-        session_data = self.storage_manager.get(user_id)
-        if not session_data:
+        session = self._session_from_data(user_id, self.storage_manager.get(user_id))
+        if session is None:
             return False
+        
+        # Store in memory
+        self.user_sessions[user_id] = session
+        return True
+
+    async def _load_from_storage_async(self, user_id: str) -> bool:
+        """
+        Load session data from storage if not already in memory, without
+        blocking the event loop. Called without self.lock, which is only
+        taken to publish the loaded session.
+        """
+        if user_id in self.user_sessions:
+            return True
+            
+        session_data = await self.storage_manager.get_async(user_id)
+        with self.lock:
+            if user_id in self.user_sessions:
+                return True
+            session = self._session_from_data(user_id, session_data)
+            if session is None:
+                return False
+            self.user_sessions[user_id] = session
+            return True
+
+    def _session_from_data(self, user_id: str, session_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Build the in-memory session from stored session data, or None if incomplete."""
+        if not session_data:
+            return None
             
         # Verify we have all the required data
         user_info = session_data.get("user_info", {})
@@ -81,7 +168,7 @@ class UserSession:
             "client_id" not in user_info or 
             "token_url" not in user_info or
             "access_token" not in tokens):
-            return False
+            return None
             
         
         token_manager = TokenManager(
@@ -97,14 +184,12 @@ class UserSession:
             
         # Set tokens
         token_manager.tokens = tokens
+        self._connect_token_persistence(user_id, token_manager)
         
-        # Store in memory
-        self.user_sessions[user_id] = {
+        return {
             "user_info": user_info,
             "token_manager": token_manager
         }
-        
-        return True
 
     def get_user_data(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve stored user session details."""
@@ -116,6 +201,18 @@ class UserSession:
                     
             return self.user_sessions.get(user_id, {}).get("user_info")
 
+    async def get_user_data_async(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve stored user session details without blocking the event loop."""
+        if not await self._load_from_storage_async(user_id):
+            return None
+        return self.user_sessions.get(user_id, {}).get("user_info")
+
+    async def get_token_manager_async(self, user_id: str) -> Optional[TokenManager]:
+        """Get the token manager for a user without blocking the event loop."""
+        if not await self._load_from_storage_async(user_id):
+            return None
+        return self.user_sessions.get(user_id, {}).get("token_manager")
+
     def get_token_manager(self, user_id: str) -> Optional[TokenManager]:
         """Get the token manager for a user."""
         with self.lock:
@@ -145,8 +242,25 @@ class UserSession:
             # Any other error means authentication failed
             return False
 
+    async def is_authenticated_async(self, user_id: str) -> bool:
+        """Check if the user is authenticated, refreshing without blocking the event loop."""
+        token_manager = await self.get_token_manager_async(user_id)
+        if not token_manager:
+            return False
+
+        try:
+            access_token = await token_manager.get_access_token_async()
+            return access_token is not None and len(access_token) > 0
+        except Exception:
+            # Expired and not refreshable, or the refresh failed
+            return False
+
     def logout(self, user_id: str) -> None:
         """Clear user session and tokens."""
+        # Drop cached Account API responses
+        account_api_cache.invalidate(user_id=user_id)
+        FrameworkContext.clear_auth_context()
+        
         with self.lock:
             # Try to load from storage if not in memory
             if user_id not in self.user_sessions:
@@ -168,6 +282,27 @@ class UserSession:
             # Delete from storage
             self.storage_manager.clear_device_data()
 
+    async def logout_async(self, user_id: str) -> None:
+        """Clear user session and tokens, revoking the token without blocking the event loop."""
+        account_api_cache.invalidate(user_id=user_id)
+        FrameworkContext.clear_auth_context()
+        
+        # Try to load from storage if not in memory
+        if not await self._load_from_storage_async(user_id):
+            return  # No session to clear
+        
+        with self.lock:
+            session = self.user_sessions.pop(user_id, {})
+        await self.storage_manager.clear_device_data_async()
+
+        # Revoke outside the lock; the session is already gone locally
+        token_manager = session.get("token_manager")
+        if token_manager:
+            try:
+                await token_manager.revoke_token_async()
+            except Exception:
+                pass  # Best effort
+
     def cleanup_expired_sessions(self) -> None:
         """Remove expired sessions from memory and storage."""
         with self.lock:
@@ -191,5 +326,5 @@ class UserSession:
             for user_id in expired_users:
                 if user_id in self.user_sessions:
                     del self.user_sessions[user_id]
-                # self.storage.delete(user_id)
-                self.storage_manager.delete(user_id)
\ No newline at end of file
+            if expired_users:
+                self.storage_manager.delete_many(expired_users)
\ No newline at end of file
@@ -0,0 +1,295 @@
+"""
+Cache of Account API responses for ``force_api`` lookups.
+
+With ``force_api`` enabled every ``get_flag``/``get_permission``/``get_role``
+call used to fetch the full list from the Account API, so checking ten flags
+meant ten identical requests. This module can keep the responses per user,
+organization and endpoint for a short TTL, so one fetch serves every lookup
+in its freshness window.
+
+Caching is off by default: ``force_api`` asks for data read from the server,
+and a cached response can be up to ``ttl + stale_ttl`` seconds old. Enable it
+with ``configure_account_api_cache(ttl=30)`` when that staleness is acceptable.
+
+After the TTL an entry can still be served for ``stale_ttl`` seconds while it
+is refreshed in the background (stale-while-revalidate). Concurrent misses
+for the same key share a single fetch.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+logger = logging.getLogger("kinde_sdk")
+
+# Matches any value in AccountApiCache.invalidate
+_ANY = object()
+
+
+class AccountApiCache:
+    """
+    Thread-safe LRU/TTL cache of Account API responses.
+
+    Keys are ``(user_id, org_code, endpoint)`` tuples. ``None`` responses are
+    never cached.
+
+    Invalidating a user only discards that user's entries and in-flight
+    fetches: each user has a generation, bumped on invalidation, that a fetch
+    must still match to be stored. Keys are indexed by user, so a per-user
+    invalidation touches only that user's keys.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 0, stale_ttl: float = 30):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before the least recently used is evicted
+            ttl: Seconds a response is served without refetching (0, the default,
+                disables caching)
+            stale_ttl: Seconds after ``ttl`` during which the old response is still
+                served while a background refresh runs (0 disables this)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Tuple, tuple]" = OrderedDict()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._refreshing: Set[Tuple] = set()
+        # Keys with an entry or a fetch in progress, by user_id
+        self._user_keys: Dict[Hashable, Set[Tuple]] = {}
+        # Bumped by invalidate(user_id=...); kept while the user has keys
+        self._user_generations: Dict[Hashable, int] = {}
+        # Bumped by clear(), configure() and invalidations not limited to a user
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def configure(self, max_size: Optional[int] = None, ttl: Optional[float] = None,
+                  stale_ttl: Optional[float] = None) -> None:
+        """
+        Change the cache settings. Arguments left as None are unchanged.
+
+        Args:
+            max_size: Maximum number of entries
+            ttl: Freshness lifetime in seconds (0 disables caching)
+            stale_ttl: Stale-while-revalidate window in seconds
+        """
+        with self._lock:
+            if max_size is not None:
+                self.max_size = max_size
+            if ttl is not None:
+                self.ttl = ttl
+            if stale_ttl is not None:
+                self.stale_ttl = stale_ttl
+            self._clear_entries()
+
+    @staticmethod
+    def make_key(user_id: Hashable, org_code: Optional[str], endpoint: str) -> Tuple:
+        """Build the cache key for a user's response from an endpoint."""
+        return (user_id, org_code, endpoint)
+
+    def get_or_fetch(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Get a cached response, or fetch and cache it.
+
+        Args:
+            key: Key from make_key
+            fetch: Performs the API call. It may run on a background thread
+                when a stale entry is refreshed, so it must not depend on
+                request-scoped state.
+
+        Returns:
+            Any: The response
+
+        Raises:
+            Exception: Whatever ``fetch`` raises on a miss
+        """
+        if self.ttl <= 0:
+            return fetch()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, fresh_until, stale_until = entry
+                if now < fresh_until:
+                    self._entries.move_to_end(key)
+                    return value
+                if now < stale_until:
+                    self._entries.move_to_end(key)
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        self._get_executor().submit(self._refresh, key, fetch, self._generation_of(key))
+                    return value
+                del self._entries[key]
+                self._untrack(key)
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+                self._track(key)
+            generation = self._generation_of(key)
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+                self._untrack(key)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._store(key, value, generation)
+            self._inflight.pop(key, None)
+            self._untrack(key)
+        future.set_result(value)
+        return value
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """
+        Get a fresh cached response without fetching.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Optional[Any]: The response, or None if it is missing or expired
+        """
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() >= entry[1]:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Tuple, value: Any) -> None:
+        """
+        Store a response fetched outside get_or_fetch (e.g. assembled from pages).
+
+        Args:
+            key: Key from make_key
+            value: The response (None is ignored)
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._store(key, value, self._generation_of(key))
+
+    def _refresh(self, key: Tuple, fetch: Callable[[], Any], generation: Tuple[int, int]) -> None:
+        """Refetch a stale entry in the background."""
+        try:
+            value = fetch()
+        except Exception as e:
+            logger.debug(f"Background refresh of Account API response failed: {e}")
+            value = None
+        with self._lock:
+            self._refreshing.discard(key)
+            self._store(key, value, generation)
+            self._untrack(key)
+
+    def _generation_of(self, key: Tuple) -> Tuple[int, int]:
+        """The generation a fetch for ``key`` must still match to be stored. Lock held."""
+        return self._generation, self._user_generations.get(key[0], 0)
+
+    def _track(self, key: Tuple) -> None:
+        """Index a key under its user. Lock held."""
+        self._user_keys.setdefault(key[0], set()).add(key)
+
+    def _untrack(self, key: Tuple) -> None:
+        """Drop a key from the index once it has no entry and no fetch. Lock held."""
+        if key in self._entries or key in self._inflight or key in self._refreshing:
+            return
+        user_id = key[0]
+        keys = self._user_keys.get(user_id)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            # No fetch of this user can still hold the old generation
+            del self._user_keys[user_id]
+            self._user_generations.pop(user_id, None)
+
+    def _store(self, key: Tuple, value: Any, generation: Tuple[int, int]) -> None:
+        """Store a fetched value. Must be called with the lock held."""
+        # Skip values fetched before an invalidation, which may be out of date
+        if value is None or generation != self._generation_of(key):
+            return
+        fresh_until = time.monotonic() + self.ttl
+        self._entries[key] = (value, fresh_until, fresh_until + self.stale_ttl)
+        self._entries.move_to_end(key)
+        self._track(key)
+        while len(self._entries) > self.max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._untrack(evicted)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="kinde-account-api")
+        return self._executor
+
+    def invalidate(self, user_id: Any = _ANY, org_code: Any = _ANY, endpoint: Any = _ANY) -> None:
+        """
+        Remove the entries matching all given arguments, e.g. on logout or
+        after changing a user's permissions.
+
+        Args:
+            user_id: Only remove this user's entries
+            org_code: Only remove entries for this organization
+            endpoint: Only remove entries for this endpoint (e.g. "get_feature_flags")
+        """
+        pattern = (user_id, org_code, endpoint)
+        with self._lock:
+            if user_id is _ANY:
+                candidates = list(self._entries)
+            else:
+                candidates = list(self._user_keys.get(user_id, ()))
+            for key in [k for k in candidates if all(p is _ANY or p == v for p, v in zip(pattern, k))]:
+                if self._entries.pop(key, None) is not None:
+                    self._untrack(key)
+            if user_id is _ANY:
+                self._generation += 1
+            elif user_id in self._user_keys:
+                # Discard this user's in-flight fetches; other users' are unaffected
+                self._user_generations[user_id] = self._user_generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._clear_entries()
+
+    def _clear_entries(self) -> None:
+        """Remove all entries and discard fetches in progress. Lock held."""
+        for key in list(self._entries):
+            del self._entries[key]
+            self._untrack(key)
+        self._generation += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared instance used by the force_api paths of FeatureFlags, Permissions and Roles,
+# and by Entitlements clients created with use_cache
+account_api_cache = AccountApiCache()
+
+
+def configure_account_api_cache(**kwargs: Any) -> None:
+    """
+    Configure the shared Account API cache.
+
+    Args:
+        **kwargs: See AccountApiCache.configure
+    """
+    account_api_cache.configure(**kwargs)
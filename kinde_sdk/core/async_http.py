@@ -0,0 +1,151 @@
+"""
+Shared async HTTP transport for the OAuth endpoints.
+
+The async OAuth paths (code exchange, userinfo, revocation, portal links) use
+a pooled ``httpx.AsyncClient`` instead of blocking ``requests`` calls, so they
+never stall the event loop. One client is kept per event loop, because httpx
+connections are bound to the loop they were opened on. Code that runs a
+coroutine on a short-lived loop (``asyncio.run``, a loop per request) wraps it
+in ``closing_async_client`` so that loop's client is closed with it.
+
+Errors are raised as the ``requests`` exceptions the sync SDK already raises
+(``requests.HTTPError``, ``requests.Timeout``, ...), so callers handle both
+paths the same way.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Optional, TypeVar
+
+import httpx
+import requests
+
+from kinde_sdk.core.sdk_headers import sdk_headers
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+_custom_client: Optional[httpx.AsyncClient] = None
+
+T = TypeVar("T")
+
+
+def set_async_client(client: Optional[httpx.AsyncClient]) -> None:
+    """
+    Use a custom client for all async OAuth requests (e.g. for proxies or custom limits).
+
+    Args:
+        client: The client to use, or None to go back to the per-loop default clients
+    """
+    global _custom_client
+    _custom_client = client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared client for the running event loop.
+
+    Returns:
+        httpx.AsyncClient: The pooled client
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    if _custom_client is not None:
+        return _custom_client
+
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS)
+            _clients[loop] = client
+        return client
+
+
+async def close_async_client() -> None:
+    """Close the shared client of the running event loop, e.g. on application shutdown."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+async def closing_async_client(awaitable: Awaitable[T]) -> T:
+    """
+    Await ``awaitable``, then close the running loop's shared client.
+
+    Use it for coroutines run on a loop that is closed afterwards, e.g.
+    ``asyncio.run(closing_async_client(coro))``; otherwise the client and its
+    pooled connections outlive the loop.
+
+    Args:
+        awaitable: The coroutine to run
+
+    Returns:
+        The result of ``awaitable``
+    """
+    try:
+        return await awaitable
+    finally:
+        await close_async_client()
+
+
+def raise_for_status(response: httpx.Response) -> None:
+    """
+    Raise ``requests.HTTPError`` for 4xx/5xx responses.
+
+    Args:
+        response: The response to check
+
+    Raises:
+        requests.HTTPError: If the response has an error status
+    """
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        # httpx responses provide the json()/status_code/text that error handlers read
+        raise requests.HTTPError(str(e), response=response) from e
+
+
+async def async_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """
+    Send a request on the shared client.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        **kwargs: Passed to ``httpx.AsyncClient.request`` (headers, data, timeout, ...).
+            The SDK headers are added to ``headers``.
+
+    Returns:
+        httpx.Response: The response, whatever its status
+
+    Raises:
+        requests.Timeout: If the request timed out
+        requests.ConnectionError: If the connection failed
+        requests.RequestException: For any other transport error
+    """
+    kwargs["headers"] = sdk_headers.merge(kwargs.get("headers"))
+    try:
+        return await get_async_client().request(method, url, **kwargs)
+    except httpx.TimeoutException as e:
+        raise requests.Timeout(str(e)) from e
+    except httpx.TransportError as e:
+        raise requests.ConnectionError(str(e)) from e
+    except httpx.HTTPError as e:
+        raise requests.RequestException(str(e)) from e
+
+
+async def async_get(url: str, **kwargs: Any) -> httpx.Response:
+    """Send a GET request on the shared client. See async_request."""
+    return await async_request("GET", url, **kwargs)
+
+
+async def async_post(url: str, **kwargs: Any) -> httpx.Response:
+    """Send a POST request on the shared client. See async_request."""
+    return await async_request("POST", url, **kwargs)
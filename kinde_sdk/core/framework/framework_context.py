@@ -8,6 +8,7 @@ class FrameworkContext:
     without needing to pass it through the entire call chain.
     """
     _context = contextvars.ContextVar('framework_context', default=None)
+    _auth_context = contextvars.ContextVar('framework_auth_context', default=None)
     
     @classmethod
     def set_request(cls, request: Any) -> None:
@@ -18,6 +19,7 @@ class FrameworkContext:
             request (Any): The framework-specific request object
         """
         cls._context.set(request)
+        cls._auth_context.set(None)
         
     @classmethod
     def get_request(cls) -> Optional[Any]:
@@ -34,4 +36,35 @@ class FrameworkContext:
         """
         Clear the current request object from the context-local storage.
         """
-        cls._context.set(None) 
\ No newline at end of file
+        cls._context.set(None)
+        cls._auth_context.set(None)
+
+    @classmethod
+    def get_auth_context(cls) -> Optional[Any]:
+        """
+        Get the authorization context built for the current request.
+        
+        Returns:
+            Optional[Any]: The kinde_sdk.auth.auth_context.AuthContext, or None if not built yet
+        """
+        return cls._auth_context.get()
+
+    @classmethod
+    def set_auth_context(cls, auth_context: Any) -> None:
+        """
+        Store the authorization context for the current request.
+        It is discarded when the request is set or cleared.
+        
+        Args:
+            auth_context (Any): The kinde_sdk.auth.auth_context.AuthContext
+        """
+        cls._auth_context.set(auth_context)
+
+    @classmethod
+    def clear_auth_context(cls) -> None:
+        """
+        Discard the authorization context of the current request, e.g. after
+        the user's tokens change.
+        """
+        cls._auth_context.set(None)
+ 
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Shared frontend (Account API) clients.
+
+Each ``kinde_sdk.frontend.api_client.ApiClient`` owns a urllib3 PoolManager.
+Building one per Account API call (as ``force_api`` lookups used to) opens a
+new connection every time. The FrontendClientPool keeps one long-lived,
+thread-safe ApiClient per Kinde host, and ``authenticated_client`` wraps it
+with a per-request bearer token, so users share warm connections without
+sharing credentials.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from kinde_sdk.core.http_client import http_client
+from kinde_sdk.core.sdk_headers import sdk_headers
+
+
+class FrontendClientPool:
+    """Long-lived frontend ApiClients, one per Kinde host."""
+
+    def __init__(self, pool_maxsize: Optional[int] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            pool_maxsize: Maximum connections kept alive per host (generator default if None)
+        """
+        self.pool_maxsize = pool_maxsize
+        self._clients: Dict[Optional[str], Any] = {}
+        self._lock = threading.Lock()
+
+    def get_client(self, host: Optional[str] = None):
+        """
+        Get the shared ApiClient for a host, creating it on first use.
+
+        Args:
+            host: Base URL of the Kinde domain (e.g. "https://example.kinde.com").
+                If None, the frontend Configuration default is used.
+
+        Returns:
+            kinde_sdk.frontend.api_client.ApiClient: The shared client. It holds
+            no access token; use authenticated_client to make calls.
+        """
+        client = self._clients.get(host)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                from kinde_sdk.frontend.api_client import ApiClient
+                from kinde_sdk.frontend.configuration import Configuration
+
+                config = Configuration(host=host)
+                if self.pool_maxsize is not None:
+                    config.connection_pool_maxsize = self.pool_maxsize
+                client = ApiClient(configuration=config)
+                sdk_headers.apply_to(client)
+                self._clients[host] = client
+            return client
+
+    def authenticated_client(self, access_token: str, host: Optional[str] = None) -> "AuthenticatedApiClient":
+        """
+        Get a client that sends ``access_token`` on the shared connection pool of ``host``.
+
+        Args:
+            access_token: The user's access token
+            host: Base URL of the Kinde domain
+
+        Returns:
+            AuthenticatedApiClient: A lightweight wrapper to pass as ``api_client`` to an API class
+        """
+        return AuthenticatedApiClient(self.get_client(host), access_token)
+
+    def close(self) -> None:
+        """Close all pooled connections. Clients are recreated on next use."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.rest_client.pool_manager.clear()
+
+
+class AuthenticatedApiClient:
+    """
+    Adds a bearer token to every request made through a shared ApiClient.
+
+    Everything except request serialization and sending is delegated to the
+    shared client. Calls without an explicit timeout use the ``account_api``
+    timeout of the shared HTTP client settings.
+    """
+
+    def __init__(self, api_client, access_token: str):
+        self._api_client = api_client
+        self._request_auth = {
+            "in": "header",
+            "type": "bearer",
+            "key": "Authorization",
+            "value": f"Bearer {access_token}",
+        }
+
+    def __getattr__(self, name: str):
+        return getattr(self._api_client, name)
+
+    def param_serialize(self, *args, _request_auth=None, **kwargs):
+        return self._api_client.param_serialize(*args, _request_auth=_request_auth or self._request_auth, **kwargs)
+
+    def call_api(self, *args, _request_timeout=None, **kwargs):
+        if _request_timeout is None:
+            _request_timeout = http_client.timeouts["account_api"]
+        return self._api_client.call_api(*args, _request_timeout=_request_timeout, **kwargs)
+
+
+# Shared pool used by the force_api lookups of FeatureFlags, Permissions and Roles
+frontend_client_pool = FrontendClientPool()
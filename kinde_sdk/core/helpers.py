@@ -9,6 +9,9 @@ import time
 import asyncio
 from typing import Dict, Union, Any, Optional, List
 
+from kinde_sdk.core.async_http import async_get, closing_async_client, raise_for_status
+from kinde_sdk.core.http_client import http_client
+
 logger = logging.getLogger("kinde_sdk")
 
 def generate_random_string(length: int = 32) -> str:
@@ -86,8 +89,8 @@ async def get_user_details(userinfo_url: str, token_manager, logger) -> Dict[str
         requests.RequestException: If the API request fails
     """
     try:
-        # Get access token
-        access_token = token_manager.get_access_token()
+        # Get access token, refreshing it without blocking the event loop
+        access_token = await token_manager.get_access_token_async()
         
         # Set up request headers
         headers = {
@@ -95,9 +98,9 @@ async def get_user_details(userinfo_url: str, token_manager, logger) -> Dict[str
             "Accept": "application/json"
         }
         
-        # Make the request to userinfo endpoint
-        response = requests.get(userinfo_url, headers=headers)
-        response.raise_for_status()
+        # Make the request to userinfo endpoint without blocking the event loop
+        response = await async_get(userinfo_url, headers=headers)
+        raise_for_status(response)
         
         # Return user profile data
         return response.json()
@@ -198,7 +201,7 @@ def get_user_organizations(api_url: str, token_manager, logger) -> List[Dict[str
         
         # Make the request to organizations endpoint
         orgs_url = f"{api_url}/user/organizations"
-        response = requests.get(orgs_url, headers=headers)
+        response = http_client.get(orgs_url, headers=headers)
         response.raise_for_status()
         
         # Return organizations data
@@ -252,7 +255,7 @@ def get_organization_details(api_url: str, org_code: str, token_manager, logger)
         
         # Make the request to organization details endpoint
         org_url = f"{api_url}/organization/{org_code}"
-        response = requests.get(org_url, headers=headers)
+        response = http_client.get(org_url, headers=headers)
         response.raise_for_status()
         
         # Return organization data
@@ -305,7 +308,7 @@ def get_organization_users(api_url: str, org_code: str, token_manager, logger) -
         
         # Make the request to organization users endpoint
         users_url = f"{api_url}/organization/{org_code}/users"
-        response = requests.get(users_url, headers=headers)
+        response = http_client.get(users_url, headers=headers)
         response.raise_for_status()
         
         # Return users data
@@ -364,7 +367,7 @@ def get_user_permissions(api_url: str, token_manager, org_code: Optional[str] =
             permissions_url = f"{api_url}/user/permissions"
             
         # Make the request to permissions endpoint
-        response = requests.get(permissions_url, headers=headers)
+        response = http_client.get(permissions_url, headers=headers)
         response.raise_for_status()
         
         # Return permissions data
@@ -455,7 +458,7 @@ def get_user_roles(api_url: str, token_manager, org_code: Optional[str] = None,
             roles_url = f"{api_url}/user/roles"
             
         # Make the request to roles endpoint
-        response = requests.get(roles_url, headers=headers)
+        response = http_client.get(roles_url, headers=headers)
         response.raise_for_status()
         
         # Return roles data
@@ -544,7 +547,7 @@ def get_flag_value(api_url: str, flag_code: str, default_value: Any, token_manag
             flag_url = f"{api_url}/feature-flags/{flag_code}"
             
         # Make the request to flag endpoint
-        response = requests.get(flag_url, headers=headers)
+        response = http_client.get(flag_url, headers=headers)
         response.raise_for_status()
         
         # Parse the response
@@ -723,9 +726,9 @@ def get_user_details_sync(userinfo_url: str, token_manager, logger) -> Dict[str,
             "Authorization": f"Bearer {access_token}",
             "Accept": "application/json"
         }
-        response = requests.get(userinfo_url, headers=headers)
+        response = http_client.get(userinfo_url, headers=headers)
         response.raise_for_status()
         return response.json()
     except RuntimeError:
         # No event loop running (Flask), use asyncio.run
-        return asyncio.run(get_user_details(userinfo_url, token_manager, logger))
\ No newline at end of file
+        return asyncio.run(closing_async_client(get_user_details(userinfo_url, token_manager, logger)))
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+Shared HTTP transport for the sync auth and token requests.
+
+Module-level ``requests.get``/``requests.post`` open a new TCP+TLS connection
+per call and have no timeout. The HttpClient keeps one pooled
+``requests.Session`` (keep-alive connections are reused across calls and
+threads), applies per-endpoint timeouts and retries transient failures.
+All SDK modules share the ``http_client`` instance, which can be tuned with
+``configure_http_client``.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from kinde_sdk.core.sdk_headers import sdk_headers
+
+# Timeouts in seconds, by endpoint name (see HttpClient.endpoint_for)
+DEFAULT_TIMEOUTS: Dict[str, float] = {
+    "token": 30,
+    "introspect": 30,
+    "revoke": 10,
+    "userinfo": 10,
+    "account_api": 10,
+    "discovery": 10,
+    "jwks": 10,
+    "default": 30,
+}
+
+# URL path fragments identifying each endpoint, checked in order
+_ENDPOINT_PATHS = (
+    ("/oauth2/token", "token"),
+    ("/oauth2/introspect", "introspect"),
+    ("/oauth2/revoke", "revoke"),
+    ("/oauth2/userinfo", "userinfo"),
+    ("/oauth2/v2/user_profile", "userinfo"),
+    ("/account_api/", "account_api"),
+    ("/.well-known/openid-configuration", "discovery"),
+    ("/.well-known/jwks.json", "jwks"),
+)
+
+
+class HttpClient:
+    """
+    Pooled, thread-safe HTTP client with per-endpoint timeouts and retries.
+
+    Connection failures are retried for every method, since the request was
+    never sent. Read failures and 502/503/504 responses are only retried for
+    idempotent methods: authorization codes and refresh tokens are single-use,
+    so token requests must not be replayed.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        retries: int = 2,
+        backoff_factor: float = 0.3,
+        timeouts: Optional[Dict[str, float]] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            pool_connections: Number of hosts to keep connection pools for
+            pool_maxsize: Maximum connections kept alive per host
+            retries: Maximum retries for transient failures (0 disables retries)
+            backoff_factor: Exponential backoff factor between retries
+            timeouts: Overrides for DEFAULT_TIMEOUTS, by endpoint name
+            session: A pre-configured session to use instead of building one.
+                Pool and retry settings are not applied to it.
+        """
+        self._lock = threading.Lock()
+        self.timeouts: Dict[str, float] = dict(DEFAULT_TIMEOUTS)
+        self.session: Optional[requests.Session] = None
+        self.configure(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            timeouts=timeouts,
+            session=session,
+        )
+
+    def configure(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        retries: int = 2,
+        backoff_factor: float = 0.3,
+        timeouts: Optional[Dict[str, float]] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        """
+        Replace the underlying session. Takes the same arguments as the constructor.
+
+        The previous session is closed; requests already in flight on it
+        still complete, and their connections are closed when released.
+        As with the other settings, omitted timeouts go back to
+        DEFAULT_TIMEOUTS rather than keeping earlier overrides.
+        """
+        if session is None:
+            session = requests.Session()
+            retry = Retry(
+                total=retries,
+                connect=retries,
+                read=retries,
+                status=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=retry,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+        with self._lock:
+            previous, self.session = self.session, session
+            self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        if previous is not None and previous is not session:
+            previous.close()
+
+    @staticmethod
+    def endpoint_for(url: str) -> str:
+        """
+        Get the endpoint name used to look up the timeout for a URL.
+
+        Args:
+            url: The request URL
+
+        Returns:
+            str: An endpoint name from DEFAULT_TIMEOUTS
+        """
+        path = urlparse(url).path
+        for fragment, endpoint in _ENDPOINT_PATHS:
+            if fragment in path:
+                return endpoint
+        return "default"
+
+    def timeout_for(self, url: str) -> float:
+        """Get the timeout in seconds for a request to ``url``."""
+        return self.timeouts.get(self.endpoint_for(url), self.timeouts["default"])
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request on the pooled session.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed to ``requests.Session.request``. ``timeout``
+                defaults to the endpoint's configured timeout, and the SDK
+                headers are added to ``headers``.
+
+        Returns:
+            requests.Response: The response
+        """
+        kwargs.setdefault("timeout", self.timeout_for(url))
+        kwargs["headers"] = sdk_headers.merge(kwargs.get("headers"))
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request. See request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request. See request."""
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+# Shared instance used by helpers, TokenManager, OAuth and ManagementTokenManager
+http_client = HttpClient()
+
+
+def configure_http_client(**kwargs: Any) -> None:
+    """
+    Configure the shared HTTP client.
+
+    Args:
+        **kwargs: See HttpClient.__init__
+    """
+    http_client.configure(**kwargs)
@@ -0,0 +1,284 @@
+"""
+Cache of OpenID discovery documents.
+
+Every ``OAuth`` used to fetch ``/.well-known/openid-configuration`` while it
+was constructed, and SmartOAuth builds two OAuth clients, so app startup
+waited on at least two blocking requests. The discovery cache keeps one
+document per host for ``ttl`` seconds and is shared by all clients.
+Constructing a client never waits on the network: until a document is
+available the standard Kinde endpoint paths are used, and missing or stale
+documents are refreshed in the background.
+
+With ``cache_dir`` set, documents are also persisted to disk, so a restarted
+process has the discovered endpoints immediately.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+from kinde_sdk.core.async_http import async_get, raise_for_status
+from kinde_sdk.core.http_client import http_client
+
+logger = logging.getLogger("kinde_sdk")
+
+# Endpoint attribute -> (discovery document field, default path)
+ENDPOINTS = {
+    "auth_url": ("authorization_endpoint", "/oauth2/auth"),
+    "token_url": ("token_endpoint", "/oauth2/token"),
+    "logout_url": ("end_session_endpoint", "/logout"),
+    "userinfo_url": ("userinfo_endpoint", "/oauth2/userinfo"),
+}
+
+
+def default_endpoints(host: str) -> Dict[str, str]:
+    """
+    Get the standard Kinde endpoints of a host.
+
+    Args:
+        host: The Kinde host (e.g. "https://example.kinde.com")
+
+    Returns:
+        Dict[str, str]: URLs by endpoint attribute ("auth_url", "token_url", ...)
+    """
+    host = host.rstrip("/")
+    return {name: f"{host}{path}" for name, (_, path) in ENDPOINTS.items()}
+
+
+class OpenIDDiscoveryCache:
+    """Thread-safe, per-host cache of OpenID discovery documents."""
+
+    def __init__(self, ttl: float = 3600, retry_interval: float = 60, cache_dir: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds before a document is refreshed (it is still used while refreshing)
+            retry_interval: Seconds to wait before retrying a host whose fetch failed
+            cache_dir: Directory to persist documents in, or None to keep them in memory only
+        """
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self.cache_dir = cache_dir
+        self._documents: Dict[str, tuple] = {}  # host -> (document, fetched_at)
+        self._endpoints: Dict[str, tuple] = {}  # host -> (endpoints, fetched_at)
+        self._refreshing: Set[str] = set()
+        self._failed_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, ttl: Optional[float] = None, retry_interval: Optional[float] = None,
+                  cache_dir: Optional[str] = None) -> None:
+        """
+        Change the cache settings. Arguments left as None are unchanged.
+
+        Args:
+            ttl: Document lifetime in seconds
+            retry_interval: Seconds between retries of failed hosts
+            cache_dir: Directory to persist documents in
+        """
+        with self._lock:
+            if ttl is not None:
+                self.ttl = ttl
+            if retry_interval is not None:
+                self.retry_interval = retry_interval
+            if cache_dir is not None:
+                self.cache_dir = cache_dir
+
+    def get(self, host: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the discovery document of a host without waiting on the network.
+
+        A missing or stale document is refreshed in the background.
+
+        Args:
+            host: The Kinde host
+
+        Returns:
+            Optional[Dict[str, Any]]: The (possibly stale) document, or None if none is available yet
+        """
+        entry = self._get_entry(host.rstrip("/"))
+        return entry[0] if entry is not None else None
+
+    def _get_entry(self, host: str) -> Optional[tuple]:
+        """Get (document, fetched_at) from memory or disk, scheduling a refresh if missing or stale."""
+        entry = self._documents.get(host)
+        if entry is None:
+            entry = self._load_from_disk(host)
+        if entry is None or time.time() - entry[1] >= self.ttl:
+            self.schedule_refresh(host)
+        return entry
+
+    def get_endpoints(self, host: str) -> Dict[str, str]:
+        """
+        Get a host's endpoint URLs without waiting on the network.
+
+        Args:
+            host: The Kinde host
+
+        Returns:
+            Dict[str, str]: URLs by endpoint attribute ("auth_url", "token_url",
+            "logout_url", "userinfo_url"). Endpoints the document does not
+            list, or all of them if no document is available yet, are the
+            standard Kinde paths.
+        """
+        host = host.rstrip("/")
+        entry = self._endpoints.get(host)
+        if entry is not None and time.time() - entry[1] < self.ttl:
+            return entry[0]
+
+        document_entry = self._get_entry(host)
+        endpoints = default_endpoints(host)
+        if document_entry is not None:
+            document, fetched_at = document_entry
+            for name, (field, _) in ENDPOINTS.items():
+                if isinstance(document.get(field), str):
+                    endpoints[name] = document[field]
+            self._endpoints[host] = (endpoints, fetched_at)
+        return endpoints
+
+    def fetch(self, host: str) -> Dict[str, Any]:
+        """
+        Fetch and cache a host's discovery document, waiting for the response.
+
+        Args:
+            host: The Kinde host
+
+        Returns:
+            Dict[str, Any]: The document
+
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If the response is not a JSON object
+        """
+        host = host.rstrip("/")
+        response = http_client.get(f"{host}/.well-known/openid-configuration")
+        response.raise_for_status()
+        return self._store(host, response.json())
+
+    async def fetch_async(self, host: str) -> Dict[str, Any]:
+        """
+        Fetch and cache a host's discovery document without blocking the event loop,
+        e.g. to warm the cache in an async application's startup hook.
+
+        Args:
+            host: The Kinde host
+
+        Returns:
+            Dict[str, Any]: The document
+
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If the response is not a JSON object
+        """
+        host = host.rstrip("/")
+        response = await async_get(f"{host}/.well-known/openid-configuration")
+        raise_for_status(response)
+        return self._store(host, response.json())
+
+    def schedule_refresh(self, host: str) -> None:
+        """
+        Refresh a host's document in the background, unless a refresh is
+        already running or the last attempt failed less than retry_interval ago.
+
+        The fetch runs on a daemon thread, so a pending discovery request
+        never delays interpreter shutdown.
+
+        Args:
+            host: The Kinde host
+        """
+        host = host.rstrip("/")
+        with self._lock:
+            if host in self._refreshing or time.time() < self._failed_until.get(host, 0):
+                return
+            self._refreshing.add(host)
+        threading.Thread(
+            target=self._background_refresh, args=(host,), name="kinde-discovery", daemon=True
+        ).start()
+
+    def _background_refresh(self, host: str) -> None:
+        try:
+            self.fetch(host)
+        except Exception as e:
+            logger.debug(f"OpenID discovery for {host} failed, using default endpoints: {e}")
+            with self._lock:
+                self._failed_until[host] = time.time() + self.retry_interval
+        finally:
+            with self._lock:
+                self._refreshing.discard(host)
+
+    def _store(self, host: str, document: Any) -> Dict[str, Any]:
+        if not isinstance(document, dict):
+            raise ValueError(f"OpenID discovery document of {host} is not a JSON object")
+        fetched_at = time.time()
+        with self._lock:
+            self._documents[host] = (document, fetched_at)
+            self._endpoints.pop(host, None)
+            self._failed_until.pop(host, None)
+        self._save_to_disk(host, document, fetched_at)
+        return document
+
+    def _cache_path(self, host: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        name = hashlib.sha256(host.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"openid-{name}.json")
+
+    def _load_from_disk(self, host: str) -> Optional[tuple]:
+        path = self._cache_path(host)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("host") != host or not isinstance(data.get("document"), dict):
+                return None
+            entry = (data["document"], float(data["fetched_at"]))
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        with self._lock:
+            # Keep a newer document fetched meanwhile
+            return self._documents.setdefault(host, entry)
+
+    def _save_to_disk(self, host: str, document: Dict[str, Any], fetched_at: float) -> None:
+        path = self._cache_path(host)
+        if path is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file and rename, so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".openid-")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"host": host, "fetched_at": fetched_at, "document": document}, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not persist OpenID discovery document of {host}: {e}")
+
+    def clear(self) -> None:
+        """Drop all documents held in memory (persisted files are kept)."""
+        with self._lock:
+            self._documents.clear()
+            self._endpoints.clear()
+            self._failed_until.clear()
+
+
+# Shared instance used by all OAuth clients
+openid_discovery_cache = OpenIDDiscoveryCache()
+
+
+def configure_openid_discovery(**kwargs: Any) -> None:
+    """
+    Configure the shared OpenID discovery cache.
+
+    Args:
+        **kwargs: See OpenIDDiscoveryCache.configure
+    """
+    openid_discovery_cache.configure(**kwargs)
@@ -0,0 +1,196 @@
+"""
+Background token refresh scheduling.
+
+Without a scheduler, tokens are renewed lazily: the first request after expiry
+pays for the token endpoint round-trip. The TokenRefreshScheduler renews
+tokens ahead of time on a background thread, at a configurable fraction of
+their lifetime plus random jitter (so many tokens issued together are not
+all renewed together), which keeps access token reads in memory.
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRefreshScheduler:
+    """
+    Runs token refresh callbacks on a single daemon thread.
+
+    Token managers register a callback with the token's lifetime whenever
+    they store a new token; re-scheduling the same key replaces the previous
+    entry. Callbacks given as bound methods are held weakly, so scheduling a
+    refresh does not keep a token manager alive.
+    """
+
+    def __init__(self, refresh_fraction: float = 0.8, jitter: float = 0.05, min_delay: float = 1.0):
+        """
+        Initialize the scheduler.
+
+        Args:
+            refresh_fraction: Fraction of the token lifetime after which it is renewed
+            jitter: Maximum random offset, as a fraction of the lifetime, added to
+                or subtracted from the refresh time
+            min_delay: Minimum seconds between scheduling and running a refresh
+        """
+        if not 0 < refresh_fraction <= 1:
+            raise ValueError("refresh_fraction must be in (0, 1]")
+        if not 0 <= jitter < refresh_fraction:
+            raise ValueError("jitter must be in [0, refresh_fraction)")
+
+        self.refresh_fraction = refresh_fraction
+        self.jitter = jitter
+        self.min_delay = min_delay
+        self._entries: Dict[str, Tuple[float, Callable[[], Optional[Callable[[], None]]]]] = {}
+        self._heap = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def next_refresh_delay(self, lifetime: float) -> float:
+        """
+        Compute when a token with the given lifetime should be renewed.
+
+        Args:
+            lifetime: Token lifetime in seconds
+
+        Returns:
+            float: Delay in seconds from now
+        """
+        delay = lifetime * self.refresh_fraction
+        delay += random.uniform(-self.jitter, self.jitter) * lifetime
+        return max(self.min_delay, delay)
+
+    def schedule(self, key: str, callback: Callable[[], None], lifetime: float) -> float:
+        """
+        Schedule (or re-schedule) a refresh.
+
+        Args:
+            key: Identifies the token; an existing entry with the same key is replaced
+            callback: Performs the refresh
+            lifetime: Lifetime of the current token in seconds
+
+        Returns:
+            float: The Unix time at which the refresh will run
+        """
+        if hasattr(callback, "__self__"):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731
+
+        due = time.time() + self.next_refresh_delay(lifetime)
+        with self._condition:
+            self._entries[key] = (due, ref)
+            heapq.heappush(self._heap, (due, next(self._counter), key))
+            self._ensure_thread()
+            self._condition.notify()
+        return due
+
+    def cancel(self, key: str) -> None:
+        """
+        Cancel a scheduled refresh.
+
+        Args:
+            key: The key the refresh was scheduled under
+        """
+        with self._condition:
+            self._entries.pop(key, None)
+
+    def is_scheduled(self, key: str) -> bool:
+        """Check whether a refresh is scheduled for ``key``."""
+        with self._condition:
+            return key in self._entries
+
+    def stop(self) -> None:
+        """Stop the background thread and drop all scheduled refreshes."""
+        with self._condition:
+            self._stopped = True
+            self._entries.clear()
+            self._heap.clear()
+            self._condition.notify()
+            thread = self._thread
+            self._thread = None
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def _ensure_thread(self) -> None:
+        """Start the worker thread if needed. Must be called with the condition held."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="kinde-token-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def _next_due(self) -> Optional[Tuple[str, Callable[[], None]]]:
+        """
+        Wait for the next due refresh. Must be called with the condition held.
+
+        Returns:
+            The key and callback to run, or None if the scheduler was stopped
+        """
+        while not self._stopped:
+            if not self._heap:
+                self._condition.wait()
+                continue
+
+            due, _, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != due:
+                # Cancelled or superseded by a later schedule() call
+                heapq.heappop(self._heap)
+                continue
+
+            remaining = due - time.time()
+            if remaining > 0:
+                self._condition.wait(timeout=remaining)
+                continue
+
+            heapq.heappop(self._heap)
+            del self._entries[key]
+            callback = entry[1]()
+            if callback is None:
+                # The token manager was garbage collected
+                continue
+            return key, callback
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                item = self._next_due()
+            if item is None:
+                return
+
+            key, callback = item
+            try:
+                callback()
+            except Exception as e:
+                # The owner falls back to refreshing on demand at expiry
+                logger.warning(f"Background token refresh for {key} failed: {str(e)}")
+
+
+_default_scheduler: Optional[TokenRefreshScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_refresh_scheduler() -> TokenRefreshScheduler:
+    """
+    Get the process-wide scheduler shared by user and M2M token managers.
+
+    Returns:
+        TokenRefreshScheduler: The shared scheduler
+    """
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = TokenRefreshScheduler()
+        return _default_scheduler
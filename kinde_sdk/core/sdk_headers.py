@@ -0,0 +1,199 @@
+"""
+SDK headers sent with every outgoing request.
+
+The Kinde-SDK tracking header used to be rebuilt for each token request,
+reading the distribution metadata and trying to import a list of web
+frameworks, so the first request of a process could import Django just to
+name it in a header. The headers are now computed on first use from the SDK
+version and the frameworks already imported (``sys.modules``), and kept in an
+immutable mapping that the HTTP clients of auth and management merge into
+every request. ``configure_sdk_headers`` overrides them.
+
+A request can be sent before the application imports its framework (e.g.
+the OIDC discovery fetch started when OAuth is constructed), so while no
+framework has been seen the detection is repeated on each use, and the
+headers are recomputed once one appears.
+"""
+
+import sys
+import threading
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from kinde_sdk._version import __version__
+
+# Module name -> framework name, checked in order (fastapi before starlette,
+# quart before flask: the first imports the second)
+FRAMEWORK_DETECTION = {
+    'django': 'Django',
+    'fastapi': 'FastAPI',
+    'starlette': 'Starlette',
+    'quart': 'Quart',
+    'flask': 'Flask',
+    'tornado': 'Tornado',
+    'pyramid': 'Pyramid',
+    'bottle': 'Bottle',
+    'cherrypy': 'CherryPy',
+    'falcon': 'Falcon',
+    'sanic': 'Sanic',
+    'aiohttp': 'aiohttp',
+}
+
+TRACKING_HEADER = "Kinde-SDK"
+
+
+def get_sdk_version() -> str:
+    """Get the SDK version."""
+    return __version__
+
+
+def get_python_version() -> str:
+    """Get the Python version in format: major.minor.micro"""
+    version_info = sys.version_info
+    return f"{version_info.major}.{version_info.minor}.{version_info.micro}"
+
+
+def detect_framework(modules: Optional[Mapping[str, object]] = None) -> Optional[str]:
+    """
+    Detect the web framework in use from the modules already imported.
+
+    Nothing is imported, so an installed but unused framework is not reported.
+
+    Args:
+        modules: Imported modules by name (defaults to sys.modules)
+
+    Returns:
+        Optional[str]: Framework name if detected, None otherwise
+    """
+    modules = sys.modules if modules is None else modules
+    for module_name, framework_name in FRAMEWORK_DETECTION.items():
+        if modules.get(module_name) is not None:
+            return framework_name
+    return None
+
+
+def build_tracking_header(
+        framework: Optional[str] = None,
+        sdk_version: Optional[str] = None,
+        python_version: Optional[str] = None
+        ) -> str:
+    """
+    Build a Kinde-SDK tracking header value.
+
+    Format: [SDK Used]/[Version of SDK]/[Version of language]/python
+
+    Args:
+        framework: Framework name, or None for plain Python
+        sdk_version: SDK version (defaults to the installed version)
+        python_version: Python version (defaults to the running version)
+
+    Returns:
+        str: "Python-[framework]/[SDK_VERSION]/[PYTHON_VERSION]/python", or
+        "Python/[SDK_VERSION]/[PYTHON_VERSION]/python" without a framework
+    """
+    sdk_version = sdk_version or get_sdk_version()
+    python_version = python_version or get_python_version()
+    prefix = f"Python-{framework}" if framework else "Python"
+    return f"{prefix}/{sdk_version}/{python_version}/python"
+
+
+class SDKHeaders:
+    """The headers added to every SDK request, computed once a framework is known."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._framework: Optional[str] = None
+        self._overrides: Mapping[str, str] = {}
+        self._headers: Optional[Mapping[str, str]] = None
+        # True while the headers were computed without any framework
+        self._framework_unknown = False
+
+    def configure(self, framework: Optional[str] = None, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Override the SDK headers. Arguments left as None are unchanged.
+
+        Args:
+            framework: Framework name to report instead of the detected one
+            headers: Headers to add, or to replace SDK headers with (e.g.
+                {"Kinde-SDK": "..."}); a value of None removes the header
+        """
+        with self._lock:
+            if framework is not None:
+                self._framework = framework
+            if headers is not None:
+                self._overrides = dict(headers)
+            self._headers = None
+
+    def reset(self) -> None:
+        """Drop overrides and recompute the headers on next use."""
+        with self._lock:
+            self._framework = None
+            self._overrides = {}
+            self._headers = None
+
+    def get(self) -> Mapping[str, str]:
+        """
+        Get the SDK headers.
+
+        Returns:
+            Mapping[str, str]: Read-only headers, the same object on every call
+            until a framework is first detected
+        """
+        headers = self._headers
+        if headers is None or (self._framework_unknown and detect_framework() is not None):
+            with self._lock:
+                if self._headers is None or self._framework_unknown:
+                    framework = self._framework or detect_framework()
+                    if self._headers is None or framework is not None:
+                        computed = {TRACKING_HEADER: build_tracking_header(framework)}
+                        computed.update(self._overrides)
+                        self._headers = MappingProxyType(
+                            {name: value for name, value in computed.items() if value is not None}
+                        )
+                        self._framework_unknown = framework is None
+                headers = self._headers
+        return headers
+
+    @property
+    def tracking_header(self) -> Optional[str]:
+        """The Kinde-SDK header value."""
+        return self.get().get(TRACKING_HEADER)
+
+    def apply_to(self, api_client) -> None:
+        """
+        Add the SDK headers to the default headers of a generated ApiClient.
+
+        Args:
+            api_client: A kinde_sdk.management or kinde_sdk.frontend ApiClient
+        """
+        api_client.default_headers.update(self.get())
+
+    def merge(self, headers: Optional[Mapping[str, str]] = None) -> dict:
+        """
+        Add the SDK headers to a request's headers.
+
+        Args:
+            headers: The request's own headers, which take precedence
+
+        Returns:
+            dict: A new dict with both
+        """
+        merged = dict(self.get())
+        if headers:
+            merged.update(headers)
+        return merged
+
+
+# Shared instance used by the auth and management HTTP clients
+sdk_headers = SDKHeaders()
+
+
+def configure_sdk_headers(framework: Optional[str] = None, headers: Optional[Mapping[str, str]] = None) -> None:
+    """
+    Configure the shared SDK headers.
+
+    Args:
+        framework: See SDKHeaders.configure
+        headers: See SDKHeaders.configure
+    """
+    sdk_headers.configure(framework=framework, headers=headers)
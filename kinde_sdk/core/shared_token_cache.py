@@ -0,0 +1,266 @@
+"""
+Token caches shared between processes.
+
+Each worker process of a multi-process server (and every short-lived job)
+used to request its own M2M token at startup and again on expiry. A shared
+token cache lets all processes on a node reuse one valid token, and its
+lock makes sure only one of them renews it at a time while the others wait
+for and then reuse the new token.
+
+Two implementations are provided: FileTokenCache (one file per token,
+locked with fcntl) and SQLiteTokenCache (one database file). Other stores
+(Redis, memcached, ...) can be used by implementing SharedTokenCache.
+
+Tokens are stored unencrypted; files are created readable by their owner only.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class SharedTokenCache(ABC):
+    """Interface of token caches shared between processes."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored token.
+
+        Args:
+            key: The token's cache key
+
+        Returns:
+            Optional[Dict[str, Any]]: The token data ("access_token", "expires_at",
+            "token_type"), or None if no token is stored
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, token: Dict[str, Any]) -> None:
+        """
+        Store a token.
+
+        Args:
+            key: The token's cache key
+            token: The token data, with an absolute "expires_at" timestamp
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove a stored token.
+
+        Args:
+            key: The token's cache key
+        """
+        pass
+
+    @abstractmethod
+    @contextmanager
+    def lock(self, key: str, timeout: float = 30.0) -> Iterator[None]:
+        """
+        Hold the renewal lock of a token, across processes.
+
+        If the lock cannot be acquired within timeout (e.g. its holder hangs),
+        the block runs without it rather than failing.
+
+        Args:
+            key: The token's cache key
+            timeout: Maximum seconds to wait for the lock
+        """
+        pass
+
+
+class FileTokenCache(SharedTokenCache):
+    """Stores each token in a JSON file, with an fcntl lock file for renewals."""
+
+    def __init__(self, directory: str, poll_interval: float = 0.05):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory for the token and lock files (created if missing)
+            poll_interval: Seconds between attempts to acquire a held lock
+        """
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self._thread_locks: Dict[str, threading.Lock] = {}
+        self._thread_locks_lock = threading.Lock()
+
+    def _path(self, key: str, suffix: str) -> str:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"token-{name}{suffix}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key, ".json"), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable shared token file: {e}")
+            return None
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+        return data.get("token")
+
+    def set(self, key: str, token: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        # Write to a temporary file and rename, so readers never see a partial token
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".token-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "token": token}, f)
+            os.replace(tmp_path, self._path(key, ".json"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key, ".json"))
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def lock(self, key: str, timeout: float = 30.0) -> Iterator[None]:
+        # flock only excludes other processes reliably, so threads of this
+        # process also take a per-key thread lock
+        with self._thread_locks_lock:
+            thread_lock = self._thread_locks.setdefault(key, threading.Lock())
+        deadline = time.monotonic() + timeout
+        if not thread_lock.acquire(timeout=timeout):
+            logger.warning("Timed out waiting for the shared token lock, renewing without it")
+            yield
+            return
+        try:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd = os.open(self._path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                locked = self._acquire_file_lock(fd, deadline)
+                try:
+                    yield
+                finally:
+                    if locked:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+        finally:
+            thread_lock.release()
+
+    def _acquire_file_lock(self, fd: int, deadline: float) -> bool:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    logger.warning("Timed out waiting for the shared token lock, renewing without it")
+                    return False
+                time.sleep(self.poll_interval)
+
+
+class SQLiteTokenCache(SharedTokenCache):
+    """Stores tokens in an SQLite database; renewals are locked with expiring leases."""
+
+    def __init__(self, path: str, lease: float = 60.0, poll_interval: float = 0.05):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path of the database file (created if missing)
+            lease: Seconds after which a lock whose holder died is released
+            poll_interval: Seconds between attempts to acquire a held lock
+        """
+        self.path = path
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, token TEXT NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)")
+        try:
+            os.chmod(path, 0o600)
+        except OSError:
+            pass
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            row = self._connect().execute("SELECT token FROM tokens WHERE key = ?", (key,)).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.debug(f"Ignoring unreadable shared token: {e}")
+            return None
+
+    def set(self, key: str, token: Dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO tokens (key, token) VALUES (?, ?)", (key, json.dumps(token)))
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM tokens WHERE key = ?", (key,))
+
+    @contextmanager
+    def lock(self, key: str, timeout: float = 30.0) -> Iterator[None]:
+        owner = uuid.uuid4().hex
+        deadline = time.monotonic() + timeout
+        locked = False
+        while True:
+            try:
+                locked = self._try_lock(key, owner)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not take the shared token lock, renewing without it: {e}")
+                break
+            if locked:
+                break
+            if time.monotonic() >= deadline:
+                logger.warning("Timed out waiting for the shared token lock, renewing without it")
+                break
+            time.sleep(self.poll_interval)
+        try:
+            yield
+        finally:
+            if locked:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM locks WHERE key = ? AND owner = ?", (key, owner))
+
+    def _try_lock(self, key: str, owner: str) -> bool:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM locks WHERE key = ? AND expires_at < ?", (key, now))
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO locks (key, owner, expires_at) VALUES (?, ?, ?)",
+                (key, owner, now + self.lease),
+            )
+            return cursor.rowcount == 1
@@ -1,14 +1,21 @@
 # core/storage/__init__.py
 from .storage_interface import StorageInterface
+from .async_storage_interface import AsyncStorageInterface, SyncStorageAdapter
 from .storage_factory import StorageFactory
 from .storage_manager import StorageManager
 from .memory_storage import MemoryStorage
 from .local_storage import LocalStorage
+from .redis_storage import RedisStorage
+from .sqlite_storage import SQLiteStorage
 
 __all__ = [
     'StorageInterface',
+    'AsyncStorageInterface',
+    'SyncStorageAdapter',
     'StorageFactory',
     'StorageManager',
     'MemoryStorage',
     'LocalStorage',
+    'RedisStorage',
+    'SQLiteStorage',
 ]
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""
+Async storage interface, so storage I/O does not block the event loop.
+
+Async backends implement AsyncStorageInterface directly. Sync backends are
+adapted with SyncStorageAdapter, which runs their blocking calls in the
+default thread pool (one hop per call, so batch methods stay a single hop).
+Backends that never block, like in-memory or request session storage,
+declare ``blocking = False`` and are called inline instead.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Union
+
+from .storage_interface import StorageInterface
+
+
+class AsyncStorageInterface(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict]:
+        """
+        Retrieve data associated with the given key.
+
+        Args:
+            key (str): The key to retrieve data for.
+
+        Returns:
+            Optional[Dict]: The stored data or None if not found.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Dict) -> None:
+        """
+        Store data associated with the given key.
+
+        Args:
+            key (str): The key to store the data under.
+            value (Dict): The data to store.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Delete data associated with the given key.
+
+        Args:
+            key (str): The key to delete data for.
+        """
+        pass
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve data for several keys.
+
+        The default runs get for each key concurrently; backends that can
+        fetch several keys in one round-trip should override it.
+
+        Args:
+            keys (Iterable[str]): The keys to retrieve data for.
+
+        Returns:
+            Dict[str, Optional[Dict]]: The stored data (or None if not found) by key.
+        """
+        keys = list(keys)
+        values = await asyncio.gather(*(self.get(key) for key in keys))
+        return dict(zip(keys, values))
+
+    async def set_many(self, items: Mapping[str, Dict]) -> None:
+        """
+        Store data for several keys.
+
+        The default runs set for each key concurrently; backends that can
+        write several keys in one round-trip should override it.
+
+        Args:
+            items (Mapping[str, Dict]): The data to store, by key.
+        """
+        await asyncio.gather(*(self.set(key, value) for key, value in items.items()))
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Delete data for several keys.
+
+        The default runs delete for each key concurrently; backends that can
+        delete several keys in one round-trip should override it.
+
+        Args:
+            keys (Iterable[str]): The keys to delete data for.
+        """
+        await asyncio.gather(*(self.delete(key) for key in keys))
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete data for every key starting with the given prefix.
+
+        Args:
+            prefix (str): The key prefix.
+
+        Raises:
+            NotImplementedError: If the backend cannot delete by prefix.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support prefix deletion")
+
+    async def delete_user_data(self, user_id: str) -> None:
+        """
+        Delete a user's device-scoped data (``device:{device_id}:{user_id}``) on every device.
+
+        Args:
+            user_id (str): The user id.
+
+        Raises:
+            NotImplementedError: If the backend cannot delete per user.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support per-user deletion")
+
+
+class SyncStorageAdapter(AsyncStorageInterface):
+    """Exposes a sync StorageInterface through AsyncStorageInterface."""
+
+    def __init__(self, storage: StorageInterface):
+        """
+        Args:
+            storage: The sync storage to adapt
+        """
+        self.storage = storage
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        if getattr(self.storage, "blocking", True):
+            # to_thread copies the context, so framework request context is kept
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def get(self, key: str) -> Optional[Dict]:
+        return await self._call(self.storage.get, key)
+
+    async def set(self, key: str, value: Dict) -> None:
+        await self._call(self.storage.set, key, value)
+
+    async def delete(self, key: str) -> None:
+        await self._call(self.storage.delete, key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        return await self._call(self.storage.get_many, list(keys))
+
+    async def set_many(self, items: Mapping[str, Dict]) -> None:
+        await self._call(self.storage.set_many, dict(items))
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        await self._call(self.storage.delete_many, list(keys))
+
+    async def delete_prefix(self, prefix: str) -> None:
+        await self._call(self.storage.delete_prefix, prefix)
+
+    async def delete_user_data(self, user_id: str) -> None:
+        await self._call(self.storage.delete_user_data, user_id)
+
+
+def as_async_storage(storage: Union[StorageInterface, AsyncStorageInterface]) -> AsyncStorageInterface:
+    """
+    Get an async view of a storage, adapting sync storages.
+
+    Args:
+        storage: A sync or async storage
+
+    Returns:
+        AsyncStorageInterface: The storage itself if async, otherwise a SyncStorageAdapter
+    """
+    if isinstance(storage, AsyncStorageInterface):
+        return storage
+    return SyncStorageAdapter(storage)
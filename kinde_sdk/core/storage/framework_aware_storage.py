@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Optional, Any
 from .storage_interface import StorageInterface
 from ..framework.framework_context import FrameworkContext
 import logging
@@ -10,6 +10,9 @@ class FrameworkAwareStorage(StorageInterface):
     through the FrameworkContext.
     """
     
+    # Sessions live on the current request, so access never blocks
+    blocking = False
+    
     def __init__(self):
         """Initialize the framework-aware storage."""
         self._session = None
@@ -102,4 +105,45 @@ class FrameworkAwareStorage(StorageInterface):
             # Mark session as modified for Flask
             if hasattr(session, 'modified'):
                 session.modified = True
-                self._logger.debug("Marked session as modified after setting flat data") 
\ No newline at end of file
+                self._logger.debug("Marked session as modified after setting flat data")
+
+    def set_many(self, items: Dict[str, Dict]) -> None:
+        """
+        Store several keys in the session, marking it modified once.
+        
+        Args:
+            items (Dict[str, Dict]): The data to store, by key
+        """
+        session = self._get_session()
+        if session is not None and items:
+            self._logger.debug(f"Setting keys {list(items)} in session")
+            session.update(items)
+            if hasattr(session, 'modified'):
+                session.modified = True
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Delete several keys from the session, marking it modified once.
+        
+        Args:
+            keys (Iterable[str]): The keys to delete
+        """
+        session = self._get_session()
+        if session is None:
+            return
+        deleted = [key for key in keys if key in session]
+        for key in deleted:
+            del session[key]
+        if deleted and hasattr(session, 'modified'):
+            session.modified = True
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete every key starting with the given prefix from the session.
+        
+        Args:
+            prefix (str): The key prefix
+        """
+        session = self._get_session()
+        if session is not None:
+            self.delete_many([key for key in list(session.keys()) if key.startswith(prefix)])
@@ -1,12 +1,17 @@
 from typing import Dict, Optional
 import json
+from .namespace_index import NamespaceIndex
 from .storage_interface import StorageInterface
 
 class LocalStorage(StorageInterface):
+    blocking = False
+
     def __init__(self):
         # In a browser environment, `localStorage` is available globally.
         # For testing in a non-browser environment, you can mock this.
         self.storage = {}
+        # Keys by device and by user, so deleting their data does not scan every key
+        self._index = NamespaceIndex()
 
     def get(self, key: str) -> Optional[Dict]:
         """
@@ -35,6 +40,7 @@ class LocalStorage(StorageInterface):
             value (Dict): The data to store.
         """
         self.storage[key] = json.dumps(value)
+        self._index.add(key)
 
     def set_flat(self, data: str) -> None:
         """
@@ -54,4 +60,30 @@ class LocalStorage(StorageInterface):
         Args:
             key (str): The key to delete data for.
         """
-        self.storage.pop(key, None)
\ No newline at end of file
+        self.storage.pop(key, None)
+        self._index.discard(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete data for every key starting with the given prefix.
+        
+        Device namespaces are looked up in the index; other prefixes scan.
+        
+        Args:
+            prefix (str): The key prefix.
+        """
+        keys = self._index.keys_with_prefix(prefix)
+        if keys is None:
+            keys = [k for k in self.storage if k.startswith(prefix)]
+        for key in keys:
+            self.delete(key)
+
+    def delete_user_data(self, user_id: str) -> None:
+        """
+        Delete a user's device-scoped data on every device, using the index.
+        
+        Args:
+            user_id (str): The user id.
+        """
+        for key in self._index.keys_for_user(user_id):
+            self.delete(key)
@@ -1,11 +1,17 @@
-
-from typing import Dict, Optional
+import threading
+from typing import Dict, Iterable, Mapping, Optional
+from .namespace_index import NamespaceIndex
 from .storage_interface import StorageInterface
 
 class MemoryStorage(StorageInterface):
+    blocking = False
+
     def __init__(self):
         self._storage = {}
         self._flat_storage = []
+        # Keys by device and by user, so deleting their data does not scan every key
+        self._index = NamespaceIndex()
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Dict]:
         """
@@ -17,7 +23,8 @@ class MemoryStorage(StorageInterface):
         Returns:
             Optional[Dict]: The stored data or None if not found.
         """
-        return self._storage.get(key)
+        with self._lock:
+            return self._storage.get(key)
 
     def set(self, key: str, value: Dict) -> None:
         """
@@ -27,7 +34,9 @@ class MemoryStorage(StorageInterface):
             key (str): The key to store the data under.
             value (Dict): The data to store.
         """
-        self._storage[key] = value
+        with self._lock:
+            self._storage[key] = value
+            self._index.add(key)
 
     def set_flat(self, data: str) -> None:
         """
@@ -46,5 +55,63 @@ class MemoryStorage(StorageInterface):
         Args:
             key (str): The key to delete data for.
         """
-        if key in self._storage:
-            del self._storage[key]
\ No newline at end of file
+        with self._lock:
+            self._delete(key)
+
+    def _delete(self, key: str) -> None:
+        self._storage.pop(key, None)
+        self._index.discard(key)
+
+    def set_many(self, items: Mapping[str, Dict]) -> None:
+        """
+        Store data for several keys.
+        
+        Args:
+            items (Mapping[str, Dict]): The data to store, by key.
+        """
+        with self._lock:
+            self._storage.update(items)
+            for key in items:
+                self._index.add(key)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Delete data for several keys.
+        
+        Args:
+            keys (Iterable[str]): The keys to delete data for.
+        """
+        with self._lock:
+            for key in keys:
+                self._delete(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete data for every key starting with the given prefix.
+        
+        Device namespaces ("device:{device_id}:") are looked up in the index,
+        in time proportional to the keys deleted; other prefixes scan.
+        
+        Args:
+            prefix (str): The key prefix.
+        """
+        with self._lock:
+            keys = self._index.keys_with_prefix(prefix)
+            if keys is None:
+                keys = [k for k in self._storage if k.startswith(prefix)]
+            for key in keys:
+                self._delete(key)
+
+    def delete_user_data(self, user_id: str) -> None:
+        """
+        Delete a user's device-scoped data on every device.
+        
+        The keys are looked up in the index, in time proportional to the
+        keys deleted.
+        
+        Args:
+            user_id (str): The user id.
+        """
+        with self._lock:
+            for key in self._index.keys_for_user(user_id):
+                self._delete(key)
@@ -0,0 +1,97 @@
+"""
+Namespace index for the in-process storages.
+
+StorageManager stores device-scoped data as ``device:{device_id}:{key}``, where
+``key`` is the user id for session data. Without an index, deleting a device's
+or a user's data means scanning every key of every user. NamespaceIndex maps
+each device namespace (``device:{device_id}:``) and each user id to its keys,
+so those deletes touch only the keys they remove.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+DEVICE_PREFIX = "device:"
+
+
+def split_device_key(key: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a device-scoped key into its namespace and key, e.g. "device:abc:user_1" into ("device:abc:", "user_1").
+
+    Args:
+        key: The storage key
+
+    Returns:
+        Optional[Tuple[str, str]]: The device namespace and the key within it,
+        or None for keys outside a device namespace
+    """
+    if not key.startswith(DEVICE_PREFIX):
+        return None
+    end = key.find(":", len(DEVICE_PREFIX))
+    if end == -1:
+        return None
+    return key[:end + 1], key[end + 1:]
+
+
+def _discard(index: Dict[str, Set[str]], name: str, key: str) -> None:
+    keys = index.get(name)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[name]
+
+
+class NamespaceIndex:
+    """Maps device namespaces and user ids to their keys. Not thread-safe; callers lock."""
+
+    def __init__(self):
+        self._device_keys: Dict[str, Set[str]] = {}
+        self._user_keys: Dict[str, Set[str]] = {}
+
+    def add(self, key: str) -> None:
+        parts = split_device_key(key)
+        if parts is None:
+            return
+        namespace, user_id = parts
+        self._device_keys.setdefault(namespace, set()).add(key)
+        if user_id:
+            self._user_keys.setdefault(user_id, set()).add(key)
+
+    def discard(self, key: str) -> None:
+        parts = split_device_key(key)
+        if parts is None:
+            return
+        namespace, user_id = parts
+        _discard(self._device_keys, namespace, key)
+        _discard(self._user_keys, user_id, key)
+
+    def keys_with_prefix(self, prefix: str) -> Optional[List[str]]:
+        """
+        Get the keys under a prefix, if the index can answer without a scan.
+
+        Args:
+            prefix: The key prefix
+
+        Returns:
+            Optional[List[str]]: The keys, or None if prefix is not a device
+            namespace (the caller must scan)
+        """
+        parts = split_device_key(prefix)
+        if parts is None or parts[1]:
+            return None
+        return list(self._device_keys.get(prefix, ()))
+
+    def keys_for_user(self, user_id: str) -> List[str]:
+        """
+        Get the device-scoped keys of a user on every device.
+
+        Args:
+            user_id: The user id
+
+        Returns:
+            List[str]: The keys
+        """
+        return list(self._user_keys.get(user_id, ()))
+
+    def clear(self) -> None:
+        self._device_keys.clear()
+        self._user_keys.clear()
@@ -0,0 +1,433 @@
+"""
+Storage backend for Redis and Redis-protocol servers (Valkey, KeyDB, ...).
+
+MemoryStorage is per process, so the workers of a horizontally scaled
+application cannot load each other's sessions. RedisStorage keeps sessions
+in a shared server. It speaks the Redis protocol (RESP) directly over a pool
+of persistent connections, so no client library is needed, and:
+
+- multi-key operations (get_many, set_many, delete_many, delete_prefix)
+  take one round-trip per batch;
+- entries holding tokens expire natively, when their tokens do (or after
+  refresh_token_ttl if a refresh token can renew them);
+- delete_prefix walks the keyspace incrementally with SCAN instead of KEYS.
+"""
+
+import json
+import logging
+import math
+import socket
+import ssl as ssl_module
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import unquote, urlparse
+
+from .storage_interface import StorageInterface
+from .ttl import entry_ttl
+
+logger = logging.getLogger(__name__)
+
+# COUNT hint of each SCAN step while deleting a prefix
+_SCAN_COUNT = 500
+
+
+class RedisError(Exception):
+    """An error reply from the server."""
+
+
+class RedisConnection:
+    """A single RESP connection."""
+
+    def __init__(
+            self,
+            host: str,
+            port: int,
+            db: int = 0,
+            username: Optional[str] = None,
+            password: Optional[str] = None,
+            ssl: bool = False,
+            socket_timeout: Optional[float] = 5.0,
+            connect_timeout: Optional[float] = 5.0
+            ):
+        sock = socket.create_connection((host, port), timeout=connect_timeout)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if ssl:
+                sock = ssl_module.create_default_context().wrap_socket(sock, server_hostname=host)
+            sock.settimeout(socket_timeout)
+        except BaseException:
+            sock.close()
+            raise
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+        try:
+            if password is not None:
+                self.execute(*(("AUTH", username, password) if username else ("AUTH", password)))
+            if db:
+                self.execute("SELECT", db)
+        except BaseException:
+            self.close()
+            raise
+
+    @staticmethod
+    def _encode(args: Sequence[Any]) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, bytes):
+                data = arg
+            elif isinstance(arg, str):
+                data = arg.encode("utf-8")
+            else:
+                data = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode("utf-8")
+        if kind == b"-":
+            return RedisError(payload.decode("utf-8"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Connection closed by server")
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected reply from server: {line!r}")
+
+    def pipeline(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        """
+        Send several commands in one write and read all their replies.
+
+        Returns:
+            List[Any]: One reply per command; error replies are RedisError instances
+        """
+        self._sock.sendall(b"".join(self._encode(command) for command in commands))
+        return [self._read_reply() for _ in commands]
+
+    def execute(self, *args: Any) -> Any:
+        """
+        Run one command.
+
+        Raises:
+            RedisError: If the server replies with an error
+        """
+        reply = self.pipeline([args])[0]
+        if isinstance(reply, RedisError):
+            raise reply
+        return reply
+
+    def close(self) -> None:
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+
+class RedisConnectionPool:
+    """Thread-safe pool of RESP connections to one server."""
+
+    def __init__(self, host: str = "localhost", port: int = 6379, max_idle: int = 10, **connection_kwargs: Any):
+        """
+        Initialize the pool. Connections are opened on demand.
+
+        Args:
+            host: Server host
+            port: Server port
+            max_idle: Maximum number of idle connections kept open
+            **connection_kwargs: See RedisConnection (db, username, password, ssl, timeouts)
+        """
+        self.host = host
+        self.port = port
+        self.max_idle = max_idle
+        self.connection_kwargs = connection_kwargs
+        self._idle: List[RedisConnection] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisConnectionPool":
+        """
+        Create a pool from a URL like ``redis://[[user]:password@]host[:port][/db]``
+        (``rediss://`` for TLS).
+        """
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "rediss"):
+            raise ValueError(f"Unsupported Redis URL scheme: {parsed.scheme}")
+        path = parsed.path.lstrip("/")
+        options = {
+            "host": parsed.hostname or "localhost",
+            "port": parsed.port or 6379,
+            "db": int(path) if path else 0,
+            "username": unquote(parsed.username) if parsed.username else None,
+            "password": unquote(parsed.password) if parsed.password else None,
+            "ssl": parsed.scheme == "rediss",
+        }
+        options.update(kwargs)
+        return cls(**options)
+
+    @contextmanager
+    def connection(self) -> Iterator[Tuple[RedisConnection, bool]]:
+        """
+        Borrow a connection.
+
+        Yields:
+            Tuple[RedisConnection, bool]: The connection and whether it was
+            reused from the pool (a reused connection may have gone stale)
+        """
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = RedisConnection(self.host, self.port, **self.connection_kwargs)
+        try:
+            yield conn, reused
+        except BaseException:
+            # The connection may be mid-reply; never reuse it
+            conn.close()
+            raise
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+
+    def pipeline(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        """
+        Run commands in one round-trip on a pooled connection.
+
+        A stale pooled connection (closed by the server while idle) is
+        replaced and the commands resent once.
+
+        Returns:
+            List[Any]: One reply per command; error replies are RedisError instances
+        """
+        if not commands:
+            return []
+        for attempt in range(2):
+            reused = False
+            try:
+                with self.connection() as (conn, reused):
+                    return conn.pipeline(commands)
+            except (ConnectionError, socket.timeout, OSError):
+                if attempt or not reused:
+                    raise
+        raise AssertionError("unreachable")
+
+    def execute(self, *args: Any) -> Any:
+        """
+        Run one command on a pooled connection.
+
+        Raises:
+            RedisError: If the server replies with an error
+        """
+        reply = self.pipeline([args])[0]
+        if isinstance(reply, RedisError):
+            raise reply
+        return reply
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def _raise_errors(replies: Iterable[Any]) -> None:
+    for reply in replies:
+        if isinstance(reply, RedisError):
+            raise reply
+
+
+def _escape_pattern(prefix: str) -> str:
+    """Escape glob characters so SCAN MATCH treats the prefix literally."""
+    return "".join("\\" + char if char in "*?[]\\" else char for char in prefix)
+
+
+class RedisStorage(StorageInterface):
+    """Stores JSON-serialized entries in a Redis-protocol server."""
+
+    def __init__(
+            self,
+            url: Optional[str] = None,
+            pool: Optional[RedisConnectionPool] = None,
+            key_prefix: str = "kinde:",
+            default_ttl: Optional[int] = None,
+            refresh_token_ttl: Optional[int] = 30 * 24 * 3600,
+            **pool_kwargs: Any
+            ):
+        """
+        Initialize the storage.
+
+        Args:
+            url: Server URL, e.g. "redis://localhost:6379/0"
+            pool: A connection pool to use instead of creating one
+            key_prefix: Prefix added to every key, to share a server with other data
+            default_ttl: Seconds before entries without tokens expire (None keeps them)
+            refresh_token_ttl: Seconds before entries whose tokens include a
+                refresh token expire, as the refresh token outlives the access token
+            **pool_kwargs: See RedisConnectionPool (host, port, db, password, ...)
+        """
+        if pool is None:
+            pool = RedisConnectionPool.from_url(url, **pool_kwargs) if url else RedisConnectionPool(**pool_kwargs)
+        self.pool = pool
+        self.key_prefix = key_prefix
+        self.default_ttl = default_ttl
+        self.refresh_token_ttl = refresh_token_ttl
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RedisStorage":
+        """
+        Create the storage from a storage config (see StorageFactory.create_storage).
+
+        Args:
+            config: {"type": "redis", "url": ..., "key_prefix": ..., ...}; the
+                options of ``config["options"]``, if any, are used as well
+
+        Returns:
+            RedisStorage: The storage
+        """
+        options = {key: value for key, value in config.items() if key not in ("type", "options")}
+        options.update(config.get("options") or {})
+        return cls(**options)
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    def _ttl_for(self, value: Any) -> Optional[int]:
+        """Get the TTL of an entry from the expiry of the tokens it holds."""
+        ttl = entry_ttl(value, self.default_ttl, self.refresh_token_ttl)
+        return None if ttl is None else max(1, math.ceil(ttl))
+
+    def _set_command(self, key: str, value: Any) -> List[Any]:
+        command = ["SET", self._key(key), json.dumps(value)]
+        ttl = self._ttl_for(value)
+        if ttl is not None:
+            command += ["EX", ttl]
+        return command
+
+    @staticmethod
+    def _decode(data: Optional[bytes]) -> Optional[Dict]:
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Retrieve data associated with the given key.
+
+        Args:
+            key (str): The key to retrieve data for.
+
+        Returns:
+            Optional[Dict]: The stored data or None if not found.
+        """
+        return self._decode(self.pool.execute("GET", self._key(key)))
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store data associated with the given key.
+
+        Args:
+            key (str): The key to store the data under.
+            value (Dict): The data to store.
+        """
+        self.pool.execute(*self._set_command(key, value))
+
+    def set_flat(self, data: str) -> None:
+        """
+        Store data without a specific key.
+
+        Args:
+            data (str): The data to store.
+        """
+        self.set("_flat_data", data)
+
+    def delete(self, key: str) -> None:
+        """
+        Delete data associated with the given key.
+
+        Args:
+            key (str): The key to delete data for.
+        """
+        self.pool.execute("DEL", self._key(key))
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve several keys in one round-trip.
+
+        Args:
+            keys: The keys to retrieve
+
+        Returns:
+            Dict[str, Optional[Dict]]: The stored data (or None) by key
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = self.pool.execute("MGET", *(self._key(key) for key in keys))
+        return {key: self._decode(value) for key, value in zip(keys, values)}
+
+    def set_many(self, items: Mapping[str, Dict]) -> None:
+        """
+        Store several keys in one round-trip.
+
+        Args:
+            items: The data to store, by key
+        """
+        _raise_errors(self.pool.pipeline([self._set_command(key, value) for key, value in items.items()]))
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        """
+        Delete several keys with one command.
+
+        Args:
+            keys: The keys to delete
+        """
+        keys = list(keys)
+        if keys:
+            self.pool.execute("DEL", *(self._key(key) for key in keys))
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete every key starting with prefix.
+
+        The keyspace is walked with SCAN, so the server is never blocked, and
+        each batch of matches is deleted with one command.
+
+        Args:
+            prefix: The key prefix (without key_prefix)
+        """
+        pattern = _escape_pattern(self._key(prefix)) + "*"
+        cursor = b"0"
+        while True:
+            cursor, keys = self.pool.execute("SCAN", cursor, "MATCH", pattern, "COUNT", _SCAN_COUNT)
+            if keys:
+                self.pool.execute("DEL", *keys)
+            if cursor in (b"0", "0", 0):
+                break
+
+    # Name used before delete_prefix was part of StorageInterface
+    clear_prefix = delete_prefix
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
@@ -0,0 +1,295 @@
+"""
+SQLite storage backend for multi-process deployments on a single host.
+
+MemoryStorage loses sessions on restart and is not shared between worker
+processes. SQLiteStorage keeps them in one database file that all workers
+on the host open:
+
+- WAL journaling lets readers proceed while another process writes;
+- each thread keeps its own connection, with SQLite's statement cache, so
+  a read is a single prepared SELECT on the primary key;
+- entries holding tokens get an expiry (when their access token expires,
+  or after refresh_token_ttl if a refresh token can renew them) and an index
+  on it makes purging expired entries cheap;
+- set_many and delete_many write in one transaction and delete_prefix
+  deletes a key range using the primary key index.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .storage_interface import StorageInterface
+from .ttl import entry_ttl
+
+logger = logging.getLogger(__name__)
+
+# Maximum keys per "IN (...)" query, below SQLite's bound parameter limit
+_MAX_KEYS_PER_QUERY = 500
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Get the smallest string greater than every string starting with prefix.
+
+    Returns:
+        Optional[str]: The bound, or None if there is none (prefix is empty or
+        all its characters are the maximum code point)
+    """
+    while prefix and ord(prefix[-1]) == 0x10FFFF:
+        prefix = prefix[:-1]
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class SQLiteStorage(StorageInterface):
+    """Stores JSON-serialized entries in an SQLite database in WAL mode."""
+
+    def __init__(
+            self,
+            path: str = "kinde_sessions.db",
+            table: str = "kinde_storage",
+            default_ttl: Optional[float] = None,
+            refresh_token_ttl: Optional[float] = 30 * 24 * 3600,
+            purge_interval: Optional[float] = 300,
+            busy_timeout: float = 5.0
+            ):
+        """
+        Initialize the storage, creating the database if needed.
+
+        Args:
+            path: Path of the database file
+            table: Table name, to share a database with other data
+            default_ttl: Seconds before entries without tokens expire (None keeps them)
+            refresh_token_ttl: Seconds before entries whose tokens include a
+                refresh token expire, as the refresh token outlives the access token
+            purge_interval: Minimum seconds between automatic purges of
+                expired entries on write (None disables them; see purge_expired)
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        if not table.replace("_", "").isalnum():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = path
+        self.table = table
+        self.default_ttl = default_ttl
+        self.refresh_token_ttl = refresh_token_ttl
+        self.purge_interval = purge_interval
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._last_purge = time.monotonic()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_expires_at ON {table} (expires_at)")
+        try:
+            os.chmod(path, 0o600)
+        except OSError:
+            pass
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SQLiteStorage":
+        """
+        Create the storage from a storage config (see StorageFactory.create_storage).
+
+        Args:
+            config: {"type": "sqlite", "path": ..., ...}; the options of
+                ``config["options"]``, if any, are used as well
+
+        Returns:
+            SQLiteStorage: The storage
+        """
+        options = {key: value for key, value in config.items() if key not in ("type", "options")}
+        options.update(config.get("options") or {})
+        return cls(**options)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Durable at checkpoints, not every commit: sessions can be re-established
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _row(self, key: str, value: Any, now: float) -> tuple:
+        ttl = entry_ttl(value, self.default_ttl, self.refresh_token_ttl)
+        return key, json.dumps(value), None if ttl is None else now + ttl
+
+    @staticmethod
+    def _decode(data: str) -> Optional[Dict]:
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    def _maybe_purge(self) -> None:
+        if self.purge_interval is None or time.monotonic() - self._last_purge < self.purge_interval:
+            return
+        self._last_purge = time.monotonic()
+        try:
+            self.purge_expired()
+        except sqlite3.Error as e:
+            logger.debug(f"Purging expired entries failed: {e}")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Retrieve data associated with the given key.
+
+        Args:
+            key (str): The key to retrieve data for.
+
+        Returns:
+            Optional[Dict]: The stored data or None if not found or expired.
+        """
+        row = self._connection().execute(
+            f"SELECT value FROM {self.table} WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store data associated with the given key.
+
+        Args:
+            key (str): The key to store the data under.
+            value (Dict): The data to store.
+        """
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                self._row(key, value, time.time()),
+            )
+        self._maybe_purge()
+
+    def set_flat(self, data: str) -> None:
+        """
+        Store data without a specific key.
+
+        Args:
+            data (str): The data to store.
+        """
+        self.set("_flat_data", data)
+
+    def delete(self, key: str) -> None:
+        """
+        Delete data associated with the given key.
+
+        Args:
+            key (str): The key to delete data for.
+        """
+        conn = self._connection()
+        with conn:
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve several keys with one query per 500 keys.
+
+        Args:
+            keys: The keys to retrieve
+
+        Returns:
+            Dict[str, Optional[Dict]]: The stored data (or None) by key
+        """
+        keys = list(keys)
+        result: Dict[str, Optional[Dict]] = dict.fromkeys(keys)
+        conn = self._connection()
+        now = time.time()
+        for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+            chunk = keys[start:start + _MAX_KEYS_PER_QUERY]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, value FROM {self.table} "
+                f"WHERE key IN ({placeholders}) AND (expires_at IS NULL OR expires_at > ?)",
+                (*chunk, now),
+            )
+            for key, value in rows:
+                result[key] = self._decode(value)
+        return result
+
+    def set_many(self, items: Mapping[str, Dict]) -> None:
+        """
+        Store several keys in one transaction.
+
+        Args:
+            items: The data to store, by key
+        """
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                [self._row(key, value, now) for key, value in items.items()],
+            )
+        self._maybe_purge()
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        """
+        Delete several keys in one transaction.
+
+        Args:
+            keys: The keys to delete
+        """
+        keys = list(keys)
+        conn = self._connection()
+        with conn:
+            for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[start:start + _MAX_KEYS_PER_QUERY]
+                conn.execute(f"DELETE FROM {self.table} WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete every key starting with prefix, as a range scan of the primary key.
+
+        Args:
+            prefix: The key prefix
+        """
+        upper = _prefix_upper_bound(prefix)
+        conn = self._connection()
+        with conn:
+            if upper is None:
+                conn.execute(f"DELETE FROM {self.table} WHERE key >= ?", (prefix,))
+            else:
+                conn.execute(f"DELETE FROM {self.table} WHERE key >= ? AND key < ?", (prefix, upper))
+
+    # Name used before delete_prefix was part of StorageInterface
+    clear_prefix = delete_prefix
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+
+        Returns:
+            int: Number of entries deleted
+        """
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
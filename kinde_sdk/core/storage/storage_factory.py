@@ -2,6 +2,8 @@ from typing import Dict, Any, Type
 from .storage_interface import StorageInterface
 from .memory_storage import MemoryStorage
 from .local_storage import LocalStorage
+from .redis_storage import RedisStorage
+from .sqlite_storage import SQLiteStorage
 from kinde_sdk.core.framework.framework_factory import FrameworkFactory
 import logging
 
@@ -51,6 +53,11 @@ class StorageFactory:
                 return MemoryStorage()
             elif storage_type == "local_storage":
                 return LocalStorage()
+            elif storage_type == "redis":
+                # Connection errors surface on first use, not here
+                return RedisStorage.from_config(config)
+            elif storage_type == "sqlite":
+                return SQLiteStorage.from_config(config)
             else:
                 logger.warning(f"Unsupported storage type: {storage_type}, falling back to memory storage")
                 return MemoryStorage()
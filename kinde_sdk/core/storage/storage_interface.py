@@ -1,9 +1,15 @@
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Iterable, Mapping, Optional
+
+from .namespace_index import split_device_key
 
 
 class StorageInterface(ABC):
+    # Whether calls may block on I/O; async callers run blocking storages in
+    # a thread pool (see SyncStorageAdapter)
+    blocking = True
+
     @abstractmethod
     def get(self, key: str) -> Optional[Dict]:
         """
@@ -46,4 +52,91 @@ class StorageInterface(ABC):
         Args:
             key (str): The key to delete data for.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve data for several keys.
+
+        The default calls get for each key; backends that can fetch several
+        keys in one round-trip should override it.
+
+        Args:
+            keys (Iterable[str]): The keys to retrieve data for.
+
+        Returns:
+            Dict[str, Optional[Dict]]: The stored data (or None if not found) by key.
+        """
+        return {key: self.get(key) for key in keys}
+
+    def set_many(self, items: Mapping[str, Dict]) -> None:
+        """
+        Store data for several keys.
+
+        The default calls set for each key; backends that can write several
+        keys in one round-trip should override it.
+
+        Args:
+            items (Mapping[str, Dict]): The data to store, by key.
+        """
+        for key, value in items.items():
+            self.set(key, value)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Delete data for several keys.
+
+        The default calls delete for each key; backends that can delete several
+        keys in one round-trip should override it.
+
+        Args:
+            keys (Iterable[str]): The keys to delete data for.
+        """
+        for key in keys:
+            self.delete(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete data for every key starting with the given prefix.
+
+        Key enumeration is backend specific. Storages that only define the
+        older ``clear_prefix`` keep working, and storages keeping their data
+        in a ``_storage`` dict fall back to scanning its keys.
+
+        Args:
+            prefix (str): The key prefix.
+
+        Raises:
+            NotImplementedError: If the backend cannot delete by prefix.
+        """
+        clear_prefix = getattr(self, "clear_prefix", None)
+        if clear_prefix is not None:
+            clear_prefix(prefix)
+            return
+        data = getattr(self, "_storage", None)
+        if not isinstance(data, dict):
+            raise NotImplementedError(f"{type(self).__name__} does not support prefix deletion")
+        self.delete_many([key for key in list(data) if key.startswith(prefix)])
+
+    def delete_user_data(self, user_id: str) -> None:
+        """
+        Delete a user's device-scoped data (``device:{device_id}:{user_id}``) on every device.
+
+        Storages keeping their data in a ``_storage`` dict fall back to
+        scanning its keys.
+
+        Args:
+            user_id (str): The user id.
+
+        Raises:
+            NotImplementedError: If the backend cannot enumerate keys.
+        """
+        data = getattr(self, "_storage", None)
+        if not isinstance(data, dict):
+            raise NotImplementedError(f"{type(self).__name__} does not support per-user deletion")
+        keys = []
+        for key in list(data):
+            parts = split_device_key(key)
+            if parts is not None and parts[1] == user_id:
+                keys.append(key)
+        self.delete_many(keys)
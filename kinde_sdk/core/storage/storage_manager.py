@@ -1,11 +1,15 @@
 # core/storage/storage_manager.py
+import logging
 import threading
 import uuid
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Mapping, Optional
+from .async_storage_interface import AsyncStorageInterface, as_async_storage
 from .storage_factory import StorageFactory
 from .storage_interface import StorageInterface
 
+logger = logging.getLogger(__name__)
+
 class StorageManager:
     _instance = None
     _lock = threading.Lock()  # Lock for thread safety
@@ -23,11 +27,18 @@ class StorageManager:
             return
             
         self._storage = None
+        self._async_storage = None
         self._initialized = True
         self._device_id = None
         self._storage_type = "memory"  # Default storage type
 
-    def initialize(self, config: Dict[str, Any] = None, device_id: Optional[str] = None, storage: Optional[StorageInterface] = None):
+    def initialize(
+            self,
+            config: Dict[str, Any] = None,
+            device_id: Optional[str] = None,
+            storage: Optional[StorageInterface] = None,
+            async_storage: Optional[AsyncStorageInterface] = None
+            ):
         """
         Initialize the storage with the provided configuration.
         
@@ -38,6 +49,9 @@ class StorageManager:
                 If None, a random identifier will be generated.
             storage (StorageInterface, optional): A pre-configured storage instance.
                 If provided, this will be used instead of creating a new one.
+            async_storage (AsyncStorageInterface, optional): A native async view of
+                the same data, used by the async methods. If None, the sync
+                storage is adapted (see SyncStorageAdapter).
         """
         with self._lock:
             if config is None:
@@ -54,6 +68,7 @@ class StorageManager:
                 self._storage = storage
             else:
                 self._storage = StorageFactory.create_storage(config)
+            self._async_storage = async_storage if async_storage is not None else as_async_storage(self._storage)
             
             # Set or generate device ID
             if device_id:
@@ -99,6 +114,21 @@ class StorageManager:
             
         return self._storage
 
+    @property
+    def async_storage(self) -> AsyncStorageInterface:
+        """
+        Get the async view of the configured storage.
+        
+        Returns:
+            AsyncStorageInterface: The async storage, initializing the default storage if needed.
+        """
+        if self._storage is None:
+            self.initialize()
+        if self._async_storage is None:
+            self._async_storage = as_async_storage(self._storage)
+            
+        return self._async_storage
+
     @property
     def storage_type(self) -> str:
         """
@@ -196,13 +226,54 @@ class StorageManager:
         namespaced_key = self._get_namespaced_key(key)
         self._storage.delete(namespaced_key)
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve several keys from storage in one batch.
+        
+        Args:
+            keys (Iterable[str]): The keys to retrieve.
+            
+        Returns:
+            Dict[str, Optional[Dict]]: The stored data (or None if not found) by key.
+        """
+        if self._storage is None:
+            self.initialize()
+            
+        namespaced_keys = {key: self._get_namespaced_key(key) for key in keys}
+        values = self._storage.get_many(list(namespaced_keys.values()))
+        return {key: values.get(namespaced_key) for key, namespaced_key in namespaced_keys.items()}
+
+    def set_many(self, items: Mapping[str, Dict]) -> None:
+        """
+        Store several keys in storage in one batch.
+        
+        Args:
+            items (Mapping[str, Dict]): The data to store, by key.
+        """
+        if self._storage is None:
+            self.initialize()
+            
+        self._storage.set_many({self._get_namespaced_key(key): value for key, value in items.items()})
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Delete several keys from storage in one batch.
+        
+        Args:
+            keys (Iterable[str]): The keys to delete.
+        """
+        if self._storage is None:
+            self.initialize()
+            
+        self._storage.delete_many([self._get_namespaced_key(key) for key in keys])
+
     def clear_device_data(self) -> None:
         """
         Clear all data associated with the current device.
         Useful for complete logout/reset scenarios.
         
-        Note: This is implementation dependent and works best with
-        storage backends that support prefix-based operations.
+        Relies on the storage's delete_prefix; storages that cannot
+        delete by prefix are left untouched and a warning is logged.
         """
         if self._storage is None:
             return
@@ -210,24 +281,136 @@ class StorageManager:
         device_id = self.get_device_id()
         prefix = f"device:{device_id}:"
         
-        # This is a naive implementation for storage that doesn't support prefix operations
-        # For more efficient implementations, extend StorageInterface with prefix operations
-        
-        # Note: This implementation works with memory storage as a fallback
-        # but won't be efficient for all storage types
-        if hasattr(self._storage, "clear_prefix"):
-            # If the storage implementation supports prefix clearing
-            self._storage.clear_prefix(prefix)
-        else:
-            # Fallback implementation - less efficient
-            if hasattr(self._storage, "_storage") and isinstance(self._storage._storage, dict):
-                keys_to_delete = [k for k in self._storage._storage.keys() if k.startswith(prefix)]
-                for k in keys_to_delete:
-                    self._storage.delete(k)
+        try:
+            self._storage.delete_prefix(prefix)
+        except NotImplementedError:
+            logger.warning(
+                f"{type(self._storage).__name__} does not support delete_prefix; device data was not cleared"
+            )
+
+    def clear_user_data(self, user_id: str) -> None:
+        """
+        Clear a user's session data on every device, e.g. when the user is deleted.
+        
+        Relies on the storage's delete_user_data; storages that cannot
+        delete per user are left untouched and a warning is logged.
+        
+        Args:
+            user_id (str): The user id.
+        """
+        if self._storage is None:
+            return
+        
+        try:
+            self._storage.delete_user_data(user_id)
+        except NotImplementedError:
+            logger.warning(
+                f"{type(self._storage).__name__} does not support delete_user_data; user data was not cleared"
+            )
+
+    async def get_async(self, key: str) -> Optional[Dict]:
+        """
+        Retrieve data from storage by key without blocking the event loop.
+        
+        Args:
+            key (str): The key to retrieve.
+            
+        Returns:
+            Optional[Dict]: The stored data or None if not found.
+        """
+        return await self.async_storage.get(self._get_namespaced_key(key))
+
+    async def setItems_async(self, key: str, value: Dict) -> None:
+        """
+        Store data in storage without blocking the event loop.
+        
+        Args:
+            key (str): The key to store under.
+            value (Dict): The data to store.
+        """
+        await self.async_storage.set(self._get_namespaced_key(key), value)
+
+    async def delete_async(self, key: str) -> None:
+        """
+        Delete data from storage by key without blocking the event loop.
+        
+        Args:
+            key (str): The key to delete.
+        """
+        await self.async_storage.delete(self._get_namespaced_key(key))
+
+    async def get_many_async(self, keys: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve several keys from storage in one batch without blocking the event loop.
+        
+        Args:
+            keys (Iterable[str]): The keys to retrieve.
+            
+        Returns:
+            Dict[str, Optional[Dict]]: The stored data (or None if not found) by key.
+        """
+        storage = self.async_storage
+        namespaced_keys = {key: self._get_namespaced_key(key) for key in keys}
+        values = await storage.get_many(list(namespaced_keys.values()))
+        return {key: values.get(namespaced_key) for key, namespaced_key in namespaced_keys.items()}
+
+    async def set_many_async(self, items: Mapping[str, Dict]) -> None:
+        """
+        Store several keys in storage in one batch without blocking the event loop.
+        
+        Args:
+            items (Mapping[str, Dict]): The data to store, by key.
+        """
+        storage = self.async_storage
+        await storage.set_many({self._get_namespaced_key(key): value for key, value in items.items()})
+
+    async def delete_many_async(self, keys: Iterable[str]) -> None:
+        """
+        Delete several keys from storage in one batch without blocking the event loop.
+        
+        Args:
+            keys (Iterable[str]): The keys to delete.
+        """
+        storage = self.async_storage
+        await storage.delete_many([self._get_namespaced_key(key) for key in keys])
+
+    async def clear_device_data_async(self) -> None:
+        """
+        Clear all data associated with the current device without blocking the event loop.
+        See clear_device_data.
+        """
+        if self._storage is None:
+            return
+            
+        storage = self.async_storage
+        prefix = f"device:{self.get_device_id()}:"
+        try:
+            await storage.delete_prefix(prefix)
+        except NotImplementedError:
+            logger.warning(
+                f"{type(storage).__name__} does not support delete_prefix; device data was not cleared"
+            )
+
+    async def clear_user_data_async(self, user_id: str) -> None:
+        """
+        Clear a user's session data on every device without blocking the event loop.
+        See clear_user_data.
+        """
+        if self._storage is None:
+            return
+            
+        storage = self.async_storage
+        try:
+            await storage.delete_user_data(user_id)
+        except NotImplementedError:
+            logger.warning(
+                f"{type(storage).__name__} does not support delete_user_data; user data was not cleared"
+            )
 
     def reset(self):
         """Reset the storage manager - useful for testing"""
         with self._lock:
             self._storage = None
+            self._async_storage = None
             self._device_id = None
-            self.initialize({"type": "memory"})
\ No newline at end of file
+        self.initialize({"type": "memory"})
\ No newline at end of file
@@ -0,0 +1,30 @@
+import time
+from typing import Any, Optional
+
+
+def entry_ttl(value: Any, default_ttl: Optional[float], refresh_token_ttl: Optional[float]) -> Optional[float]:
+    """
+    Get how long a stored entry stays useful, from the tokens it holds.
+
+    Session entries look like {"user_info": ..., "tokens": {...}}; token
+    entries hold the tokens directly. An entry expires with its access token,
+    unless a refresh token can renew it.
+
+    Args:
+        value: The entry
+        default_ttl: TTL of entries without tokens (None keeps them)
+        refresh_token_ttl: TTL of entries whose tokens include a refresh token
+
+    Returns:
+        Optional[float]: Seconds until the entry expires (0 or less if it
+        already has), or None if it does not expire
+    """
+    if not isinstance(value, dict):
+        return default_ttl
+    tokens = value.get("tokens") if isinstance(value.get("tokens"), dict) else value
+    expires_at = tokens.get("expires_at")
+    if isinstance(expires_at, bool) or not isinstance(expires_at, (int, float)):
+        return default_ttl
+    if tokens.get("refresh_token"):
+        return refresh_token_ttl
+    return expires_at - time.time()
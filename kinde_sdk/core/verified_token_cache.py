@@ -0,0 +1,119 @@
+"""
+Cache of verification results for bearer tokens.
+
+Verifying the same access token over and over (introspection or a local
+signature check) is wasted work: the result cannot change until the token
+expires or is revoked. This module keeps a bounded LRU of verified claims,
+keyed by a SHA-256 of the raw token so that tokens themselves are never used
+as dictionary keys.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from kinde_sdk.core.helpers import hash_string
+
+
+class VerifiedTokenCache:
+    """
+    Thread-safe LRU/TTL cache of verified token claims.
+
+    Entries expire after ``ttl`` seconds or at the token's ``exp``, whichever
+    comes first, so a cached result never outlives the token. Each entry also
+    records the ``context`` it was verified in (e.g. the issuer and audience),
+    and a lookup from a different context is treated as a miss.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before the least recently used is evicted
+            ttl: Maximum lifetime of an entry in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hash_string(token)
+
+    def get(self, token: str, context: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Get the cached claims for a token.
+
+        Args:
+            token: The raw token
+            context: The verification context the claims must have been cached under
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached claims, or None on a miss
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            claims, expires_at, entry_context = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            if entry_context != context:
+                return None
+
+            self._entries.move_to_end(key)
+            return claims
+
+    def set(self, token: str, claims: Dict[str, Any], context: str = "", exp: Optional[float] = None) -> None:
+        """
+        Cache the verified claims for a token.
+
+        Args:
+            token: The raw token
+            claims: The verified claims
+            context: The verification context (e.g. issuer and audience)
+            exp: Token expiry as a Unix timestamp. Defaults to ``claims["exp"]``.
+        """
+        if exp is None:
+            exp = claims.get("exp")
+
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (claims, expires_at, context)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        """
+        Remove a token from the cache, e.g. on logout or revocation.
+
+        Args:
+            token: The raw token
+        """
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared instance used by the token verifier, introspection and revocation paths
+verified_token_cache = VerifiedTokenCache()
@@ -17,14 +17,103 @@
 
 from kinde_sdk._version import __version__  # single source of truth; see kinde_sdk/_version.py
 
-# import apis into sdk package
-from kinde_sdk.frontend.api.billing_api import BillingApi
-from kinde_sdk.frontend.api.feature_flags_api import FeatureFlagsApi
-from kinde_sdk.frontend.api.o_auth_api import OAuthApi
-from kinde_sdk.frontend.api.permissions_api import PermissionsApi
-from kinde_sdk.frontend.api.properties_api import PropertiesApi
-from kinde_sdk.frontend.api.roles_api import RolesApi
-from kinde_sdk.frontend.api.self_serve_portal_api import SelfServePortalApi
+import importlib as _importlib
+from typing import TYPE_CHECKING
+
+# Imported on first access by __getattr__ below, to keep the package import fast
+_LAZY_IMPORTS = {
+    "BillingApi": "kinde_sdk.frontend.api.billing_api",
+    "FeatureFlagsApi": "kinde_sdk.frontend.api.feature_flags_api",
+    "OAuthApi": "kinde_sdk.frontend.api.o_auth_api",
+    "PermissionsApi": "kinde_sdk.frontend.api.permissions_api",
+    "PropertiesApi": "kinde_sdk.frontend.api.properties_api",
+    "RolesApi": "kinde_sdk.frontend.api.roles_api",
+    "SelfServePortalApi": "kinde_sdk.frontend.api.self_serve_portal_api",
+    "Error": "kinde_sdk.frontend.models.error",
+    "ErrorResponse": "kinde_sdk.frontend.models.error_response",
+    "GetEntitlementResponse": "kinde_sdk.frontend.models.get_entitlement_response",
+    "GetEntitlementResponseData": "kinde_sdk.frontend.models.get_entitlement_response_data",
+    "GetEntitlementResponseDataEntitlement": "kinde_sdk.frontend.models.get_entitlement_response_data_entitlement",
+    "GetEntitlementsResponse": "kinde_sdk.frontend.models.get_entitlements_response",
+    "GetEntitlementsResponseData": "kinde_sdk.frontend.models.get_entitlements_response_data",
+    "GetEntitlementsResponseDataEntitlementsInner": "kinde_sdk.frontend.models.get_entitlements_response_data_entitlements_inner",
+    "GetEntitlementsResponseDataPlansInner": "kinde_sdk.frontend.models.get_entitlements_response_data_plans_inner",
+    "GetEntitlementsResponseMetadata": "kinde_sdk.frontend.models.get_entitlements_response_metadata",
+    "GetFeatureFlagsResponse": "kinde_sdk.frontend.models.get_feature_flags_response",
+    "GetFeatureFlagsResponseData": "kinde_sdk.frontend.models.get_feature_flags_response_data",
+    "GetFeatureFlagsResponseDataFeatureFlagsInner": "kinde_sdk.frontend.models.get_feature_flags_response_data_feature_flags_inner",
+    "GetFeatureFlagsResponseDataFeatureFlagsInnerValue": "kinde_sdk.frontend.models.get_feature_flags_response_data_feature_flags_inner_value",
+    "GetUserPermissionsResponse": "kinde_sdk.frontend.models.get_user_permissions_response",
+    "GetUserPermissionsResponseData": "kinde_sdk.frontend.models.get_user_permissions_response_data",
+    "GetUserPermissionsResponseDataPermissionsInner": "kinde_sdk.frontend.models.get_user_permissions_response_data_permissions_inner",
+    "GetUserPermissionsResponseMetadata": "kinde_sdk.frontend.models.get_user_permissions_response_metadata",
+    "GetUserPropertiesResponse": "kinde_sdk.frontend.models.get_user_properties_response",
+    "GetUserPropertiesResponseData": "kinde_sdk.frontend.models.get_user_properties_response_data",
+    "GetUserPropertiesResponseDataPropertiesInner": "kinde_sdk.frontend.models.get_user_properties_response_data_properties_inner",
+    "GetUserPropertiesResponseDataPropertiesInnerValue": "kinde_sdk.frontend.models.get_user_properties_response_data_properties_inner_value",
+    "GetUserPropertiesResponseMetadata": "kinde_sdk.frontend.models.get_user_properties_response_metadata",
+    "GetUserRolesResponse": "kinde_sdk.frontend.models.get_user_roles_response",
+    "GetUserRolesResponseData": "kinde_sdk.frontend.models.get_user_roles_response_data",
+    "GetUserRolesResponseDataRolesInner": "kinde_sdk.frontend.models.get_user_roles_response_data_roles_inner",
+    "GetUserRolesResponseMetadata": "kinde_sdk.frontend.models.get_user_roles_response_metadata",
+    "PortalLink": "kinde_sdk.frontend.models.portal_link",
+    "TokenErrorResponse": "kinde_sdk.frontend.models.token_error_response",
+    "TokenIntrospect": "kinde_sdk.frontend.models.token_introspect",
+    "UserProfileV2": "kinde_sdk.frontend.models.user_profile_v2",
+}
+
+if TYPE_CHECKING:
+    from kinde_sdk.frontend.api.billing_api import BillingApi as BillingApi
+    from kinde_sdk.frontend.api.feature_flags_api import FeatureFlagsApi as FeatureFlagsApi
+    from kinde_sdk.frontend.api.o_auth_api import OAuthApi as OAuthApi
+    from kinde_sdk.frontend.api.permissions_api import PermissionsApi as PermissionsApi
+    from kinde_sdk.frontend.api.properties_api import PropertiesApi as PropertiesApi
+    from kinde_sdk.frontend.api.roles_api import RolesApi as RolesApi
+    from kinde_sdk.frontend.api.self_serve_portal_api import SelfServePortalApi as SelfServePortalApi
+    from kinde_sdk.frontend.models.error import Error as Error
+    from kinde_sdk.frontend.models.error_response import ErrorResponse as ErrorResponse
+    from kinde_sdk.frontend.models.get_entitlement_response import GetEntitlementResponse as GetEntitlementResponse
+    from kinde_sdk.frontend.models.get_entitlement_response_data import GetEntitlementResponseData as GetEntitlementResponseData
+    from kinde_sdk.frontend.models.get_entitlement_response_data_entitlement import GetEntitlementResponseDataEntitlement as GetEntitlementResponseDataEntitlement
+    from kinde_sdk.frontend.models.get_entitlements_response import GetEntitlementsResponse as GetEntitlementsResponse
+    from kinde_sdk.frontend.models.get_entitlements_response_data import GetEntitlementsResponseData as GetEntitlementsResponseData
+    from kinde_sdk.frontend.models.get_entitlements_response_data_entitlements_inner import GetEntitlementsResponseDataEntitlementsInner as GetEntitlementsResponseDataEntitlementsInner
+    from kinde_sdk.frontend.models.get_entitlements_response_data_plans_inner import GetEntitlementsResponseDataPlansInner as GetEntitlementsResponseDataPlansInner
+    from kinde_sdk.frontend.models.get_entitlements_response_metadata import GetEntitlementsResponseMetadata as GetEntitlementsResponseMetadata
+    from kinde_sdk.frontend.models.get_feature_flags_response import GetFeatureFlagsResponse as GetFeatureFlagsResponse
+    from kinde_sdk.frontend.models.get_feature_flags_response_data import GetFeatureFlagsResponseData as GetFeatureFlagsResponseData
+    from kinde_sdk.frontend.models.get_feature_flags_response_data_feature_flags_inner import GetFeatureFlagsResponseDataFeatureFlagsInner as GetFeatureFlagsResponseDataFeatureFlagsInner
+    from kinde_sdk.frontend.models.get_feature_flags_response_data_feature_flags_inner_value import GetFeatureFlagsResponseDataFeatureFlagsInnerValue as GetFeatureFlagsResponseDataFeatureFlagsInnerValue
+    from kinde_sdk.frontend.models.get_user_permissions_response import GetUserPermissionsResponse as GetUserPermissionsResponse
+    from kinde_sdk.frontend.models.get_user_permissions_response_data import GetUserPermissionsResponseData as GetUserPermissionsResponseData
+    from kinde_sdk.frontend.models.get_user_permissions_response_data_permissions_inner import GetUserPermissionsResponseDataPermissionsInner as GetUserPermissionsResponseDataPermissionsInner
+    from kinde_sdk.frontend.models.get_user_permissions_response_metadata import GetUserPermissionsResponseMetadata as GetUserPermissionsResponseMetadata
+    from kinde_sdk.frontend.models.get_user_properties_response import GetUserPropertiesResponse as GetUserPropertiesResponse
+    from kinde_sdk.frontend.models.get_user_properties_response_data import GetUserPropertiesResponseData as GetUserPropertiesResponseData
+    from kinde_sdk.frontend.models.get_user_properties_response_data_properties_inner import GetUserPropertiesResponseDataPropertiesInner as GetUserPropertiesResponseDataPropertiesInner
+    from kinde_sdk.frontend.models.get_user_properties_response_data_properties_inner_value import GetUserPropertiesResponseDataPropertiesInnerValue as GetUserPropertiesResponseDataPropertiesInnerValue
+    from kinde_sdk.frontend.models.get_user_properties_response_metadata import GetUserPropertiesResponseMetadata as GetUserPropertiesResponseMetadata
+    from kinde_sdk.frontend.models.get_user_roles_response import GetUserRolesResponse as GetUserRolesResponse
+    from kinde_sdk.frontend.models.get_user_roles_response_data import GetUserRolesResponseData as GetUserRolesResponseData
+    from kinde_sdk.frontend.models.get_user_roles_response_data_roles_inner import GetUserRolesResponseDataRolesInner as GetUserRolesResponseDataRolesInner
+    from kinde_sdk.frontend.models.get_user_roles_response_metadata import GetUserRolesResponseMetadata as GetUserRolesResponseMetadata
+    from kinde_sdk.frontend.models.portal_link import PortalLink as PortalLink
+    from kinde_sdk.frontend.models.token_error_response import TokenErrorResponse as TokenErrorResponse
+    from kinde_sdk.frontend.models.token_introspect import TokenIntrospect as TokenIntrospect
+    from kinde_sdk.frontend.models.user_profile_v2 import UserProfileV2 as UserProfileV2
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 # import ApiClient
 from kinde_sdk.frontend.api_response import ApiResponse
@@ -37,41 +126,14 @@ from kinde_sdk.frontend.exceptions import ApiKeyError
 from kinde_sdk.frontend.exceptions import ApiAttributeError
 from kinde_sdk.frontend.exceptions import ApiException
 
-# import models into sdk package
-from kinde_sdk.frontend.models.error import Error
-from kinde_sdk.frontend.models.error_response import ErrorResponse
-from kinde_sdk.frontend.models.get_entitlement_response import GetEntitlementResponse
-from kinde_sdk.frontend.models.get_entitlement_response_data import GetEntitlementResponseData
-from kinde_sdk.frontend.models.get_entitlement_response_data_entitlement import GetEntitlementResponseDataEntitlement
-from kinde_sdk.frontend.models.get_entitlements_response import GetEntitlementsResponse
-from kinde_sdk.frontend.models.get_entitlements_response_data import GetEntitlementsResponseData
-from kinde_sdk.frontend.models.get_entitlements_response_data_entitlements_inner import GetEntitlementsResponseDataEntitlementsInner
-from kinde_sdk.frontend.models.get_entitlements_response_data_plans_inner import GetEntitlementsResponseDataPlansInner
-from kinde_sdk.frontend.models.get_entitlements_response_metadata import GetEntitlementsResponseMetadata
-from kinde_sdk.frontend.models.get_feature_flags_response import GetFeatureFlagsResponse
-from kinde_sdk.frontend.models.get_feature_flags_response_data import GetFeatureFlagsResponseData
-from kinde_sdk.frontend.models.get_feature_flags_response_data_feature_flags_inner import GetFeatureFlagsResponseDataFeatureFlagsInner
-from kinde_sdk.frontend.models.get_feature_flags_response_data_feature_flags_inner_value import GetFeatureFlagsResponseDataFeatureFlagsInnerValue
-from kinde_sdk.frontend.models.get_user_permissions_response import GetUserPermissionsResponse
-from kinde_sdk.frontend.models.get_user_permissions_response_data import GetUserPermissionsResponseData
-from kinde_sdk.frontend.models.get_user_permissions_response_data_permissions_inner import GetUserPermissionsResponseDataPermissionsInner
-from kinde_sdk.frontend.models.get_user_permissions_response_metadata import GetUserPermissionsResponseMetadata
-from kinde_sdk.frontend.models.get_user_properties_response import GetUserPropertiesResponse
-from kinde_sdk.frontend.models.get_user_properties_response_data import GetUserPropertiesResponseData
-from kinde_sdk.frontend.models.get_user_properties_response_data_properties_inner import GetUserPropertiesResponseDataPropertiesInner
-from kinde_sdk.frontend.models.get_user_properties_response_data_properties_inner_value import GetUserPropertiesResponseDataPropertiesInnerValue
-from kinde_sdk.frontend.models.get_user_properties_response_metadata import GetUserPropertiesResponseMetadata
-from kinde_sdk.frontend.models.get_user_roles_response import GetUserRolesResponse
-from kinde_sdk.frontend.models.get_user_roles_response_data import GetUserRolesResponseData
-from kinde_sdk.frontend.models.get_user_roles_response_data_roles_inner import GetUserRolesResponseDataRolesInner
-from kinde_sdk.frontend.models.get_user_roles_response_metadata import GetUserRolesResponseMetadata
-from kinde_sdk.frontend.models.portal_link import PortalLink
-from kinde_sdk.frontend.models.token_error_response import TokenErrorResponse
-from kinde_sdk.frontend.models.token_introspect import TokenIntrospect
-from kinde_sdk.frontend.models.user_profile_v2 import UserProfileV2
-
 # Custom imports for Kinde Frontend Client
 # from .frontend_client import FrontendClient
 
 # Re-export for convenience
 # __all__ = ['FrontendClient']
+
+# Names exported by "from ... import *", including the lazily imported ones
+__all__ = sorted(
+    {name for name in globals() if not name.startswith("_") and name != "TYPE_CHECKING"}
+    | set(_LAZY_IMPORTS)
+)
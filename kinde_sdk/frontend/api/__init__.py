@@ -1,11 +1,43 @@
 # flake8: noqa
 
-# import apis into api package
-from kinde_sdk.frontend.api.billing_api import BillingApi
-from kinde_sdk.frontend.api.feature_flags_api import FeatureFlagsApi
-from kinde_sdk.frontend.api.o_auth_api import OAuthApi
-from kinde_sdk.frontend.api.permissions_api import PermissionsApi
-from kinde_sdk.frontend.api.properties_api import PropertiesApi
-from kinde_sdk.frontend.api.roles_api import RolesApi
-from kinde_sdk.frontend.api.self_serve_portal_api import SelfServePortalApi
+import importlib as _importlib
+from typing import TYPE_CHECKING
 
+# Imported on first access by __getattr__ below, to keep the package import fast
+_LAZY_IMPORTS = {
+    "BillingApi": "kinde_sdk.frontend.api.billing_api",
+    "FeatureFlagsApi": "kinde_sdk.frontend.api.feature_flags_api",
+    "OAuthApi": "kinde_sdk.frontend.api.o_auth_api",
+    "PermissionsApi": "kinde_sdk.frontend.api.permissions_api",
+    "PropertiesApi": "kinde_sdk.frontend.api.properties_api",
+    "RolesApi": "kinde_sdk.frontend.api.roles_api",
+    "SelfServePortalApi": "kinde_sdk.frontend.api.self_serve_portal_api",
+}
+
+if TYPE_CHECKING:
+    from kinde_sdk.frontend.api.billing_api import BillingApi as BillingApi
+    from kinde_sdk.frontend.api.feature_flags_api import FeatureFlagsApi as FeatureFlagsApi
+    from kinde_sdk.frontend.api.o_auth_api import OAuthApi as OAuthApi
+    from kinde_sdk.frontend.api.permissions_api import PermissionsApi as PermissionsApi
+    from kinde_sdk.frontend.api.properties_api import PropertiesApi as PropertiesApi
+    from kinde_sdk.frontend.api.roles_api import RolesApi as RolesApi
+    from kinde_sdk.frontend.api.self_serve_portal_api import SelfServePortalApi as SelfServePortalApi
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+# Names exported by "from ... import *", including the lazily imported ones
+__all__ = sorted(
+    {name for name in globals() if not name.startswith("_") and name != "TYPE_CHECKING"}
+    | set(_LAZY_IMPORTS)
+)
@@ -1,31 +1,83 @@
 # flake8: noqa
 
-# import apis into api package
-from kinde_sdk.management.api.api_keys_api import APIKeysApi
-from kinde_sdk.management.api.apis_api import APIsApi
-from kinde_sdk.management.api.applications_api import ApplicationsApi
-from kinde_sdk.management.api.billing_agreements_api import BillingAgreementsApi
-from kinde_sdk.management.api.billing_entitlements_api import BillingEntitlementsApi
-from kinde_sdk.management.api.billing_meter_usage_api import BillingMeterUsageApi
-from kinde_sdk.management.api.business_api import BusinessApi
-from kinde_sdk.management.api.callbacks_api import CallbacksApi
-from kinde_sdk.management.api.connected_apps_api import ConnectedAppsApi
-from kinde_sdk.management.api.connections_api import ConnectionsApi
-from kinde_sdk.management.api.directories_api import DirectoriesApi
-from kinde_sdk.management.api.environment_variables_api import EnvironmentVariablesApi
-from kinde_sdk.management.api.environments_api import EnvironmentsApi
-from kinde_sdk.management.api.feature_flags_api import FeatureFlagsApi
-from kinde_sdk.management.api.identities_api import IdentitiesApi
-from kinde_sdk.management.api.industries_api import IndustriesApi
-from kinde_sdk.management.api.mfa_api import MFAApi
-from kinde_sdk.management.api.organizations_api import OrganizationsApi
-from kinde_sdk.management.api.permissions_api import PermissionsApi
-from kinde_sdk.management.api.properties_api import PropertiesApi
-from kinde_sdk.management.api.property_categories_api import PropertyCategoriesApi
-from kinde_sdk.management.api.roles_api import RolesApi
-from kinde_sdk.management.api.search_api import SearchApi
-from kinde_sdk.management.api.subscribers_api import SubscribersApi
-from kinde_sdk.management.api.timezones_api import TimezonesApi
-from kinde_sdk.management.api.users_api import UsersApi
-from kinde_sdk.management.api.webhooks_api import WebhooksApi
+import importlib as _importlib
+from typing import TYPE_CHECKING
 
+# Imported on first access by __getattr__ below, to keep the package import fast
+_LAZY_IMPORTS = {
+    "APIKeysApi": "kinde_sdk.management.api.api_keys_api",
+    "APIsApi": "kinde_sdk.management.api.apis_api",
+    "ApplicationsApi": "kinde_sdk.management.api.applications_api",
+    "BillingAgreementsApi": "kinde_sdk.management.api.billing_agreements_api",
+    "BillingEntitlementsApi": "kinde_sdk.management.api.billing_entitlements_api",
+    "BillingMeterUsageApi": "kinde_sdk.management.api.billing_meter_usage_api",
+    "BusinessApi": "kinde_sdk.management.api.business_api",
+    "CallbacksApi": "kinde_sdk.management.api.callbacks_api",
+    "ConnectedAppsApi": "kinde_sdk.management.api.connected_apps_api",
+    "ConnectionsApi": "kinde_sdk.management.api.connections_api",
+    "DirectoriesApi": "kinde_sdk.management.api.directories_api",
+    "EnvironmentVariablesApi": "kinde_sdk.management.api.environment_variables_api",
+    "EnvironmentsApi": "kinde_sdk.management.api.environments_api",
+    "FeatureFlagsApi": "kinde_sdk.management.api.feature_flags_api",
+    "IdentitiesApi": "kinde_sdk.management.api.identities_api",
+    "IndustriesApi": "kinde_sdk.management.api.industries_api",
+    "MFAApi": "kinde_sdk.management.api.mfa_api",
+    "OrganizationsApi": "kinde_sdk.management.api.organizations_api",
+    "PermissionsApi": "kinde_sdk.management.api.permissions_api",
+    "PropertiesApi": "kinde_sdk.management.api.properties_api",
+    "PropertyCategoriesApi": "kinde_sdk.management.api.property_categories_api",
+    "RolesApi": "kinde_sdk.management.api.roles_api",
+    "SearchApi": "kinde_sdk.management.api.search_api",
+    "SubscribersApi": "kinde_sdk.management.api.subscribers_api",
+    "TimezonesApi": "kinde_sdk.management.api.timezones_api",
+    "UsersApi": "kinde_sdk.management.api.users_api",
+    "WebhooksApi": "kinde_sdk.management.api.webhooks_api",
+}
+
+if TYPE_CHECKING:
+    from kinde_sdk.management.api.api_keys_api import APIKeysApi as APIKeysApi
+    from kinde_sdk.management.api.apis_api import APIsApi as APIsApi
+    from kinde_sdk.management.api.applications_api import ApplicationsApi as ApplicationsApi
+    from kinde_sdk.management.api.billing_agreements_api import BillingAgreementsApi as BillingAgreementsApi
+    from kinde_sdk.management.api.billing_entitlements_api import BillingEntitlementsApi as BillingEntitlementsApi
+    from kinde_sdk.management.api.billing_meter_usage_api import BillingMeterUsageApi as BillingMeterUsageApi
+    from kinde_sdk.management.api.business_api import BusinessApi as BusinessApi
+    from kinde_sdk.management.api.callbacks_api import CallbacksApi as CallbacksApi
+    from kinde_sdk.management.api.connected_apps_api import ConnectedAppsApi as ConnectedAppsApi
+    from kinde_sdk.management.api.connections_api import ConnectionsApi as ConnectionsApi
+    from kinde_sdk.management.api.directories_api import DirectoriesApi as DirectoriesApi
+    from kinde_sdk.management.api.environment_variables_api import EnvironmentVariablesApi as EnvironmentVariablesApi
+    from kinde_sdk.management.api.environments_api import EnvironmentsApi as EnvironmentsApi
+    from kinde_sdk.management.api.feature_flags_api import FeatureFlagsApi as FeatureFlagsApi
+    from kinde_sdk.management.api.identities_api import IdentitiesApi as IdentitiesApi
+    from kinde_sdk.management.api.industries_api import IndustriesApi as IndustriesApi
+    from kinde_sdk.management.api.mfa_api import MFAApi as MFAApi
+    from kinde_sdk.management.api.organizations_api import OrganizationsApi as OrganizationsApi
+    from kinde_sdk.management.api.permissions_api import PermissionsApi as PermissionsApi
+    from kinde_sdk.management.api.properties_api import PropertiesApi as PropertiesApi
+    from kinde_sdk.management.api.property_categories_api import PropertyCategoriesApi as PropertyCategoriesApi
+    from kinde_sdk.management.api.roles_api import RolesApi as RolesApi
+    from kinde_sdk.management.api.search_api import SearchApi as SearchApi
+    from kinde_sdk.management.api.subscribers_api import SubscribersApi as SubscribersApi
+    from kinde_sdk.management.api.timezones_api import TimezonesApi as TimezonesApi
+    from kinde_sdk.management.api.users_api import UsersApi as UsersApi
+    from kinde_sdk.management.api.webhooks_api import WebhooksApi as WebhooksApi
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+# Names exported by "from ... import *", including the lazily imported ones
+__all__ = sorted(
+    {name for name in globals() if not name.startswith("_") and name != "TYPE_CHECKING"}
+    | set(_LAZY_IMPORTS)
+)
@@ -0,0 +1,362 @@
+"""
+Async client for the Kinde Management API.
+
+The generated API classes are synchronous: each method validates and
+serializes its arguments, calls ``ApiClient.call_api`` (blocking urllib3) and
+deserializes the response. AsyncManagementClient reuses the generated code
+for everything except the network call. Each method runs with a capturing
+api_client that records the serialized request and the response types
+instead of sending it; the request is then sent on the shared
+``httpx.AsyncClient`` and the response deserialized by the real ApiClient.
+"""
+
+import functools
+import json
+import logging
+import re
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+
+from kinde_sdk.core.async_http import get_async_client
+from kinde_sdk.core.sdk_headers import sdk_headers
+from kinde_sdk.management import api
+from kinde_sdk.management.api_client import ApiClient
+from kinde_sdk.management.configuration import Configuration
+from kinde_sdk.management.exceptions import ApiException, ApiValueError
+from .bulk import BulkExecutor, BulkItemResult, BulkResult
+from .management_client import ManagementClient
+from .management_token_manager import ManagementTokenManager
+from .pagination import apaginate
+
+logger = logging.getLogger("kinde_sdk.management")
+
+
+class AsyncRESTResponse:
+    """Response wrapper with the interface of ``rest.RESTResponse``."""
+
+    def __init__(self, response: httpx.Response):
+        self.response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.data = response.content
+
+    def read(self):
+        return self.data
+
+    @property
+    def headers(self):
+        """Returns a dictionary of response headers."""
+        return self.response.headers
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers; use ``headers`` instead."""
+        return self.response.headers
+
+
+class _Deferred:
+    """Placeholder returned to generated code in place of a response or result."""
+
+    def read(self):
+        return None
+
+    @property
+    def data(self):
+        return _DEFERRED_DATA
+
+    @property
+    def response(self):
+        return _DEFERRED_RAW
+
+
+_DEFERRED_DATA = object()
+_DEFERRED_RAW = object()
+
+
+class _CapturingApiClient:
+    """
+    Stands in for ApiClient while a generated method runs.
+
+    Serialization is delegated to the real ApiClient; ``call_api`` records the
+    request instead of sending it, and ``response_deserialize`` records the
+    response types map.
+    """
+
+    def __init__(self, api_client: ApiClient):
+        self._api_client = api_client
+        self.request: Optional[Tuple[tuple, Dict[str, Any]]] = None
+        self.response_types_map: Optional[Dict[str, Optional[str]]] = None
+        self.pending_response = _Deferred()
+        self.deferred_result = _Deferred()
+
+    def __getattr__(self, name):
+        return getattr(self._api_client, name)
+
+    def call_api(self, *args, **kwargs):
+        self.request = (args, kwargs)
+        return self.pending_response
+
+    def response_deserialize(self, response_data=None, response_types_map=None):
+        self.response_types_map = response_types_map
+        return self.deferred_result
+
+
+class AsyncApi:
+    """
+    Async counterpart of a generated API class.
+
+    Every public method of the wrapped class is available as a coroutine
+    function with the same name and arguments.
+    """
+
+    def __init__(self, api_class: type, client: "AsyncManagementClient"):
+        self._api_class = api_class
+        self._client = client
+
+    def __getattr__(self, name: str):
+        method = getattr(self._api_class, name, None)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(f"{self._api_class.__name__} has no attribute {name!r}")
+
+        @functools.wraps(method)
+        async def async_method(*args, **kwargs):
+            return await self._client._call(self._api_class, name, args, kwargs)
+
+        # Cache so later lookups skip __getattr__
+        setattr(self, name, async_method)
+        return async_method
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | {n for n in dir(self._api_class) if not n.startswith("_")})
+
+
+class AsyncManagementClient:
+    """
+    Async client for the Kinde Management API.
+
+    Exposes the same snake_case ``*_api`` attributes as ManagementClient, with
+    async methods. Access tokens are acquired with
+    ``ManagementTokenManager.get_access_token_async``, which shares the token
+    cache with ManagementClient.
+
+    Example:
+        ```python
+        client = AsyncManagementClient(domain, client_id, client_secret)
+
+        users = await client.users_api.get_users(page_size=50)
+        org = await client.organizations_api.get_organization(code="org_123")
+        ```
+    """
+
+    def __init__(self, domain: str, client_id: str, client_secret: str):
+        """
+        Initialize the management client.
+
+        Args:
+            domain: Your Kinde domain (e.g., "example.kinde.com")
+            client_id: Client ID for the management API
+            client_secret: Client secret for the management API
+        """
+        self.domain = domain
+        self.base_url = f"https://{domain}"
+        self.token_manager = ManagementTokenManager(domain, client_id, client_secret)
+
+        # Used for serialization and deserialization only; requests are sent with httpx
+        self.configuration = Configuration(host=self.base_url)
+        self.api_client = ApiClient(configuration=self.configuration)
+        sdk_headers.apply_to(self.api_client)
+
+        # API classes are wrapped on first access (see __getattr__)
+
+    def __getattr__(self, name: str):
+        """Create an AsyncApi on first access, named as on ManagementClient (e.g. ``client.users_api``)."""
+        class_name = ManagementClient._api_class_names().get(name)
+        if class_name is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        async_api = AsyncApi(getattr(api, class_name), self)
+        setattr(self, name, async_api)
+        logger.debug(f"Initialized async {class_name} as client.{name}")
+        return async_api
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(ManagementClient._api_class_names()))
+
+    # Auto-pagination: stream every item of a list endpoint, following next_token
+
+    def paginate(self, fetch_page, items_field: Optional[str] = None, page_size: Optional[int] = None,
+                 prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """
+        Asynchronously iterate over all items of any paginated list endpoint.
+
+        Args:
+            fetch_page: The API method, e.g. ``client.roles_api.get_role_users``
+            items_field: Name of the list field in the response (inferred if None)
+            page_size: Number of items per request (API default if None)
+            prefetch: Fetch the next page while the current one is consumed
+            **kwargs: Other arguments for ``fetch_page``
+
+        Returns:
+            AsyncIterator[Any]: The items of every page, in order
+        """
+        return apaginate(fetch_page, items_field, page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_users(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """Asynchronously iterate over all users. Filters are passed to UsersApi.get_users()."""
+        return self.paginate(self.users_api.get_users, "users", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_organizations(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """Asynchronously iterate over all organizations. Filters are passed to OrganizationsApi.get_organizations()."""
+        return self.paginate(self.organizations_api.get_organizations, "organizations", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_organization_users(self, org_code: str, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """Asynchronously iterate over all users of an organization. Filters are passed to OrganizationsApi.get_organization_users()."""
+        return self.paginate(self.organizations_api.get_organization_users, "organization_users", page_size=page_size, prefetch=prefetch, org_code=org_code, **kwargs)
+
+    def iter_organization_invites(self, org_code: str, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """Asynchronously iterate over all invitations of an organization. Filters are passed to OrganizationsApi.get_organization_invites()."""
+        return self.paginate(self.organizations_api.get_organization_invites, "invites", page_size=page_size, prefetch=prefetch, org_code=org_code, **kwargs)
+
+    def iter_roles(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """Asynchronously iterate over all roles. Filters are passed to RolesApi.get_roles()."""
+        return self.paginate(self.roles_api.get_roles, "roles", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_permissions(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """Asynchronously iterate over all permissions. Filters are passed to PermissionsApi.get_permissions()."""
+        return self.paginate(self.permissions_api.get_permissions, "permissions", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_applications(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """Asynchronously iterate over all applications. Filters are passed to ApplicationsApi.get_applications()."""
+        return self.paginate(self.applications_api.get_applications, "applications", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_subscribers(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> AsyncIterator[Any]:
+        """Asynchronously iterate over all subscribers. Filters are passed to SubscribersApi.get_subscribers()."""
+        return self.paginate(self.subscribers_api.get_subscribers, "subscribers", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    # Bulk operations: many calls run concurrently with rate-limit handling
+
+    async def run_bulk(self, func: Callable[[Any], Awaitable[Any]], items: Iterable[Any], max_concurrency: int = 8,
+                       on_result: Optional[Callable[[BulkItemResult], None]] = None, **kwargs) -> BulkResult:
+        """
+        Await ``func(item)`` for every item concurrently. See ManagementClient.run_bulk.
+
+        Example:
+            ```python
+            result = await client.run_bulk(
+                lambda user: client.users_api.create_user(create_user_request=user),
+                users,
+            )
+            ```
+
+        Args:
+            func: Coroutine function to call for each item
+            items: The items; consumed lazily
+            max_concurrency: Maximum number of calls in flight
+            on_result: Optional callback invoked with each BulkItemResult as it completes
+            **kwargs: Other BulkExecutor options (max_retries, base_delay, ...)
+
+        Returns:
+            BulkResult: Per-item results and errors, in input order
+        """
+        executor = BulkExecutor(max_concurrency=max_concurrency, **kwargs)
+        return await executor.arun(func, items, on_result=on_result)
+
+    async def _call(self, api_class: type, method_name: str, args: tuple, kwargs: dict):
+        """Run a generated API method with the network call made asynchronously."""
+        capture = _CapturingApiClient(self.api_client)
+        result = getattr(api_class(api_client=capture), method_name)(*args, **kwargs)
+        if capture.request is None:
+            # Not an endpoint method
+            return result
+
+        call_args, call_kwargs = capture.request
+        response_data = await self.call_api(*call_args, **call_kwargs)
+
+        if result is _DEFERRED_RAW:
+            # *_without_preload_content returns the raw HTTP response
+            return response_data.response
+
+        api_response = self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=capture.response_types_map,
+        )
+        if result is capture.deferred_result:
+            # *_with_http_info
+            return api_response
+        return api_response.data
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> AsyncRESTResponse:
+        """
+        Send a serialized request with a bearer token.
+
+        Mirrors ``ApiClient.call_api`` and ``RESTClientObject.request``.
+
+        Returns:
+            AsyncRESTResponse: The response
+        """
+        token = await self.token_manager.get_access_token_async()
+        headers = dict(header_params or {})
+        headers['Authorization'] = f"Bearer {token}"
+
+        request_kwargs = self._build_request(method.upper(), headers, body, post_params)
+        timeout = self._build_timeout(_request_timeout)
+        if timeout is not None:
+            request_kwargs['timeout'] = timeout
+
+        try:
+            response = await get_async_client().request(method.upper(), url, headers=headers, **request_kwargs)
+        except httpx.HTTPError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg) from e
+        return AsyncRESTResponse(response)
+
+    @staticmethod
+    def _build_timeout(_request_timeout) -> Optional[httpx.Timeout]:
+        if not _request_timeout:
+            return None
+        if isinstance(_request_timeout, (int, float)):
+            return httpx.Timeout(_request_timeout)
+        if isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            return httpx.Timeout(None, connect=_request_timeout[0], read=_request_timeout[1])
+        return None
+
+    @staticmethod
+    def _build_request(method: str, headers: Dict[str, str], body, post_params) -> Dict[str, Any]:
+        """Encode the request body the way ``RESTClientObject.request`` does."""
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+        post_params = post_params or []
+
+        if method not in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            return {}
+
+        content_type = headers.get('Content-Type')
+        if not content_type or re.search('json', content_type, re.IGNORECASE):
+            return {'content': json.dumps(body)} if body is not None else {}
+        if content_type == 'application/x-www-form-urlencoded':
+            return {'content': urlencode(post_params)}
+        if content_type == 'multipart/form-data':
+            # Let httpx generate the Content-Type with the multipart boundary
+            del headers['Content-Type']
+            files = [(k, v) for k, v in post_params if isinstance(v, tuple)]
+            data = {k: json.dumps(v) if isinstance(v, dict) else v for k, v in post_params if not isinstance(v, tuple)}
+            return {'data': data, 'files': files}
+        if isinstance(body, (str, bytes)):
+            return {'content': body}
+        if content_type.startswith('text/') and isinstance(body, bool):
+            return {'content': "true" if body else "false"}
+
+        msg = """Cannot prepare a request message for provided
+                 arguments. Please check that your arguments match
+                 declared content type."""
+        raise ApiException(status=0, reason=msg)
@@ -0,0 +1,386 @@
+"""
+Concurrent bulk execution of Management API calls.
+
+BulkExecutor runs one call per item with bounded parallelism. Rate limiting
+is handled adaptively: a 429 response halves the number of concurrent calls
+and pauses all workers for the ``Retry-After`` period (or an exponential
+backoff). Each run of successful calls raises the limit again by one. A
+failed item never aborts the run; every item gets a BulkItemResult.
+
+Only 429 responses are retried by default: the request was rejected before
+it ran, so retrying cannot apply a write twice. A 502/503/504 may come after
+the server applied the change, so retrying those is opt-in
+(``retry_server_errors=True``), for idempotent calls.
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger("kinde_sdk.management")
+
+RETRYABLE_STATUSES = (429,)
+# Retried only with retry_server_errors=True, as the call may have been applied
+SERVER_ERROR_STATUSES = (502, 503, 504)
+
+
+class BulkItemResult:
+    """Outcome of the call for one item."""
+
+    def __init__(self, index: int, item: Any, result: Any = None, error: Optional[BaseException] = None, attempts: int = 0):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+        self.attempts = attempts
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = "ok" if self.succeeded else f"error={self.error!r}"
+        return f"BulkItemResult(index={self.index}, {outcome}, attempts={self.attempts})"
+
+
+class BulkResult:
+    """Per-item results of a bulk run, in input order."""
+
+    def __init__(self, results: List[BulkItemResult]):
+        self.results = sorted(results, key=lambda r: r.index)
+
+    @property
+    def succeeded(self) -> List[BulkItemResult]:
+        return [r for r in self.results if r.succeeded]
+
+    @property
+    def failed(self) -> List[BulkItemResult]:
+        return [r for r in self.results if not r.succeeded]
+
+    def __iter__(self) -> Iterator[BulkItemResult]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __repr__(self) -> str:
+        return f"BulkResult(total={len(self)}, failed={len(self.failed)})"
+
+
+def _error_status(error: BaseException) -> Optional[int]:
+    """Get the HTTP status of an ApiException or requests.HTTPError."""
+    status = getattr(error, "status", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """
+    Get the delay requested by a ``Retry-After`` header, in seconds.
+
+    Supports both delta-seconds and HTTP-date values.
+    """
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class _AdaptiveLimit:
+    """
+    Concurrency limit shared by the workers of a run (additive increase,
+    multiplicative decrease). Not thread-safe; callers hold their own lock.
+    """
+
+    def __init__(self, max_concurrency: int, min_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit = max_concurrency
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._successes = 0
+
+    def can_start(self, now: float) -> bool:
+        return self.in_flight < self.limit and now >= self.paused_until
+
+    def wait_time(self, now: float) -> Optional[float]:
+        """Seconds until the pause ends, or None if only waiting for a free slot."""
+        return self.paused_until - now if now < self.paused_until else None
+
+    def on_success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._successes = 0
+
+    def on_throttle(self, delay: float) -> None:
+        self.limit = max(self.min_concurrency, self.limit // 2)
+        self._successes = 0
+        self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+
+class BulkExecutor:
+    """
+    Runs a function over many items concurrently, adapting to rate limits.
+
+    Example:
+        ```python
+        executor = BulkExecutor(max_concurrency=10)
+        results = executor.run(
+            lambda user: client.users_api.create_user(create_user_request=user),
+            users,
+        )
+        for failure in results.failed:
+            print(failure.item, failure.error)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 60.0,
+        retry_statuses: Iterable[int] = RETRYABLE_STATUSES,
+        retry_server_errors: bool = False,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_concurrency: Maximum number of calls in flight
+            min_concurrency: Concurrency never drops below this when throttled
+            max_retries: Retries per item for retryable failures
+            base_delay: Initial backoff in seconds when no Retry-After is given
+            max_delay: Maximum backoff in seconds
+            retry_statuses: HTTP statuses that are retried
+            retry_server_errors: Also retry 502/503/504; only safe when ``func`` is idempotent
+        """
+        if max_concurrency < 1 or not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("Require 1 <= min_concurrency <= max_concurrency")
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        if retry_server_errors:
+            self.retry_statuses |= frozenset(SERVER_ERROR_STATUSES)
+
+    def _retry_delay(self, error: BaseException, attempt: int) -> Optional[float]:
+        """
+        Get the delay before retrying, or None if the error is not retryable.
+
+        Args:
+            error: The error raised by the call
+            attempt: Number of attempts made so far (1-based)
+        """
+        if attempt > self.max_retries or _error_status(error) not in self.retry_statuses:
+            return None
+        delay = _retry_after(error)
+        if delay is None:
+            # Exponential backoff with full jitter
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        return min(delay, self.max_delay)
+
+    def run(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        on_result: Optional[Callable[[BulkItemResult], None]] = None,
+    ) -> BulkResult:
+        """
+        Call ``func(item)`` for every item on a pool of worker threads.
+
+        Args:
+            func: The call to make for each item
+            items: The items; consumed lazily
+            on_result: Optional callback invoked with each BulkItemResult as it completes
+
+        Returns:
+            BulkResult: The results of all items
+
+        Raises:
+            Exception: The first error raised by ``items`` or ``on_result``. No
+                new items are started after it; calls in flight complete first.
+        """
+        limit = _AdaptiveLimit(self.max_concurrency, self.min_concurrency)
+        condition = threading.Condition()
+        source = enumerate(items)
+        results: List[BulkItemResult] = []
+        errors: List[Exception] = []
+
+        def acquire() -> None:
+            with condition:
+                while True:
+                    now = time.monotonic()
+                    if limit.can_start(now):
+                        limit.in_flight += 1
+                        return
+                    condition.wait(timeout=limit.wait_time(now))
+
+        def release(throttle_delay: Optional[float] = None, success: bool = False) -> None:
+            with condition:
+                limit.in_flight -= 1
+                if throttle_delay is not None:
+                    limit.on_throttle(throttle_delay)
+                elif success:
+                    limit.on_success()
+                condition.notify_all()
+
+        def process(index: int, item: Any) -> BulkItemResult:
+            attempt = 0
+            while True:
+                attempt += 1
+                acquire()
+                try:
+                    value = func(item)
+                except Exception as e:
+                    delay = self._retry_delay(e, attempt)
+                    throttled = delay is not None and _error_status(e) == 429
+                    release(throttle_delay=delay if throttled else None)
+                    if delay is None:
+                        return BulkItemResult(index, item, error=e, attempts=attempt)
+                    logger.debug(f"Bulk item {index} failed with status {_error_status(e)}, retrying in {delay:.2f}s")
+                    if not throttled:
+                        time.sleep(delay)
+                    continue
+                release(success=True)
+                return BulkItemResult(index, item, result=value, attempts=attempt)
+
+        def worker() -> None:
+            try:
+                while True:
+                    with condition:
+                        if errors:
+                            return
+                        try:
+                            index, item = next(source)
+                        except StopIteration:
+                            return
+                    item_result = process(index, item)
+                    with condition:
+                        results.append(item_result)
+                    if on_result is not None:
+                        on_result(item_result)
+            except Exception as e:
+                # Stop the run rather than silently dropping this worker's remaining items
+                with condition:
+                    errors.append(e)
+
+        threads = [
+            threading.Thread(target=worker, name=f"kinde-bulk-{n}", daemon=True)
+            for n in range(self.max_concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return BulkResult(results)
+
+    async def arun(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        on_result: Optional[Callable[[BulkItemResult], None]] = None,
+    ) -> BulkResult:
+        """
+        Await ``func(item)`` for every item with bounded concurrency.
+
+        Args:
+            func: Coroutine function to call for each item (e.g. an AsyncManagementClient method)
+            items: The items; consumed lazily
+            on_result: Optional callback invoked with each BulkItemResult as it completes
+
+        Returns:
+            BulkResult: The results of all items
+
+        Raises:
+            Exception: The first error raised by ``items`` or ``on_result``. No
+                new items are started after it; calls in flight complete first.
+        """
+        limit = _AdaptiveLimit(self.max_concurrency, self.min_concurrency)
+        condition = asyncio.Condition()
+        source = enumerate(items)
+        results: List[BulkItemResult] = []
+        errors: List[Exception] = []
+
+        async def acquire() -> None:
+            async with condition:
+                while True:
+                    now = time.monotonic()
+                    if limit.can_start(now):
+                        limit.in_flight += 1
+                        return
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=limit.wait_time(now))
+                    except asyncio.TimeoutError:
+                        pass
+
+        async def release(throttle_delay: Optional[float] = None, success: bool = False) -> None:
+            async with condition:
+                limit.in_flight -= 1
+                if throttle_delay is not None:
+                    limit.on_throttle(throttle_delay)
+                elif success:
+                    limit.on_success()
+                condition.notify_all()
+
+        async def process(index: int, item: Any) -> BulkItemResult:
+            attempt = 0
+            while True:
+                attempt += 1
+                await acquire()
+                try:
+                    value = await func(item)
+                except Exception as e:
+                    delay = self._retry_delay(e, attempt)
+                    throttled = delay is not None and _error_status(e) == 429
+                    await release(throttle_delay=delay if throttled else None)
+                    if delay is None:
+                        return BulkItemResult(index, item, error=e, attempts=attempt)
+                    logger.debug(f"Bulk item {index} failed with status {_error_status(e)}, retrying in {delay:.2f}s")
+                    if not throttled:
+                        await asyncio.sleep(delay)
+                    continue
+                await release(success=True)
+                return BulkItemResult(index, item, result=value, attempts=attempt)
+
+        async def worker() -> None:
+            try:
+                while not errors:
+                    try:
+                        index, item = next(source)
+                    except StopIteration:
+                        return
+                    item_result = await process(index, item)
+                    results.append(item_result)
+                    if on_result is not None:
+                        on_result(item_result)
+            except Exception as e:
+                errors.append(e)
+
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+        if errors:
+            raise errors[0]
+        return BulkResult(results)
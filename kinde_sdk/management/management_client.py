@@ -6,17 +6,19 @@ with the existing Kinde SDK infrastructure and adds automatic token management
 to the generated API classes.
 """
 
-import inspect
 import logging
 import re
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
 import warnings
 
 # Import the api module to dynamically load all API classes
 from kinde_sdk.management import api
+from kinde_sdk.core.sdk_headers import sdk_headers
 from kinde_sdk.management.api_client import ApiClient
 from kinde_sdk.management.configuration import Configuration
 from .management_token_manager import ManagementTokenManager
+from .bulk import BulkExecutor, BulkItemResult, BulkResult
+from .pagination import paginate
 
 logger = logging.getLogger("kinde_sdk.management")
 
@@ -29,7 +31,7 @@ class ManagementClient:
     the auto-generated API classes, with automatic token management.
     
     All API classes are dynamically loaded from the 'api' module and made available
-    as snake_case properties. For example:
+    as snake_case properties, created on first access. For example:
     - UsersApi -> client.users_api.*
     - OrganizationsApi -> client.organizations_api.*
     - FeatureFlagsApi -> client.feature_flags_api.*
@@ -91,12 +93,12 @@ class ManagementClient:
         # Initialize API client with the correct configuration
         self.configuration = Configuration(host=self.base_url)
         self.api_client = ApiClient(configuration=self.configuration)
+        sdk_headers.apply_to(self.api_client)
         
         # Set up automatic token injection
         self._setup_token_handling()
         
-        # Dynamically initialize all API classes from the api module
-        self._initialize_api_classes()
+        # API classes from the api module are created on first access (see __getattr__)
     
     def _setup_token_handling(self):
         """
@@ -132,34 +134,47 @@ class ManagementClient:
         
         self.api_client.call_api = call_api_with_token
     
-    def _initialize_api_classes(self):
+    _api_attributes: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def _api_class_names(cls) -> Dict[str, str]:
         """
-        Dynamically initialize all API classes from the api module.
-        
-        This method inspects the api module and creates an instance of each
-        API class (classes ending with 'Api'), making them available as
-        snake_case attributes on this client.
-        
+        Map snake_case attribute names to the API class names of the api module.
+
+        Built from the api module's export list, so no API module is imported.
+
         For example:
-        - UsersApi -> self.users_api
-        - OrganizationsApi -> self.organizations_api
-        - FeatureFlagsApi -> self.feature_flags_api
-        """
-        # Get all members of the api module
-        for name, obj in inspect.getmembers(api):
-            # Check if it's a class and ends with 'Api'
-            if inspect.isclass(obj) and name.endswith('Api'):
-                # Convert class name to snake_case attribute name
-                # e.g., UsersApi -> users, FeatureFlagsApi -> feature_flags
-                attr_name = self._class_name_to_snake_case(name)
-                
-                # Initialize the API class with our configured api_client
-                api_instance = obj(api_client=self.api_client)
-                
-                # Set it as an attribute on this client
-                setattr(self, attr_name, api_instance)
-                
-                logger.debug(f"Initialized {name} as client.{attr_name}")
+        - users_api -> UsersApi
+        - organizations_api -> OrganizationsApi
+        - feature_flags_api -> FeatureFlagsApi
+        """
+        if ManagementClient._api_attributes is None:
+            ManagementClient._api_attributes = {
+                ManagementClient._class_name_to_snake_case(name): name
+                for name in api.__all__
+                if name.endswith('Api')
+            }
+        return ManagementClient._api_attributes
+
+    def __getattr__(self, name: str):
+        """
+        Create API instances on first access (e.g. ``client.users_api``).
+
+        Only the API classes (and the models they use) that are actually
+        accessed get imported, which keeps cold starts fast.
+        """
+        class_name = self._api_class_names().get(name)
+        if class_name is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        # Initialize the API class with our configured api_client
+        api_instance = getattr(api, class_name)(api_client=self.api_client)
+        setattr(self, name, api_instance)
+        logger.debug(f"Initialized {class_name} as client.{name}")
+        return api_instance
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._api_class_names()))
     
     @staticmethod
     def _class_name_to_snake_case(class_name: str) -> str:
@@ -200,6 +215,93 @@ class ManagementClient:
         # Convert to lowercase
         return s2.lower()
     
+    # Auto-pagination: stream every item of a list endpoint, following next_token
+
+    def paginate(self, fetch_page, items_field: Optional[str] = None, page_size: Optional[int] = None,
+                 prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """
+        Iterate over all items of any paginated list endpoint.
+
+        Args:
+            fetch_page: The API method, e.g. ``client.roles_api.get_role_users``
+            items_field: Name of the list field in the response (inferred if None)
+            page_size: Number of items per request (API default if None)
+            prefetch: Fetch the next page while the current one is consumed
+            **kwargs: Other arguments for ``fetch_page``
+
+        Returns:
+            Iterator[Any]: The items of every page, in order
+        """
+        return paginate(fetch_page, items_field, page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_users(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate over all users. Filters are passed to UsersApi.get_users()."""
+        return self.paginate(self.users_api.get_users, "users", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_organizations(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate over all organizations. Filters are passed to OrganizationsApi.get_organizations()."""
+        return self.paginate(self.organizations_api.get_organizations, "organizations", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_organization_users(self, org_code: str, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate over all users of an organization. Filters are passed to OrganizationsApi.get_organization_users()."""
+        return self.paginate(self.organizations_api.get_organization_users, "organization_users", page_size=page_size, prefetch=prefetch, org_code=org_code, **kwargs)
+
+    def iter_organization_invites(self, org_code: str, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate over all invitations of an organization. Filters are passed to OrganizationsApi.get_organization_invites()."""
+        return self.paginate(self.organizations_api.get_organization_invites, "invites", page_size=page_size, prefetch=prefetch, org_code=org_code, **kwargs)
+
+    def iter_roles(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate over all roles. Filters are passed to RolesApi.get_roles()."""
+        return self.paginate(self.roles_api.get_roles, "roles", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_permissions(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate over all permissions. Filters are passed to PermissionsApi.get_permissions()."""
+        return self.paginate(self.permissions_api.get_permissions, "permissions", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_applications(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate over all applications. Filters are passed to ApplicationsApi.get_applications()."""
+        return self.paginate(self.applications_api.get_applications, "applications", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    def iter_subscribers(self, page_size: Optional[int] = None, prefetch: bool = False, **kwargs) -> Iterator[Any]:
+        """Iterate over all subscribers. Filters are passed to SubscribersApi.get_subscribers()."""
+        return self.paginate(self.subscribers_api.get_subscribers, "subscribers", page_size=page_size, prefetch=prefetch, **kwargs)
+
+    # Bulk operations: many calls run concurrently with rate-limit handling
+
+    def run_bulk(self, func: Callable[[Any], Any], items: Iterable[Any], max_concurrency: int = 8,
+                 on_result: Optional[Callable[[BulkItemResult], None]] = None, **kwargs) -> BulkResult:
+        """
+        Call ``func(item)`` for every item concurrently.
+
+        429 responses reduce the concurrency and pause all calls for the
+        ``Retry-After`` period, then the call is retried. 502/503/504 failures
+        are retried only with ``retry_server_errors=True``, for idempotent calls.
+        Other failures are recorded per item and do not stop the run.
+
+        Example:
+            ```python
+            result = client.run_bulk(
+                lambda user: client.users_api.create_user(create_user_request=user),
+                users,
+            )
+            ```
+
+        Args:
+            func: The call to make for each item
+            items: The items; consumed lazily
+            max_concurrency: Maximum number of calls in flight
+            on_result: Optional callback invoked with each BulkItemResult as it completes
+            **kwargs: Other BulkExecutor options (max_retries, base_delay, ...)
+
+        Returns:
+            BulkResult: Per-item results and errors, in input order
+
+        Raises:
+            Exception: The first error raised by ``items`` or ``on_result``
+        """
+        executor = BulkExecutor(max_concurrency=max_concurrency, **kwargs)
+        return executor.run(func, items, on_result=on_result)
+
     # Backwards compatibility: Provide direct method access for common operations
     # These delegate to the appropriate API class methods
     # Note: These methods are deprecated. For full functionality and proper type hints,
@@ -4,65 +4,57 @@ Token manager for the Kinde Management API.
 This module provides token management for the Kinde Management API using client credentials flow.
 """
 
+import asyncio
+import logging
 import time
 import requests
 import threading
-from typing import Any, Dict, Optional
-import importlib.metadata
-import sys
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+from kinde_sdk.core.async_http import async_post, raise_for_status
+from kinde_sdk.core.shared_token_cache import SharedTokenCache
+from kinde_sdk.core.refresh_scheduler import TokenRefreshScheduler, get_refresh_scheduler
+from kinde_sdk.core.http_client import http_client
+from kinde_sdk.core.verified_token_cache import verified_token_cache
+from kinde_sdk.core import sdk_headers as sdk_headers_module
+from kinde_sdk.core.sdk_headers import sdk_headers
+
+logger = logging.getLogger("kinde_sdk.management")
 
 class SDKTracker:
-    """Handles SDK tracking header generation for Kinde Python SDK."""
+    """
+    Handles SDK tracking header generation for Kinde Python SDK.
+
+    Kept for compatibility; the headers are computed once by
+    kinde_sdk.core.sdk_headers and shared by all SDK requests.
+    """
     
     # SDK Package name for version detection
     SDK_PACKAGE_NAME = "kinde-python-sdk"
     
     # Framework detection mapping
-    FRAMEWORK_DETECTION = {
-        'django': 'Django',
-        'flask': 'Flask', 
-        'fastapi': 'FastAPI',
-        'starlette': 'Starlette',
-        'tornado': 'Tornado',
-        'pyramid': 'Pyramid',
-        'bottle': 'Bottle',
-        'cherrypy': 'CherryPy',
-        'falcon': 'Falcon',
-        'sanic': 'Sanic',
-        'quart': 'Quart',
-        'aiohttp': 'aiohttp'
-    }
+    FRAMEWORK_DETECTION = sdk_headers_module.FRAMEWORK_DETECTION
     
     @classmethod
     def get_sdk_version(cls) -> str:
         """Get the installed SDK version."""
-        try:
-            return importlib.metadata.version(cls.SDK_PACKAGE_NAME)
-        except importlib.metadata.PackageNotFoundError:
-            # Fallback for development/testing
-            return "2.0.0-dev"
+        return sdk_headers_module.get_sdk_version()
     
     @classmethod
     def get_python_version(cls) -> str:
         """Get the Python version in format: major.minor.micro"""
-        version_info = sys.version_info
-        return f"{version_info.major}.{version_info.minor}.{version_info.micro}"
+        return sdk_headers_module.get_python_version()
     
     @classmethod
     def detect_framework(cls) -> Optional[str]:
         """
-        Detect the web framework being used.
+        Detect the web framework being used from the modules already imported.
         
         Returns:
             str: Framework name if detected, None otherwise
         """
-        for module_name, framework_name in cls.FRAMEWORK_DETECTION.items():
-            try:
-                importlib.import_module(module_name)
-                return framework_name
-            except ImportError:
-                continue
-        return None
+        return sdk_headers_module.detect_framework()
     
     @classmethod
     def generate_tracking_header(cls, framework: Optional[str] = None) -> str:
@@ -74,20 +66,11 @@ class SDKTracker:
             
         Returns:
             str: Header value in format: Python-[framework]/[SDK_VERSION]/[PYTHON_VERSION]/python
-                 or Python/[SDK_VERSION] if no framework detected
+                 or Python/[SDK_VERSION]/[PYTHON_VERSION]/python if no framework detected
         """
-        sdk_version = cls.get_sdk_version()
-        python_version = cls.get_python_version()
-        
-        # Use provided framework or auto-detect
-        detected_framework = framework or cls.detect_framework()
-        
-        if detected_framework:
-            # Format: Python-[framework]/[SDK_VERSION]/[PYTHON_VERSION]/python
-            return f"Python-{detected_framework}/{sdk_version}/{python_version}/python"
-        else:
-            # Format: Python/[SDK_VERSION] (when no framework detected)
-            return f"Python/{sdk_version}"
+        if framework:
+            return sdk_headers_module.build_tracking_header(framework)
+        return sdk_headers.tracking_header
     
     @classmethod
     def get_tracking_headers(cls, framework: Optional[str] = None) -> Dict[str, str]:
@@ -115,11 +98,50 @@ class ManagementTokenManager:
 
     # SDK tracking configuration
     SDK_PACKAGE_NAME = "kinde-python-sdk"
-    FRAMEWORK_DETECTION = {
-        'django': 'Django',
-        'flask': 'Flask', 
-        'fastapi': 'FastAPI'
-    }
+    FRAMEWORK_DETECTION = sdk_headers_module.FRAMEWORK_DETECTION
+
+    # Seconds before expiry at which a new token is requested
+    EXPIRY_BUFFER = 60
+    # Renews tokens ahead of expiry when set (see enable_background_refresh)
+    _refresh_scheduler: Optional[TokenRefreshScheduler] = None
+    # Shares tokens with other processes when set (see enable_shared_cache)
+    _shared_cache: Optional[SharedTokenCache] = None
+
+    @classmethod
+    def enable_background_refresh(cls, scheduler: Optional[TokenRefreshScheduler] = None) -> None:
+        """
+        Request new M2M tokens in the background before they expire.
+
+        Args:
+            scheduler: The scheduler to use. Defaults to the shared scheduler.
+        """
+        cls._refresh_scheduler = scheduler or get_refresh_scheduler()
+
+    @classmethod
+    def disable_background_refresh(cls) -> None:
+        """Stop scheduling background refreshes for new tokens."""
+        cls._refresh_scheduler = None
+
+    @classmethod
+    def enable_shared_cache(cls, cache: SharedTokenCache) -> None:
+        """
+        Share M2M tokens with other processes, e.g. the workers of a
+        multi-process server or cron jobs on the same node.
+
+        Processes reuse a valid token from the cache instead of requesting
+        their own, and renewals are locked so only one process requests a
+        new token while the others wait for it.
+
+        Args:
+            cache: The shared cache, e.g. FileTokenCache or SQLiteTokenCache
+                from kinde_sdk.core.shared_token_cache
+        """
+        cls._shared_cache = cache
+
+    @classmethod
+    def disable_shared_cache(cls) -> None:
+        """Keep M2M tokens in process memory only."""
+        cls._shared_cache = None
 
     @classmethod
     def reset_instances(cls):
@@ -151,41 +173,37 @@ class ManagementTokenManager:
         self.token_url = f"https://{domain}/oauth2/token"
         self.tokens = {}  # Store tokens
         self.lock = threading.RLock()  # Add a lock for thread safety
+        # Verifiers by expected audience, created lazily by validate_via_jwks
+        self._token_verifiers = {}
+        self._jwks_key_cache = None  # Signing keys, shared by the verifiers
+        # asyncio locks are bound to their event loop, so keep one per loop
+        self._async_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
         self.initialized = True
 
     def _get_sdk_version(self) -> str:
         """Get the installed SDK version."""
-        try:
-            return importlib.metadata.version(self.SDK_PACKAGE_NAME)
-        except importlib.metadata.PackageNotFoundError:
-            # Fallback for development/testing
-            return "2.0.0-dev"
+        return sdk_headers_module.get_sdk_version()
 
     def _get_python_version(self) -> str:
         """Get the Python version in format: major.minor.micro"""
-        version_info = sys.version_info
-        return f"{version_info.major}.{version_info.minor}.{version_info.micro}"
+        return sdk_headers_module.get_python_version()
 
     def _detect_framework(self) -> Optional[str]:
         """
-        Detect the web framework being used.
+        Detect the web framework being used from the modules already imported.
         
         Returns:
             str: Framework name if detected, None otherwise
         """
-        for module_name, framework_name in self.FRAMEWORK_DETECTION.items():
-            try:
-                importlib.import_module(module_name)
-                return framework_name
-            except ImportError:
-                continue
-        return None
+        return sdk_headers_module.detect_framework()
 
     def _generate_tracking_header(self, framework: Optional[str] = None) -> str:
         """
         Generate the Kinde-SDK tracking header value.
         
         Format: [SDK Used]/[Version of SDK]/[Version of language]/python
+
+        Requests use the precomputed sdk_headers instead of calling this.
         
         Args:
             framework: Optional framework name to override auto-detection
@@ -193,18 +211,11 @@ class ManagementTokenManager:
         Returns:
             str: Header value in 4-segment format as per client specification
         """
-        sdk_version = self._get_sdk_version()
-        python_version = self._get_python_version()
-        
-        # Use provided framework or auto-detect
-        detected_framework = framework or self._detect_framework()
-        
-        if detected_framework:
-            # Format: Python-[framework]/[SDK_VERSION]/[PYTHON_VERSION]/python
-            return f"Python-{detected_framework}/{sdk_version}/{python_version}/python"
-        else:
-            # Format: Python/[SDK_VERSION]/[PYTHON_VERSION]/python (FIXED - now 4 segments)
-            return f"Python/{sdk_version}/{python_version}/python"
+        return sdk_headers_module.build_tracking_header(
+            framework or self._detect_framework(),
+            sdk_version=self._get_sdk_version(),
+            python_version=self._get_python_version(),
+        )
 
     def set_tokens(self, token_data: Dict[str, Any]):
         """ Store tokens with expiration. """
@@ -220,18 +231,157 @@ class ManagementTokenManager:
                 "token_type": token_type
             }
 
+    def _refresh_schedule_key(self) -> str:
+        return f"m2m:{self.domain}:{self.client_id}"
+
+    def _schedule_refresh(self) -> None:
+        """
+        Schedule a background renewal of the client credentials token.
+
+        Only the client credentials paths call this: tokens stored by the
+        validate_and_set_* methods are a user's bearer token, which this
+        manager cannot renew.
+        """
+        scheduler = self._refresh_scheduler
+        if scheduler is None:
+            return
+        with self.lock:
+            expires_in = self.tokens.get("expires_at", 0) - time.time()
+        if expires_in > 0:
+            scheduler.schedule(self._refresh_schedule_key(), self._background_refresh, expires_in)
+
+    def _background_refresh(self) -> None:
+        """
+        Refresh callback run by the background scheduler.
+
+        The lock is not held during the request, so readers keep getting the
+        current (still valid) token until set_tokens swaps in the new one.
+        With a shared cache, a token another process renewed meanwhile is
+        adopted instead of requesting one more.
+        """
+        shared_cache = self._shared_cache
+        if shared_cache is None:
+            self.request_new_token()
+            return
+
+        with self.lock:
+            current_expiry = self.tokens.get("expires_at", 0)
+        with shared_cache.lock(self._refresh_schedule_key()):
+            shared = self._shared_token(shared_cache)
+            if shared is not None and shared["expires_at"] > current_expiry:
+                self._adopt_shared_token(shared)
+            else:
+                self.request_new_token()
+
+    def _shared_token(self, shared_cache: SharedTokenCache) -> Optional[Dict[str, Any]]:
+        """Get the shared token if it is not about to expire."""
+        try:
+            token = shared_cache.get(self._refresh_schedule_key())
+        except Exception as e:
+            logger.warning(f"Could not read the shared M2M token cache: {e}")
+            return None
+        if (
+            isinstance(token, dict) and token.get("access_token")
+            and isinstance(token.get("expires_at"), (int, float))
+            and time.time() < token["expires_at"] - self.EXPIRY_BUFFER
+        ):
+            return token
+        return None
+
+    def _adopt_shared_token(self, token: Dict[str, Any]) -> str:
+        """Use a token another process stored in the shared cache."""
+        with self.lock:
+            self.tokens = {
+                "access_token": token["access_token"],
+                "expires_at": token["expires_at"],
+                "token_type": token.get("token_type") or "Bearer",
+            }
+        self._schedule_refresh()
+        return token["access_token"]
+
+    def _publish_token(self) -> None:
+        """Store the current client credentials token in the shared cache."""
+        shared_cache = self._shared_cache
+        if shared_cache is None:
+            return
+        with self.lock:
+            token = dict(self.tokens)
+        try:
+            shared_cache.set(self._refresh_schedule_key(), token)
+        except Exception as e:
+            logger.warning(f"Could not write the shared M2M token cache: {e}")
+
+    def _cached_access_token(self) -> Optional[str]:
+        """Return the stored access token if it is not about to expire."""
+        with self.lock:
+            if self.tokens and "access_token" in self.tokens and time.time() < self.tokens.get("expires_at", 0) - self.EXPIRY_BUFFER:
+                return self.tokens["access_token"]
+            return None
+
     def get_access_token(self):
         """ Get a valid access token. Request new if expired. """
         with self.lock:
             # Check if token exists and is not expired
-            if self.tokens and "access_token" in self.tokens and time.time() < self.tokens.get("expires_at", 0) - 60:
-                return self.tokens["access_token"]
-                
-            # Need to get a new token
-            return self.request_new_token()
+            token = self._cached_access_token()
+            if token:
+                return token
 
-    def request_new_token(self):
-        """Use client credentials to get a new access token with tracking headers."""
+            shared_cache = self._shared_cache
+            if shared_cache is None:
+                # Need to get a new token
+                return self.request_new_token()
+
+        return self._get_shared_access_token(shared_cache)
+
+    def _get_shared_access_token(self, shared_cache: SharedTokenCache) -> str:
+        """Reuse the shared token, or request one while holding the shared renewal lock."""
+        shared = self._shared_token(shared_cache)
+        if shared is not None:
+            return self._adopt_shared_token(shared)
+
+        # The shared lock is always taken before self.lock, as in _background_refresh
+        with shared_cache.lock(self._refresh_schedule_key()):
+            with self.lock:
+                # Another thread or process may have renewed it while we waited
+                token = self._cached_access_token()
+                if token:
+                    return token
+                shared = self._shared_token(shared_cache)
+                if shared is not None:
+                    return self._adopt_shared_token(shared)
+                return self.request_new_token()
+
+    async def get_access_token_async(self) -> str:
+        """
+        Get a valid access token without blocking the event loop.
+
+        Concurrent callers on the same event loop share a single token request.
+
+        Returns:
+            str: The access token
+        """
+        token = self._cached_access_token()
+        if token:
+            return token
+
+        if self._shared_cache is not None:
+            # The shared cache and its lock are blocking, so coordinate in a worker thread
+            return await asyncio.to_thread(self.get_access_token)
+
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            async_lock = self._async_locks.get(loop)
+            if async_lock is None:
+                async_lock = self._async_locks[loop] = asyncio.Lock()
+
+        async with async_lock:
+            token = self._cached_access_token()
+            if token:
+                return token
+            return await self.request_new_token_async()
+
+    def _token_request(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Build the form data and headers for a client credentials request."""
         data = {
             "grant_type": "client_credentials",
             "client_id": self.client_id,
@@ -247,11 +397,16 @@ class ManagementTokenManager:
         # Add SDK tracking header as per specification
         # This is required for analytics and support purposes
         # Format: [SDK Used]/[Version of SDK]/[Version of language]/python
-        headers["Kinde-SDK"] = self._generate_tracking_header()
+        headers.update(sdk_headers.get())
+        return data, headers
+
+    def request_new_token(self):
+        """Use client credentials to get a new access token with tracking headers."""
+        data, headers = self._token_request()
         
         # Add timeout to prevent hanging on network issues
         try:
-            response = requests.post(
+            response = http_client.post(
                 self.token_url, 
                 data=data, 
                 headers=headers,  # Now includes tracking headers
@@ -262,6 +417,8 @@ class ManagementTokenManager:
             
             # This call now works because we use RLock
             self.set_tokens(token_data)
+            self._schedule_refresh()
+            self._publish_token()
             return self.tokens["access_token"]
             
         except requests.exceptions.Timeout:
@@ -269,10 +426,35 @@ class ManagementTokenManager:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Token request failed for domain {self.domain}: {str(e)}") from e
 
+    async def request_new_token_async(self) -> str:
+        """Async version of request_new_token, using the shared async HTTP client."""
+        data, headers = self._token_request()
+
+        try:
+            response = await async_post(self.token_url, data=data, headers=headers, timeout=30)
+            raise_for_status(response)
+            token_data = response.json()
+        except requests.exceptions.Timeout:
+            raise Exception(f"Token request timed out after 30 seconds for domain {self.domain}")
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Token request failed for domain {self.domain}: {str(e)}") from e
+
+        self.set_tokens(token_data)
+        self._schedule_refresh()
+        self._publish_token()
+        return self.tokens["access_token"]
+
     def clear_tokens(self):
         """ Clear stored tokens. """
         with self.lock:
             self.tokens = {}
+        if self._shared_cache is not None:
+            try:
+                self._shared_cache.delete(self._refresh_schedule_key())
+            except Exception as e:
+                logger.warning(f"Could not clear the shared M2M token cache: {e}")
+        if self._refresh_scheduler is not None:
+            self._refresh_scheduler.cancel(self._refresh_schedule_key())
 
     def validate_and_set_via_introspection(self, bearer_token: str) -> Dict[str, Any]:
         """
@@ -287,6 +469,16 @@ class ManagementTokenManager:
         Raises:
             Exception: If introspection fails or token is invalid.
         """
+        # Repeat presentations of an already-introspected token skip the round-trips
+        cache_context = f"introspection|{self.domain}"
+        cached_result = verified_token_cache.get(bearer_token, cache_context)
+        if cached_result is not None:
+            self.set_tokens({
+                "access_token": bearer_token,
+                "expires_in": max(0, cached_result["exp"] - int(time.time())) if cached_result.get("exp") else 3600
+            })
+            return cached_result
+
         # First, get a management token using client credentials
         management_token = self.get_access_token()
         
@@ -296,14 +488,13 @@ class ManagementTokenManager:
         }
         
         try:
-            response = requests.post(
+            response = http_client.post(
                 introspection_url, 
                 data=introspect_data,
-                headers={
+                headers=sdk_headers.merge({
                     "Content-Type": "application/x-www-form-urlencoded",
                     "Authorization": f"Bearer {management_token}",
-                    "Kinde-SDK": self._generate_tracking_header()
-                },
+                }),
                 timeout=30
             )
             response.raise_for_status()
@@ -321,10 +512,57 @@ class ManagementTokenManager:
                 "expires_in": expires_in
             }
             self.set_tokens(token_data)
+            verified_token_cache.set(bearer_token, introspection_result, cache_context)
             
             return introspection_result
             
         except requests.exceptions.Timeout:
             raise Exception(f"Introspection request timed out after 30 seconds for domain {self.domain}") from None
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Introspection request failed for domain {self.domain}: {str(e)}") from e
\ No newline at end of file
+            raise Exception(f"Introspection request failed for domain {self.domain}: {str(e)}") from e
+
+    def get_token_verifier(self, audience: Optional[str] = None):
+        """
+        Get the local JWKS-backed token verifier for this domain and audience.
+
+        One verifier is kept per audience. They share a single signing key
+        cache, so only the first verification, TTL expiry or key rotation hits
+        the JWKS endpoint.
+
+        Args:
+            audience: Expected audience. If None, the audience is not checked.
+
+        Returns:
+            TokenVerifier: The verifier for this domain and audience
+        """
+        from kinde_sdk.auth.token_verifier import JwksKeyCache, TokenVerifier, normalize_issuer
+
+        with self.lock:
+            verifier = self._token_verifiers.get(audience)
+            if verifier is None:
+                if self._jwks_key_cache is None:
+                    self._jwks_key_cache = JwksKeyCache(f"{normalize_issuer(self.domain)}/.well-known/jwks.json")
+                verifier = TokenVerifier(self.domain, audience=audience, key_cache=self._jwks_key_cache)
+                self._token_verifiers[audience] = verifier
+            return verifier
+
+    def validate_via_jwks(self, bearer_token: str, audience: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Validate a bearer token locally against the domain's JWKS.
+
+        This is the in-process alternative to introspection: the signature,
+        issuer, audience, expiry and not-before claims are checked without
+        calling the introspection endpoint. The manager's own client
+        credentials token is left unchanged.
+
+        Args:
+            bearer_token: The bearer token to validate.
+            audience: Expected audience. If None, the audience is not checked.
+
+        Returns:
+            Dict: The verified token claims.
+
+        Raises:
+            KindeTokenException: If the token is invalid.
+        """
+        return self.get_token_verifier(audience).verify(bearer_token)
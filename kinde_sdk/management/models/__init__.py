@@ -13,270 +13,560 @@
     Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from kinde_sdk.management.models.add_api_scope_request import AddAPIScopeRequest
-from kinde_sdk.management.models.add_apis_request import AddAPIsRequest
-from kinde_sdk.management.models.add_organization_users_request import AddOrganizationUsersRequest
-from kinde_sdk.management.models.add_organization_users_request_users_inner import AddOrganizationUsersRequestUsersInner
-from kinde_sdk.management.models.add_organization_users_response import AddOrganizationUsersResponse
-from kinde_sdk.management.models.add_role_scope_request import AddRoleScopeRequest
-from kinde_sdk.management.models.add_role_scope_response import AddRoleScopeResponse
-from kinde_sdk.management.models.api_result import ApiResult
-from kinde_sdk.management.models.application_access_role import ApplicationAccessRole
-from kinde_sdk.management.models.applications import Applications
-from kinde_sdk.management.models.authorize_app_api_response import AuthorizeAppApiResponse
-from kinde_sdk.management.models.category import Category
-from kinde_sdk.management.models.connected_apps_access_token import ConnectedAppsAccessToken
-from kinde_sdk.management.models.connected_apps_auth_url import ConnectedAppsAuthUrl
-from kinde_sdk.management.models.connection import Connection
-from kinde_sdk.management.models.connection_connection import ConnectionConnection
-from kinde_sdk.management.models.create_api_key_request import CreateApiKeyRequest
-from kinde_sdk.management.models.create_api_key_response import CreateApiKeyResponse
-from kinde_sdk.management.models.create_api_key_response_api_key import CreateApiKeyResponseApiKey
-from kinde_sdk.management.models.create_api_scopes_response import CreateApiScopesResponse
-from kinde_sdk.management.models.create_api_scopes_response_scope import CreateApiScopesResponseScope
-from kinde_sdk.management.models.create_apis_response import CreateApisResponse
-from kinde_sdk.management.models.create_apis_response_api import CreateApisResponseApi
-from kinde_sdk.management.models.create_application_request import CreateApplicationRequest
-from kinde_sdk.management.models.create_application_response import CreateApplicationResponse
-from kinde_sdk.management.models.create_application_response_application import CreateApplicationResponseApplication
-from kinde_sdk.management.models.create_billing_agreement_request import CreateBillingAgreementRequest
-from kinde_sdk.management.models.create_category_request import CreateCategoryRequest
-from kinde_sdk.management.models.create_category_response import CreateCategoryResponse
-from kinde_sdk.management.models.create_category_response_category import CreateCategoryResponseCategory
-from kinde_sdk.management.models.create_connection_request import CreateConnectionRequest
-from kinde_sdk.management.models.create_connection_request_options import CreateConnectionRequestOptions
-from kinde_sdk.management.models.create_connection_request_options_one_of import CreateConnectionRequestOptionsOneOf
-from kinde_sdk.management.models.create_connection_request_options_one_of1 import CreateConnectionRequestOptionsOneOf1
-from kinde_sdk.management.models.create_connection_request_options_one_of2 import CreateConnectionRequestOptionsOneOf2
-from kinde_sdk.management.models.create_connection_response import CreateConnectionResponse
-from kinde_sdk.management.models.create_connection_response_connection import CreateConnectionResponseConnection
-from kinde_sdk.management.models.create_directory_request import CreateDirectoryRequest
-from kinde_sdk.management.models.create_directory_response import CreateDirectoryResponse
-from kinde_sdk.management.models.create_environment_variable_request import CreateEnvironmentVariableRequest
-from kinde_sdk.management.models.create_environment_variable_response import CreateEnvironmentVariableResponse
-from kinde_sdk.management.models.create_environment_variable_response_environment_variable import CreateEnvironmentVariableResponseEnvironmentVariable
-from kinde_sdk.management.models.create_feature_flag_request import CreateFeatureFlagRequest
-from kinde_sdk.management.models.create_identity_response import CreateIdentityResponse
-from kinde_sdk.management.models.create_identity_response_identity import CreateIdentityResponseIdentity
-from kinde_sdk.management.models.create_meter_usage_record_request import CreateMeterUsageRecordRequest
-from kinde_sdk.management.models.create_meter_usage_record_response import CreateMeterUsageRecordResponse
-from kinde_sdk.management.models.create_organization_invite_request import CreateOrganizationInviteRequest
-from kinde_sdk.management.models.create_organization_invite_response import CreateOrganizationInviteResponse
-from kinde_sdk.management.models.create_organization_invite_response_invite import CreateOrganizationInviteResponseInvite
-from kinde_sdk.management.models.create_organization_request import CreateOrganizationRequest
-from kinde_sdk.management.models.create_organization_response import CreateOrganizationResponse
-from kinde_sdk.management.models.create_organization_response_organization import CreateOrganizationResponseOrganization
-from kinde_sdk.management.models.create_organization_user_permission_request import CreateOrganizationUserPermissionRequest
-from kinde_sdk.management.models.create_organization_user_role_request import CreateOrganizationUserRoleRequest
-from kinde_sdk.management.models.create_permission_request import CreatePermissionRequest
-from kinde_sdk.management.models.create_property_request import CreatePropertyRequest
-from kinde_sdk.management.models.create_property_response import CreatePropertyResponse
-from kinde_sdk.management.models.create_property_response_property import CreatePropertyResponseProperty
-from kinde_sdk.management.models.create_role_request import CreateRoleRequest
-from kinde_sdk.management.models.create_roles_response import CreateRolesResponse
-from kinde_sdk.management.models.create_roles_response_role import CreateRolesResponseRole
-from kinde_sdk.management.models.create_subscriber_success_response import CreateSubscriberSuccessResponse
-from kinde_sdk.management.models.create_subscriber_success_response_subscriber import CreateSubscriberSuccessResponseSubscriber
-from kinde_sdk.management.models.create_user_billing_customer_request import CreateUserBillingCustomerRequest
-from kinde_sdk.management.models.create_user_billing_customer_response import CreateUserBillingCustomerResponse
-from kinde_sdk.management.models.create_user_billing_customer_response_billing_customer import CreateUserBillingCustomerResponseBillingCustomer
-from kinde_sdk.management.models.create_user_identity_request import CreateUserIdentityRequest
-from kinde_sdk.management.models.create_user_request import CreateUserRequest
-from kinde_sdk.management.models.create_user_request_identities_inner import CreateUserRequestIdentitiesInner
-from kinde_sdk.management.models.create_user_request_identities_inner_details import CreateUserRequestIdentitiesInnerDetails
-from kinde_sdk.management.models.create_user_request_profile import CreateUserRequestProfile
-from kinde_sdk.management.models.create_user_response import CreateUserResponse
-from kinde_sdk.management.models.create_web_hook_request import CreateWebHookRequest
-from kinde_sdk.management.models.create_webhook_response import CreateWebhookResponse
-from kinde_sdk.management.models.create_webhook_response_webhook import CreateWebhookResponseWebhook
-from kinde_sdk.management.models.delete_api_response import DeleteApiResponse
-from kinde_sdk.management.models.delete_directory_response import DeleteDirectoryResponse
-from kinde_sdk.management.models.delete_environment_variable_response import DeleteEnvironmentVariableResponse
-from kinde_sdk.management.models.delete_role_scope_response import DeleteRoleScopeResponse
-from kinde_sdk.management.models.delete_webhook_response import DeleteWebhookResponse
-from kinde_sdk.management.models.directory import Directory
-from kinde_sdk.management.models.environment_variable import EnvironmentVariable
-from kinde_sdk.management.models.error import Error
-from kinde_sdk.management.models.error_response import ErrorResponse
-from kinde_sdk.management.models.event_type import EventType
-from kinde_sdk.management.models.get_api_key_response import GetApiKeyResponse
-from kinde_sdk.management.models.get_api_key_response_api_key import GetApiKeyResponseApiKey
-from kinde_sdk.management.models.get_api_keys_response import GetApiKeysResponse
-from kinde_sdk.management.models.get_api_keys_response_api_keys_inner import GetApiKeysResponseApiKeysInner
-from kinde_sdk.management.models.get_api_response import GetApiResponse
-from kinde_sdk.management.models.get_api_response_api import GetApiResponseApi
-from kinde_sdk.management.models.get_api_response_api_applications_inner import GetApiResponseApiApplicationsInner
-from kinde_sdk.management.models.get_api_response_api_scopes_inner import GetApiResponseApiScopesInner
-from kinde_sdk.management.models.get_api_scope_response import GetApiScopeResponse
-from kinde_sdk.management.models.get_api_scopes_response import GetApiScopesResponse
-from kinde_sdk.management.models.get_api_scopes_response_scopes_inner import GetApiScopesResponseScopesInner
-from kinde_sdk.management.models.get_apis_response import GetApisResponse
-from kinde_sdk.management.models.get_apis_response_apis_inner import GetApisResponseApisInner
-from kinde_sdk.management.models.get_apis_response_apis_inner_scopes_inner import GetApisResponseApisInnerScopesInner
-from kinde_sdk.management.models.get_application_access_roles_response import GetApplicationAccessRolesResponse
-from kinde_sdk.management.models.get_application_response import GetApplicationResponse
-from kinde_sdk.management.models.get_application_response_application import GetApplicationResponseApplication
-from kinde_sdk.management.models.get_applications_response import GetApplicationsResponse
-from kinde_sdk.management.models.get_billing_agreements_response import GetBillingAgreementsResponse
-from kinde_sdk.management.models.get_billing_agreements_response_agreements_inner import GetBillingAgreementsResponseAgreementsInner
-from kinde_sdk.management.models.get_billing_agreements_response_agreements_inner_entitlements_inner import GetBillingAgreementsResponseAgreementsInnerEntitlementsInner
-from kinde_sdk.management.models.get_billing_entitlements_response import GetBillingEntitlementsResponse
-from kinde_sdk.management.models.get_billing_entitlements_response_entitlements_inner import GetBillingEntitlementsResponseEntitlementsInner
-from kinde_sdk.management.models.get_billing_entitlements_response_plans_inner import GetBillingEntitlementsResponsePlansInner
-from kinde_sdk.management.models.get_business_response import GetBusinessResponse
-from kinde_sdk.management.models.get_business_response_business import GetBusinessResponseBusiness
-from kinde_sdk.management.models.get_categories_response import GetCategoriesResponse
-from kinde_sdk.management.models.get_connections_response import GetConnectionsResponse
-from kinde_sdk.management.models.get_directories_response import GetDirectoriesResponse
-from kinde_sdk.management.models.get_directory_response import GetDirectoryResponse
-from kinde_sdk.management.models.get_environment_feature_flags_response import GetEnvironmentFeatureFlagsResponse
-from kinde_sdk.management.models.get_environment_response import GetEnvironmentResponse
-from kinde_sdk.management.models.get_environment_response_environment import GetEnvironmentResponseEnvironment
-from kinde_sdk.management.models.get_environment_response_environment_background_color import GetEnvironmentResponseEnvironmentBackgroundColor
-from kinde_sdk.management.models.get_environment_response_environment_link_color import GetEnvironmentResponseEnvironmentLinkColor
-from kinde_sdk.management.models.get_environment_variable_response import GetEnvironmentVariableResponse
-from kinde_sdk.management.models.get_environment_variables_response import GetEnvironmentVariablesResponse
-from kinde_sdk.management.models.get_event_response import GetEventResponse
-from kinde_sdk.management.models.get_event_response_event import GetEventResponseEvent
-from kinde_sdk.management.models.get_event_types_response import GetEventTypesResponse
-from kinde_sdk.management.models.get_identities_response import GetIdentitiesResponse
-from kinde_sdk.management.models.get_industries_response import GetIndustriesResponse
-from kinde_sdk.management.models.get_industries_response_industries_inner import GetIndustriesResponseIndustriesInner
-from kinde_sdk.management.models.get_organization_feature_flags_response import GetOrganizationFeatureFlagsResponse
-from kinde_sdk.management.models.get_organization_feature_flags_response_feature_flags_value import GetOrganizationFeatureFlagsResponseFeatureFlagsValue
-from kinde_sdk.management.models.get_organization_invite_response import GetOrganizationInviteResponse
-from kinde_sdk.management.models.get_organization_invite_response_roles_inner import GetOrganizationInviteResponseRolesInner
-from kinde_sdk.management.models.get_organization_invites_response import GetOrganizationInvitesResponse
-from kinde_sdk.management.models.get_organization_passkey200_response import GetOrganizationPasskey200Response
-from kinde_sdk.management.models.get_organization_response import GetOrganizationResponse
-from kinde_sdk.management.models.get_organization_response_billing import GetOrganizationResponseBilling
-from kinde_sdk.management.models.get_organization_response_billing_agreements_inner import GetOrganizationResponseBillingAgreementsInner
-from kinde_sdk.management.models.get_organization_role_active_users_count_response import GetOrganizationRoleActiveUsersCountResponse
-from kinde_sdk.management.models.get_organization_role_users_count_response import GetOrganizationRoleUsersCountResponse
-from kinde_sdk.management.models.get_organization_role_users_response import GetOrganizationRoleUsersResponse
-from kinde_sdk.management.models.get_organization_role_users_response_users_inner import GetOrganizationRoleUsersResponseUsersInner
-from kinde_sdk.management.models.get_organization_users_response import GetOrganizationUsersResponse
-from kinde_sdk.management.models.get_organizations_response import GetOrganizationsResponse
-from kinde_sdk.management.models.get_organizations_user_permissions_response import GetOrganizationsUserPermissionsResponse
-from kinde_sdk.management.models.get_organizations_user_roles_response import GetOrganizationsUserRolesResponse
-from kinde_sdk.management.models.get_passkey200_response import GetPasskey200Response
-from kinde_sdk.management.models.get_permissions_response import GetPermissionsResponse
-from kinde_sdk.management.models.get_properties_response import GetPropertiesResponse
-from kinde_sdk.management.models.get_property_values_response import GetPropertyValuesResponse
-from kinde_sdk.management.models.get_redirect_callback_urls_response import GetRedirectCallbackUrlsResponse
-from kinde_sdk.management.models.get_role_response import GetRoleResponse
-from kinde_sdk.management.models.get_role_response_role import GetRoleResponseRole
-from kinde_sdk.management.models.get_role_users_response import GetRoleUsersResponse
-from kinde_sdk.management.models.get_role_users_response_users_inner import GetRoleUsersResponseUsersInner
-from kinde_sdk.management.models.get_roles_response import GetRolesResponse
-from kinde_sdk.management.models.get_subscriber_response import GetSubscriberResponse
-from kinde_sdk.management.models.get_subscribers_response import GetSubscribersResponse
-from kinde_sdk.management.models.get_system_permissions_response import GetSystemPermissionsResponse
-from kinde_sdk.management.models.get_timezones_response import GetTimezonesResponse
-from kinde_sdk.management.models.get_timezones_response_timezones_inner import GetTimezonesResponseTimezonesInner
-from kinde_sdk.management.models.get_user_mfa_response import GetUserMfaResponse
-from kinde_sdk.management.models.get_user_mfa_response_mfa import GetUserMfaResponseMfa
-from kinde_sdk.management.models.get_user_sessions_response import GetUserSessionsResponse
-from kinde_sdk.management.models.get_user_sessions_response_sessions_inner import GetUserSessionsResponseSessionsInner
-from kinde_sdk.management.models.get_webhooks_response import GetWebhooksResponse
-from kinde_sdk.management.models.identity import Identity
-from kinde_sdk.management.models.logout_redirect_urls import LogoutRedirectUrls
-from kinde_sdk.management.models.model_property import ModelProperty
-from kinde_sdk.management.models.not_found_response import NotFoundResponse
-from kinde_sdk.management.models.not_found_response_errors import NotFoundResponseErrors
-from kinde_sdk.management.models.organization_invite import OrganizationInvite
-from kinde_sdk.management.models.organization_item_schema import OrganizationItemSchema
-from kinde_sdk.management.models.organization_user import OrganizationUser
-from kinde_sdk.management.models.organization_user_permission import OrganizationUserPermission
-from kinde_sdk.management.models.organization_user_permission_roles_inner import OrganizationUserPermissionRolesInner
-from kinde_sdk.management.models.organization_user_role import OrganizationUserRole
-from kinde_sdk.management.models.organization_user_role_permissions import OrganizationUserRolePermissions
-from kinde_sdk.management.models.organization_user_role_permissions_permissions import OrganizationUserRolePermissionsPermissions
-from kinde_sdk.management.models.permissions import Permissions
-from kinde_sdk.management.models.property_value import PropertyValue
-from kinde_sdk.management.models.read_env_logo_response import ReadEnvLogoResponse
-from kinde_sdk.management.models.read_env_logo_response_logos_inner import ReadEnvLogoResponseLogosInner
-from kinde_sdk.management.models.read_logo_response import ReadLogoResponse
-from kinde_sdk.management.models.read_logo_response_logos_inner import ReadLogoResponseLogosInner
-from kinde_sdk.management.models.redirect_callback_urls import RedirectCallbackUrls
-from kinde_sdk.management.models.replace_connection_request import ReplaceConnectionRequest
-from kinde_sdk.management.models.replace_connection_request_options import ReplaceConnectionRequestOptions
-from kinde_sdk.management.models.replace_connection_request_options_one_of import ReplaceConnectionRequestOptionsOneOf
-from kinde_sdk.management.models.replace_connection_request_options_one_of1 import ReplaceConnectionRequestOptionsOneOf1
-from kinde_sdk.management.models.replace_logout_redirect_urls_request import ReplaceLogoutRedirectURLsRequest
-from kinde_sdk.management.models.replace_mfa_request import ReplaceMFARequest
-from kinde_sdk.management.models.replace_organization_mfa_request import ReplaceOrganizationMFARequest
-from kinde_sdk.management.models.replace_redirect_callback_urls_request import ReplaceRedirectCallbackURLsRequest
-from kinde_sdk.management.models.role import Role
-from kinde_sdk.management.models.role_permissions_response import RolePermissionsResponse
-from kinde_sdk.management.models.role_scopes_response import RoleScopesResponse
-from kinde_sdk.management.models.role_system_permissions_response import RoleSystemPermissionsResponse
-from kinde_sdk.management.models.roles import Roles
-from kinde_sdk.management.models.rotate_api_key_response import RotateApiKeyResponse
-from kinde_sdk.management.models.rotate_api_key_response_api_key import RotateApiKeyResponseApiKey
-from kinde_sdk.management.models.scopes import Scopes
-from kinde_sdk.management.models.search_users_response import SearchUsersResponse
-from kinde_sdk.management.models.search_users_response_results_inner import SearchUsersResponseResultsInner
-from kinde_sdk.management.models.search_users_response_results_inner_api_scopes_inner import SearchUsersResponseResultsInnerApiScopesInner
-from kinde_sdk.management.models.set_user_password_request import SetUserPasswordRequest
-from kinde_sdk.management.models.subscriber import Subscriber
-from kinde_sdk.management.models.subscribers_subscriber import SubscribersSubscriber
-from kinde_sdk.management.models.success_response import SuccessResponse
-from kinde_sdk.management.models.system_permissions import SystemPermissions
-from kinde_sdk.management.models.update_api_applications_request import UpdateAPIApplicationsRequest
-from kinde_sdk.management.models.update_api_applications_request_applications_inner import UpdateAPIApplicationsRequestApplicationsInner
-from kinde_sdk.management.models.update_api_scope_request import UpdateAPIScopeRequest
-from kinde_sdk.management.models.update_application_request import UpdateApplicationRequest
-from kinde_sdk.management.models.update_application_tokens_request import UpdateApplicationTokensRequest
-from kinde_sdk.management.models.update_applications_property_request import UpdateApplicationsPropertyRequest
-from kinde_sdk.management.models.update_applications_property_request_value import UpdateApplicationsPropertyRequestValue
-from kinde_sdk.management.models.update_business_request import UpdateBusinessRequest
-from kinde_sdk.management.models.update_category_request import UpdateCategoryRequest
-from kinde_sdk.management.models.update_connection_request import UpdateConnectionRequest
-from kinde_sdk.management.models.update_connection_request_options import UpdateConnectionRequestOptions
-from kinde_sdk.management.models.update_connection_request_options_one_of import UpdateConnectionRequestOptionsOneOf
-from kinde_sdk.management.models.update_connection_request_options_one_of1 import UpdateConnectionRequestOptionsOneOf1
-from kinde_sdk.management.models.update_directory_request import UpdateDirectoryRequest
-from kinde_sdk.management.models.update_directory_response import UpdateDirectoryResponse
-from kinde_sdk.management.models.update_environement_feature_flag_override_request import UpdateEnvironementFeatureFlagOverrideRequest
-from kinde_sdk.management.models.update_environment_variable_request import UpdateEnvironmentVariableRequest
-from kinde_sdk.management.models.update_environment_variable_response import UpdateEnvironmentVariableResponse
-from kinde_sdk.management.models.update_identity_request import UpdateIdentityRequest
-from kinde_sdk.management.models.update_organization_passkey200_response import UpdateOrganizationPasskey200Response
-from kinde_sdk.management.models.update_organization_passkey_request import UpdateOrganizationPasskeyRequest
-from kinde_sdk.management.models.update_organization_properties_request import UpdateOrganizationPropertiesRequest
-from kinde_sdk.management.models.update_organization_request import UpdateOrganizationRequest
-from kinde_sdk.management.models.update_organization_sessions_request import UpdateOrganizationSessionsRequest
-from kinde_sdk.management.models.update_organization_users_request import UpdateOrganizationUsersRequest
-from kinde_sdk.management.models.update_organization_users_request_users_inner import UpdateOrganizationUsersRequestUsersInner
-from kinde_sdk.management.models.update_organization_users_response import UpdateOrganizationUsersResponse
-from kinde_sdk.management.models.update_passkey200_response import UpdatePasskey200Response
-from kinde_sdk.management.models.update_passkey_request import UpdatePasskeyRequest
-from kinde_sdk.management.models.update_property_request import UpdatePropertyRequest
-from kinde_sdk.management.models.update_role_permissions_request import UpdateRolePermissionsRequest
-from kinde_sdk.management.models.update_role_permissions_request_permissions_inner import UpdateRolePermissionsRequestPermissionsInner
-from kinde_sdk.management.models.update_role_permissions_response import UpdateRolePermissionsResponse
-from kinde_sdk.management.models.update_role_system_permissions_request import UpdateRoleSystemPermissionsRequest
-from kinde_sdk.management.models.update_role_system_permissions_request_system_permissions_inner import UpdateRoleSystemPermissionsRequestSystemPermissionsInner
-from kinde_sdk.management.models.update_role_system_permissions_response import UpdateRoleSystemPermissionsResponse
-from kinde_sdk.management.models.update_roles_request import UpdateRolesRequest
-from kinde_sdk.management.models.update_user_request import UpdateUserRequest
-from kinde_sdk.management.models.update_user_response import UpdateUserResponse
-from kinde_sdk.management.models.update_web_hook_request import UpdateWebHookRequest
-from kinde_sdk.management.models.update_webhook_response import UpdateWebhookResponse
-from kinde_sdk.management.models.update_webhook_response_webhook import UpdateWebhookResponseWebhook
-from kinde_sdk.management.models.user import User
-from kinde_sdk.management.models.user_billing import UserBilling
-from kinde_sdk.management.models.user_identities_inner import UserIdentitiesInner
-from kinde_sdk.management.models.user_identity import UserIdentity
-from kinde_sdk.management.models.user_identity_result import UserIdentityResult
-from kinde_sdk.management.models.users_response import UsersResponse
-from kinde_sdk.management.models.users_response_users_inner import UsersResponseUsersInner
-from kinde_sdk.management.models.users_response_users_inner_billing import UsersResponseUsersInnerBilling
-from kinde_sdk.management.models.users_response_users_inner_identities_inner import UsersResponseUsersInnerIdentitiesInner
-from kinde_sdk.management.models.users_response_users_inner_last_organization_sign_ins_inner import UsersResponseUsersInnerLastOrganizationSignInsInner
-from kinde_sdk.management.models.verify_api_key_request import VerifyApiKeyRequest
-from kinde_sdk.management.models.verify_api_key_response import VerifyApiKeyResponse
-from kinde_sdk.management.models.webhook import Webhook
+import importlib as _importlib
+from typing import TYPE_CHECKING
 
+# Imported on first access by __getattr__ below, to keep the package import fast
+_LAZY_IMPORTS = {
+    "AddAPIScopeRequest": "kinde_sdk.management.models.add_api_scope_request",
+    "AddAPIsRequest": "kinde_sdk.management.models.add_apis_request",
+    "AddOrganizationUsersRequest": "kinde_sdk.management.models.add_organization_users_request",
+    "AddOrganizationUsersRequestUsersInner": "kinde_sdk.management.models.add_organization_users_request_users_inner",
+    "AddOrganizationUsersResponse": "kinde_sdk.management.models.add_organization_users_response",
+    "AddRoleScopeRequest": "kinde_sdk.management.models.add_role_scope_request",
+    "AddRoleScopeResponse": "kinde_sdk.management.models.add_role_scope_response",
+    "ApiResult": "kinde_sdk.management.models.api_result",
+    "ApplicationAccessRole": "kinde_sdk.management.models.application_access_role",
+    "Applications": "kinde_sdk.management.models.applications",
+    "AuthorizeAppApiResponse": "kinde_sdk.management.models.authorize_app_api_response",
+    "Category": "kinde_sdk.management.models.category",
+    "ConnectedAppsAccessToken": "kinde_sdk.management.models.connected_apps_access_token",
+    "ConnectedAppsAuthUrl": "kinde_sdk.management.models.connected_apps_auth_url",
+    "Connection": "kinde_sdk.management.models.connection",
+    "ConnectionConnection": "kinde_sdk.management.models.connection_connection",
+    "CreateApiKeyRequest": "kinde_sdk.management.models.create_api_key_request",
+    "CreateApiKeyResponse": "kinde_sdk.management.models.create_api_key_response",
+    "CreateApiKeyResponseApiKey": "kinde_sdk.management.models.create_api_key_response_api_key",
+    "CreateApiScopesResponse": "kinde_sdk.management.models.create_api_scopes_response",
+    "CreateApiScopesResponseScope": "kinde_sdk.management.models.create_api_scopes_response_scope",
+    "CreateApisResponse": "kinde_sdk.management.models.create_apis_response",
+    "CreateApisResponseApi": "kinde_sdk.management.models.create_apis_response_api",
+    "CreateApplicationRequest": "kinde_sdk.management.models.create_application_request",
+    "CreateApplicationResponse": "kinde_sdk.management.models.create_application_response",
+    "CreateApplicationResponseApplication": "kinde_sdk.management.models.create_application_response_application",
+    "CreateBillingAgreementRequest": "kinde_sdk.management.models.create_billing_agreement_request",
+    "CreateCategoryRequest": "kinde_sdk.management.models.create_category_request",
+    "CreateCategoryResponse": "kinde_sdk.management.models.create_category_response",
+    "CreateCategoryResponseCategory": "kinde_sdk.management.models.create_category_response_category",
+    "CreateConnectionRequest": "kinde_sdk.management.models.create_connection_request",
+    "CreateConnectionRequestOptions": "kinde_sdk.management.models.create_connection_request_options",
+    "CreateConnectionRequestOptionsOneOf": "kinde_sdk.management.models.create_connection_request_options_one_of",
+    "CreateConnectionRequestOptionsOneOf1": "kinde_sdk.management.models.create_connection_request_options_one_of1",
+    "CreateConnectionRequestOptionsOneOf2": "kinde_sdk.management.models.create_connection_request_options_one_of2",
+    "CreateConnectionResponse": "kinde_sdk.management.models.create_connection_response",
+    "CreateConnectionResponseConnection": "kinde_sdk.management.models.create_connection_response_connection",
+    "CreateDirectoryRequest": "kinde_sdk.management.models.create_directory_request",
+    "CreateDirectoryResponse": "kinde_sdk.management.models.create_directory_response",
+    "CreateEnvironmentVariableRequest": "kinde_sdk.management.models.create_environment_variable_request",
+    "CreateEnvironmentVariableResponse": "kinde_sdk.management.models.create_environment_variable_response",
+    "CreateEnvironmentVariableResponseEnvironmentVariable": "kinde_sdk.management.models.create_environment_variable_response_environment_variable",
+    "CreateFeatureFlagRequest": "kinde_sdk.management.models.create_feature_flag_request",
+    "CreateIdentityResponse": "kinde_sdk.management.models.create_identity_response",
+    "CreateIdentityResponseIdentity": "kinde_sdk.management.models.create_identity_response_identity",
+    "CreateMeterUsageRecordRequest": "kinde_sdk.management.models.create_meter_usage_record_request",
+    "CreateMeterUsageRecordResponse": "kinde_sdk.management.models.create_meter_usage_record_response",
+    "CreateOrganizationInviteRequest": "kinde_sdk.management.models.create_organization_invite_request",
+    "CreateOrganizationInviteResponse": "kinde_sdk.management.models.create_organization_invite_response",
+    "CreateOrganizationInviteResponseInvite": "kinde_sdk.management.models.create_organization_invite_response_invite",
+    "CreateOrganizationRequest": "kinde_sdk.management.models.create_organization_request",
+    "CreateOrganizationResponse": "kinde_sdk.management.models.create_organization_response",
+    "CreateOrganizationResponseOrganization": "kinde_sdk.management.models.create_organization_response_organization",
+    "CreateOrganizationUserPermissionRequest": "kinde_sdk.management.models.create_organization_user_permission_request",
+    "CreateOrganizationUserRoleRequest": "kinde_sdk.management.models.create_organization_user_role_request",
+    "CreatePermissionRequest": "kinde_sdk.management.models.create_permission_request",
+    "CreatePropertyRequest": "kinde_sdk.management.models.create_property_request",
+    "CreatePropertyResponse": "kinde_sdk.management.models.create_property_response",
+    "CreatePropertyResponseProperty": "kinde_sdk.management.models.create_property_response_property",
+    "CreateRoleRequest": "kinde_sdk.management.models.create_role_request",
+    "CreateRolesResponse": "kinde_sdk.management.models.create_roles_response",
+    "CreateRolesResponseRole": "kinde_sdk.management.models.create_roles_response_role",
+    "CreateSubscriberSuccessResponse": "kinde_sdk.management.models.create_subscriber_success_response",
+    "CreateSubscriberSuccessResponseSubscriber": "kinde_sdk.management.models.create_subscriber_success_response_subscriber",
+    "CreateUserBillingCustomerRequest": "kinde_sdk.management.models.create_user_billing_customer_request",
+    "CreateUserBillingCustomerResponse": "kinde_sdk.management.models.create_user_billing_customer_response",
+    "CreateUserBillingCustomerResponseBillingCustomer": "kinde_sdk.management.models.create_user_billing_customer_response_billing_customer",
+    "CreateUserIdentityRequest": "kinde_sdk.management.models.create_user_identity_request",
+    "CreateUserRequest": "kinde_sdk.management.models.create_user_request",
+    "CreateUserRequestIdentitiesInner": "kinde_sdk.management.models.create_user_request_identities_inner",
+    "CreateUserRequestIdentitiesInnerDetails": "kinde_sdk.management.models.create_user_request_identities_inner_details",
+    "CreateUserRequestProfile": "kinde_sdk.management.models.create_user_request_profile",
+    "CreateUserResponse": "kinde_sdk.management.models.create_user_response",
+    "CreateWebHookRequest": "kinde_sdk.management.models.create_web_hook_request",
+    "CreateWebhookResponse": "kinde_sdk.management.models.create_webhook_response",
+    "CreateWebhookResponseWebhook": "kinde_sdk.management.models.create_webhook_response_webhook",
+    "DeleteApiResponse": "kinde_sdk.management.models.delete_api_response",
+    "DeleteDirectoryResponse": "kinde_sdk.management.models.delete_directory_response",
+    "DeleteEnvironmentVariableResponse": "kinde_sdk.management.models.delete_environment_variable_response",
+    "DeleteRoleScopeResponse": "kinde_sdk.management.models.delete_role_scope_response",
+    "DeleteWebhookResponse": "kinde_sdk.management.models.delete_webhook_response",
+    "Directory": "kinde_sdk.management.models.directory",
+    "EnvironmentVariable": "kinde_sdk.management.models.environment_variable",
+    "Error": "kinde_sdk.management.models.error",
+    "ErrorResponse": "kinde_sdk.management.models.error_response",
+    "EventType": "kinde_sdk.management.models.event_type",
+    "GetApiKeyResponse": "kinde_sdk.management.models.get_api_key_response",
+    "GetApiKeyResponseApiKey": "kinde_sdk.management.models.get_api_key_response_api_key",
+    "GetApiKeysResponse": "kinde_sdk.management.models.get_api_keys_response",
+    "GetApiKeysResponseApiKeysInner": "kinde_sdk.management.models.get_api_keys_response_api_keys_inner",
+    "GetApiResponse": "kinde_sdk.management.models.get_api_response",
+    "GetApiResponseApi": "kinde_sdk.management.models.get_api_response_api",
+    "GetApiResponseApiApplicationsInner": "kinde_sdk.management.models.get_api_response_api_applications_inner",
+    "GetApiResponseApiScopesInner": "kinde_sdk.management.models.get_api_response_api_scopes_inner",
+    "GetApiScopeResponse": "kinde_sdk.management.models.get_api_scope_response",
+    "GetApiScopesResponse": "kinde_sdk.management.models.get_api_scopes_response",
+    "GetApiScopesResponseScopesInner": "kinde_sdk.management.models.get_api_scopes_response_scopes_inner",
+    "GetApisResponse": "kinde_sdk.management.models.get_apis_response",
+    "GetApisResponseApisInner": "kinde_sdk.management.models.get_apis_response_apis_inner",
+    "GetApisResponseApisInnerScopesInner": "kinde_sdk.management.models.get_apis_response_apis_inner_scopes_inner",
+    "GetApplicationAccessRolesResponse": "kinde_sdk.management.models.get_application_access_roles_response",
+    "GetApplicationResponse": "kinde_sdk.management.models.get_application_response",
+    "GetApplicationResponseApplication": "kinde_sdk.management.models.get_application_response_application",
+    "GetApplicationsResponse": "kinde_sdk.management.models.get_applications_response",
+    "GetBillingAgreementsResponse": "kinde_sdk.management.models.get_billing_agreements_response",
+    "GetBillingAgreementsResponseAgreementsInner": "kinde_sdk.management.models.get_billing_agreements_response_agreements_inner",
+    "GetBillingAgreementsResponseAgreementsInnerEntitlementsInner": "kinde_sdk.management.models.get_billing_agreements_response_agreements_inner_entitlements_inner",
+    "GetBillingEntitlementsResponse": "kinde_sdk.management.models.get_billing_entitlements_response",
+    "GetBillingEntitlementsResponseEntitlementsInner": "kinde_sdk.management.models.get_billing_entitlements_response_entitlements_inner",
+    "GetBillingEntitlementsResponsePlansInner": "kinde_sdk.management.models.get_billing_entitlements_response_plans_inner",
+    "GetBusinessResponse": "kinde_sdk.management.models.get_business_response",
+    "GetBusinessResponseBusiness": "kinde_sdk.management.models.get_business_response_business",
+    "GetCategoriesResponse": "kinde_sdk.management.models.get_categories_response",
+    "GetConnectionsResponse": "kinde_sdk.management.models.get_connections_response",
+    "GetDirectoriesResponse": "kinde_sdk.management.models.get_directories_response",
+    "GetDirectoryResponse": "kinde_sdk.management.models.get_directory_response",
+    "GetEnvironmentFeatureFlagsResponse": "kinde_sdk.management.models.get_environment_feature_flags_response",
+    "GetEnvironmentResponse": "kinde_sdk.management.models.get_environment_response",
+    "GetEnvironmentResponseEnvironment": "kinde_sdk.management.models.get_environment_response_environment",
+    "GetEnvironmentResponseEnvironmentBackgroundColor": "kinde_sdk.management.models.get_environment_response_environment_background_color",
+    "GetEnvironmentResponseEnvironmentLinkColor": "kinde_sdk.management.models.get_environment_response_environment_link_color",
+    "GetEnvironmentVariableResponse": "kinde_sdk.management.models.get_environment_variable_response",
+    "GetEnvironmentVariablesResponse": "kinde_sdk.management.models.get_environment_variables_response",
+    "GetEventResponse": "kinde_sdk.management.models.get_event_response",
+    "GetEventResponseEvent": "kinde_sdk.management.models.get_event_response_event",
+    "GetEventTypesResponse": "kinde_sdk.management.models.get_event_types_response",
+    "GetIdentitiesResponse": "kinde_sdk.management.models.get_identities_response",
+    "GetIndustriesResponse": "kinde_sdk.management.models.get_industries_response",
+    "GetIndustriesResponseIndustriesInner": "kinde_sdk.management.models.get_industries_response_industries_inner",
+    "GetOrganizationFeatureFlagsResponse": "kinde_sdk.management.models.get_organization_feature_flags_response",
+    "GetOrganizationFeatureFlagsResponseFeatureFlagsValue": "kinde_sdk.management.models.get_organization_feature_flags_response_feature_flags_value",
+    "GetOrganizationInviteResponse": "kinde_sdk.management.models.get_organization_invite_response",
+    "GetOrganizationInviteResponseRolesInner": "kinde_sdk.management.models.get_organization_invite_response_roles_inner",
+    "GetOrganizationInvitesResponse": "kinde_sdk.management.models.get_organization_invites_response",
+    "GetOrganizationPasskey200Response": "kinde_sdk.management.models.get_organization_passkey200_response",
+    "GetOrganizationResponse": "kinde_sdk.management.models.get_organization_response",
+    "GetOrganizationResponseBilling": "kinde_sdk.management.models.get_organization_response_billing",
+    "GetOrganizationResponseBillingAgreementsInner": "kinde_sdk.management.models.get_organization_response_billing_agreements_inner",
+    "GetOrganizationRoleActiveUsersCountResponse": "kinde_sdk.management.models.get_organization_role_active_users_count_response",
+    "GetOrganizationRoleUsersCountResponse": "kinde_sdk.management.models.get_organization_role_users_count_response",
+    "GetOrganizationRoleUsersResponse": "kinde_sdk.management.models.get_organization_role_users_response",
+    "GetOrganizationRoleUsersResponseUsersInner": "kinde_sdk.management.models.get_organization_role_users_response_users_inner",
+    "GetOrganizationUsersResponse": "kinde_sdk.management.models.get_organization_users_response",
+    "GetOrganizationsResponse": "kinde_sdk.management.models.get_organizations_response",
+    "GetOrganizationsUserPermissionsResponse": "kinde_sdk.management.models.get_organizations_user_permissions_response",
+    "GetOrganizationsUserRolesResponse": "kinde_sdk.management.models.get_organizations_user_roles_response",
+    "GetPasskey200Response": "kinde_sdk.management.models.get_passkey200_response",
+    "GetPermissionsResponse": "kinde_sdk.management.models.get_permissions_response",
+    "GetPropertiesResponse": "kinde_sdk.management.models.get_properties_response",
+    "GetPropertyValuesResponse": "kinde_sdk.management.models.get_property_values_response",
+    "GetRedirectCallbackUrlsResponse": "kinde_sdk.management.models.get_redirect_callback_urls_response",
+    "GetRoleResponse": "kinde_sdk.management.models.get_role_response",
+    "GetRoleResponseRole": "kinde_sdk.management.models.get_role_response_role",
+    "GetRoleUsersResponse": "kinde_sdk.management.models.get_role_users_response",
+    "GetRoleUsersResponseUsersInner": "kinde_sdk.management.models.get_role_users_response_users_inner",
+    "GetRolesResponse": "kinde_sdk.management.models.get_roles_response",
+    "GetSubscriberResponse": "kinde_sdk.management.models.get_subscriber_response",
+    "GetSubscribersResponse": "kinde_sdk.management.models.get_subscribers_response",
+    "GetSystemPermissionsResponse": "kinde_sdk.management.models.get_system_permissions_response",
+    "GetTimezonesResponse": "kinde_sdk.management.models.get_timezones_response",
+    "GetTimezonesResponseTimezonesInner": "kinde_sdk.management.models.get_timezones_response_timezones_inner",
+    "GetUserMfaResponse": "kinde_sdk.management.models.get_user_mfa_response",
+    "GetUserMfaResponseMfa": "kinde_sdk.management.models.get_user_mfa_response_mfa",
+    "GetUserSessionsResponse": "kinde_sdk.management.models.get_user_sessions_response",
+    "GetUserSessionsResponseSessionsInner": "kinde_sdk.management.models.get_user_sessions_response_sessions_inner",
+    "GetWebhooksResponse": "kinde_sdk.management.models.get_webhooks_response",
+    "Identity": "kinde_sdk.management.models.identity",
+    "LogoutRedirectUrls": "kinde_sdk.management.models.logout_redirect_urls",
+    "ModelProperty": "kinde_sdk.management.models.model_property",
+    "NotFoundResponse": "kinde_sdk.management.models.not_found_response",
+    "NotFoundResponseErrors": "kinde_sdk.management.models.not_found_response_errors",
+    "OrganizationInvite": "kinde_sdk.management.models.organization_invite",
+    "OrganizationItemSchema": "kinde_sdk.management.models.organization_item_schema",
+    "OrganizationUser": "kinde_sdk.management.models.organization_user",
+    "OrganizationUserPermission": "kinde_sdk.management.models.organization_user_permission",
+    "OrganizationUserPermissionRolesInner": "kinde_sdk.management.models.organization_user_permission_roles_inner",
+    "OrganizationUserRole": "kinde_sdk.management.models.organization_user_role",
+    "OrganizationUserRolePermissions": "kinde_sdk.management.models.organization_user_role_permissions",
+    "OrganizationUserRolePermissionsPermissions": "kinde_sdk.management.models.organization_user_role_permissions_permissions",
+    "Permissions": "kinde_sdk.management.models.permissions",
+    "PropertyValue": "kinde_sdk.management.models.property_value",
+    "ReadEnvLogoResponse": "kinde_sdk.management.models.read_env_logo_response",
+    "ReadEnvLogoResponseLogosInner": "kinde_sdk.management.models.read_env_logo_response_logos_inner",
+    "ReadLogoResponse": "kinde_sdk.management.models.read_logo_response",
+    "ReadLogoResponseLogosInner": "kinde_sdk.management.models.read_logo_response_logos_inner",
+    "RedirectCallbackUrls": "kinde_sdk.management.models.redirect_callback_urls",
+    "ReplaceConnectionRequest": "kinde_sdk.management.models.replace_connection_request",
+    "ReplaceConnectionRequestOptions": "kinde_sdk.management.models.replace_connection_request_options",
+    "ReplaceConnectionRequestOptionsOneOf": "kinde_sdk.management.models.replace_connection_request_options_one_of",
+    "ReplaceConnectionRequestOptionsOneOf1": "kinde_sdk.management.models.replace_connection_request_options_one_of1",
+    "ReplaceLogoutRedirectURLsRequest": "kinde_sdk.management.models.replace_logout_redirect_urls_request",
+    "ReplaceMFARequest": "kinde_sdk.management.models.replace_mfa_request",
+    "ReplaceOrganizationMFARequest": "kinde_sdk.management.models.replace_organization_mfa_request",
+    "ReplaceRedirectCallbackURLsRequest": "kinde_sdk.management.models.replace_redirect_callback_urls_request",
+    "Role": "kinde_sdk.management.models.role",
+    "RolePermissionsResponse": "kinde_sdk.management.models.role_permissions_response",
+    "RoleScopesResponse": "kinde_sdk.management.models.role_scopes_response",
+    "RoleSystemPermissionsResponse": "kinde_sdk.management.models.role_system_permissions_response",
+    "Roles": "kinde_sdk.management.models.roles",
+    "RotateApiKeyResponse": "kinde_sdk.management.models.rotate_api_key_response",
+    "RotateApiKeyResponseApiKey": "kinde_sdk.management.models.rotate_api_key_response_api_key",
+    "Scopes": "kinde_sdk.management.models.scopes",
+    "SearchUsersResponse": "kinde_sdk.management.models.search_users_response",
+    "SearchUsersResponseResultsInner": "kinde_sdk.management.models.search_users_response_results_inner",
+    "SearchUsersResponseResultsInnerApiScopesInner": "kinde_sdk.management.models.search_users_response_results_inner_api_scopes_inner",
+    "SetUserPasswordRequest": "kinde_sdk.management.models.set_user_password_request",
+    "Subscriber": "kinde_sdk.management.models.subscriber",
+    "SubscribersSubscriber": "kinde_sdk.management.models.subscribers_subscriber",
+    "SuccessResponse": "kinde_sdk.management.models.success_response",
+    "SystemPermissions": "kinde_sdk.management.models.system_permissions",
+    "UpdateAPIApplicationsRequest": "kinde_sdk.management.models.update_api_applications_request",
+    "UpdateAPIApplicationsRequestApplicationsInner": "kinde_sdk.management.models.update_api_applications_request_applications_inner",
+    "UpdateAPIScopeRequest": "kinde_sdk.management.models.update_api_scope_request",
+    "UpdateApplicationRequest": "kinde_sdk.management.models.update_application_request",
+    "UpdateApplicationTokensRequest": "kinde_sdk.management.models.update_application_tokens_request",
+    "UpdateApplicationsPropertyRequest": "kinde_sdk.management.models.update_applications_property_request",
+    "UpdateApplicationsPropertyRequestValue": "kinde_sdk.management.models.update_applications_property_request_value",
+    "UpdateBusinessRequest": "kinde_sdk.management.models.update_business_request",
+    "UpdateCategoryRequest": "kinde_sdk.management.models.update_category_request",
+    "UpdateConnectionRequest": "kinde_sdk.management.models.update_connection_request",
+    "UpdateConnectionRequestOptions": "kinde_sdk.management.models.update_connection_request_options",
+    "UpdateConnectionRequestOptionsOneOf": "kinde_sdk.management.models.update_connection_request_options_one_of",
+    "UpdateConnectionRequestOptionsOneOf1": "kinde_sdk.management.models.update_connection_request_options_one_of1",
+    "UpdateDirectoryRequest": "kinde_sdk.management.models.update_directory_request",
+    "UpdateDirectoryResponse": "kinde_sdk.management.models.update_directory_response",
+    "UpdateEnvironementFeatureFlagOverrideRequest": "kinde_sdk.management.models.update_environement_feature_flag_override_request",
+    "UpdateEnvironmentVariableRequest": "kinde_sdk.management.models.update_environment_variable_request",
+    "UpdateEnvironmentVariableResponse": "kinde_sdk.management.models.update_environment_variable_response",
+    "UpdateIdentityRequest": "kinde_sdk.management.models.update_identity_request",
+    "UpdateOrganizationPasskey200Response": "kinde_sdk.management.models.update_organization_passkey200_response",
+    "UpdateOrganizationPasskeyRequest": "kinde_sdk.management.models.update_organization_passkey_request",
+    "UpdateOrganizationPropertiesRequest": "kinde_sdk.management.models.update_organization_properties_request",
+    "UpdateOrganizationRequest": "kinde_sdk.management.models.update_organization_request",
+    "UpdateOrganizationSessionsRequest": "kinde_sdk.management.models.update_organization_sessions_request",
+    "UpdateOrganizationUsersRequest": "kinde_sdk.management.models.update_organization_users_request",
+    "UpdateOrganizationUsersRequestUsersInner": "kinde_sdk.management.models.update_organization_users_request_users_inner",
+    "UpdateOrganizationUsersResponse": "kinde_sdk.management.models.update_organization_users_response",
+    "UpdatePasskey200Response": "kinde_sdk.management.models.update_passkey200_response",
+    "UpdatePasskeyRequest": "kinde_sdk.management.models.update_passkey_request",
+    "UpdatePropertyRequest": "kinde_sdk.management.models.update_property_request",
+    "UpdateRolePermissionsRequest": "kinde_sdk.management.models.update_role_permissions_request",
+    "UpdateRolePermissionsRequestPermissionsInner": "kinde_sdk.management.models.update_role_permissions_request_permissions_inner",
+    "UpdateRolePermissionsResponse": "kinde_sdk.management.models.update_role_permissions_response",
+    "UpdateRoleSystemPermissionsRequest": "kinde_sdk.management.models.update_role_system_permissions_request",
+    "UpdateRoleSystemPermissionsRequestSystemPermissionsInner": "kinde_sdk.management.models.update_role_system_permissions_request_system_permissions_inner",
+    "UpdateRoleSystemPermissionsResponse": "kinde_sdk.management.models.update_role_system_permissions_response",
+    "UpdateRolesRequest": "kinde_sdk.management.models.update_roles_request",
+    "UpdateUserRequest": "kinde_sdk.management.models.update_user_request",
+    "UpdateUserResponse": "kinde_sdk.management.models.update_user_response",
+    "UpdateWebHookRequest": "kinde_sdk.management.models.update_web_hook_request",
+    "UpdateWebhookResponse": "kinde_sdk.management.models.update_webhook_response",
+    "UpdateWebhookResponseWebhook": "kinde_sdk.management.models.update_webhook_response_webhook",
+    "User": "kinde_sdk.management.models.user",
+    "UserBilling": "kinde_sdk.management.models.user_billing",
+    "UserIdentitiesInner": "kinde_sdk.management.models.user_identities_inner",
+    "UserIdentity": "kinde_sdk.management.models.user_identity",
+    "UserIdentityResult": "kinde_sdk.management.models.user_identity_result",
+    "UsersResponse": "kinde_sdk.management.models.users_response",
+    "UsersResponseUsersInner": "kinde_sdk.management.models.users_response_users_inner",
+    "UsersResponseUsersInnerBilling": "kinde_sdk.management.models.users_response_users_inner_billing",
+    "UsersResponseUsersInnerIdentitiesInner": "kinde_sdk.management.models.users_response_users_inner_identities_inner",
+    "UsersResponseUsersInnerLastOrganizationSignInsInner": "kinde_sdk.management.models.users_response_users_inner_last_organization_sign_ins_inner",
+    "VerifyApiKeyRequest": "kinde_sdk.management.models.verify_api_key_request",
+    "VerifyApiKeyResponse": "kinde_sdk.management.models.verify_api_key_response",
+    "Webhook": "kinde_sdk.management.models.webhook",
+}
+
+if TYPE_CHECKING:
+    from kinde_sdk.management.models.add_api_scope_request import AddAPIScopeRequest as AddAPIScopeRequest
+    from kinde_sdk.management.models.add_apis_request import AddAPIsRequest as AddAPIsRequest
+    from kinde_sdk.management.models.add_organization_users_request import AddOrganizationUsersRequest as AddOrganizationUsersRequest
+    from kinde_sdk.management.models.add_organization_users_request_users_inner import AddOrganizationUsersRequestUsersInner as AddOrganizationUsersRequestUsersInner
+    from kinde_sdk.management.models.add_organization_users_response import AddOrganizationUsersResponse as AddOrganizationUsersResponse
+    from kinde_sdk.management.models.add_role_scope_request import AddRoleScopeRequest as AddRoleScopeRequest
+    from kinde_sdk.management.models.add_role_scope_response import AddRoleScopeResponse as AddRoleScopeResponse
+    from kinde_sdk.management.models.api_result import ApiResult as ApiResult
+    from kinde_sdk.management.models.application_access_role import ApplicationAccessRole as ApplicationAccessRole
+    from kinde_sdk.management.models.applications import Applications as Applications
+    from kinde_sdk.management.models.authorize_app_api_response import AuthorizeAppApiResponse as AuthorizeAppApiResponse
+    from kinde_sdk.management.models.category import Category as Category
+    from kinde_sdk.management.models.connected_apps_access_token import ConnectedAppsAccessToken as ConnectedAppsAccessToken
+    from kinde_sdk.management.models.connected_apps_auth_url import ConnectedAppsAuthUrl as ConnectedAppsAuthUrl
+    from kinde_sdk.management.models.connection import Connection as Connection
+    from kinde_sdk.management.models.connection_connection import ConnectionConnection as ConnectionConnection
+    from kinde_sdk.management.models.create_api_key_request import CreateApiKeyRequest as CreateApiKeyRequest
+    from kinde_sdk.management.models.create_api_key_response import CreateApiKeyResponse as CreateApiKeyResponse
+    from kinde_sdk.management.models.create_api_key_response_api_key import CreateApiKeyResponseApiKey as CreateApiKeyResponseApiKey
+    from kinde_sdk.management.models.create_api_scopes_response import CreateApiScopesResponse as CreateApiScopesResponse
+    from kinde_sdk.management.models.create_api_scopes_response_scope import CreateApiScopesResponseScope as CreateApiScopesResponseScope
+    from kinde_sdk.management.models.create_apis_response import CreateApisResponse as CreateApisResponse
+    from kinde_sdk.management.models.create_apis_response_api import CreateApisResponseApi as CreateApisResponseApi
+    from kinde_sdk.management.models.create_application_request import CreateApplicationRequest as CreateApplicationRequest
+    from kinde_sdk.management.models.create_application_response import CreateApplicationResponse as CreateApplicationResponse
+    from kinde_sdk.management.models.create_application_response_application import CreateApplicationResponseApplication as CreateApplicationResponseApplication
+    from kinde_sdk.management.models.create_billing_agreement_request import CreateBillingAgreementRequest as CreateBillingAgreementRequest
+    from kinde_sdk.management.models.create_category_request import CreateCategoryRequest as CreateCategoryRequest
+    from kinde_sdk.management.models.create_category_response import CreateCategoryResponse as CreateCategoryResponse
+    from kinde_sdk.management.models.create_category_response_category import CreateCategoryResponseCategory as CreateCategoryResponseCategory
+    from kinde_sdk.management.models.create_connection_request import CreateConnectionRequest as CreateConnectionRequest
+    from kinde_sdk.management.models.create_connection_request_options import CreateConnectionRequestOptions as CreateConnectionRequestOptions
+    from kinde_sdk.management.models.create_connection_request_options_one_of import CreateConnectionRequestOptionsOneOf as CreateConnectionRequestOptionsOneOf
+    from kinde_sdk.management.models.create_connection_request_options_one_of1 import CreateConnectionRequestOptionsOneOf1 as CreateConnectionRequestOptionsOneOf1
+    from kinde_sdk.management.models.create_connection_request_options_one_of2 import CreateConnectionRequestOptionsOneOf2 as CreateConnectionRequestOptionsOneOf2
+    from kinde_sdk.management.models.create_connection_response import CreateConnectionResponse as CreateConnectionResponse
+    from kinde_sdk.management.models.create_connection_response_connection import CreateConnectionResponseConnection as CreateConnectionResponseConnection
+    from kinde_sdk.management.models.create_directory_request import CreateDirectoryRequest as CreateDirectoryRequest
+    from kinde_sdk.management.models.create_directory_response import CreateDirectoryResponse as CreateDirectoryResponse
+    from kinde_sdk.management.models.create_environment_variable_request import CreateEnvironmentVariableRequest as CreateEnvironmentVariableRequest
+    from kinde_sdk.management.models.create_environment_variable_response import CreateEnvironmentVariableResponse as CreateEnvironmentVariableResponse
+    from kinde_sdk.management.models.create_environment_variable_response_environment_variable import CreateEnvironmentVariableResponseEnvironmentVariable as CreateEnvironmentVariableResponseEnvironmentVariable
+    from kinde_sdk.management.models.create_feature_flag_request import CreateFeatureFlagRequest as CreateFeatureFlagRequest
+    from kinde_sdk.management.models.create_identity_response import CreateIdentityResponse as CreateIdentityResponse
+    from kinde_sdk.management.models.create_identity_response_identity import CreateIdentityResponseIdentity as CreateIdentityResponseIdentity
+    from kinde_sdk.management.models.create_meter_usage_record_request import CreateMeterUsageRecordRequest as CreateMeterUsageRecordRequest
+    from kinde_sdk.management.models.create_meter_usage_record_response import CreateMeterUsageRecordResponse as CreateMeterUsageRecordResponse
+    from kinde_sdk.management.models.create_organization_invite_request import CreateOrganizationInviteRequest as CreateOrganizationInviteRequest
+    from kinde_sdk.management.models.create_organization_invite_response import CreateOrganizationInviteResponse as CreateOrganizationInviteResponse
+    from kinde_sdk.management.models.create_organization_invite_response_invite import CreateOrganizationInviteResponseInvite as CreateOrganizationInviteResponseInvite
+    from kinde_sdk.management.models.create_organization_request import CreateOrganizationRequest as CreateOrganizationRequest
+    from kinde_sdk.management.models.create_organization_response import CreateOrganizationResponse as CreateOrganizationResponse
+    from kinde_sdk.management.models.create_organization_response_organization import CreateOrganizationResponseOrganization as CreateOrganizationResponseOrganization
+    from kinde_sdk.management.models.create_organization_user_permission_request import CreateOrganizationUserPermissionRequest as CreateOrganizationUserPermissionRequest
+    from kinde_sdk.management.models.create_organization_user_role_request import CreateOrganizationUserRoleRequest as CreateOrganizationUserRoleRequest
+    from kinde_sdk.management.models.create_permission_request import CreatePermissionRequest as CreatePermissionRequest
+    from kinde_sdk.management.models.create_property_request import CreatePropertyRequest as CreatePropertyRequest
+    from kinde_sdk.management.models.create_property_response import CreatePropertyResponse as CreatePropertyResponse
+    from kinde_sdk.management.models.create_property_response_property import CreatePropertyResponseProperty as CreatePropertyResponseProperty
+    from kinde_sdk.management.models.create_role_request import CreateRoleRequest as CreateRoleRequest
+    from kinde_sdk.management.models.create_roles_response import CreateRolesResponse as CreateRolesResponse
+    from kinde_sdk.management.models.create_roles_response_role import CreateRolesResponseRole as CreateRolesResponseRole
+    from kinde_sdk.management.models.create_subscriber_success_response import CreateSubscriberSuccessResponse as CreateSubscriberSuccessResponse
+    from kinde_sdk.management.models.create_subscriber_success_response_subscriber import CreateSubscriberSuccessResponseSubscriber as CreateSubscriberSuccessResponseSubscriber
+    from kinde_sdk.management.models.create_user_billing_customer_request import CreateUserBillingCustomerRequest as CreateUserBillingCustomerRequest
+    from kinde_sdk.management.models.create_user_billing_customer_response import CreateUserBillingCustomerResponse as CreateUserBillingCustomerResponse
+    from kinde_sdk.management.models.create_user_billing_customer_response_billing_customer import CreateUserBillingCustomerResponseBillingCustomer as CreateUserBillingCustomerResponseBillingCustomer
+    from kinde_sdk.management.models.create_user_identity_request import CreateUserIdentityRequest as CreateUserIdentityRequest
+    from kinde_sdk.management.models.create_user_request import CreateUserRequest as CreateUserRequest
+    from kinde_sdk.management.models.create_user_request_identities_inner import CreateUserRequestIdentitiesInner as CreateUserRequestIdentitiesInner
+    from kinde_sdk.management.models.create_user_request_identities_inner_details import CreateUserRequestIdentitiesInnerDetails as CreateUserRequestIdentitiesInnerDetails
+    from kinde_sdk.management.models.create_user_request_profile import CreateUserRequestProfile as CreateUserRequestProfile
+    from kinde_sdk.management.models.create_user_response import CreateUserResponse as CreateUserResponse
+    from kinde_sdk.management.models.create_web_hook_request import CreateWebHookRequest as CreateWebHookRequest
+    from kinde_sdk.management.models.create_webhook_response import CreateWebhookResponse as CreateWebhookResponse
+    from kinde_sdk.management.models.create_webhook_response_webhook import CreateWebhookResponseWebhook as CreateWebhookResponseWebhook
+    from kinde_sdk.management.models.delete_api_response import DeleteApiResponse as DeleteApiResponse
+    from kinde_sdk.management.models.delete_directory_response import DeleteDirectoryResponse as DeleteDirectoryResponse
+    from kinde_sdk.management.models.delete_environment_variable_response import DeleteEnvironmentVariableResponse as DeleteEnvironmentVariableResponse
+    from kinde_sdk.management.models.delete_role_scope_response import DeleteRoleScopeResponse as DeleteRoleScopeResponse
+    from kinde_sdk.management.models.delete_webhook_response import DeleteWebhookResponse as DeleteWebhookResponse
+    from kinde_sdk.management.models.directory import Directory as Directory
+    from kinde_sdk.management.models.environment_variable import EnvironmentVariable as EnvironmentVariable
+    from kinde_sdk.management.models.error import Error as Error
+    from kinde_sdk.management.models.error_response import ErrorResponse as ErrorResponse
+    from kinde_sdk.management.models.event_type import EventType as EventType
+    from kinde_sdk.management.models.get_api_key_response import GetApiKeyResponse as GetApiKeyResponse
+    from kinde_sdk.management.models.get_api_key_response_api_key import GetApiKeyResponseApiKey as GetApiKeyResponseApiKey
+    from kinde_sdk.management.models.get_api_keys_response import GetApiKeysResponse as GetApiKeysResponse
+    from kinde_sdk.management.models.get_api_keys_response_api_keys_inner import GetApiKeysResponseApiKeysInner as GetApiKeysResponseApiKeysInner
+    from kinde_sdk.management.models.get_api_response import GetApiResponse as GetApiResponse
+    from kinde_sdk.management.models.get_api_response_api import GetApiResponseApi as GetApiResponseApi
+    from kinde_sdk.management.models.get_api_response_api_applications_inner import GetApiResponseApiApplicationsInner as GetApiResponseApiApplicationsInner
+    from kinde_sdk.management.models.get_api_response_api_scopes_inner import GetApiResponseApiScopesInner as GetApiResponseApiScopesInner
+    from kinde_sdk.management.models.get_api_scope_response import GetApiScopeResponse as GetApiScopeResponse
+    from kinde_sdk.management.models.get_api_scopes_response import GetApiScopesResponse as GetApiScopesResponse
+    from kinde_sdk.management.models.get_api_scopes_response_scopes_inner import GetApiScopesResponseScopesInner as GetApiScopesResponseScopesInner
+    from kinde_sdk.management.models.get_apis_response import GetApisResponse as GetApisResponse
+    from kinde_sdk.management.models.get_apis_response_apis_inner import GetApisResponseApisInner as GetApisResponseApisInner
+    from kinde_sdk.management.models.get_apis_response_apis_inner_scopes_inner import GetApisResponseApisInnerScopesInner as GetApisResponseApisInnerScopesInner
+    from kinde_sdk.management.models.get_application_access_roles_response import GetApplicationAccessRolesResponse as GetApplicationAccessRolesResponse
+    from kinde_sdk.management.models.get_application_response import GetApplicationResponse as GetApplicationResponse
+    from kinde_sdk.management.models.get_application_response_application import GetApplicationResponseApplication as GetApplicationResponseApplication
+    from kinde_sdk.management.models.get_applications_response import GetApplicationsResponse as GetApplicationsResponse
+    from kinde_sdk.management.models.get_billing_agreements_response import GetBillingAgreementsResponse as GetBillingAgreementsResponse
+    from kinde_sdk.management.models.get_billing_agreements_response_agreements_inner import GetBillingAgreementsResponseAgreementsInner as GetBillingAgreementsResponseAgreementsInner
+    from kinde_sdk.management.models.get_billing_agreements_response_agreements_inner_entitlements_inner import GetBillingAgreementsResponseAgreementsInnerEntitlementsInner as GetBillingAgreementsResponseAgreementsInnerEntitlementsInner
+    from kinde_sdk.management.models.get_billing_entitlements_response import GetBillingEntitlementsResponse as GetBillingEntitlementsResponse
+    from kinde_sdk.management.models.get_billing_entitlements_response_entitlements_inner import GetBillingEntitlementsResponseEntitlementsInner as GetBillingEntitlementsResponseEntitlementsInner
+    from kinde_sdk.management.models.get_billing_entitlements_response_plans_inner import GetBillingEntitlementsResponsePlansInner as GetBillingEntitlementsResponsePlansInner
+    from kinde_sdk.management.models.get_business_response import GetBusinessResponse as GetBusinessResponse
+    from kinde_sdk.management.models.get_business_response_business import GetBusinessResponseBusiness as GetBusinessResponseBusiness
+    from kinde_sdk.management.models.get_categories_response import GetCategoriesResponse as GetCategoriesResponse
+    from kinde_sdk.management.models.get_connections_response import GetConnectionsResponse as GetConnectionsResponse
+    from kinde_sdk.management.models.get_directories_response import GetDirectoriesResponse as GetDirectoriesResponse
+    from kinde_sdk.management.models.get_directory_response import GetDirectoryResponse as GetDirectoryResponse
+    from kinde_sdk.management.models.get_environment_feature_flags_response import GetEnvironmentFeatureFlagsResponse as GetEnvironmentFeatureFlagsResponse
+    from kinde_sdk.management.models.get_environment_response import GetEnvironmentResponse as GetEnvironmentResponse
+    from kinde_sdk.management.models.get_environment_response_environment import GetEnvironmentResponseEnvironment as GetEnvironmentResponseEnvironment
+    from kinde_sdk.management.models.get_environment_response_environment_background_color import GetEnvironmentResponseEnvironmentBackgroundColor as GetEnvironmentResponseEnvironmentBackgroundColor
+    from kinde_sdk.management.models.get_environment_response_environment_link_color import GetEnvironmentResponseEnvironmentLinkColor as GetEnvironmentResponseEnvironmentLinkColor
+    from kinde_sdk.management.models.get_environment_variable_response import GetEnvironmentVariableResponse as GetEnvironmentVariableResponse
+    from kinde_sdk.management.models.get_environment_variables_response import GetEnvironmentVariablesResponse as GetEnvironmentVariablesResponse
+    from kinde_sdk.management.models.get_event_response import GetEventResponse as GetEventResponse
+    from kinde_sdk.management.models.get_event_response_event import GetEventResponseEvent as GetEventResponseEvent
+    from kinde_sdk.management.models.get_event_types_response import GetEventTypesResponse as GetEventTypesResponse
+    from kinde_sdk.management.models.get_identities_response import GetIdentitiesResponse as GetIdentitiesResponse
+    from kinde_sdk.management.models.get_industries_response import GetIndustriesResponse as GetIndustriesResponse
+    from kinde_sdk.management.models.get_industries_response_industries_inner import GetIndustriesResponseIndustriesInner as GetIndustriesResponseIndustriesInner
+    from kinde_sdk.management.models.get_organization_feature_flags_response import GetOrganizationFeatureFlagsResponse as GetOrganizationFeatureFlagsResponse
+    from kinde_sdk.management.models.get_organization_feature_flags_response_feature_flags_value import GetOrganizationFeatureFlagsResponseFeatureFlagsValue as GetOrganizationFeatureFlagsResponseFeatureFlagsValue
+    from kinde_sdk.management.models.get_organization_invite_response import GetOrganizationInviteResponse as GetOrganizationInviteResponse
+    from kinde_sdk.management.models.get_organization_invite_response_roles_inner import GetOrganizationInviteResponseRolesInner as GetOrganizationInviteResponseRolesInner
+    from kinde_sdk.management.models.get_organization_invites_response import GetOrganizationInvitesResponse as GetOrganizationInvitesResponse
+    from kinde_sdk.management.models.get_organization_passkey200_response import GetOrganizationPasskey200Response as GetOrganizationPasskey200Response
+    from kinde_sdk.management.models.get_organization_response import GetOrganizationResponse as GetOrganizationResponse
+    from kinde_sdk.management.models.get_organization_response_billing import GetOrganizationResponseBilling as GetOrganizationResponseBilling
+    from kinde_sdk.management.models.get_organization_response_billing_agreements_inner import GetOrganizationResponseBillingAgreementsInner as GetOrganizationResponseBillingAgreementsInner
+    from kinde_sdk.management.models.get_organization_role_active_users_count_response import GetOrganizationRoleActiveUsersCountResponse as GetOrganizationRoleActiveUsersCountResponse
+    from kinde_sdk.management.models.get_organization_role_users_count_response import GetOrganizationRoleUsersCountResponse as GetOrganizationRoleUsersCountResponse
+    from kinde_sdk.management.models.get_organization_role_users_response import GetOrganizationRoleUsersResponse as GetOrganizationRoleUsersResponse
+    from kinde_sdk.management.models.get_organization_role_users_response_users_inner import GetOrganizationRoleUsersResponseUsersInner as GetOrganizationRoleUsersResponseUsersInner
+    from kinde_sdk.management.models.get_organization_users_response import GetOrganizationUsersResponse as GetOrganizationUsersResponse
+    from kinde_sdk.management.models.get_organizations_response import GetOrganizationsResponse as GetOrganizationsResponse
+    from kinde_sdk.management.models.get_organizations_user_permissions_response import GetOrganizationsUserPermissionsResponse as GetOrganizationsUserPermissionsResponse
+    from kinde_sdk.management.models.get_organizations_user_roles_response import GetOrganizationsUserRolesResponse as GetOrganizationsUserRolesResponse
+    from kinde_sdk.management.models.get_passkey200_response import GetPasskey200Response as GetPasskey200Response
+    from kinde_sdk.management.models.get_permissions_response import GetPermissionsResponse as GetPermissionsResponse
+    from kinde_sdk.management.models.get_properties_response import GetPropertiesResponse as GetPropertiesResponse
+    from kinde_sdk.management.models.get_property_values_response import GetPropertyValuesResponse as GetPropertyValuesResponse
+    from kinde_sdk.management.models.get_redirect_callback_urls_response import GetRedirectCallbackUrlsResponse as GetRedirectCallbackUrlsResponse
+    from kinde_sdk.management.models.get_role_response import GetRoleResponse as GetRoleResponse
+    from kinde_sdk.management.models.get_role_response_role import GetRoleResponseRole as GetRoleResponseRole
+    from kinde_sdk.management.models.get_role_users_response import GetRoleUsersResponse as GetRoleUsersResponse
+    from kinde_sdk.management.models.get_role_users_response_users_inner import GetRoleUsersResponseUsersInner as GetRoleUsersResponseUsersInner
+    from kinde_sdk.management.models.get_roles_response import GetRolesResponse as GetRolesResponse
+    from kinde_sdk.management.models.get_subscriber_response import GetSubscriberResponse as GetSubscriberResponse
+    from kinde_sdk.management.models.get_subscribers_response import GetSubscribersResponse as GetSubscribersResponse
+    from kinde_sdk.management.models.get_system_permissions_response import GetSystemPermissionsResponse as GetSystemPermissionsResponse
+    from kinde_sdk.management.models.get_timezones_response import GetTimezonesResponse as GetTimezonesResponse
+    from kinde_sdk.management.models.get_timezones_response_timezones_inner import GetTimezonesResponseTimezonesInner as GetTimezonesResponseTimezonesInner
+    from kinde_sdk.management.models.get_user_mfa_response import GetUserMfaResponse as GetUserMfaResponse
+    from kinde_sdk.management.models.get_user_mfa_response_mfa import GetUserMfaResponseMfa as GetUserMfaResponseMfa
+    from kinde_sdk.management.models.get_user_sessions_response import GetUserSessionsResponse as GetUserSessionsResponse
+    from kinde_sdk.management.models.get_user_sessions_response_sessions_inner import GetUserSessionsResponseSessionsInner as GetUserSessionsResponseSessionsInner
+    from kinde_sdk.management.models.get_webhooks_response import GetWebhooksResponse as GetWebhooksResponse
+    from kinde_sdk.management.models.identity import Identity as Identity
+    from kinde_sdk.management.models.logout_redirect_urls import LogoutRedirectUrls as LogoutRedirectUrls
+    from kinde_sdk.management.models.model_property import ModelProperty as ModelProperty
+    from kinde_sdk.management.models.not_found_response import NotFoundResponse as NotFoundResponse
+    from kinde_sdk.management.models.not_found_response_errors import NotFoundResponseErrors as NotFoundResponseErrors
+    from kinde_sdk.management.models.organization_invite import OrganizationInvite as OrganizationInvite
+    from kinde_sdk.management.models.organization_item_schema import OrganizationItemSchema as OrganizationItemSchema
+    from kinde_sdk.management.models.organization_user import OrganizationUser as OrganizationUser
+    from kinde_sdk.management.models.organization_user_permission import OrganizationUserPermission as OrganizationUserPermission
+    from kinde_sdk.management.models.organization_user_permission_roles_inner import OrganizationUserPermissionRolesInner as OrganizationUserPermissionRolesInner
+    from kinde_sdk.management.models.organization_user_role import OrganizationUserRole as OrganizationUserRole
+    from kinde_sdk.management.models.organization_user_role_permissions import OrganizationUserRolePermissions as OrganizationUserRolePermissions
+    from kinde_sdk.management.models.organization_user_role_permissions_permissions import OrganizationUserRolePermissionsPermissions as OrganizationUserRolePermissionsPermissions
+    from kinde_sdk.management.models.permissions import Permissions as Permissions
+    from kinde_sdk.management.models.property_value import PropertyValue as PropertyValue
+    from kinde_sdk.management.models.read_env_logo_response import ReadEnvLogoResponse as ReadEnvLogoResponse
+    from kinde_sdk.management.models.read_env_logo_response_logos_inner import ReadEnvLogoResponseLogosInner as ReadEnvLogoResponseLogosInner
+    from kinde_sdk.management.models.read_logo_response import ReadLogoResponse as ReadLogoResponse
+    from kinde_sdk.management.models.read_logo_response_logos_inner import ReadLogoResponseLogosInner as ReadLogoResponseLogosInner
+    from kinde_sdk.management.models.redirect_callback_urls import RedirectCallbackUrls as RedirectCallbackUrls
+    from kinde_sdk.management.models.replace_connection_request import ReplaceConnectionRequest as ReplaceConnectionRequest
+    from kinde_sdk.management.models.replace_connection_request_options import ReplaceConnectionRequestOptions as ReplaceConnectionRequestOptions
+    from kinde_sdk.management.models.replace_connection_request_options_one_of import ReplaceConnectionRequestOptionsOneOf as ReplaceConnectionRequestOptionsOneOf
+    from kinde_sdk.management.models.replace_connection_request_options_one_of1 import ReplaceConnectionRequestOptionsOneOf1 as ReplaceConnectionRequestOptionsOneOf1
+    from kinde_sdk.management.models.replace_logout_redirect_urls_request import ReplaceLogoutRedirectURLsRequest as ReplaceLogoutRedirectURLsRequest
+    from kinde_sdk.management.models.replace_mfa_request import ReplaceMFARequest as ReplaceMFARequest
+    from kinde_sdk.management.models.replace_organization_mfa_request import ReplaceOrganizationMFARequest as ReplaceOrganizationMFARequest
+    from kinde_sdk.management.models.replace_redirect_callback_urls_request import ReplaceRedirectCallbackURLsRequest as ReplaceRedirectCallbackURLsRequest
+    from kinde_sdk.management.models.role import Role as Role
+    from kinde_sdk.management.models.role_permissions_response import RolePermissionsResponse as RolePermissionsResponse
+    from kinde_sdk.management.models.role_scopes_response import RoleScopesResponse as RoleScopesResponse
+    from kinde_sdk.management.models.role_system_permissions_response import RoleSystemPermissionsResponse as RoleSystemPermissionsResponse
+    from kinde_sdk.management.models.roles import Roles as Roles
+    from kinde_sdk.management.models.rotate_api_key_response import RotateApiKeyResponse as RotateApiKeyResponse
+    from kinde_sdk.management.models.rotate_api_key_response_api_key import RotateApiKeyResponseApiKey as RotateApiKeyResponseApiKey
+    from kinde_sdk.management.models.scopes import Scopes as Scopes
+    from kinde_sdk.management.models.search_users_response import SearchUsersResponse as SearchUsersResponse
+    from kinde_sdk.management.models.search_users_response_results_inner import SearchUsersResponseResultsInner as SearchUsersResponseResultsInner
+    from kinde_sdk.management.models.search_users_response_results_inner_api_scopes_inner import SearchUsersResponseResultsInnerApiScopesInner as SearchUsersResponseResultsInnerApiScopesInner
+    from kinde_sdk.management.models.set_user_password_request import SetUserPasswordRequest as SetUserPasswordRequest
+    from kinde_sdk.management.models.subscriber import Subscriber as Subscriber
+    from kinde_sdk.management.models.subscribers_subscriber import SubscribersSubscriber as SubscribersSubscriber
+    from kinde_sdk.management.models.success_response import SuccessResponse as SuccessResponse
+    from kinde_sdk.management.models.system_permissions import SystemPermissions as SystemPermissions
+    from kinde_sdk.management.models.update_api_applications_request import UpdateAPIApplicationsRequest as UpdateAPIApplicationsRequest
+    from kinde_sdk.management.models.update_api_applications_request_applications_inner import UpdateAPIApplicationsRequestApplicationsInner as UpdateAPIApplicationsRequestApplicationsInner
+    from kinde_sdk.management.models.update_api_scope_request import UpdateAPIScopeRequest as UpdateAPIScopeRequest
+    from kinde_sdk.management.models.update_application_request import UpdateApplicationRequest as UpdateApplicationRequest
+    from kinde_sdk.management.models.update_application_tokens_request import UpdateApplicationTokensRequest as UpdateApplicationTokensRequest
+    from kinde_sdk.management.models.update_applications_property_request import UpdateApplicationsPropertyRequest as UpdateApplicationsPropertyRequest
+    from kinde_sdk.management.models.update_applications_property_request_value import UpdateApplicationsPropertyRequestValue as UpdateApplicationsPropertyRequestValue
+    from kinde_sdk.management.models.update_business_request import UpdateBusinessRequest as UpdateBusinessRequest
+    from kinde_sdk.management.models.update_category_request import UpdateCategoryRequest as UpdateCategoryRequest
+    from kinde_sdk.management.models.update_connection_request import UpdateConnectionRequest as UpdateConnectionRequest
+    from kinde_sdk.management.models.update_connection_request_options import UpdateConnectionRequestOptions as UpdateConnectionRequestOptions
+    from kinde_sdk.management.models.update_connection_request_options_one_of import UpdateConnectionRequestOptionsOneOf as UpdateConnectionRequestOptionsOneOf
+    from kinde_sdk.management.models.update_connection_request_options_one_of1 import UpdateConnectionRequestOptionsOneOf1 as UpdateConnectionRequestOptionsOneOf1
+    from kinde_sdk.management.models.update_directory_request import UpdateDirectoryRequest as UpdateDirectoryRequest
+    from kinde_sdk.management.models.update_directory_response import UpdateDirectoryResponse as UpdateDirectoryResponse
+    from kinde_sdk.management.models.update_environement_feature_flag_override_request import UpdateEnvironementFeatureFlagOverrideRequest as UpdateEnvironementFeatureFlagOverrideRequest
+    from kinde_sdk.management.models.update_environment_variable_request import UpdateEnvironmentVariableRequest as UpdateEnvironmentVariableRequest
+    from kinde_sdk.management.models.update_environment_variable_response import UpdateEnvironmentVariableResponse as UpdateEnvironmentVariableResponse
+    from kinde_sdk.management.models.update_identity_request import UpdateIdentityRequest as UpdateIdentityRequest
+    from kinde_sdk.management.models.update_organization_passkey200_response import UpdateOrganizationPasskey200Response as UpdateOrganizationPasskey200Response
+    from kinde_sdk.management.models.update_organization_passkey_request import UpdateOrganizationPasskeyRequest as UpdateOrganizationPasskeyRequest
+    from kinde_sdk.management.models.update_organization_properties_request import UpdateOrganizationPropertiesRequest as UpdateOrganizationPropertiesRequest
+    from kinde_sdk.management.models.update_organization_request import UpdateOrganizationRequest as UpdateOrganizationRequest
+    from kinde_sdk.management.models.update_organization_sessions_request import UpdateOrganizationSessionsRequest as UpdateOrganizationSessionsRequest
+    from kinde_sdk.management.models.update_organization_users_request import UpdateOrganizationUsersRequest as UpdateOrganizationUsersRequest
+    from kinde_sdk.management.models.update_organization_users_request_users_inner import UpdateOrganizationUsersRequestUsersInner as UpdateOrganizationUsersRequestUsersInner
+    from kinde_sdk.management.models.update_organization_users_response import UpdateOrganizationUsersResponse as UpdateOrganizationUsersResponse
+    from kinde_sdk.management.models.update_passkey200_response import UpdatePasskey200Response as UpdatePasskey200Response
+    from kinde_sdk.management.models.update_passkey_request import UpdatePasskeyRequest as UpdatePasskeyRequest
+    from kinde_sdk.management.models.update_property_request import UpdatePropertyRequest as UpdatePropertyRequest
+    from kinde_sdk.management.models.update_role_permissions_request import UpdateRolePermissionsRequest as UpdateRolePermissionsRequest
+    from kinde_sdk.management.models.update_role_permissions_request_permissions_inner import UpdateRolePermissionsRequestPermissionsInner as UpdateRolePermissionsRequestPermissionsInner
+    from kinde_sdk.management.models.update_role_permissions_response import UpdateRolePermissionsResponse as UpdateRolePermissionsResponse
+    from kinde_sdk.management.models.update_role_system_permissions_request import UpdateRoleSystemPermissionsRequest as UpdateRoleSystemPermissionsRequest
+    from kinde_sdk.management.models.update_role_system_permissions_request_system_permissions_inner import UpdateRoleSystemPermissionsRequestSystemPermissionsInner as UpdateRoleSystemPermissionsRequestSystemPermissionsInner
+    from kinde_sdk.management.models.update_role_system_permissions_response import UpdateRoleSystemPermissionsResponse as UpdateRoleSystemPermissionsResponse
+    from kinde_sdk.management.models.update_roles_request import UpdateRolesRequest as UpdateRolesRequest
+    from kinde_sdk.management.models.update_user_request import UpdateUserRequest as UpdateUserRequest
+    from kinde_sdk.management.models.update_user_response import UpdateUserResponse as UpdateUserResponse
+    from kinde_sdk.management.models.update_web_hook_request import UpdateWebHookRequest as UpdateWebHookRequest
+    from kinde_sdk.management.models.update_webhook_response import UpdateWebhookResponse as UpdateWebhookResponse
+    from kinde_sdk.management.models.update_webhook_response_webhook import UpdateWebhookResponseWebhook as UpdateWebhookResponseWebhook
+    from kinde_sdk.management.models.user import User as User
+    from kinde_sdk.management.models.user_billing import UserBilling as UserBilling
+    from kinde_sdk.management.models.user_identities_inner import UserIdentitiesInner as UserIdentitiesInner
+    from kinde_sdk.management.models.user_identity import UserIdentity as UserIdentity
+    from kinde_sdk.management.models.user_identity_result import UserIdentityResult as UserIdentityResult
+    from kinde_sdk.management.models.users_response import UsersResponse as UsersResponse
+    from kinde_sdk.management.models.users_response_users_inner import UsersResponseUsersInner as UsersResponseUsersInner
+    from kinde_sdk.management.models.users_response_users_inner_billing import UsersResponseUsersInnerBilling as UsersResponseUsersInnerBilling
+    from kinde_sdk.management.models.users_response_users_inner_identities_inner import UsersResponseUsersInnerIdentitiesInner as UsersResponseUsersInnerIdentitiesInner
+    from kinde_sdk.management.models.users_response_users_inner_last_organization_sign_ins_inner import UsersResponseUsersInnerLastOrganizationSignInsInner as UsersResponseUsersInnerLastOrganizationSignInsInner
+    from kinde_sdk.management.models.verify_api_key_request import VerifyApiKeyRequest as VerifyApiKeyRequest
+    from kinde_sdk.management.models.verify_api_key_response import VerifyApiKeyResponse as VerifyApiKeyResponse
+    from kinde_sdk.management.models.webhook import Webhook as Webhook
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+# Names exported by "from ... import *", including the lazily imported ones
+__all__ = sorted(
+    {name for name in globals() if not name.startswith("_") and name != "TYPE_CHECKING"}
+    | set(_LAZY_IMPORTS)
+)
@@ -0,0 +1,138 @@
+"""
+Auto-pagination for Management API list endpoints.
+
+List endpoints (``get_users``, ``get_organizations``, ...) return one page at
+a time along with a ``next_token``. The generators in this module follow the
+tokens and yield individual items, so callers can stream large result sets
+while holding at most two pages in memory. With ``prefetch=True`` the next
+page is requested while the current one is being consumed.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+
+
+def _page_items(page: Any, items_field: Optional[str]) -> List[Any]:
+    """
+    Get the items of a page.
+
+    Args:
+        page: A list response model (e.g. UsersResponse)
+        items_field: Name of the field holding the items. If None, the first
+            list-valued field of the page is used.
+
+    Returns:
+        List[Any]: The items, or an empty list
+    """
+    if page is None:
+        return []
+    if items_field is not None:
+        return getattr(page, items_field, None) or []
+    for field_name in type(page).model_fields:
+        value = getattr(page, field_name, None)
+        if isinstance(value, list):
+            return value
+    return []
+
+
+def _next_token(page: Any, items: List[Any], current_token: Optional[str]) -> Optional[str]:
+    """Get the token of the next page, or None if this is the last page."""
+    next_token = getattr(page, "next_token", None)
+    # Stop on empty pages and on tokens that do not advance, to avoid looping forever
+    if not items or not next_token or next_token == current_token:
+        return None
+    return next_token
+
+
+def paginate(
+    fetch_page: Callable[..., Any],
+    items_field: Optional[str] = None,
+    page_size: Optional[int] = None,
+    prefetch: bool = False,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """
+    Iterate over all items of a paginated list endpoint.
+
+    Args:
+        fetch_page: The API method, e.g. ``client.users_api.get_users``
+        items_field: Name of the list field in the response (inferred if None)
+        page_size: Number of items per request (API default if None)
+        prefetch: Fetch the next page on a background thread while the
+            current page is consumed
+        **kwargs: Other arguments for ``fetch_page`` (filters, sort, ...)
+
+    Yields:
+        The items of every page, in order
+    """
+    def fetch(token: Optional[str]) -> Any:
+        return fetch_page(page_size=page_size, next_token=token, **kwargs)
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kinde-paginate") if prefetch else None
+    try:
+        token = None
+        page = fetch(token)
+        while True:
+            items = _page_items(page, items_field)
+            next_token = _next_token(page, items, token)
+            future = executor.submit(fetch, next_token) if executor and next_token else None
+
+            yield from items
+
+            if next_token is None:
+                return
+            page = future.result() if future else fetch(next_token)
+            token = next_token
+    finally:
+        if executor:
+            # Abandon the prefetched page if the caller stopped early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(
+    fetch_page: Callable[..., Awaitable[Any]],
+    items_field: Optional[str] = None,
+    page_size: Optional[int] = None,
+    prefetch: bool = False,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """
+    Async version of paginate, for coroutine API methods (see AsyncManagementClient).
+
+    Args:
+        fetch_page: The async API method, e.g. ``async_client.users_api.get_users``
+        items_field: Name of the list field in the response (inferred if None)
+        page_size: Number of items per request (API default if None)
+        prefetch: Request the next page in a task while the current page is consumed
+        **kwargs: Other arguments for ``fetch_page`` (filters, sort, ...)
+
+    Yields:
+        The items of every page, in order
+    """
+    def fetch(token: Optional[str]) -> Awaitable[Any]:
+        return fetch_page(page_size=page_size, next_token=token, **kwargs)
+
+    task: Optional[asyncio.Future] = None
+    try:
+        token = None
+        page = await fetch(token)
+        while True:
+            items = _page_items(page, items_field)
+            next_token = _next_token(page, items, token)
+            if prefetch and next_token:
+                task = asyncio.ensure_future(fetch(next_token))
+
+            for item in items:
+                yield item
+
+            if next_token is None:
+                return
+            if task is not None:
+                page, task = await task, None
+            else:
+                page = await fetch(next_token)
+            token = next_token
+    finally:
+        if task is not None and not task.done():
+            task.cancel()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the management client.
+
+Each scenario runs in a fresh interpreter, so nothing is cached between
+runs. "all models and APIs" forces every lazily imported class to load and
+approximates the cost of the old eager imports.
+
+Usage:
+    python testv2/benchmark_import_time.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "import kinde_sdk.management": """
+import kinde_sdk.management
+""",
+    "ManagementClient + users_api": """
+from kinde_sdk.management import ManagementClient
+ManagementClient("example.kinde.com", "client_id", "client_secret").users_api
+""",
+    "all models and APIs (eager)": """
+import kinde_sdk.management as management
+for name in management.__all__:
+    getattr(management, name)
+""",
+}
+
+TIMER = """
+import sys, time
+_start = time.perf_counter()
+{code}
+_elapsed = time.perf_counter() - _start
+_modules = len([m for m in sys.modules if m.startswith("kinde_sdk.management")])
+print(f"{{_elapsed}} {{_modules}}")
+"""
+
+
+def measure(code: str):
+    """Run code in a fresh interpreter and return (seconds, management modules loaded)."""
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(code=code)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="runs per scenario (default: 5)")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<32} {'median':>10} {'min':>10} {'modules':>8}")
+    for name, code in SCENARIOS.items():
+        results = [measure(code) for _ in range(args.runs)]
+        times = [seconds for seconds, _ in results]
+        print(f"{name:<32} {statistics.median(times) * 1000:>8.0f}ms {min(times) * 1000:>8.0f}ms {results[-1][1]:>8}")
+
+
+if __name__ == "__main__":
+    main()
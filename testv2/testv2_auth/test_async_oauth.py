@@ -24,6 +24,7 @@ def mock_sync_oauth():
     mock._framework = Mock()
     mock._framework.get_user_id.return_value = "user_123"
     mock._session_manager = Mock()
+    mock._session_manager.get_token_manager_async = AsyncMock()
     mock._logger = Mock()
     # Add KindeConfigurationException to the mock
     mock.KindeConfigurationException = KindeConfigurationException
@@ -98,6 +99,15 @@ class TestAsyncOAuthSyncMethods:
 class TestAsyncOAuthAsyncMethods:
     """Test async methods."""
     
+    @pytest.mark.asyncio
+    async def test_is_authenticated_async(self, async_oauth, mock_sync_oauth):
+        """Test is_authenticated_async delegates to the non-blocking check."""
+        mock_sync_oauth.is_authenticated_async = AsyncMock(return_value=True)
+
+        assert await async_oauth.is_authenticated_async() is True
+        mock_sync_oauth.is_authenticated_async.assert_awaited_once()
+        mock_sync_oauth.is_authenticated.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_get_user_info_async_success(self, async_oauth, mock_sync_oauth):
         """Test get_user_info_async method with successful response."""
@@ -123,7 +133,7 @@ class TestAsyncOAuthAsyncMethods:
     async def test_get_user_info_async_no_token_manager(self, async_oauth, mock_sync_oauth):
         """Test get_user_info_async when no token manager is found."""
         # Configure mock to return no token manager
-        mock_sync_oauth._session_manager.get_token_manager.return_value = None
+        mock_sync_oauth._session_manager.get_token_manager_async.return_value = None
         
         with pytest.raises(Exception, match="No token manager found for user"):
             await async_oauth.get_user_info_async()
@@ -332,7 +342,7 @@ class TestAsyncOAuthHelperIntegration:
         """Test that get_user_info_async calls the helper function correctly."""
         # Mock token manager
         mock_token_manager = Mock()
-        mock_sync_oauth._session_manager.get_token_manager.return_value = mock_token_manager
+        mock_sync_oauth._session_manager.get_token_manager_async.return_value = mock_token_manager
         
         # Mock the async helper function
         with patch('kinde_sdk.auth.async_oauth.get_user_details', new_callable=AsyncMock) as mock_get_details:
@@ -357,7 +367,7 @@ class TestAsyncOAuthHelperIntegration:
         
         # Mock token manager
         mock_token_manager = Mock()
-        mock_sync_oauth._session_manager.get_token_manager.return_value = mock_token_manager
+        mock_sync_oauth._session_manager.get_token_manager_async.return_value = mock_token_manager
         
         # Mock the async helper function
         with patch('kinde_sdk.auth.async_oauth.get_user_details', new_callable=AsyncMock) as mock_get_details:
@@ -0,0 +1,171 @@
+import asyncio
+import contextvars
+import unittest
+from unittest.mock import Mock, patch
+
+from kinde_sdk.auth.auth_context import AuthContext
+from kinde_sdk.auth.claims import Claims
+from kinde_sdk.auth.feature_flags import FeatureFlags
+from kinde_sdk.auth.permissions import Permissions
+from kinde_sdk.auth.roles import Roles
+from kinde_sdk.core.framework.framework_context import FrameworkContext
+
+CLAIMS = {
+    "org_code": "org_123",
+    "permissions": ["read:todos", "create:todos"],
+    "roles": [{"id": "1", "key": "admin", "name": "Admin"}],
+    "feature_flags": {"theme": {"t": "s", "v": "dark"}},
+    "given_name": "Ada",
+}
+
+
+class TestAuthContext(unittest.TestCase):
+    def setUp(self):
+        self.token_manager = Mock()
+        self.token_manager.get_claims.return_value = dict(CLAIMS)
+
+    def test_indexes(self):
+        context = AuthContext("user_1", self.token_manager)
+        self.assertEqual(context.org_code, "org_123")
+        self.assertEqual(context.permissions, frozenset({"read:todos", "create:todos"}))
+        self.assertEqual(context.roles["admin"]["name"], "Admin")
+        self.assertEqual(context.feature_flags["theme"].value, "dark")
+
+    def test_claims_are_read_once(self):
+        context = AuthContext("user_1", self.token_manager)
+        for _ in range(5):
+            context.claims
+            context.permissions
+        self.token_manager.get_claims.assert_called_once_with("access_token")
+
+    def test_immutable(self):
+        context = AuthContext("user_1", self.token_manager)
+        with self.assertRaises(AttributeError):
+            context.user_id = "user_2"
+        with self.assertRaises(TypeError):
+            context.claims["org_code"] = "other"
+
+    def test_missing_claims(self):
+        self.token_manager.get_claims.return_value = {}
+        context = AuthContext("user_1", self.token_manager)
+        self.assertIsNone(context.org_code)
+        self.assertEqual(context.permissions, frozenset())
+        self.assertEqual(dict(context.roles), {})
+
+
+class TestRequestScopedContext(unittest.TestCase):
+    def setUp(self):
+        self.framework = Mock()
+        self.framework.get_user_id.return_value = "user_1"
+        self.token_manager = Mock(user_id="user_1")
+        self.token_manager.get_force_api.return_value = False
+        self.token_manager.get_claims.return_value = dict(CLAIMS)
+        self.session_manager = Mock()
+        self.session_manager.get_token_manager.return_value = self.token_manager
+
+        self.helpers = [Permissions(), Roles(), FeatureFlags(), Claims()]
+        for helper in self.helpers:
+            helper._framework = self.framework
+            helper._session_manager = self.session_manager
+
+    def tearDown(self):
+        FrameworkContext.clear_request()
+
+    async def _run_helpers(self):
+        permissions, roles, feature_flags, claims = self.helpers
+        return [
+            await permissions.get_permission("read:todos"),
+            await permissions.get_permissions(),
+            await roles.get_role("admin"),
+            await roles.get_roles(),
+            await feature_flags.get_flag("theme"),
+            await feature_flags.get_all_flags(),
+            await claims.get_claim("given_name"),
+        ]
+
+    def test_built_once_per_request(self):
+        async def request():
+            FrameworkContext.set_request(object())
+            await self._run_helpers()
+            return await self._run_helpers()
+
+        results = asyncio.run(request())
+        self.assertTrue(results[0]["isGranted"])
+        self.assertTrue(results[2]["isGranted"])
+        self.assertEqual(results[4].value, "dark")
+        self.assertEqual(results[6]["value"], "Ada")
+        self.framework.get_user_id.assert_called_once()
+        self.session_manager.get_token_manager.assert_called_once_with("user_1")
+        self.token_manager.get_claims.assert_called_once_with("access_token")
+
+    def test_new_request_builds_new_context(self):
+        async def requests():
+            FrameworkContext.set_request(object())
+            await self._run_helpers()
+            FrameworkContext.set_request(object())
+            await self._run_helpers()
+
+        asyncio.run(requests())
+        self.assertEqual(self.session_manager.get_token_manager.call_count, 2)
+
+    def test_not_cached_outside_a_request(self):
+        async def calls():
+            await self._run_helpers()
+            return FrameworkContext.get_auth_context()
+
+        self.assertIsNone(asyncio.run(calls()))
+        self.assertGreater(self.session_manager.get_token_manager.call_count, 1)
+
+    def test_anonymous_user_is_not_cached(self):
+        self.framework.get_user_id.return_value = None
+
+        async def request():
+            FrameworkContext.set_request(object())
+            result = await self.helpers[0].get_permission("read:todos")
+            return result, FrameworkContext.get_auth_context()
+
+        result, auth_context = asyncio.run(request())
+        self.assertFalse(result["isGranted"])
+        self.assertIsNone(auth_context)
+
+    def test_set_tokens_discards_context(self):
+        from kinde_sdk.auth.token_manager import TokenManager
+
+        FrameworkContext.set_request(object())
+        self.helpers[0]._get_auth_context()
+        self.assertIsNotNone(FrameworkContext.get_auth_context())
+
+        token_manager = TokenManager("user_ctx", "client_id", None, "https://example.kinde.com/oauth2/token")
+        with patch.object(token_manager, "_refresh_scheduler", None):
+            token_manager.set_tokens({"access_token": "not-a-jwt"})
+        self.assertIsNone(FrameworkContext.get_auth_context())
+
+    def test_concurrent_requests_are_isolated(self):
+        current_user = contextvars.ContextVar("current_user")
+        self.framework.get_user_id.side_effect = current_user.get
+        token_managers = {}
+        for user_id in ("user_1", "user_2"):
+            token_manager = Mock(user_id=user_id)
+            token_manager.get_force_api.return_value = False
+            token_manager.get_claims.return_value = {"permissions": [f"perm:{user_id}"]}
+            token_managers[user_id] = token_manager
+        self.session_manager.get_token_manager.side_effect = token_managers.get
+        permissions = self.helpers[0]
+
+        async def handle(user_id):
+            FrameworkContext.set_request(object())
+            current_user.set(user_id)
+            first = await permissions.get_permission(f"perm:{user_id}")
+            await asyncio.sleep(0)
+            second = await permissions.get_permission(f"perm:{user_id}")
+            return first["isGranted"] and second["isGranted"]
+
+        async def run():
+            return await asyncio.gather(handle("user_1"), handle("user_2"))
+
+        self.assertEqual(asyncio.run(run()), [True, True])
+        self.assertEqual(self.session_manager.get_token_manager.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
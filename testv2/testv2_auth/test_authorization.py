@@ -0,0 +1,135 @@
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from kinde_sdk.auth.api_options import ApiOptions
+from kinde_sdk.auth.authorization import AuthorizationSnapshot, authorization
+from kinde_sdk.auth.feature_flags import feature_flags
+from kinde_sdk.auth.permissions import permissions
+from kinde_sdk.auth.roles import roles
+
+DELAY = 0.2
+
+RESPONSES = {
+    "get_user_permissions": SimpleNamespace(data=SimpleNamespace(
+        org_code="org_123", permissions=[SimpleNamespace(id="p1", key="read:todos", name="Read")]
+    )),
+    "get_user_roles": SimpleNamespace(data=SimpleNamespace(
+        org_code="org_123", roles=[SimpleNamespace(id="r1", key="admin", name="Admin", description=None, is_default_role=False)]
+    )),
+    "get_feature_flags": SimpleNamespace(data=SimpleNamespace(flags={"theme": {"t": "s", "v": "dark"}})),
+}
+
+
+def _slow_fetch(api_class, method_name):
+    time.sleep(DELAY)
+    return RESPONSES[method_name]
+
+
+def _billing_api():
+    billing_api = Mock()
+
+    def get_entitlements(page_size=None, starting_after=None):
+        time.sleep(DELAY)
+        return SimpleNamespace(
+            data=SimpleNamespace(entitlements=[SimpleNamespace(feature_key="pro_feature")]),
+            metadata=SimpleNamespace(has_more=False, next_page_starting_after=None),
+        )
+
+    billing_api.get_entitlements.side_effect = get_entitlements
+    return billing_api
+
+
+class TestAuthorizationSnapshot(unittest.TestCase):
+    def test_lookups(self):
+        snapshot = AuthorizationSnapshot(
+            org_code="org_123",
+            permissions=["read:todos"],
+            roles=[{"key": "admin"}],
+            feature_flags={},
+        )
+        self.assertTrue(snapshot.has_permission("read:todos"))
+        self.assertFalse(snapshot.has_permission("delete:todos"))
+        self.assertTrue(snapshot.has_role("admin"))
+        self.assertEqual(snapshot.get_flag_value("missing", 3), 3)
+        self.assertIsNone(snapshot.entitlements)
+
+
+class TestGetAuthorizationSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.patches = [patch.object(helper, "_get_force_api_setting", return_value=False)
+                        for helper in (permissions, roles, feature_flags)]
+        self.patches += [patch.object(helper, "_fetch_account_api", side_effect=_slow_fetch)
+                         for helper in (permissions, roles, feature_flags)]
+        self.patches.append(patch.object(authorization, "_create_authenticated_api_client", return_value=_billing_api()))
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def test_force_api_calls_run_concurrently(self):
+        start = time.perf_counter()
+        snapshot = asyncio.run(authorization.get_authorization_snapshot(ApiOptions(force_api=True)))
+        elapsed = time.perf_counter() - start
+
+        # Four calls of DELAY each would take 4 * DELAY if run one after another
+        self.assertLess(elapsed, DELAY * 2.5)
+        self.assertEqual(snapshot.org_code, "org_123")
+        self.assertTrue(snapshot.has_permission("read:todos"))
+        self.assertTrue(snapshot.has_role("admin"))
+        self.assertEqual(snapshot.get_flag_value("theme"), "dark")
+        self.assertEqual([e.feature_key for e in snapshot.entitlements], ["pro_feature"])
+
+    def test_without_entitlements(self):
+        snapshot = asyncio.run(authorization.get_authorization_snapshot(
+            ApiOptions(force_api=True), include_entitlements=False
+        ))
+        self.assertIsNone(snapshot.entitlements)
+        authorization._create_authenticated_api_client.assert_not_called()
+
+    def test_failed_lookup_is_left_empty(self):
+        with patch.object(roles, "_fetch_account_api", side_effect=RuntimeError("boom")):
+            snapshot = asyncio.run(authorization.get_authorization_snapshot(ApiOptions(force_api=True)))
+        self.assertEqual(snapshot.roles, [])
+        self.assertTrue(snapshot.has_permission("read:todos"))
+
+    def test_raising_lookup_is_left_empty(self):
+        # get_all_flags raises ValueError on a malformed flag claim
+        with patch.object(feature_flags, "get_all_flags", side_effect=ValueError("Invalid flag")):
+            snapshot = asyncio.run(authorization.get_authorization_snapshot(ApiOptions(force_api=True)))
+        self.assertEqual(snapshot.feature_flags, {})
+        self.assertTrue(snapshot.has_role("admin"))
+        self.assertEqual([e.feature_key for e in snapshot.entitlements], ["pro_feature"])
+
+    def test_entitlements_failure_is_left_empty(self):
+        authorization._create_authenticated_api_client.return_value.get_entitlements.side_effect = RuntimeError("boom")
+        snapshot = asyncio.run(authorization.get_authorization_snapshot(ApiOptions(force_api=True)))
+        self.assertEqual(snapshot.entitlements, [])
+
+
+class TestFetchAccountApiAsync(unittest.TestCase):
+    def test_does_not_block_the_event_loop(self):
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            with patch.object(permissions, "_fetch_account_api", side_effect=_slow_fetch):
+                await permissions._fetch_account_api_async(None, "get_user_permissions")
+            task.cancel()
+            return ticks
+
+        self.assertGreater(asyncio.run(run()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
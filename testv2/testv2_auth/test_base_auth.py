@@ -81,4 +81,38 @@ class TestBaseAuth:
         auth = BaseAuth()
         result = auth._get_token_manager()
         
-        assert result is None 
\ No newline at end of file
+        assert result is None
+
+    @patch('kinde_sdk.core.framework.framework_factory.FrameworkFactory.get_framework_instance')
+    def test_create_authenticated_api_client_uses_pooled_client(self, mock_framework_factory):
+        """Test that API clients share the pooled ApiClient of the token's Kinde host"""
+        from kinde_sdk.core.frontend_client_pool import frontend_client_pool
+        from kinde_sdk.frontend.api.permissions_api import PermissionsApi
+
+        mock_framework = Mock()
+        mock_framework.get_user_id.return_value = "user_123"
+        mock_framework_factory.return_value = mock_framework
+
+        mock_token_manager = Mock()
+        mock_token_manager.get_access_token.return_value = "access_token_123"
+        mock_token_manager.token_url = "https://example.kinde.com/oauth2/token"
+        auth = BaseAuth()
+        auth._session_manager = Mock()
+        auth._session_manager.get_token_manager.return_value = mock_token_manager
+
+        first = auth._create_authenticated_api_client(PermissionsApi)
+        second = auth._create_authenticated_api_client(PermissionsApi)
+
+        shared = frontend_client_pool.get_client("https://example.kinde.com")
+        assert first.api_client._api_client is shared
+        assert second.api_client._api_client is shared
+        assert first.api_client._request_auth["value"] == "Bearer access_token_123"
+
+    def test_get_api_host(self):
+        """Test that the Account API host is derived from the token URL"""
+        token_manager = Mock()
+        token_manager.token_url = "https://example.kinde.com/oauth2/token"
+        assert BaseAuth._get_api_host(token_manager) == "https://example.kinde.com"
+
+        token_manager.token_url = None
+        assert BaseAuth._get_api_host(token_manager) is None
@@ -0,0 +1,173 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from kinde_sdk.auth.api_options import ApiOptions
+from kinde_sdk.auth.feature_flags import FeatureFlags
+from kinde_sdk.auth.permissions import Permissions
+from kinde_sdk.auth.policy import AllOf, AnyOf, Flag, Permission, Policy, Role, evaluate_policy
+from kinde_sdk.auth.roles import Roles
+
+CLAIMS = {
+    "org_code": "org_123",
+    "permissions": ["read:todos", "create:todos"],
+    "roles": [{"id": "1", "key": "admin", "name": "Admin"}],
+    "feature_flags": {
+        "beta_access": {"t": "b", "v": True},
+        "theme": {"t": "s", "v": "dark"},
+    },
+}
+
+
+def _authenticated(helper, claims=CLAIMS):
+    token_manager = Mock()
+    token_manager.get_force_api.return_value = False
+    token_manager.get_claims.return_value = dict(claims)
+    helper._framework = Mock(**{"get_user_id.return_value": "user_1"})
+    helper._session_manager = Mock(**{"get_token_manager.return_value": token_manager})
+    return helper
+
+
+class TestBatchChecks(unittest.TestCase):
+    def test_get_permissions_for(self):
+        permissions = _authenticated(Permissions())
+        result = asyncio.run(permissions.get_permissions_for(["read:todos", "delete:todos"]))
+        self.assertEqual(result, {
+            "orgCode": "org_123",
+            "permissions": {"read:todos": True, "delete:todos": False},
+        })
+
+    def test_get_permissions_for_not_authenticated(self):
+        permissions = Permissions()
+        permissions._framework = Mock(**{"get_user_id.return_value": None})
+        result = asyncio.run(permissions.get_permissions_for(["read:todos"]))
+        self.assertEqual(result, {"orgCode": None, "permissions": {"read:todos": False}})
+
+    def test_get_permissions_for_force_api_makes_one_call(self):
+        permissions = _authenticated(Permissions())
+        response = SimpleNamespace(data=SimpleNamespace(
+            org_code="org_api",
+            permissions=[SimpleNamespace(id="p1", key="read:todos", name="Read")],
+        ))
+        with patch.object(permissions, "_fetch_account_api", return_value=response) as fetch:
+            result = asyncio.run(permissions.get_permissions_for(
+                ["read:todos", "create:todos", "delete:todos"], ApiOptions(force_api=True)
+            ))
+        fetch.assert_called_once()
+        self.assertEqual(result["orgCode"], "org_api")
+        self.assertEqual(result["permissions"], {"read:todos": True, "create:todos": False, "delete:todos": False})
+
+    def test_has_roles(self):
+        roles = _authenticated(Roles())
+        result = asyncio.run(roles.has_roles(["admin", "user"]))
+        self.assertEqual(result, {"orgCode": "org_123", "roles": {"admin": True, "user": False}})
+
+    def test_has_roles_force_api(self):
+        roles = _authenticated(Roles())
+        response = SimpleNamespace(data=SimpleNamespace(
+            org_code="org_api", roles=[SimpleNamespace(id="r1", key="user", name="User")]
+        ))
+        with patch.object(roles, "_fetch_account_api", return_value=response) as fetch:
+            result = asyncio.run(roles.has_roles(["admin", "user"], ApiOptions(force_api=True)))
+        fetch.assert_called_once()
+        self.assertEqual(result["roles"], {"admin": False, "user": True})
+
+    def test_get_flags(self):
+        feature_flags = _authenticated(FeatureFlags())
+        result = asyncio.run(feature_flags.get_flags(["theme", "missing"], defaults={"missing": 10}))
+        self.assertEqual(result["theme"].value, "dark")
+        self.assertFalse(result["theme"].is_default)
+        self.assertEqual(result["missing"].value, 10)
+        self.assertTrue(result["missing"].is_default)
+
+    def test_get_flags_invalid_flag_raises(self):
+        feature_flags = _authenticated(FeatureFlags(), {"feature_flags": {"limit": {"t": "i", "v": "many"}}})
+        with self.assertRaises(ValueError):
+            asyncio.run(feature_flags.get_flags(["limit"]))
+
+    def test_get_flags_force_api_makes_one_call(self):
+        feature_flags = _authenticated(FeatureFlags())
+        response = SimpleNamespace(data=SimpleNamespace(flags={
+            "theme": {"t": "s", "v": "light"}, "beta_access": {"t": "b", "v": False},
+        }))
+        with patch.object(feature_flags, "_fetch_account_api", return_value=response) as fetch:
+            result = asyncio.run(feature_flags.get_flags(
+                ["theme", "beta_access", "missing"], options=ApiOptions(force_api=True)
+            ))
+        fetch.assert_called_once()
+        self.assertEqual(result["theme"].value, "light")
+        self.assertIs(result["beta_access"].value, False)
+        self.assertTrue(result["missing"].is_default)
+
+
+class TestPolicy(unittest.TestCase):
+    def setUp(self):
+        self.permissions = _authenticated(Permissions())
+        self.roles = _authenticated(Roles())
+        self.feature_flags = _authenticated(FeatureFlags())
+        self.patches = [
+            patch("kinde_sdk.auth.policy.permissions", self.permissions),
+            patch("kinde_sdk.auth.policy.roles", self.roles),
+            patch("kinde_sdk.auth.policy.feature_flags", self.feature_flags),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def _evaluate(self, policy):
+        return asyncio.run(evaluate_policy(policy))
+
+    def test_single_checks(self):
+        self.assertTrue(self._evaluate(Permission("read:todos")))
+        self.assertFalse(self._evaluate(Permission("delete:todos")))
+        self.assertTrue(self._evaluate(Role("admin")))
+        self.assertTrue(self._evaluate(Flag("beta_access")))
+        self.assertTrue(self._evaluate(Flag("theme", "dark")))
+        self.assertFalse(self._evaluate(Flag("theme", "light")))
+        self.assertFalse(self._evaluate(Flag("missing", None)))
+
+    def test_all_and_any(self):
+        self.assertTrue(self._evaluate(AllOf(Permission("read:todos"), Role("admin"), Flag("beta_access"))))
+        self.assertFalse(self._evaluate(AllOf(Permission("read:todos"), Role("owner"))))
+        self.assertTrue(self._evaluate(AnyOf(Role("owner"), Permission("create:todos"))))
+        self.assertFalse(self._evaluate(AnyOf(Role("owner"), Permission("delete:todos"))))
+
+    def test_operators(self):
+        policy = Permission("read:todos") & (Role("owner") | Flag("beta_access"))
+        self.assertIsInstance(policy, AllOf)
+        self.assertTrue(self._evaluate(policy))
+
+    def test_one_batch_call_per_kind(self):
+        policy = AllOf(
+            Permission("read:todos"), Permission("create:todos"),
+            AnyOf(Role("owner"), Role("admin")),
+            Flag("beta_access"), Flag("theme", "dark"),
+        )
+        with patch.object(self.permissions, "get_permissions_for", wraps=self.permissions.get_permissions_for) as p, \
+                patch.object(self.roles, "has_roles", wraps=self.roles.has_roles) as r, \
+                patch.object(self.feature_flags, "get_flags", wraps=self.feature_flags.get_flags) as f:
+            self.assertTrue(self._evaluate(policy))
+        self.assertEqual((p.call_count, r.call_count, f.call_count), (1, 1, 1))
+
+    def test_unused_kinds_are_not_fetched(self):
+        with patch.object(self.roles, "has_roles") as has_roles:
+            self.assertTrue(self._evaluate(Permission("read:todos")))
+        has_roles.assert_not_called()
+
+    def test_policy_is_abstract(self):
+        class Incomplete(Policy):
+            def _collect(self, required):
+                pass
+
+        with self.assertRaises(TypeError):
+            Policy()
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+import jwt
+
+from kinde_sdk.auth.claim_index import ClaimIndex, FeatureFlag, parse_flag_value
+from kinde_sdk.auth.feature_flags import FeatureFlags
+from kinde_sdk.auth.token_manager import TokenManager
+
+SIGNING_KEY = "test-signing-key-that-is-at-least-32-bytes"
+
+CLAIMS = {
+    "org_code": "org_123",
+    "permissions": ["read:todos", "create:todos"],
+    "roles": [{"id": "1", "key": "admin", "name": "Admin"}, {"id": "2", "key": "user", "name": "User"}],
+    "feature_flags": {
+        "theme": {"t": "s", "v": "pink"},
+        "is_dark_mode": {"t": "b", "v": True},
+        "competitions_limit": {"t": "i", "v": 5},
+    },
+}
+
+
+class TestClaimIndex(unittest.TestCase):
+    def test_indexes(self):
+        index = ClaimIndex(CLAIMS)
+        self.assertEqual(index.org_code, "org_123")
+        self.assertEqual(index.permissions, frozenset({"read:todos", "create:todos"}))
+        self.assertEqual(index.roles["user"]["id"], "2")
+        self.assertEqual(index.feature_flags["theme"].value, "pink")
+        self.assertEqual(index.feature_flags["theme"].code, "theme")
+        self.assertEqual(index.feature_flags["is_dark_mode"].type, "boolean")
+        self.assertEqual(index.feature_flags["competitions_limit"].value, 5)
+        self.assertEqual(index.invalid_flags, frozenset())
+
+    def test_invalid_flags_are_not_indexed(self):
+        index = ClaimIndex({"feature_flags": {"limit": {"t": "i", "v": "many"}, "broken": None}})
+        self.assertEqual(dict(index.feature_flags), {})
+        self.assertEqual(index.invalid_flags, frozenset({"limit", "broken"}))
+
+    def test_empty(self):
+        for claims in (None, {}, "not claims"):
+            index = ClaimIndex(claims)
+            self.assertIsNone(index.org_code)
+            self.assertEqual(index.permissions, frozenset())
+            self.assertEqual(len(index.roles), 0)
+            self.assertEqual(len(index.feature_flags), 0)
+
+    def test_read_only(self):
+        index = ClaimIndex(CLAIMS)
+        with self.assertRaises(TypeError):
+            index.roles["owner"] = {}
+        with self.assertRaises(TypeError):
+            index.claims["org_code"] = "other"
+        flag = next(iter(index.feature_flags.values()))
+        with self.assertRaises(AttributeError):
+            flag.value = "changed"
+        with self.assertRaises(AttributeError):
+            flag.extra = True
+
+
+class TestTokenManagerClaimIndex(unittest.TestCase):
+    def setUp(self):
+        TokenManager.reset_instances()
+        self.token_manager = TokenManager("user_1", "client_id", None, "https://example.kinde.com/oauth2/token")
+
+    def tearDown(self):
+        TokenManager.reset_instances()
+
+    def _set_tokens(self, claims):
+        with patch.object(TokenManager, "_refresh_scheduler", None):
+            self.token_manager.set_tokens({"access_token": jwt.encode(claims, SIGNING_KEY, algorithm="HS256")})
+
+    def test_built_once_per_token(self):
+        self._set_tokens(CLAIMS)
+        index = self.token_manager.get_claim_index()
+        self.assertIs(self.token_manager.get_claim_index(), index)
+        self.assertIn("read:todos", index.permissions)
+
+        self._set_tokens({**CLAIMS, "permissions": ["delete:todos"]})
+        self.assertIsNot(self.token_manager.get_claim_index(), index)
+        self.assertEqual(self.token_manager.get_claim_index().permissions, frozenset({"delete:todos"}))
+
+    def test_rebuilt_when_tokens_are_replaced(self):
+        self._set_tokens(CLAIMS)
+        self.token_manager.tokens = {"access_token": "x", "access_token_claims": {"permissions": ["p"]}}
+        self.assertEqual(self.token_manager.get_claim_index().permissions, frozenset({"p"}))
+        self.token_manager.tokens = {}
+        self.assertEqual(self.token_manager.get_claim_index().permissions, frozenset())
+
+
+class TestFeatureFlagLookups(unittest.TestCase):
+    def setUp(self):
+        TokenManager.reset_instances()
+        self.token_manager = TokenManager("user_1", "client_id", None, "https://example.kinde.com/oauth2/token")
+        self.feature_flags = FeatureFlags()
+        self.feature_flags._framework = Mock(**{"get_user_id.return_value": "user_1"})
+        self.feature_flags._session_manager = Mock(**{"get_token_manager.return_value": self.token_manager})
+
+    def tearDown(self):
+        TokenManager.reset_instances()
+
+    def _set_claims(self, claims):
+        with patch.object(TokenManager, "_refresh_scheduler", None):
+            self.token_manager.set_tokens({"access_token": jwt.encode(claims, SIGNING_KEY, algorithm="HS256")})
+
+    def test_flags_are_parsed_once_per_token(self):
+        self._set_claims(CLAIMS)
+        with patch("kinde_sdk.auth.feature_flags.parse_flag_value") as parse:
+            first = asyncio.run(self.feature_flags.get_flag("theme"))
+            second = asyncio.run(self.feature_flags.get_flag("theme"))
+            all_flags = asyncio.run(self.feature_flags.get_all_flags())
+        parse.assert_not_called()
+        self.assertIsInstance(first, FeatureFlag)
+        self.assertIs(first, second)
+        self.assertEqual(first.value, "pink")
+        self.assertEqual(all_flags["competitions_limit"].code, "competitions_limit")
+
+    def test_missing_flag_uses_default(self):
+        self._set_claims(CLAIMS)
+        flag = asyncio.run(self.feature_flags.get_flag("missing", default_value=3))
+        self.assertTrue(flag.is_default)
+        self.assertEqual(flag.value, 3)
+
+    def test_invalid_flag_still_raises(self):
+        self._set_claims({"feature_flags": {"limit": {"t": "i", "v": "many"}}})
+        with self.assertRaises(ValueError):
+            asyncio.run(self.feature_flags.get_flag("limit"))
+        with self.assertRaises(ValueError):
+            asyncio.run(self.feature_flags.get_all_flags())
+
+    def test_get_all_flags_reparse_includes_code(self):
+        self._set_claims({"feature_flags": {"theme": {"t": "s", "v": "pink"}, "limit": {"t": "i", "v": "many"}}})
+        with patch("kinde_sdk.auth.feature_flags.parse_flag_value", wraps=parse_flag_value) as parse:
+            with self.assertRaises(ValueError):
+                asyncio.run(self.feature_flags.get_all_flags())
+        self.assertEqual([call.args[0]["code"] for call in parse.call_args_list], ["theme", "limit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -87,14 +87,11 @@ class TestEntitlements:
 
     def test_init_with_trailing_slash(self):
         """Test initialization with trailing slash in base_url."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             mock_billing_class.return_value = mock_billing
             
@@ -104,28 +101,22 @@ class TestEntitlements:
             assert entitlements.base_url == "https://test.kinde.com"
             assert entitlements.token == "test_token"
             
-            # Check that Configuration was called correctly
-            mock_config_class.assert_called_once_with(
-                host="https://test.kinde.com",
-                access_token="test_token"
+            # Check that the pooled client for the host is used
+            mock_pool.authenticated_client.assert_called_once_with(
+                "test_token",
+                host="https://test.kinde.com"
             )
             
-            # Check that ApiClient was created
-            mock_api_client_class.assert_called_once_with(mock_config)
-            
             # Check that BillingApi was created
             mock_billing_class.assert_called_once_with(mock_api_client)
 
     def test_init_without_trailing_slash(self):
         """Test initialization without trailing slash in base_url."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             mock_billing_class.return_value = mock_billing
             
@@ -137,14 +128,11 @@ class TestEntitlements:
 
     def test_get_all_entitlements_single_page(self, sample_entitlements_response):
         """Test get_all_entitlements with single page of results."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             mock_billing.get_entitlements.return_value = sample_entitlements_response
             mock_billing_class.return_value = mock_billing
@@ -165,14 +153,11 @@ class TestEntitlements:
 
     def test_get_all_entitlements_multiple_pages(self, sample_entitlement):
         """Test get_all_entitlements with multiple pages of results."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             
             # First page response
@@ -238,14 +223,11 @@ class TestEntitlements:
 
     def test_get_all_entitlements_empty_response(self):
         """Test get_all_entitlements with empty response."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             
             # Empty response
@@ -273,14 +255,11 @@ class TestEntitlements:
 
     def test_get_all_entitlements_no_metadata(self):
         """Test get_all_entitlements when response has no metadata."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             
             # Response without metadata
@@ -306,14 +285,11 @@ class TestEntitlements:
 
     def test_get_all_entitlements_no_data(self):
         """Test get_all_entitlements when response has no data."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             
             # Response without data
@@ -336,14 +312,11 @@ class TestEntitlements:
 
     def test_get_entitlement_success(self, sample_single_entitlement_response):
         """Test get_entitlement with successful response."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             mock_billing.get_entitlement.return_value = sample_single_entitlement_response
             mock_billing_class.return_value = mock_billing
@@ -361,14 +334,11 @@ class TestEntitlements:
 
     def test_get_entitlement_with_empty_key(self):
         """Test get_entitlement with empty key."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             mock_billing_class.return_value = mock_billing
             
@@ -382,14 +352,11 @@ class TestEntitlements:
 
     def test_get_entitlement_with_special_characters(self):
         """Test get_entitlement with special characters in key."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             mock_billing_class.return_value = mock_billing
             
@@ -404,14 +371,11 @@ class TestEntitlements:
 
     def test_api_error_handling(self):
         """Test that API errors are properly propagated."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             mock_billing.get_entitlements.side_effect = Exception("API Error")
             mock_billing_class.return_value = mock_billing
@@ -424,14 +388,11 @@ class TestEntitlements:
 
     def test_get_entitlement_api_error_handling(self):
         """Test that API errors in get_entitlement are properly propagated."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             mock_billing.get_entitlement.side_effect = Exception("API Error")
             mock_billing_class.return_value = mock_billing
@@ -444,14 +405,11 @@ class TestEntitlements:
 
     def test_metadata_has_more_false_string(self):
         """Test get_all_entitlements when has_more is False as string."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             
                         # Create a mock response where has_more might be a string "false"
@@ -476,14 +434,11 @@ class TestEntitlements:
 
     def test_infinite_loop_prevention(self):
         """Test that infinite loops are prevented when cursor doesn't advance."""
-        with patch('kinde_sdk.auth.entitlements.Configuration') as mock_config_class, \
-             patch('kinde_sdk.auth.entitlements.ApiClient') as mock_api_client_class, \
+        with patch('kinde_sdk.auth.entitlements.frontend_client_pool') as mock_pool, \
              patch('kinde_sdk.auth.entitlements.BillingApi') as mock_billing_class:
             
-            mock_config = Mock()
-            mock_config_class.return_value = mock_config
             mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+            mock_pool.authenticated_client.return_value = mock_api_client
             mock_billing = Mock()
             
             # Create a mock response that indicates more pages but cursor doesn't advance
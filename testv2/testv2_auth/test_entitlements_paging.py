@@ -0,0 +1,197 @@
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import jwt
+
+from kinde_sdk.auth.entitlements import Entitlements
+from kinde_sdk.core.account_api_cache import AccountApiCache, account_api_cache
+
+SIGNING_KEY = "test-signing-key-that-is-at-least-32-bytes"
+
+
+class _FakeBillingApi:
+    """Serves three pages of two entitlements, taking `delay` seconds per page."""
+
+    def __init__(self, delay=0.0, pages=3):
+        self.delay = delay
+        self.pages = pages
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_entitlements(self, page_size=None, starting_after=None):
+        with self.lock:
+            self.calls.append(starting_after)
+        time.sleep(self.delay)
+        page = 0 if starting_after is None else int(starting_after.split("_")[1]) + 1
+        items = [SimpleNamespace(id=f"ent_{page}_{i}", feature_key=f"feature_{page}_{i}") for i in range(2)]
+        has_more = page < self.pages - 1
+        return SimpleNamespace(
+            data=SimpleNamespace(entitlements=items),
+            metadata=SimpleNamespace(has_more=has_more, next_page_starting_after=f"page_{page}" if has_more else None),
+        )
+
+
+def _ids(entitlements):
+    return [e.id for e in entitlements]
+
+
+ALL_IDS = [f"ent_{page}_{i}" for page in range(3) for i in range(2)]
+
+
+class TestIterEntitlements(unittest.TestCase):
+    def test_yields_every_page_in_order(self):
+        api = _FakeBillingApi()
+        client = Entitlements.from_billing_api(api)
+        self.assertEqual(_ids(client.iter_entitlements()), ALL_IDS)
+        self.assertEqual(_ids(client.iter_entitlements(prefetch=False)), ALL_IDS)
+        self.assertEqual(_ids(client.get_all_entitlements()), ALL_IDS)
+
+    def test_yields_before_later_pages_are_fetched(self):
+        api = _FakeBillingApi()
+        iterator = Entitlements.from_billing_api(api).iter_entitlements(prefetch=False)
+        next(iterator)
+        self.assertEqual(api.calls, [None])
+        iterator.close()
+
+    def test_prefetch_overlaps_caller_work(self):
+        delay = 0.1
+        client = Entitlements.from_billing_api(_FakeBillingApi(delay=delay))
+
+        def consume(prefetch):
+            start = time.perf_counter()
+            for index, _ in enumerate(client.iter_entitlements(prefetch=prefetch)):
+                if index % 2 == 1:
+                    time.sleep(delay)  # caller's work on each page
+            return time.perf_counter() - start
+
+        serial = consume(prefetch=False)
+        prefetched = consume(prefetch=True)
+        # Serial: 3 fetches + 3 pages of work; prefetched: the fetches of pages 2 and 3 overlap the work
+        self.assertLess(prefetched, serial - delay)
+
+    def test_early_stop_does_not_fetch_the_rest(self):
+        api = _FakeBillingApi()
+        for _ in Entitlements.from_billing_api(api).iter_entitlements(prefetch=False):
+            break
+        self.assertEqual(api.calls, [None])
+
+
+class TestAiterEntitlements(unittest.TestCase):
+    def _collect(self, client, **kwargs):
+        async def run():
+            return [e async for e in client.aiter_entitlements(**kwargs)]
+        return asyncio.run(run())
+
+    def test_yields_every_page_in_order(self):
+        client = Entitlements.from_billing_api(_FakeBillingApi())
+        self.assertEqual(_ids(self._collect(client)), ALL_IDS)
+        self.assertEqual(_ids(self._collect(client, prefetch=False)), ALL_IDS)
+
+    def test_does_not_block_the_event_loop(self):
+        client = Entitlements.from_billing_api(_FakeBillingApi(delay=0.05))
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            entitlements = [e async for e in client.aiter_entitlements()]
+            task.cancel()
+            return entitlements, ticks
+
+        entitlements, ticks = asyncio.run(run())
+        self.assertEqual(len(entitlements), 6)
+        self.assertGreater(ticks, 5)
+
+
+class TestEntitlementsCache(unittest.TestCase):
+    def setUp(self):
+        account_api_cache.configure(ttl=30)
+
+    def tearDown(self):
+        account_api_cache.configure(ttl=0)
+
+    def test_cache_serves_repeated_walks(self):
+        api = _FakeBillingApi()
+        client = Entitlements.from_billing_api(api, user_id="user_1", org_code="org_1", use_cache=True)
+        self.assertEqual(_ids(client.get_all_entitlements()), ALL_IDS)
+        self.assertEqual(_ids(client.iter_entitlements()), ALL_IDS)
+        self.assertEqual(_ids(asyncio.run(self._acollect(client))), ALL_IDS)
+        self.assertEqual(len(api.calls), 3)
+
+    def test_cache_is_per_customer(self):
+        api = _FakeBillingApi()
+        Entitlements.from_billing_api(api, user_id="user_1", org_code="org_1", use_cache=True).get_all_entitlements()
+        Entitlements.from_billing_api(api, user_id="user_1", org_code="org_2", use_cache=True).get_all_entitlements()
+        self.assertEqual(len(api.calls), 6)
+
+    def test_complete_stream_is_cached_but_partial_is_not(self):
+        api = _FakeBillingApi()
+        client = Entitlements.from_billing_api(api, user_id="user_1", use_cache=True)
+        for _ in client.iter_entitlements():
+            break
+        self.assertEqual(len(account_api_cache), 0)
+        list(client.iter_entitlements())
+        self.assertEqual(len(account_api_cache), 1)
+
+    def test_not_cached_by_default(self):
+        api = _FakeBillingApi()
+        client = Entitlements.from_billing_api(api)
+        client.get_all_entitlements()
+        client.get_all_entitlements()
+        self.assertEqual(len(api.calls), 6)
+
+    def test_cache_key_from_token(self):
+        token = jwt.encode({"sub": "user_1", "org_code": "org_1"}, SIGNING_KEY, algorithm="HS256")
+        key = Entitlements("https://example.kinde.com", token, use_cache=True)._cache_key
+        self.assertEqual(key[:2], ("user_1", "org_1"))
+        self.assertIn("https://example.kinde.com", key[2])
+        self.assertEqual(key, Entitlements("https://example.kinde.com", token, use_cache=True)._cache_key)
+        self.assertNotEqual(key, Entitlements("https://other.kinde.com", token, use_cache=True)._cache_key)
+        self.assertIsNone(Entitlements("https://example.kinde.com", "opaque", use_cache=True)._cache_key)
+
+    def test_forged_token_does_not_hit_another_users_entry(self):
+        claims = {"sub": "user_1", "org_code": "org_1"}
+        victim = Entitlements("https://example.kinde.com", jwt.encode(claims, SIGNING_KEY, algorithm="HS256"), use_cache=True)
+        forged = Entitlements("https://example.kinde.com", jwt.encode(claims, "wrong-key-" * 4, algorithm="HS256"), use_cache=True)
+        victim.billing_api = _FakeBillingApi()
+        forged.billing_api = _FakeBillingApi()
+        victim.get_all_entitlements()
+        forged.get_all_entitlements()
+        self.assertEqual(len(forged.billing_api.calls), 3)
+        # Invalidating the user still removes both entries
+        account_api_cache.invalidate(user_id="user_1")
+        self.assertEqual(len(account_api_cache), 0)
+
+    def test_cache_key_includes_host(self):
+        api_a, api_b = _FakeBillingApi(), _FakeBillingApi()
+        api_a.api_client = Mock(configuration=Mock(host="https://a.kinde.com"))
+        api_b.api_client = Mock(configuration=Mock(host="https://b.kinde.com"))
+        Entitlements.from_billing_api(api_a, user_id="user_1", use_cache=True).get_all_entitlements()
+        Entitlements.from_billing_api(api_b, user_id="user_1", use_cache=True).get_all_entitlements()
+        self.assertEqual(len(api_b.calls), 3)
+
+    def test_logout_invalidation_applies(self):
+        api = _FakeBillingApi()
+        client = Entitlements.from_billing_api(api, user_id="user_1", use_cache=True)
+        client.get_all_entitlements()
+        account_api_cache.invalidate(user_id="user_1")
+        client.get_all_entitlements()
+        self.assertEqual(len(api.calls), 6)
+
+    @staticmethod
+    async def _acollect(client):
+        return [e async for e in client.aiter_entitlements()]
+
+
+if __name__ == "__main__":
+    unittest.main()
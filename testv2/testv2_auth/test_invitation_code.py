@@ -1,6 +1,6 @@
 import unittest
 import asyncio
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from urllib.parse import urlparse, parse_qs
 
 from kinde_sdk.auth.oauth import OAuth
@@ -16,7 +16,7 @@ def run_async(coro):
 class TestInvitationCode(unittest.TestCase):
     """Tests for invitation code support in OAuth login flow."""
 
-    @patch("requests.get")
+    @patch("kinde_sdk.core.http_client.http_client.get")
     def setUp(self, mock_get):
         """Set up test fixtures."""
         mock_response = MagicMock()
@@ -36,6 +36,7 @@ class TestInvitationCode(unittest.TestCase):
             host="https://test.kinde.com",
         )
         self.mock_storage = MagicMock()
+        self.mock_storage.set_many_async = AsyncMock()
         self.oauth._session_manager = MagicMock()
         self.oauth._session_manager.storage_manager = self.mock_storage
         self.oauth.auth_url = "https://example.com/oauth2/auth"
@@ -94,6 +94,7 @@ class TestOAuthExtended(unittest.TestCase):
             return None
         
         self.mock_storage.get = MagicMock(side_effect=mock_get_side_effect)
+        self.mock_storage.set_many_async = AsyncMock()
         
         # Mock session manager
         self.mock_session_manager = MagicMock(spec=UserSession)
@@ -244,7 +245,7 @@ class TestOAuthMethodSignatures(unittest.TestCase):
         'KINDE_REDIRECT_URI': 'http://localhost:8000/callback',
         'KINDE_HOST': 'https://test.kinde.com'
     })
-    @patch('kinde_sdk.auth.oauth.requests.get')
+    @patch('kinde_sdk.core.http_client.http_client.get')
     @patch('kinde_sdk.auth.oauth.StorageFactory')
     @patch('kinde_sdk.auth.oauth.FrameworkFactory')
     def test_is_authenticated_signature_has_no_parameters(self, mock_framework_factory, mock_storage_factory, mock_get):
@@ -283,7 +284,7 @@ class TestOAuthMethodSignatures(unittest.TestCase):
         'KINDE_REDIRECT_URI': 'http://localhost:8000/callback',
         'KINDE_HOST': 'https://test.kinde.com'
     })
-    @patch('kinde_sdk.auth.oauth.requests.get')
+    @patch('kinde_sdk.core.http_client.http_client.get')
     @patch('kinde_sdk.auth.oauth.StorageFactory')
     @patch('kinde_sdk.auth.oauth.FrameworkFactory')
     def test_get_user_info_signature_has_no_parameters(self, mock_framework_factory, mock_storage_factory, mock_get):
@@ -324,7 +325,7 @@ class TestOAuthMethodSignatures(unittest.TestCase):
     })
     @patch('kinde_sdk.auth.oauth.StorageFactory')
     @patch('kinde_sdk.auth.oauth.FrameworkFactory')
-    @patch('kinde_sdk.auth.oauth.requests.get')
+    @patch('kinde_sdk.core.http_client.http_client.get')
     def test_is_authenticated_rejects_extra_parameters(self, mock_get, mock_framework_factory, mock_storage_factory):
         """
         Test that passing extra parameters to is_authenticated() raises TypeError.
@@ -364,7 +365,7 @@ class TestOAuthMethodSignatures(unittest.TestCase):
     })
     @patch('kinde_sdk.auth.oauth.StorageFactory')
     @patch('kinde_sdk.auth.oauth.FrameworkFactory')
-    @patch('kinde_sdk.auth.oauth.requests.get')
+    @patch('kinde_sdk.core.http_client.http_client.get')
     def test_get_user_info_rejects_extra_parameters(self, mock_get, mock_framework_factory, mock_storage_factory):
         """
         Test that passing extra parameters to get_user_info() raises TypeError.
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from kinde_sdk.auth.oauth import OAuth
+from kinde_sdk.auth.user_session import UserSession
+from kinde_sdk.core.exceptions import KindeLoginException
+from kinde_sdk.core.storage.memory_storage import MemoryStorage
+from kinde_sdk.core.storage.storage_manager import StorageManager
+
+
+class RecordingStorage(MemoryStorage):
+    """Memory storage recording each storage operation, as round-trips."""
+
+    def __init__(self):
+        super().__init__()
+        self.operations = []
+
+    def get(self, key):
+        self.operations.append("get")
+        return super().get(key)
+
+    def set(self, key, value):
+        self.operations.append("set")
+        super().set(key, value)
+
+    def delete(self, key):
+        self.operations.append("delete")
+        super().delete(key)
+
+    def get_many(self, keys):
+        self.operations.append("get_many")
+        return {key: super(RecordingStorage, self).get(key) for key in keys}
+
+    def set_many(self, items):
+        self.operations.append("set_many")
+        for key, value in items.items():
+            super().set(key, value)
+
+    def delete_many(self, keys):
+        self.operations.append("delete_many")
+        for key in keys:
+            super().delete(key)
+
+
+class TestOAuthLoginState(unittest.TestCase):
+    @patch("kinde_sdk.core.http_client.http_client.get")
+    def setUp(self, mock_get):
+        mock_get.side_effect = Exception("no discovery in tests")
+        self.oauth = OAuth(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            redirect_uri="http://localhost:8000/callback",
+            host="https://test.kinde.com",
+        )
+        self.storage = RecordingStorage()
+        self.manager = StorageManager()
+        self.manager.initialize(storage=self.storage, device_id="device_1")
+        self.oauth._session_manager = MagicMock(spec=UserSession)
+        self.oauth._session_manager.storage_manager = self.manager
+        self.oauth._session_manager.get_token_manager_async.return_value = MagicMock()
+        self.storage.operations.clear()
+
+    def tearDown(self):
+        self.manager.initialize({"type": "memory"})
+
+    def test_generate_auth_url_stores_login_state_in_one_batch(self):
+        result = asyncio.run(self.oauth.generate_auth_url())
+        self.assertEqual(self.storage.operations, ["set_many"])
+        self.assertEqual(self.storage.get("user:state")["value"], result["state"])
+        self.assertEqual(self.storage.get("user:code_verifier")["value"], result["code_verifier"])
+        self.assertIsNotNone(self.storage.get("user:nonce"))
+
+    def test_handle_redirect_reads_and_clears_login_state_in_batches(self):
+        result = asyncio.run(self.oauth.generate_auth_url())
+        self.storage.operations.clear()
+        exchange = AsyncMock(return_value={"access_token": "a"})
+        with patch.object(self.oauth, "exchange_code_for_tokens", exchange), \
+                patch("kinde_sdk.auth.oauth.helper_get_user_details", AsyncMock(return_value={"id": "kp_1"})):
+            asyncio.run(self.oauth.handle_redirect("code", "user_1", result["state"]))
+        exchange.assert_awaited_once_with("code", result["code_verifier"])
+        self.assertEqual(self.storage.operations, ["get_many", "delete_many"])
+        for key in ("user:state", "user:nonce", "user:code_verifier"):
+            self.assertIsNone(self.storage.get(key))
+
+    def test_state_mismatch_keeps_login_state(self):
+        asyncio.run(self.oauth.generate_auth_url())
+        with self.assertRaises(KindeLoginException):
+            asyncio.run(self.oauth.handle_redirect("code", "user_1", "wrong_state"))
+        self.assertIsNotNone(self.storage.get("user:code_verifier"))
+
+
+if __name__ == "__main__":
+    unittest.main()
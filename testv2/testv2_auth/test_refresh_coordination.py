@@ -0,0 +1,235 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from kinde_sdk.auth.refresh_lease import FileRefreshLease, NullRefreshLease, RefreshLease
+from kinde_sdk.auth.token_manager import TokenManager
+from kinde_sdk.auth.user_session import UserSession
+from kinde_sdk.core.framework.framework_context import FrameworkContext
+from kinde_sdk.core.storage import MemoryStorage, StorageManager
+from kinde_sdk.core.storage.framework_aware_storage import FrameworkAwareStorage
+
+
+def _token_response(access_token, refresh_token="rotated_refresh", expires_in=3600):
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "expires_in": expires_in,
+    }
+    return response
+
+
+class _HeldLease(RefreshLease):
+    """Lease that is held by "another process" for a number of attempts."""
+
+    def __init__(self, busy_attempts):
+        self.busy_attempts = busy_attempts
+        self.attempts = 0
+        self.released = []
+
+    def acquire(self, key, ttl):
+        self.attempts += 1
+        return self.attempts > self.busy_attempts
+
+    def release(self, key):
+        self.released.append(key)
+
+
+class TestSingleFlightRefresh(unittest.TestCase):
+    def setUp(self):
+        TokenManager.reset_instances()
+        TokenManager.set_refresh_lease(None)
+        self.manager = TokenManager("user", "client_id", "client_secret", "https://example.com/oauth2/token")
+        self.manager.tokens = {
+            "access_token": "expired_token",
+            "refresh_token": "refresh_token",
+            "expires_at": time.time() - 10,
+        }
+
+    def tearDown(self):
+        TokenManager.set_refresh_lease(None)
+        TokenManager.reset_instances()
+
+    def test_concurrent_callers_share_one_refresh(self):
+        start = threading.Barrier(10)
+        results = []
+
+        def slow_post(*args, **kwargs):
+            time.sleep(0.1)
+            return _token_response("fresh_token")
+
+        def worker():
+            start.wait()
+            results.append(self.manager.get_access_token())
+
+        with patch("kinde_sdk.core.http_client.http_client.post", side_effect=slow_post) as mock_post:
+            threads = [threading.Thread(target=worker) for _ in range(10)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(results, ["fresh_token"] * 10)
+
+    def test_refresh_uses_timeout(self):
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=_token_response("fresh_token")) as mock_post:
+            self.manager.get_access_token()
+        self.assertEqual(mock_post.call_args[1]["timeout"], TokenManager.REFRESH_LEASE_TTL)
+
+    def test_valid_token_read_does_not_wait_for_refresh(self):
+        self.manager.tokens["expires_at"] = time.time() + 3600
+        with self.manager._refresh_lock:
+            # A refresh in flight must not block readers of a valid token
+            self.assertEqual(self.manager.get_access_token(), "expired_token")
+
+    def test_refreshed_tokens_are_persisted(self):
+        saved = []
+        self.manager.set_token_persistence(lambda: None, lambda tokens: saved.append(dict(tokens)))
+
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=_token_response("fresh_token")):
+            self.manager.get_access_token()
+
+        self.assertEqual(saved[0]["access_token"], "fresh_token")
+        self.assertEqual(saved[0]["refresh_token"], "rotated_refresh")
+
+    def test_waits_for_lease_and_adopts_tokens_refreshed_elsewhere(self):
+        lease = _HeldLease(busy_attempts=100)
+        TokenManager.set_refresh_lease(lease)
+        persisted = {"tokens": None}
+        self.manager.set_token_persistence(lambda: persisted["tokens"], lambda tokens: None)
+
+        def other_process_refreshes():
+            time.sleep(0.15)
+            persisted["tokens"] = {
+                "access_token": "refreshed_elsewhere",
+                "refresh_token": "rotated_elsewhere",
+                "expires_at": time.time() + 3600,
+            }
+
+        threading.Thread(target=other_process_refreshes).start()
+        with patch("kinde_sdk.core.http_client.http_client.post") as mock_post:
+            token = self.manager.get_access_token()
+
+        mock_post.assert_not_called()
+        self.assertEqual(token, "refreshed_elsewhere")
+        self.assertEqual(self.manager.tokens["refresh_token"], "rotated_elsewhere")
+        self.assertEqual(lease.released, [])
+
+    def test_refreshes_once_lease_is_granted(self):
+        lease = _HeldLease(busy_attempts=2)
+        TokenManager.set_refresh_lease(lease)
+        self.manager.REFRESH_POLL_INTERVAL = 0.01
+
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=_token_response("fresh_token")) as mock_post:
+            token = self.manager.get_access_token()
+
+        self.assertEqual(token, "fresh_token")
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(len(lease.released), 1)
+        # Lease keys never contain the refresh token itself
+        self.assertNotIn("refresh_token", lease.released[0])
+
+    def test_invalid_grant_adopts_tokens_from_other_process(self):
+        error_response = MagicMock()
+        error_response.raise_for_status.side_effect = requests.HTTPError("400 invalid_grant")
+        persisted = {
+            "access_token": "refreshed_elsewhere",
+            "expires_at": time.time() + 3600,
+        }
+        self.manager.set_token_persistence(lambda: persisted, lambda tokens: None)
+
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=error_response):
+            self.assertEqual(self.manager.get_access_token(), "refreshed_elsewhere")
+
+    def test_invalid_grant_without_shared_tokens_raises(self):
+        error_response = MagicMock()
+        error_response.raise_for_status.side_effect = requests.HTTPError("400 invalid_grant")
+
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=error_response):
+            with self.assertRaises(requests.HTTPError):
+                self.manager.get_access_token()
+
+
+class TestSessionTokenPersistence(unittest.TestCase):
+    user_info = {"client_id": "client_id", "token_url": "https://example.com/oauth2/token"}
+    expired_tokens = {"access_token": "expired_token", "refresh_token": "refresh_token", "expires_in": -10}
+
+    def setUp(self):
+        TokenManager.reset_instances()
+
+    def tearDown(self):
+        FrameworkContext.clear_request()
+        StorageManager().initialize({"type": "memory"})
+        TokenManager.reset_instances()
+
+    def _token_manager(self, storage):
+        StorageManager().initialize(storage=storage, device_id="device_1")
+        session = UserSession()
+        session.set_user_data("user_1", self.user_info, self.expired_tokens)
+        return session.get_token_manager("user_1")
+
+    def _refresh(self, token_manager):
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=_token_response("fresh_token")):
+            token_manager.refresh_access_token()
+
+    def test_refresh_persists_session(self):
+        storage = MemoryStorage()
+        token_manager = self._token_manager(storage)
+        storage.delete("device:device_1:user_1")
+        self._refresh(token_manager)
+        self.assertEqual(storage.get("device:device_1:user_1")["tokens"]["access_token"], "fresh_token")
+
+    def test_refresh_without_request_skips_framework_storage(self):
+        token_manager = self._token_manager(FrameworkAwareStorage())
+        with patch.object(FrameworkAwareStorage, "set") as set_item, \
+                patch.object(FrameworkAwareStorage, "get") as get_item:
+            self._refresh(token_manager)
+        set_item.assert_not_called()
+        get_item.assert_not_called()
+        self.assertEqual(token_manager.tokens["access_token"], "fresh_token")
+
+    def test_refresh_in_request_uses_framework_storage(self):
+        request = MagicMock(session={})
+        FrameworkContext.set_request(request)
+        token_manager = self._token_manager(FrameworkAwareStorage())
+        request.session.clear()
+        self._refresh(token_manager)
+        self.assertEqual(request.session["device:device_1:user_1"]["tokens"]["access_token"], "fresh_token")
+
+
+class TestFileRefreshLease(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.lease = FileRefreshLease(self.directory)
+
+    def test_acquire_is_exclusive(self):
+        self.assertTrue(self.lease.acquire("key", ttl=30))
+        self.assertFalse(FileRefreshLease(self.directory).acquire("key", ttl=30))
+        self.lease.release("key")
+        self.assertTrue(self.lease.acquire("key", ttl=30))
+
+    def test_abandoned_lease_is_taken_over(self):
+        self.assertTrue(self.lease.acquire("key", ttl=30))
+        old = time.time() - 60
+        os.utime(os.path.join(self.directory, "key.lock"), (old, old))
+        self.assertTrue(FileRefreshLease(self.directory).acquire("key", ttl=30))
+
+    def test_release_missing_lease(self):
+        self.lease.release("missing")  # Should not raise
+
+    def test_null_lease_always_granted(self):
+        lease = NullRefreshLease()
+        self.assertTrue(lease.acquire("key", ttl=30))
+        self.assertTrue(lease.acquire("key", ttl=30))
+
+
+if __name__ == "__main__":
+    unittest.main()
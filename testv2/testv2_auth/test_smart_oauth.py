@@ -93,6 +93,14 @@ class TestSmartOAuthSyncMethods:
 class TestSmartOAuthAsyncMethods:
     """Test async methods."""
     
+    @pytest.mark.asyncio
+    async def test_is_authenticated_async(self, smart_oauth, mock_async_oauth):
+        """Test is_authenticated_async method."""
+        mock_async_oauth.is_authenticated_async = AsyncMock(return_value=True)
+
+        assert await smart_oauth.is_authenticated_async() is True
+        mock_async_oauth.is_authenticated_async.assert_awaited_once()
+    
     @pytest.mark.asyncio
     async def test_get_user_info_async(self, smart_oauth, mock_async_oauth):
         """Test get_user_info_async method."""
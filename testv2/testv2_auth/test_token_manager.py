@@ -1,6 +1,6 @@
 import unittest
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 import time
 import threading
 import jwt
@@ -157,8 +157,8 @@ class TestTokenManagerExtended(unittest.TestCase):
         # Set redirect URI
         manager.set_redirect_uri("http://localhost/callback")
         
-        # Mock requests.post
-        with patch('requests.post') as mock_post:
+        # Mock the async token endpoint request
+        with patch('kinde_sdk.auth.token_manager.async_post', new_callable=AsyncMock) as mock_post:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
             mock_response.json.return_value = {
@@ -225,7 +225,7 @@ class TestTokenManagerExtended(unittest.TestCase):
         }
         
         # Mock requests.post
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
             mock_response.json.return_value = {
@@ -252,7 +252,7 @@ class TestTokenManagerExtended(unittest.TestCase):
         }
         
         # Mock requests.post to raise an exception
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             mock_post.side_effect = Exception("Network error")
             
             # Should not raise exception
@@ -277,7 +277,7 @@ class TestTokenManagerExtended(unittest.TestCase):
         }
         
         # Mock requests.post
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
             mock_post.return_value = mock_response
@@ -330,8 +330,8 @@ class TestTokenManagerExtended(unittest.TestCase):
         # Set redirect URI
         self.token_manager.set_redirect_uri("https://example.com/callback")
         
-        # Mock requests.post
-        with patch('requests.post') as mock_post:
+        # Mock the async token endpoint request
+        with patch('kinde_sdk.auth.token_manager.async_post', new_callable=AsyncMock) as mock_post:
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
             mock_response.json.return_value = {
@@ -0,0 +1,223 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kinde_sdk.auth.token_verifier import JwksKeyCache, TokenVerifier, normalize_issuer
+from kinde_sdk.core.exceptions import KindeTokenException
+from kinde_sdk.core.verified_token_cache import VerifiedTokenCache, verified_token_cache
+from kinde_sdk.management.management_token_manager import ManagementTokenManager
+
+
+def _make_key(kid):
+    """Create an RSA private key and its public JWK."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return private_key, jwk
+
+
+class _JwksServer:
+    """Minimal local HTTP server serving a JWKS document."""
+
+    def __init__(self):
+        self.jwks = {"keys": []}
+        self.request_count = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.request_count += 1
+                if self.path != "/.well-known/jwks.json":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = json.dumps(server.jwks).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestTokenVerifier(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = _JwksServer()
+        cls.key1, cls.jwk1 = _make_key("key-1")
+        cls.key2, cls.jwk2 = _make_key("key-2")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.jwks = {"keys": [self.jwk1]}
+        self.server.request_count = 0
+        verified_token_cache.clear()
+        self.verifier = TokenVerifier(self.server.url, audience="https://api.example.com")
+
+    def _token(self, private_key=None, kid="key-1", **overrides):
+        now = int(time.time())
+        claims = {
+            "iss": self.server.url,
+            "aud": ["https://api.example.com"],
+            "sub": "kp_123",
+            "iat": now,
+            "nbf": now,
+            "exp": now + 3600,
+        }
+        claims.update(overrides)
+        return jwt.encode(claims, private_key or self.key1, algorithm="RS256", headers={"kid": kid})
+
+    def test_normalize_issuer(self):
+        self.assertEqual(normalize_issuer("example.kinde.com"), "https://example.kinde.com")
+        self.assertEqual(normalize_issuer("https://example.kinde.com/"), "https://example.kinde.com")
+
+    def test_verify_valid_token(self):
+        claims = self.verifier.verify(self._token())
+        self.assertEqual(claims["sub"], "kp_123")
+
+    def test_keys_are_cached(self):
+        for _ in range(5):
+            self.verifier.verify(self._token())
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_unknown_kid_triggers_refresh(self):
+        self.verifier.verify(self._token())
+        # Rotate in a new key
+        self.server.jwks = {"keys": [self.jwk1, self.jwk2]}
+        self.verifier.key_cache.min_refresh_interval = 0
+
+        claims = self.verifier.verify(self._token(private_key=self.key2, kid="key-2"))
+        self.assertEqual(claims["sub"], "kp_123")
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_unknown_kid_refresh_is_rate_limited(self):
+        self.verifier.verify(self._token())
+        with self.assertRaises(KindeTokenException):
+            self.verifier.verify(self._token(kid="missing"))
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_ttl_expiry_refetches_keys(self):
+        verifier = TokenVerifier(self.server.url, audience="https://api.example.com", jwks_ttl=0, cache=None)
+        verifier.verify(self._token())
+        verifier.verify(self._token())
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_verified_claims_are_cached(self):
+        cache = VerifiedTokenCache()
+        verifier = TokenVerifier(self.server.url, audience="https://api.example.com", jwks_ttl=0, cache=cache)
+        token = self._token()
+
+        first = verifier.verify(token)
+        second = verifier.verify(token)
+
+        self.assertEqual(first, second)
+        # With a zero JWKS TTL, only the first call could have fetched keys
+        self.assertEqual(self.server.request_count, 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_cached_claims_not_shared_across_audiences(self):
+        token = self._token()
+        self.verifier.verify(token)
+
+        other = TokenVerifier(self.server.url, audience="https://other.example.com", key_cache=self.verifier.key_cache)
+        with self.assertRaises(KindeTokenException):
+            other.verify(token)
+
+    def test_bad_signature_rejected(self):
+        forged = self._token(private_key=self.key2, kid="key-1")
+        with self.assertRaises(KindeTokenException):
+            self.verifier.verify(forged)
+
+    def test_expired_token_rejected(self):
+        with self.assertRaises(KindeTokenException):
+            self.verifier.verify(self._token(exp=int(time.time()) - 10))
+
+    def test_not_yet_valid_token_rejected(self):
+        with self.assertRaises(KindeTokenException):
+            self.verifier.verify(self._token(nbf=int(time.time()) + 600))
+
+    def test_wrong_issuer_rejected(self):
+        with self.assertRaises(KindeTokenException):
+            self.verifier.verify(self._token(iss="https://evil.example.com"))
+
+    def test_wrong_audience_rejected(self):
+        with self.assertRaises(KindeTokenException):
+            self.verifier.verify(self._token(aud=["https://other.example.com"]))
+
+    def test_audience_not_checked_when_not_configured(self):
+        verifier = TokenVerifier(self.server.url, key_cache=self.verifier.key_cache)
+        claims = verifier.verify(self._token(aud=["https://other.example.com"]))
+        self.assertEqual(claims["sub"], "kp_123")
+
+    def test_unsupported_algorithm_rejected(self):
+        token = jwt.encode({"iss": self.server.url, "exp": int(time.time()) + 60}, "s" * 32, algorithm="HS256")
+        with self.assertRaises(KindeTokenException):
+            self.verifier.verify(token)
+
+    def test_malformed_token_rejected(self):
+        with self.assertRaises(KindeTokenException):
+            self.verifier.verify("not-a-jwt")
+
+    def test_jwks_fetch_failure(self):
+        cache = JwksKeyCache(f"{self.server.url}/missing.json")
+        with self.assertRaises(KindeTokenException):
+            cache.get_signing_key("key-1")
+
+    def test_management_token_manager_validate_via_jwks(self):
+        ManagementTokenManager.reset_instances()
+        try:
+            manager = ManagementTokenManager(self.server.url, "client_id", "client_secret")
+
+            token = self._token()
+            claims = manager.validate_via_jwks(token)
+
+            self.assertEqual(claims["sub"], "kp_123")
+            # Verification does not replace the manager's own token
+            self.assertEqual(manager.tokens, {})
+        finally:
+            ManagementTokenManager.reset_instances()
+
+    def test_management_token_manager_verifier_per_audience(self):
+        ManagementTokenManager.reset_instances()
+        try:
+            manager = ManagementTokenManager(self.server.url, "client_id", "client_secret")
+            token_a = self._token(aud=["https://a.example.com"])
+            token_b = self._token(aud=["https://b.example.com"])
+
+            self.assertEqual(manager.validate_via_jwks(token_a, audience="https://a.example.com")["sub"], "kp_123")
+            # A later audience is enforced, not ignored
+            with self.assertRaises(KindeTokenException):
+                manager.validate_via_jwks(token_a, audience="https://b.example.com")
+            self.assertEqual(manager.validate_via_jwks(token_b, audience="https://b.example.com")["sub"], "kp_123")
+            with self.assertRaises(KindeTokenException):
+                manager.validate_via_jwks(token_b, audience="https://a.example.com")
+
+            verifier_a = manager.get_token_verifier("https://a.example.com")
+            self.assertIs(verifier_a, manager.get_token_verifier("https://a.example.com"))
+            self.assertIs(verifier_a.key_cache, manager.get_token_verifier("https://b.example.com").key_cache)
+            self.assertEqual(self.server.request_count, 1)
+        finally:
+            ManagementTokenManager.reset_instances()
+
+
+if __name__ == "__main__":
+    unittest.main()
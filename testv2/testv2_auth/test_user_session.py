@@ -1,7 +1,8 @@
+import asyncio
 import unittest
 import pytest
 import time
-from unittest.mock import patch, MagicMock, Mock, call
+from unittest.mock import patch, MagicMock, Mock, AsyncMock, call
 
 from kinde_sdk.auth.user_session import UserSession
 from kinde_sdk.auth.token_manager import TokenManager
@@ -34,6 +35,10 @@ class TestUserSession(unittest.TestCase):
             if key in self.storage_dict:
                 del self.storage_dict[key]
                 
+        def mock_delete_many(keys):
+            for key in keys:
+                mock_delete(key)
+                
         def mock_clear_device_data():
             # This would clear all device-specific data
             # For test simplicity, let's just remove the user_id we're testing with
@@ -45,6 +50,7 @@ class TestUserSession(unittest.TestCase):
         self.mock_storage_manager.setItems.side_effect = mock_setItems
         self.mock_storage_manager.set.side_effect = mock_set_flat
         self.mock_storage_manager.delete.side_effect = mock_delete
+        self.mock_storage_manager.delete_many.side_effect = mock_delete_many
         self.mock_storage_manager.clear_device_data.side_effect = mock_clear_device_data
         
         # Patch the StorageManager's __new__ method to return our mock
@@ -253,7 +259,7 @@ class TestUserSession(unittest.TestCase):
             self.user_session.set_user_data(user3, self.user_info, expired_no_refresh_data)
         
         # Reset mock
-        self.mock_storage_manager.delete.reset_mock()
+        self.mock_storage_manager.delete_many.reset_mock()
         
         # Run cleanup
         self.user_session.cleanup_expired_sessions()
@@ -263,8 +269,8 @@ class TestUserSession(unittest.TestCase):
         self.assertIn(user2, self.user_session.user_sessions)  # Has refresh token - kept
         self.assertNotIn(user3, self.user_session.user_sessions)  # Expired without refresh - removed
         
-        # Check storage delete was called for user3
-        self.mock_storage_manager.delete.assert_called_once_with(user3)
+        # Check storage delete was called for user3 only, in one batch
+        self.mock_storage_manager.delete_many.assert_called_once_with([user3])
         
         # Check storage dict reflects the changes
         self.assertIn(user1, self.storage_dict)
@@ -362,6 +368,21 @@ class TestUserSession(unittest.TestCase):
             mock_get_tm.return_value = mock_tm
             self.assertFalse(user_session.is_authenticated("any_user"))
 
+    def test_is_authenticated_async(self):
+        """is_authenticated_async refreshes through the async token path"""
+        mock_tm = MagicMock()
+        mock_tm.get_access_token_async = AsyncMock(return_value="token")
+
+        with patch.object(UserSession, 'get_token_manager_async', AsyncMock(return_value=mock_tm)):
+            self.assertTrue(asyncio.run(self.user_session.is_authenticated_async(self.user_id)))
+            mock_tm.get_access_token.assert_not_called()
+
+            mock_tm.get_access_token_async.side_effect = ValueError("Token expired")
+            self.assertFalse(asyncio.run(self.user_session.is_authenticated_async(self.user_id)))
+
+        with patch.object(UserSession, 'get_token_manager_async', AsyncMock(return_value=None)):
+            self.assertFalse(asyncio.run(self.user_session.is_authenticated_async(self.user_id)))
+
     def test_logout_with_revoke_exception(self):
         """Test logout with token revocation exception"""
         # Set up the user session
@@ -421,11 +442,10 @@ class TestUserSession(unittest.TestCase):
         self.assertNotIn(user2, self.user_session.user_sessions)  # Removed (no tokens)
         self.assertIn(user3, self.user_session.user_sessions)     # Kept (has refresh token)
         
-        # Verify storage deletes
-        self.mock_storage_manager.delete.assert_has_calls([
-            call(user1),
-            call(user2)
-        ], any_order=True)
+        # Verify storage deletes, in one batch
+        self.mock_storage_manager.delete_many.assert_called_once()
+        deleted = self.mock_storage_manager.delete_many.call_args[0][0]
+        self.assertCountEqual(deleted, [user1, user2])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,222 @@
+import asyncio
+import threading
+import time
+import unittest
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from kinde_sdk.auth.api_options import ApiOptions
+from kinde_sdk.auth.feature_flags import FeatureFlags
+from kinde_sdk.core.account_api_cache import AccountApiCache, account_api_cache
+
+
+class _Fetch:
+    def __init__(self, delay=0.0, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return f"response_{call}"
+
+
+class _NoScanOrderedDict(OrderedDict):
+    """OrderedDict that fails the test if its keys are iterated."""
+
+    def __iter__(self):
+        raise AssertionError("cache was scanned")
+
+
+class TestAccountApiCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = AccountApiCache(max_size=3, ttl=60, stale_ttl=0)
+        self.key = AccountApiCache.make_key("user_1", "org_1", "get_feature_flags")
+
+    def test_hit_within_ttl(self):
+        fetch = _Fetch()
+        self.assertEqual(self.cache.get_or_fetch(self.key, fetch), "response_1")
+        self.assertEqual(self.cache.get_or_fetch(self.key, fetch), "response_1")
+        self.assertEqual(fetch.calls, 1)
+
+    def test_keys_are_per_user_org_and_endpoint(self):
+        fetch = _Fetch()
+        self.cache.get_or_fetch(self.key, fetch)
+        self.cache.get_or_fetch(AccountApiCache.make_key("user_2", "org_1", "get_feature_flags"), fetch)
+        self.cache.get_or_fetch(AccountApiCache.make_key("user_1", "org_2", "get_feature_flags"), fetch)
+        self.cache.get_or_fetch(AccountApiCache.make_key("user_1", "org_1", "get_user_roles"), fetch)
+        self.assertEqual(fetch.calls, 4)
+
+    def test_refetch_after_ttl(self):
+        fetch = _Fetch()
+        now = time.monotonic()
+        self.cache.get_or_fetch(self.key, fetch)
+        with patch("kinde_sdk.core.account_api_cache.time.monotonic", return_value=now + 61):
+            self.assertEqual(self.cache.get_or_fetch(self.key, fetch), "response_2")
+
+    def test_stale_while_revalidate(self):
+        cache = AccountApiCache(ttl=60, stale_ttl=60)
+        fetch = _Fetch(delay=0.05)
+        now = time.monotonic()
+        cache.get_or_fetch(self.key, fetch)
+
+        with patch("kinde_sdk.core.account_api_cache.time.monotonic", return_value=now + 90):
+            # Stale value is served immediately and refreshed once in the background
+            self.assertEqual(cache.get_or_fetch(self.key, fetch), "response_1")
+            self.assertEqual(cache.get_or_fetch(self.key, fetch), "response_1")
+        cache._executor.shutdown(wait=True)
+
+        self.assertEqual(fetch.calls, 2)
+        self.assertEqual(cache.get_or_fetch(self.key, fetch), "response_2")
+
+    def test_concurrent_misses_share_one_fetch(self):
+        fetch = _Fetch(delay=0.1)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_fetch(self.key, fetch)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(fetch.calls, 1)
+        self.assertEqual(results, ["response_1"] * 8)
+
+    def test_errors_are_not_cached(self):
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_fetch(self.key, _Fetch(error=RuntimeError("boom")))
+        self.assertEqual(self.cache.get_or_fetch(self.key, _Fetch()), "response_1")
+
+    def test_none_is_not_cached(self):
+        self.cache.get_or_fetch(self.key, lambda: None)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru_eviction(self):
+        fetch = _Fetch()
+        for user in ("a", "b", "c", "d"):
+            self.cache.get_or_fetch(AccountApiCache.make_key(user, None, "x"), fetch)
+        self.assertEqual(len(self.cache), 3)
+        self.cache.get_or_fetch(AccountApiCache.make_key("a", None, "x"), fetch)
+        self.assertEqual(fetch.calls, 5)
+
+    def test_invalidate(self):
+        fetch = _Fetch()
+        other = AccountApiCache.make_key("user_2", "org_1", "get_feature_flags")
+        self.cache.get_or_fetch(self.key, fetch)
+        self.cache.get_or_fetch(other, fetch)
+
+        self.cache.invalidate(user_id="user_1")
+        self.assertEqual(self.cache.get_or_fetch(self.key, fetch), "response_3")
+        self.assertEqual(self.cache.get_or_fetch(other, fetch), "response_2")
+
+        self.cache.invalidate(endpoint="get_feature_flags")
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidate_during_fetch_discards_result(self):
+        started = threading.Event()
+
+        def fetch():
+            started.set()
+            time.sleep(0.1)
+            return "old"
+
+        thread = threading.Thread(target=self.cache.get_or_fetch, args=(self.key, fetch))
+        thread.start()
+        started.wait()
+        self.cache.invalidate(user_id="user_1")
+        thread.join()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidating_a_user_keeps_other_users_fetches(self):
+        started = threading.Event()
+        other = AccountApiCache.make_key("user_2", "org_1", "get_feature_flags")
+
+        def fetch():
+            started.set()
+            time.sleep(0.1)
+            return "user_2 data"
+
+        thread = threading.Thread(target=self.cache.get_or_fetch, args=(other, fetch))
+        thread.start()
+        started.wait()
+        self.cache.invalidate(user_id="user_1")
+        thread.join()
+        self.assertEqual(self.cache.get(other), "user_2 data")
+
+    def test_invalidate_user_uses_index(self):
+        fetch = _Fetch()
+        for user in ("user_1", "user_2"):
+            self.cache.get_or_fetch(AccountApiCache.make_key(user, "org_1", "get_feature_flags"), fetch)
+        self.cache._entries = _NoScanOrderedDict(self.cache._entries)
+        self.cache.invalidate(user_id="user_1")
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertEqual(len(self.cache), 1)
+        # The index and generations only keep users with entries or fetches
+        self.assertEqual(list(self.cache._user_keys), ["user_2"])
+        self.assertEqual(self.cache._user_generations, {})
+
+    def test_disabled_by_default(self):
+        cache = AccountApiCache()
+        fetch = _Fetch()
+        cache.get_or_fetch(self.key, fetch)
+        cache.get_or_fetch(self.key, fetch)
+        self.assertEqual(fetch.calls, 2)
+
+    def test_get_and_put(self):
+        self.assertIsNone(self.cache.get(self.key))
+        self.cache.put(self.key, "assembled")
+        self.assertEqual(self.cache.get(self.key), "assembled")
+        self.assertEqual(self.cache.get_or_fetch(self.key, _Fetch()), "assembled")
+
+        now = time.monotonic()
+        with patch("kinde_sdk.core.account_api_cache.time.monotonic", return_value=now + 61):
+            self.assertIsNone(self.cache.get(self.key))
+
+    def test_ttl_zero_disables_cache(self):
+        cache = AccountApiCache(ttl=0)
+        fetch = _Fetch()
+        cache.get_or_fetch(self.key, fetch)
+        cache.get_or_fetch(self.key, fetch)
+        self.assertEqual(fetch.calls, 2)
+
+
+class TestForceApiLookups(unittest.TestCase):
+    def setUp(self):
+        account_api_cache.configure(ttl=30)
+        self.feature_flags = FeatureFlags()
+        self.token_manager = Mock(user_id="user_1")
+        self.token_manager.get_force_api.return_value = False
+        self.token_manager.get_claims.return_value = {"org_code": "org_1"}
+        self.api = Mock()
+        self.api.get_feature_flags.return_value = SimpleNamespace(
+            data=SimpleNamespace(flags={"theme": {"t": "s", "v": "dark"}})
+        )
+
+    def tearDown(self):
+        account_api_cache.configure(ttl=0)
+
+    def test_one_fetch_serves_many_flags(self):
+        with patch.object(self.feature_flags, "_get_token_manager", return_value=self.token_manager), \
+                patch.object(self.feature_flags, "_create_authenticated_api_client", return_value=self.api):
+            for _ in range(10):
+                asyncio.run(self.feature_flags.get_flag("theme", options=ApiOptions(force_api=True)))
+
+        self.assertEqual(self.api.get_feature_flags.call_count, 1)
+
+    def test_logout_invalidates_user(self):
+        account_api_cache.get_or_fetch(AccountApiCache.make_key("user_1", "org_1", "get_feature_flags"), lambda: "x")
+        with patch.object(self.feature_flags._session_manager, "_load_from_storage", return_value=False):
+            self.feature_flags._session_manager.logout("user_1")
+        self.assertEqual(len(account_api_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import requests
+
+from kinde_sdk.auth.token_manager import TokenManager
+from kinde_sdk.core.async_http import (
+    async_get,
+    async_post,
+    _clients,
+    close_async_client,
+    closing_async_client,
+    get_async_client,
+    raise_for_status,
+    set_async_client,
+)
+from kinde_sdk.core.helpers import get_user_details
+
+
+class TestAsyncHttp(unittest.TestCase):
+    def setUp(self):
+        self.requests_seen = []
+
+    def tearDown(self):
+        set_async_client(None)
+
+    def _use_transport(self, handler):
+        def recording_handler(request):
+            self.requests_seen.append(request)
+            return handler(request)
+
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(recording_handler)))
+
+    def test_client_shared_within_loop(self):
+        async def get_twice():
+            return get_async_client(), get_async_client()
+
+        first, second = asyncio.run(get_twice())
+        self.assertIs(first, second)
+
+    def test_client_per_loop(self):
+        async def get_client():
+            client = get_async_client()
+            await close_async_client()
+            return client
+
+        self.assertIsNot(asyncio.run(get_client()), asyncio.run(get_client()))
+
+    def test_close_async_client(self):
+        async def close():
+            client = get_async_client()
+            await close_async_client()
+            return client
+
+        self.assertTrue(asyncio.run(close()).is_closed)
+
+    def test_closing_async_client_for_short_lived_loops(self):
+        async def get_client():
+            return get_async_client()
+
+        for _ in range(3):
+            self.assertTrue(asyncio.run(closing_async_client(get_client())).is_closed)
+        self.assertEqual(len(_clients), 0)
+
+    def test_requires_running_loop(self):
+        with self.assertRaises(RuntimeError):
+            get_async_client()
+
+    def test_post_form_data(self):
+        self._use_transport(lambda request: httpx.Response(200, json={"ok": True}))
+        response = asyncio.run(async_post("https://example.com/oauth2/token", data={"code": "abc"}))
+
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertEqual(self.requests_seen[0].method, "POST")
+        self.assertEqual(self.requests_seen[0].content, b"code=abc")
+
+    def test_status_errors_raise_requests_http_error(self):
+        self._use_transport(lambda request: httpx.Response(401, json={"error": "invalid_token"}))
+        response = asyncio.run(async_get("https://example.com/oauth2/userinfo"))
+
+        with self.assertRaises(requests.HTTPError) as context:
+            raise_for_status(response)
+        self.assertEqual(context.exception.response.status_code, 401)
+        self.assertEqual(context.exception.response.json(), {"error": "invalid_token"})
+
+    def test_transport_errors_raise_requests_exceptions(self):
+        def timeout(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        def refused(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        self._use_transport(timeout)
+        with self.assertRaises(requests.Timeout):
+            asyncio.run(async_get("https://example.com"))
+
+        self._use_transport(refused)
+        with self.assertRaises(requests.ConnectionError):
+            asyncio.run(async_get("https://example.com"))
+
+    def test_get_user_details_uses_async_transport(self):
+        self._use_transport(lambda request: httpx.Response(200, json={"id": "user1"}))
+        token_manager = MagicMock()
+        token_manager.get_access_token_async = AsyncMock(return_value="test_token")
+
+        result = asyncio.run(get_user_details("https://example.com/oauth2/userinfo", token_manager, MagicMock()))
+
+        self.assertEqual(result, {"id": "user1"})
+        self.assertEqual(self.requests_seen[0].headers["Authorization"], "Bearer test_token")
+
+    def test_get_user_details_error_response(self):
+        self._use_transport(lambda request: httpx.Response(401, json={"error_description": "Token is invalid"}))
+        token_manager = MagicMock()
+        token_manager.get_access_token_async = AsyncMock(return_value="test_token")
+        logger = MagicMock()
+
+        with self.assertRaises(requests.HTTPError):
+            asyncio.run(get_user_details("https://example.com/oauth2/userinfo", token_manager, logger))
+        logger.error.assert_called_with("User details retrieval failed: Token is invalid")
+
+
+class TestTokenManagerAsyncTransport(unittest.TestCase):
+    def setUp(self):
+        TokenManager.reset_instances()
+        self.manager = TokenManager("user", "client_id", "client_secret", "https://example.com/oauth2/token")
+        self.requests_seen = []
+
+        def handler(request):
+            self.requests_seen.append(request)
+            if request.url.path.endswith("/token"):
+                return httpx.Response(200, json={"access_token": "new_token", "expires_in": 3600})
+            return httpx.Response(200)
+
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    def tearDown(self):
+        set_async_client(None)
+        TokenManager.reset_instances()
+
+    def test_exchange_code_for_token(self):
+        self.manager.set_redirect_uri("https://example.com/callback")
+        token = asyncio.run(self.manager.exchange_code_for_token("auth_code", "verifier"))
+
+        self.assertEqual(token, "new_token")
+        body = self.requests_seen[0].content.decode()
+        self.assertIn("code=auth_code", body)
+        self.assertIn("code_verifier=verifier", body)
+
+    def test_exchange_code_error(self):
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(400, json={"error": "invalid_grant"})
+        )))
+        self.manager.set_redirect_uri("https://example.com/callback")
+
+        with self.assertRaises(requests.HTTPError):
+            asyncio.run(self.manager.exchange_code_for_token("auth_code"))
+
+    def test_revoke_token_async(self):
+        self.manager.tokens = {"access_token": "token_to_revoke"}
+        asyncio.run(self.manager.revoke_token_async())
+
+        self.assertEqual(self.manager.tokens, {})
+        self.assertEqual(self.requests_seen[0].url.path, "/oauth2/revoke")
+        self.assertIn("token=token_to_revoke", self.requests_seen[0].content.decode())
+
+    def test_revoke_token_async_is_best_effort(self):
+        def refused(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(refused)))
+        self.manager.tokens = {"access_token": "token_to_revoke"}
+        asyncio.run(self.manager.revoke_token_async())
+        self.assertEqual(self.manager.tokens, {})
+
+    def test_get_access_token_async_refreshes_over_async_client(self):
+        self.manager.tokens = {"access_token": "old_token", "refresh_token": "refresh", "expires_at": 0}
+
+        with patch("kinde_sdk.auth.token_manager.http_client") as mock_http_client:
+            token = asyncio.run(self.manager.get_access_token_async())
+
+        self.assertEqual(token, "new_token")
+        mock_http_client.post.assert_not_called()
+        body = self.requests_seen[0].content.decode()
+        self.assertIn("grant_type=refresh_token", body)
+        self.assertIn("refresh_token=refresh", body)
+
+    def test_concurrent_async_refreshes_share_one_request(self):
+        self.manager.tokens = {"access_token": "old_token", "refresh_token": "refresh", "expires_at": 0}
+
+        async def refresh_concurrently():
+            return await asyncio.gather(*(self.manager.get_access_token_async() for _ in range(5)))
+
+        self.assertEqual(asyncio.run(refresh_concurrently()), ["new_token"] * 5)
+        self.assertEqual(len(self.requests_seen), 1)
+
+    def test_async_refresh_error_adopts_persisted_tokens(self):
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(400, json={"error": "invalid_grant"})
+        )))
+        persisted = {"access_token": "rotated_token", "refresh_token": "rotated", "expires_at": time.time() + 3600}
+        self.manager.set_token_persistence(lambda: persisted, MagicMock())
+        self.manager.tokens = {"access_token": "old_token", "refresh_token": "refresh", "expires_at": 0}
+
+        self.assertEqual(asyncio.run(self.manager.refresh_access_token_async()), "rotated_token")
+
+
+if __name__ == "__main__":
+    unittest.main()
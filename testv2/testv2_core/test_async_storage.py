@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from kinde_sdk.auth.token_manager import TokenManager
+from kinde_sdk.auth.user_session import UserSession
+from kinde_sdk.core.framework.framework_context import FrameworkContext
+from kinde_sdk.core.storage import AsyncStorageInterface, MemoryStorage, StorageManager, SyncStorageAdapter
+
+
+class ThreadRecordingStorage(MemoryStorage):
+    """Memory storage that reports as blocking and records the calling thread."""
+
+    blocking = True
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def get(self, key):
+        self.calls.append(("get", threading.get_ident(), FrameworkContext.get_request()))
+        return super().get(key)
+
+    def get_many(self, keys):
+        self.calls.append(("get_many", threading.get_ident(), None))
+        return {key: super(ThreadRecordingStorage, self).get(key) for key in keys}
+
+
+class NativeAsyncStorage(AsyncStorageInterface):
+    """Async storage implementing only the required methods."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+class TestSyncStorageAdapter(unittest.TestCase):
+    def test_blocking_storage_runs_in_thread_pool(self):
+        storage = ThreadRecordingStorage()
+        storage.set("a", {"v": 1})
+
+        async def run():
+            FrameworkContext.set_request("request")
+            try:
+                return await SyncStorageAdapter(storage).get("a"), threading.get_ident()
+            finally:
+                FrameworkContext.clear_request()
+
+        value, loop_thread = asyncio.run(run())
+        self.assertEqual(value, {"v": 1})
+        _, thread, request = storage.calls[0]
+        self.assertNotEqual(thread, loop_thread)
+        # The request context follows the call into the worker thread
+        self.assertEqual(request, "request")
+
+    def test_batch_is_one_call(self):
+        storage = ThreadRecordingStorage()
+        result = asyncio.run(SyncStorageAdapter(storage).get_many(["a", "b"]))
+        self.assertEqual(result, {"a": None, "b": None})
+        self.assertEqual([call[0] for call in storage.calls], ["get_many"])
+
+    def test_non_blocking_storage_runs_inline(self):
+        storage = MemoryStorage()
+        adapter = SyncStorageAdapter(storage)
+        with patch("asyncio.to_thread") as to_thread:
+            asyncio.run(adapter.set_many({"a": {"v": 1}}))
+            self.assertEqual(asyncio.run(adapter.get("a")), {"v": 1})
+            asyncio.run(adapter.delete_prefix("a"))
+        to_thread.assert_not_called()
+        self.assertIsNone(storage.get("a"))
+
+    def test_async_interface_defaults(self):
+        storage = NativeAsyncStorage()
+
+        async def run():
+            await storage.set_many({"a": {"v": 1}, "b": {"v": 2}})
+            await storage.delete_many(["b"])
+            return await storage.get_many(["a", "b"])
+
+        self.assertEqual(asyncio.run(run()), {"a": {"v": 1}, "b": None})
+        with self.assertRaises(NotImplementedError):
+            asyncio.run(storage.delete_prefix("a"))
+
+
+class TestStorageManagerAsync(unittest.TestCase):
+    def setUp(self):
+        self.manager = StorageManager()
+
+    def tearDown(self):
+        self.manager.initialize({"type": "memory"})
+
+    def test_sync_storage_is_adapted(self):
+        storage = MemoryStorage()
+        self.manager.initialize(storage=storage, device_id="device_1")
+
+        async def run():
+            await self.manager.setItems_async("user_1", {"v": 1})
+            await self.manager.set_many_async({"user_2": {"v": 2}, "user:state": {"value": "s"}})
+            values = await self.manager.get_many_async(["user_1", "user_2", "user:state"])
+            await self.manager.delete_async("user_1")
+            return values, await self.manager.get_async("user_1")
+
+        values, deleted = asyncio.run(run())
+        self.assertEqual(values, {"user_1": {"v": 1}, "user_2": {"v": 2}, "user:state": {"value": "s"}})
+        self.assertIsNone(deleted)
+        self.assertEqual(storage.get("device:device_1:user_2"), {"v": 2})
+        asyncio.run(self.manager.clear_device_data_async())
+        self.assertIsNone(storage.get("device:device_1:user_2"))
+        self.assertEqual(storage.get("user:state"), {"value": "s"})
+
+    def test_native_async_storage(self):
+        async_storage = NativeAsyncStorage()
+        self.manager.initialize(storage=MemoryStorage(), device_id="device_1", async_storage=async_storage)
+        self.assertIs(self.manager.async_storage, async_storage)
+
+        async def run():
+            await self.manager.setItems_async("user_1", {"v": 1})
+            await self.manager.delete_many_async(["user_1"])
+            with self.assertLogs("kinde_sdk.core.storage.storage_manager", level="WARNING"):
+                await self.manager.clear_device_data_async()
+
+        asyncio.run(run())
+        self.assertEqual(async_storage.data, {})
+
+
+class TestUserSessionAsync(unittest.TestCase):
+    user_info = {"client_id": "client", "token_url": "https://example.com/oauth2/token"}
+
+    def setUp(self):
+        TokenManager.reset_instances()
+        self.storage = ThreadRecordingStorage()
+        StorageManager().initialize(storage=self.storage, device_id="device_1")
+
+    def tearDown(self):
+        StorageManager().initialize({"type": "memory"})
+        TokenManager.reset_instances()
+
+    def test_session_round_trip_through_async_storage(self):
+        token_data = {"access_token": "access", "refresh_token": "refresh", "expires_in": 3600}
+
+        async def run():
+            await UserSession().set_user_data_async("user_1", self.user_info, token_data)
+            # A new instance, as in another worker, loads the session from storage
+            session = UserSession()
+            token_manager = await session.get_token_manager_async("user_1")
+            user_data = await session.get_user_data_async("user_1")
+            missing = await session.get_token_manager_async("user_2")
+            return token_manager, user_data, missing, threading.get_ident()
+
+        token_manager, user_data, missing, loop_thread = asyncio.run(run())
+        self.assertEqual(token_manager.tokens["access_token"], "access")
+        self.assertEqual(user_data, self.user_info)
+        self.assertIsNone(missing)
+        self.assertTrue(self.storage.calls)
+        self.assertTrue(all(thread != loop_thread for _, thread, _ in self.storage.calls))
+
+    def test_logout_async_clears_device_data(self):
+        session = UserSession()
+
+        async def run():
+            await session.set_user_data_async("user_1", self.user_info, {"access_token": "access"})
+            await session.logout_async("user_1")
+
+        with patch.object(TokenManager, "revoke_token_async") as revoke:
+            asyncio.run(run())
+        revoke.assert_awaited_once()
+        self.assertNotIn("user_1", session.user_sessions)
+        self.assertIsNone(self.storage.get("device:device_1:user_1"))
+
+    def test_event_loop_is_not_blocked(self):
+        slow = ThreadRecordingStorage()
+        original_get = slow.get
+        slow.get = lambda key: (time.sleep(0.2), original_get(key))[1]
+        StorageManager().initialize(storage=slow, device_id="device_1")
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.ensure_future(ticker())
+            await UserSession().get_token_manager_async("user_1")
+            task.cancel()
+            return ticks
+
+        self.assertGreater(asyncio.run(run()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
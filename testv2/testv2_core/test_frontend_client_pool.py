@@ -0,0 +1,118 @@
+import http.server
+import json
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kinde_sdk.core.frontend_client_pool import AuthenticatedApiClient, FrontendClientPool
+from kinde_sdk.core.http_client import DEFAULT_TIMEOUTS
+from kinde_sdk.frontend.api.permissions_api import PermissionsApi
+
+
+class _AccountApiHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append((self.client_address, self.path, self.headers.get("Authorization")))
+        body = json.dumps({"data": {"org_code": "org_123", "permissions": []}, "metadata": {"has_more": False}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestFrontendClientPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _AccountApiHandler)
+        cls.host = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _AccountApiHandler.requests = []
+        self.pool = FrontendClientPool()
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_one_client_per_host(self):
+        client = self.pool.get_client("https://a.kinde.com")
+        self.assertIs(self.pool.get_client("https://a.kinde.com"), client)
+        self.assertIsNot(self.pool.get_client("https://b.kinde.com"), client)
+        self.assertEqual(client.configuration.host, "https://a.kinde.com")
+        self.assertIsNone(client.configuration.access_token)
+
+    def test_concurrent_get_client_creates_one_client(self):
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def get():
+            barrier.wait()
+            clients.append(self.pool.get_client("https://a.kinde.com"))
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(client) for client in clients}), 1)
+
+    def test_pool_maxsize(self):
+        pool = FrontendClientPool(pool_maxsize=3)
+        self.assertEqual(pool.get_client("https://a.kinde.com").configuration.connection_pool_maxsize, 3)
+
+    def test_users_share_connections_but_not_tokens(self):
+        for token in ("token_user_1", "token_user_2", "token_user_1"):
+            api = PermissionsApi(api_client=self.pool.authenticated_client(token, host=self.host))
+            response = api.get_user_permissions()
+            self.assertEqual(response.data.org_code, "org_123")
+
+        addresses = {address for address, _, _ in _AccountApiHandler.requests}
+        self.assertEqual(len(addresses), 1)
+        self.assertEqual(
+            [auth for _, _, auth in _AccountApiHandler.requests],
+            ["Bearer token_user_1", "Bearer token_user_2", "Bearer token_user_1"],
+        )
+        self.assertTrue(_AccountApiHandler.requests[0][1].startswith("/account_api/v1/permissions"))
+
+    def test_default_and_explicit_timeout(self):
+        shared = MagicMock()
+        client = AuthenticatedApiClient(shared, "token")
+
+        client.call_api("GET", "https://a.kinde.com/account_api/v1/roles", _request_timeout=None)
+        self.assertEqual(shared.call_api.call_args[1]["_request_timeout"], DEFAULT_TIMEOUTS["account_api"])
+
+        client.call_api("GET", "https://a.kinde.com/account_api/v1/roles", _request_timeout=2)
+        self.assertEqual(shared.call_api.call_args[1]["_request_timeout"], 2)
+
+    def test_explicit_request_auth_wins(self):
+        shared = MagicMock()
+        client = AuthenticatedApiClient(shared, "token")
+        override = {"in": "header", "type": "bearer", "key": "Authorization", "value": "Bearer other"}
+
+        client.param_serialize("GET", "/x", _request_auth=override)
+        self.assertIs(shared.param_serialize.call_args[1]["_request_auth"], override)
+
+        client.param_serialize("GET", "/x")
+        self.assertEqual(shared.param_serialize.call_args[1]["_request_auth"]["value"], "Bearer token")
+
+    def test_close_drops_clients(self):
+        client = self.pool.get_client("https://a.kinde.com")
+        with patch.object(client.rest_client.pool_manager, "clear") as clear:
+            self.pool.close()
+        clear.assert_called_once()
+        self.assertIsNot(self.pool.get_client("https://a.kinde.com"), client)
+
+
+if __name__ == "__main__":
+    unittest.main()
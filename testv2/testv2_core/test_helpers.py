@@ -1,6 +1,6 @@
 import unittest
 import warnings
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import patch, MagicMock, Mock, AsyncMock
 import json
 import base64
 import time
@@ -120,11 +120,11 @@ class TestHelpers(unittest.TestCase):
         # Mock dependencies
         userinfo_url = "https://test.kinde.com/api/v1/user"
         token_manager = MagicMock()
-        token_manager.get_access_token.return_value = "test_access_token"
+        token_manager.get_access_token_async = AsyncMock(return_value="test_access_token")
         logger = MagicMock()
         
-        # Create the mock for requests.get
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        # Create the mock for the async userinfo request
+        with patch('kinde_sdk.core.helpers.async_get', new_callable=AsyncMock) as mock_get:
             # Mock response
             mock_response = MagicMock()
             mock_response.json.return_value = {"id": "user1", "name": "Test User"}
@@ -149,7 +149,7 @@ class TestHelpers(unittest.TestCase):
         """Test get_user_details handles token errors."""
         userinfo_url = "https://test.kinde.com/api/v1/user"
         token_manager = MagicMock()
-        token_manager.get_access_token.side_effect = ValueError("No token")
+        token_manager.get_access_token_async = AsyncMock(side_effect=ValueError("No token"))
         logger = MagicMock()
         
         with self.assertRaises(ValueError):
@@ -161,11 +161,11 @@ class TestHelpers(unittest.TestCase):
         """Test get_user_details handles request errors with JSON response."""
         userinfo_url = "https://test.kinde.com/api/v1/user"
         token_manager = MagicMock()
-        token_manager.get_access_token.return_value = "test_token"
+        token_manager.get_access_token_async = AsyncMock(return_value="test_token")
         logger = MagicMock()
         
         # Create a mock response with JSON error data
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.helpers.async_get', new_callable=AsyncMock) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = {"error": "invalid_token", "error_description": "Token is invalid"}
             mock_get.side_effect = RequestException(response=mock_response)
@@ -179,11 +179,11 @@ class TestHelpers(unittest.TestCase):
         """Test get_user_details handles request errors without JSON response."""
         userinfo_url = "https://test.kinde.com/api/v1/user"
         token_manager = MagicMock()
-        token_manager.get_access_token.return_value = "test_token"
+        token_manager.get_access_token_async = AsyncMock(return_value="test_token")
         logger = MagicMock()
         
         # Create a mock response that raises an exception when json() is called
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.helpers.async_get', new_callable=AsyncMock) as mock_get:
             mock_response = MagicMock()
             mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
             mock_response.status_code = 500
@@ -255,7 +255,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock for requests.get
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             # Mock response
             mock_response = MagicMock()
             mock_response.json.return_value = {
@@ -303,7 +303,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response with JSON error data
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = {"error": "forbidden", "error_description": "Access denied"}
             mock_get.side_effect = RequestException(response=mock_response)
@@ -321,7 +321,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response that raises an exception when json() is called
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
             mock_response.status_code = 500
@@ -342,7 +342,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock for requests.get
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             # Mock response
             mock_response = MagicMock()
             mock_response.json.return_value = {
@@ -391,7 +391,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response with JSON error data
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = {"error": "not_found", "error_description": "Organization not found"}
             mock_get.side_effect = RequestException(response=mock_response)
@@ -410,7 +410,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response that raises an exception when json() is called
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
             mock_response.status_code = 404
@@ -431,7 +431,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock for requests.get
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             # Mock response
             mock_response = MagicMock()
             mock_response.json.return_value = {
@@ -481,7 +481,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response with JSON error data
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = {"error": "forbidden", "error_description": "Access denied"}
             mock_get.side_effect = RequestException(response=mock_response)
@@ -500,7 +500,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response that raises an exception when json() is called
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
             mock_response.status_code = 500
@@ -520,7 +520,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock for requests.get
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             # Mock response
             mock_response = MagicMock()
             mock_response.json.return_value = {
@@ -584,7 +584,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response with JSON error data
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = {"error": "forbidden", "error_description": "Access denied"}
             mock_get.side_effect = RequestException(response=mock_response)
@@ -602,7 +602,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response that raises an exception when json() is called
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
             mock_response.status_code = 500
@@ -620,7 +620,7 @@ class TestHelpers(unittest.TestCase):
         token_manager.get_access_token.return_value = "test_access_token"
         
         # Create a mock for requests.get
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             # Mock response
             mock_response = MagicMock()
             mock_response.json.return_value = {
@@ -688,7 +688,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock for requests.get
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             # Mock response
             mock_response = MagicMock()
             mock_response.json.return_value = {
@@ -752,7 +752,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response with JSON error data
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = {"error": "forbidden", "error_description": "Access denied"}
             mock_get.side_effect = RequestException(response=mock_response)
@@ -770,7 +770,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock response that raises an exception when json() is called
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
             mock_response.status_code = 500
@@ -788,7 +788,7 @@ class TestHelpers(unittest.TestCase):
         token_manager.get_access_token.return_value = "test_access_token"
         
         # Create a mock for requests.get
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             # Mock response
             mock_response = MagicMock()
             mock_response.json.return_value = {
@@ -861,7 +861,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock for requests.get
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             # Mock response for active flag
             mock_response_active = MagicMock()
             mock_response_active.json.return_value = {
@@ -917,7 +917,7 @@ class TestHelpers(unittest.TestCase):
         logger = MagicMock()
         
         # Create a mock that raises an exception
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_get.side_effect = RequestException("Network error")
             
             # Should return default value on error
@@ -934,7 +934,7 @@ class TestHelpers(unittest.TestCase):
         token_manager.get_access_token.return_value = "test_token"
         
         # Create a mock that raises an exception
-        with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+        with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
             mock_get.side_effect = RequestException("Network error")
             
             # Should return default value on error without logging
@@ -1102,7 +1102,7 @@ class TestHelpers(unittest.TestCase):
         # Mock asyncio.get_running_loop to raise RuntimeError (no event loop)
         with patch('kinde_sdk.core.helpers.asyncio.get_running_loop') as mock_get_loop:
             with patch('kinde_sdk.core.helpers.asyncio.run') as mock_run:
-                with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+                with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
                     mock_get_loop.side_effect = RuntimeError("No running event loop")
                     
                     # Mock the async get_user_details function
@@ -1126,7 +1126,7 @@ class TestHelpers(unittest.TestCase):
         
         # Mock asyncio.get_running_loop to return a mock loop (event loop exists)
         with patch('kinde_sdk.core.helpers.asyncio.get_running_loop') as mock_get_loop:
-            with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+            with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
                 mock_loop = MagicMock()
                 mock_get_loop.return_value = mock_loop
                 
@@ -1153,15 +1153,12 @@ class TestHelpers(unittest.TestCase):
         """Test get_user_details_sync handles token errors."""
         userinfo_url = "https://test.kinde.com/api/v1/user"
         token_manager = MagicMock()
-        token_manager.get_access_token.side_effect = ValueError("No token")
+        token_manager.get_access_token_async = AsyncMock(side_effect=ValueError("No token"))
         logger = MagicMock()
         
-        # Mock asyncio.get_running_loop to raise RuntimeError (no event loop)
-        with patch('kinde_sdk.core.helpers.asyncio.get_running_loop') as mock_get_loop:
-            mock_get_loop.side_effect = RuntimeError("No running event loop")
-            
-            with self.assertRaises(ValueError):
-                get_user_details_sync(userinfo_url, token_manager, logger)
+        # No event loop is running here, so the asyncio.run path is taken
+        with self.assertRaises(ValueError):
+            get_user_details_sync(userinfo_url, token_manager, logger)
 
     def test_get_user_details_sync_request_error(self):
         """Test get_user_details_sync handles request errors."""
@@ -1172,7 +1169,7 @@ class TestHelpers(unittest.TestCase):
         
         # Mock asyncio.get_running_loop to return a mock loop (event loop exists)
         with patch('kinde_sdk.core.helpers.asyncio.get_running_loop') as mock_get_loop:
-            with patch('kinde_sdk.core.helpers.requests.get') as mock_get:
+            with patch('kinde_sdk.core.http_client.http_client.get') as mock_get:
                 mock_loop = MagicMock()
                 mock_get_loop.return_value = mock_loop
                 
@@ -0,0 +1,139 @@
+import http.server
+import json
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from kinde_sdk.core.helpers import get_user_organizations
+from kinde_sdk.core.http_client import DEFAULT_TIMEOUTS, HttpClient, http_client
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    status_codes = []
+
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        status = type(self).status_codes.pop(0) if type(self).status_codes else 200
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _KeepAliveHandler.connections = set()
+        _KeepAliveHandler.status_codes = []
+        self.client = HttpClient(backoff_factor=0)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_endpoint_for(self):
+        self.assertEqual(HttpClient.endpoint_for("https://x.kinde.com/oauth2/token"), "token")
+        self.assertEqual(HttpClient.endpoint_for("https://x.kinde.com/oauth2/introspect"), "introspect")
+        self.assertEqual(HttpClient.endpoint_for("https://x.kinde.com/oauth2/revoke"), "revoke")
+        self.assertEqual(HttpClient.endpoint_for("https://x.kinde.com/oauth2/v2/user_profile"), "userinfo")
+        self.assertEqual(HttpClient.endpoint_for("https://x.kinde.com/account_api/v1/permissions"), "account_api")
+        self.assertEqual(HttpClient.endpoint_for("https://x.kinde.com/.well-known/jwks.json"), "jwks")
+        self.assertEqual(HttpClient.endpoint_for("https://x.kinde.com/other"), "default")
+
+    def test_default_timeout_per_endpoint(self):
+        self.client.session = MagicMock()
+        self.client.get("https://x.kinde.com/account_api/v1/roles")
+        self.assertEqual(self.client.session.request.call_args[1]["timeout"], DEFAULT_TIMEOUTS["account_api"])
+
+    def test_configured_and_explicit_timeouts(self):
+        self.client.configure(timeouts={"token": 5})
+        self.client.session = MagicMock()
+
+        self.client.post("https://x.kinde.com/oauth2/token", data={})
+        self.assertEqual(self.client.session.request.call_args[1]["timeout"], 5)
+
+        self.client.post("https://x.kinde.com/oauth2/token", data={}, timeout=1)
+        self.assertEqual(self.client.session.request.call_args[1]["timeout"], 1)
+
+    def test_configure_resets_omitted_timeouts(self):
+        self.client.configure(timeouts={"token": 5, "revoke": 2})
+        self.client.configure(timeouts={"revoke": 3})
+        self.assertEqual(self.client.timeouts["token"], DEFAULT_TIMEOUTS["token"])
+        self.assertEqual(self.client.timeouts["revoke"], 3)
+
+        self.client.configure()
+        self.assertEqual(self.client.timeouts, DEFAULT_TIMEOUTS)
+
+    def test_custom_session(self):
+        session = requests.Session()
+        client = HttpClient(session=session)
+        self.assertIs(client.session, session)
+
+    def test_configure_closes_previous_session(self):
+        previous = MagicMock()
+        self.client.session = previous
+        self.client.configure()
+        previous.close.assert_called_once()
+        self.assertIsNot(self.client.session, previous)
+
+        # Reconfiguring with the current session keeps it open
+        current = MagicMock()
+        self.client.session = current
+        self.client.configure(session=current)
+        current.close.assert_not_called()
+
+    def test_connections_are_reused(self):
+        for _ in range(5):
+            response = self.client.get(f"{self.base_url}/account_api/v1/roles")
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(_KeepAliveHandler.connections), 1)
+
+    def test_get_retries_transient_errors(self):
+        _KeepAliveHandler.status_codes = [503, 502]
+        response = self.client.get(f"{self.base_url}/account_api/v1/roles")
+        self.assertEqual(response.status_code, 200)
+
+    def test_retries_can_be_disabled(self):
+        client = HttpClient(retries=0)
+        _KeepAliveHandler.status_codes = [503]
+        self.assertEqual(client.get(f"{self.base_url}/account_api/v1/roles").status_code, 503)
+        client.close()
+
+    def test_connect_errors_raise_requests_exceptions(self):
+        client = HttpClient(retries=0)
+        with self.assertRaises(requests.ConnectionError):
+            client.get("http://127.0.0.1:1/oauth2/userinfo")
+
+    def test_helpers_use_shared_client(self):
+        token_manager = MagicMock()
+        token_manager.get_access_token.return_value = "test_token"
+        response = MagicMock()
+        response.json.return_value = {"organizations": [{"code": "org_1"}]}
+
+        with patch.object(http_client, "get", return_value=response) as mock_get:
+            result = get_user_organizations("https://x.kinde.com", token_manager, MagicMock())
+
+        self.assertEqual(result, [{"code": "org_1"}])
+        mock_get.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import threading
+import unittest
+
+from kinde_sdk.core.storage import LocalStorage, MemoryStorage, StorageManager
+from kinde_sdk.core.storage.storage_interface import StorageInterface
+from kinde_sdk.core.storage.namespace_index import NamespaceIndex, split_device_key
+
+
+class NoScanDict(dict):
+    """Dict that fails the test if its keys are iterated."""
+
+    def __iter__(self):
+        raise AssertionError("storage was scanned")
+
+    def keys(self):
+        raise AssertionError("storage was scanned")
+
+
+class TestNamespaceIndex(unittest.TestCase):
+    def test_split_device_key(self):
+        self.assertEqual(split_device_key("device:abc:user_1"), ("device:abc:", "user_1"))
+        self.assertEqual(split_device_key("device:abc:user:state"), ("device:abc:", "user:state"))
+        self.assertEqual(split_device_key("device:abc:"), ("device:abc:", ""))
+        self.assertIsNone(split_device_key("device:abc"))
+        self.assertIsNone(split_device_key("user:state"))
+        self.assertIsNone(split_device_key("_device_id"))
+
+    def test_keys_with_prefix(self):
+        index = NamespaceIndex()
+        for key in ("device:a:1", "device:a:2", "device:ab:1", "user:state"):
+            index.add(key)
+        self.assertCountEqual(index.keys_with_prefix("device:a:"), ["device:a:1", "device:a:2"])
+        self.assertEqual(index.keys_with_prefix("device:zz:"), [])
+        # Not a device namespace: the caller has to scan
+        self.assertIsNone(index.keys_with_prefix("device:"))
+        self.assertIsNone(index.keys_with_prefix("device:a"))
+        self.assertIsNone(index.keys_with_prefix("device:a:1:"))
+        index.discard("device:a:1")
+        index.discard("device:a:2")
+        self.assertEqual(index.keys_with_prefix("device:a:"), [])
+        self.assertNotIn("device:a:", index._device_keys)
+
+    def test_keys_for_user(self):
+        index = NamespaceIndex()
+        for key in ("device:a:1", "device:b:1", "device:b:2", "user:state"):
+            index.add(key)
+        self.assertCountEqual(index.keys_for_user("1"), ["device:a:1", "device:b:1"])
+        self.assertEqual(index.keys_for_user("3"), [])
+        index.discard("device:a:1")
+        index.discard("device:b:1")
+        self.assertEqual(index.keys_for_user("1"), [])
+        self.assertNotIn("1", index._user_keys)
+        # Each key is kept once per device and once per user, with no catch-all set
+        self.assertEqual(sum(len(keys) for keys in index._device_keys.values()), 1)
+
+
+class TestIndexedStorages(unittest.TestCase):
+    def test_device_prefix_delete_does_not_scan(self):
+        storage = MemoryStorage()
+        storage._storage = NoScanDict()
+        storage.set_many({f"device:other_{i}:user": {"i": i} for i in range(1000)})
+        storage.set_many({"device:mine:user_1": {}, "device:mine:user_2": {}})
+        storage.delete("device:mine:user_2")
+        storage.delete_prefix("device:mine:")
+        self.assertIsNone(storage.get("device:mine:user_1"))
+        self.assertEqual(storage.get("device:other_1:user"), {"i": 1})
+        self.assertEqual(len(storage._storage), 1000)
+
+    def test_other_prefixes_still_work(self):
+        for storage in (MemoryStorage(), LocalStorage()):
+            storage.set_many({"device:a:user_1": {}, "device:a:user_2": {}, "device:b:user_1": {}})
+            storage.delete_prefix("device:a:user_1")
+            storage.delete_prefix("device:b")
+            remaining = storage.get_many(["device:a:user_1", "device:a:user_2", "device:b:user_1"])
+            self.assertEqual([k for k, v in remaining.items() if v is not None], ["device:a:user_2"])
+
+    def test_local_storage_uses_index(self):
+        storage = LocalStorage()
+        storage.set("device:a:user_1", {})
+        storage.set("device:b:user_1", {})
+        storage.storage = NoScanDict(storage.storage)
+        storage.delete_prefix("device:a:")
+        self.assertIsNone(storage.get("device:a:user_1"))
+        self.assertEqual(storage.get("device:b:user_1"), {})
+
+    def test_concurrent_writes_keep_index_consistent(self):
+        storage = MemoryStorage()
+
+        def worker(n):
+            for i in range(200):
+                storage.set(f"device:{n}:user_{i}", {})
+                if i % 2:
+                    storage.delete(f"device:{n}:user_{i}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sum(len(storage._index.keys_with_prefix(f"device:{n}:")) for n in range(4)), 400)
+        storage.delete_prefix("device:")
+        self.assertEqual(storage._storage, {})
+
+    def test_user_delete_does_not_scan(self):
+        for storage in (MemoryStorage(), LocalStorage()):
+            storage.set_many({f"device:d_{i}:user_{i}": {} for i in range(1000)})
+            storage.set_many({"device:d_1:user_x": {}, "device:d_2:user_x": {}})
+            if isinstance(storage, MemoryStorage):
+                storage._storage = NoScanDict(storage._storage)
+            else:
+                storage.storage = NoScanDict(storage.storage)
+            storage.delete_user_data("user_x")
+            self.assertEqual(storage.get_many(["device:d_1:user_x", "device:d_2:user_x"]),
+                             {"device:d_1:user_x": None, "device:d_2:user_x": None})
+            self.assertEqual(storage.get("device:d_1:user_1"), {})
+
+    def test_clear_user_data_falls_back_to_scan(self):
+        storage = MemoryStorage()
+        storage.set_many({"device:a:user_1": {}, "device:b:user_1": {}, "device:b:user_2": {}})
+        storage._index = NamespaceIndex()
+        StorageInterface.delete_user_data(storage, "user_1")
+        self.assertEqual(list(storage._storage), ["device:b:user_2"])
+
+    def test_logout_clears_only_the_device(self):
+        storage = MemoryStorage()
+        manager = StorageManager()
+        try:
+            manager.initialize(storage=storage, device_id="device_1")
+            manager.setItems("user_1", {"v": 1})
+            storage.set("device:device_2:user_1", {"v": 2})
+            storage._storage = NoScanDict(storage._storage)
+            manager.clear_device_data()
+            self.assertIsNone(manager.get("user_1"))
+            self.assertEqual(storage.get("device:device_2:user_1"), {"v": 2})
+        finally:
+            manager.initialize({"type": "memory"})
+
+
+    def test_clear_user_data_clears_every_device(self):
+        storage = MemoryStorage()
+        manager = StorageManager()
+        try:
+            manager.initialize(storage=storage, device_id="device_1")
+            manager.setItems("user_1", {"v": 1})
+            storage.set_many({"device:device_2:user_1": {"v": 2}, "device:device_2:user_2": {"v": 3}})
+            manager.clear_user_data("user_1")
+            self.assertIsNone(manager.get("user_1"))
+            self.assertIsNone(storage.get("device:device_2:user_1"))
+            self.assertEqual(storage.get("device:device_2:user_2"), {"v": 3})
+        finally:
+            manager.initialize({"type": "memory"})
+
+if __name__ == "__main__":
+    unittest.main()
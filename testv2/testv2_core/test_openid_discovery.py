@@ -0,0 +1,185 @@
+import asyncio
+import http.server
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from kinde_sdk.core.openid_discovery import OpenIDDiscoveryCache, default_endpoints
+
+
+class _DiscoveryHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+    delay = 0.0
+    status = 200
+
+    def do_GET(self):
+        type(self).requests.append(self.path)
+        time.sleep(type(self).delay)
+        host = f"http://{self.headers['Host']}"
+        body = json.dumps({
+            "issuer": host,
+            "authorization_endpoint": f"{host}/discovered/auth",
+            "token_endpoint": f"{host}/discovered/token",
+        }).encode()
+        self.send_response(type(self).status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+class _ServerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _DiscoveryHandler)
+        cls.host = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _DiscoveryHandler.requests = []
+        _DiscoveryHandler.delay = 0.0
+        _DiscoveryHandler.status = 200
+        self.cache = OpenIDDiscoveryCache()
+
+    def _wait_until_fetched(self, cache=None):
+        cache = cache or self.cache
+        _wait_for(lambda: cache._documents.get(self.host) is not None)
+
+
+class TestOpenIDDiscoveryCache(_ServerTestCase):
+    def test_defaults_until_document_is_fetched(self):
+        _DiscoveryHandler.delay = 0.2
+        start = time.perf_counter()
+        endpoints = self.cache.get_endpoints(self.host)
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertEqual(endpoints, default_endpoints(self.host))
+
+        self._wait_until_fetched()
+        endpoints = self.cache.get_endpoints(self.host)
+        self.assertEqual(endpoints["auth_url"], f"{self.host}/discovered/auth")
+        self.assertEqual(endpoints["token_url"], f"{self.host}/discovered/token")
+        # Fields missing from the document keep the standard paths
+        self.assertEqual(endpoints["logout_url"], f"{self.host}/logout")
+        self.assertEqual(endpoints["userinfo_url"], f"{self.host}/oauth2/userinfo")
+
+    def test_one_fetch_per_host(self):
+        _DiscoveryHandler.delay = 0.1
+        for _ in range(10):
+            self.cache.get(self.host)
+            self.cache.get(self.host + "/")
+        self._wait_until_fetched()
+        self.cache.get_endpoints(self.host)
+        self.assertEqual(_DiscoveryHandler.requests, ["/.well-known/openid-configuration"])
+
+    def test_refresh_runs_on_a_daemon_thread(self):
+        _DiscoveryHandler.delay = 0.2
+        self.cache.get(self.host)
+        threads = [t for t in threading.enumerate() if t.name == "kinde-discovery"]
+        self.assertTrue(threads)
+        self.assertTrue(all(t.daemon for t in threads))
+        self._wait_until_fetched()
+
+    def test_stale_document_is_used_while_refreshing(self):
+        self.cache.fetch(self.host)
+        self.cache.configure(ttl=0)
+        fetched_at = self.cache._documents[self.host][1]
+        self.assertIsNotNone(self.cache.get(self.host))
+        _wait_for(lambda: self.cache._documents[self.host][1] > fetched_at)
+        self.assertEqual(len(_DiscoveryHandler.requests), 2)
+
+    def test_failed_fetch_backs_off(self):
+        _DiscoveryHandler.status = 500
+        self.cache.configure(retry_interval=60)
+        self.cache.get(self.host)
+        _wait_for(lambda: self.host in self.cache._failed_until)
+        self.cache.get(self.host)
+        self.assertEqual(self.cache.get_endpoints(self.host), default_endpoints(self.host))
+        self.assertEqual(len(_DiscoveryHandler.requests), 1)
+
+    def test_fetch_async(self):
+        document = asyncio.run(self.cache.fetch_async(self.host))
+        self.assertEqual(document["issuer"], self.host)
+        self.assertEqual(self.cache.get_endpoints(self.host)["auth_url"], f"{self.host}/discovered/auth")
+
+    def test_persisted_document_is_used_after_restart(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            OpenIDDiscoveryCache(cache_dir=cache_dir).fetch(self.host)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            restarted = OpenIDDiscoveryCache(cache_dir=cache_dir)
+            endpoints = restarted.get_endpoints(self.host)
+            self.assertEqual(endpoints["auth_url"], f"{self.host}/discovered/auth")
+            self.assertEqual(len(_DiscoveryHandler.requests), 1)
+
+    def test_corrupt_persisted_document_is_ignored(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = OpenIDDiscoveryCache(cache_dir=cache_dir)
+            with open(cache._cache_path(self.host), "w") as f:
+                f.write("{not json")
+            _DiscoveryHandler.delay = 0.2
+            self.assertEqual(cache.get_endpoints(self.host), default_endpoints(self.host))
+            self._wait_until_fetched(cache)
+
+
+class TestOAuthDiscovery(_ServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.patcher = patch("kinde_sdk.auth.oauth.openid_discovery_cache", self.cache)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_construction_does_not_wait_on_discovery(self):
+        from kinde_sdk.auth.oauth import OAuth
+
+        _DiscoveryHandler.delay = 0.5
+        start = time.perf_counter()
+        oauth = OAuth(client_id="client_id", host=self.host)
+        self.assertLess(time.perf_counter() - start, 0.25)
+        self.assertEqual(oauth.auth_url, f"{self.host}/oauth2/auth")
+
+        self._wait_until_fetched()
+        self.assertEqual(oauth.auth_url, f"{self.host}/discovered/auth")
+
+    def test_smart_oauth_discovers_once(self):
+        from kinde_sdk.auth.smart_oauth import SmartOAuth
+
+        _DiscoveryHandler.delay = 0.1
+        SmartOAuth(client_id="client_id", host=self.host)
+        self._wait_until_fetched()
+        self.assertEqual(len(_DiscoveryHandler.requests), 1)
+
+    def test_assigned_endpoints_take_precedence(self):
+        from kinde_sdk.auth.oauth import OAuth
+
+        self.cache.fetch(self.host)
+        oauth = OAuth(client_id="client_id", host=self.host)
+        oauth.token_url = "https://example.com/oauth2/token"
+        self.assertEqual(oauth.token_url, "https://example.com/oauth2/token")
+        self.assertEqual(oauth.auth_url, f"{self.host}/discovered/auth")
+
+
+if __name__ == "__main__":
+    unittest.main()
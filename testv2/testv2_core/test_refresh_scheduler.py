@@ -0,0 +1,176 @@
+import gc
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kinde_sdk.auth.token_manager import TokenManager
+from kinde_sdk.core.refresh_scheduler import TokenRefreshScheduler, get_refresh_scheduler
+from kinde_sdk.management.management_token_manager import ManagementTokenManager
+
+
+def _token_response(access_token, expires_in=3600):
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {
+        "access_token": access_token,
+        "refresh_token": "rotated_refresh",
+        "expires_in": expires_in,
+    }
+    return response
+
+
+class _Target:
+    def __init__(self):
+        self.calls = threading.Event()
+
+    def refresh(self):
+        self.calls.set()
+
+
+class TestTokenRefreshScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = TokenRefreshScheduler(refresh_fraction=0.5, jitter=0, min_delay=0)
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TokenRefreshScheduler(refresh_fraction=0)
+        with self.assertRaises(ValueError):
+            TokenRefreshScheduler(refresh_fraction=0.5, jitter=0.5)
+
+    def test_delay_within_jitter_bounds(self):
+        scheduler = TokenRefreshScheduler(refresh_fraction=0.8, jitter=0.1, min_delay=1)
+        for _ in range(100):
+            delay = scheduler.next_refresh_delay(100)
+            self.assertGreaterEqual(delay, 70)
+            self.assertLessEqual(delay, 90)
+        self.assertEqual(scheduler.next_refresh_delay(0), 1)
+
+    def test_callback_runs_when_due(self):
+        target = _Target()
+        self.scheduler.schedule("key", target.refresh, lifetime=0.1)
+        self.assertTrue(target.calls.wait(timeout=2))
+        self.assertFalse(self.scheduler.is_scheduled("key"))
+
+    def test_cancel(self):
+        target = _Target()
+        self.scheduler.schedule("key", target.refresh, lifetime=0.2)
+        self.scheduler.cancel("key")
+        self.assertFalse(target.calls.wait(timeout=0.3))
+
+    def test_reschedule_replaces_entry(self):
+        calls = []
+        self.scheduler.schedule("key", lambda: calls.append("first"), lifetime=0.1)
+        self.scheduler.schedule("key", lambda: calls.append("second"), lifetime=0.2)
+        time.sleep(0.4)
+        self.assertEqual(calls, ["second"])
+
+    def test_callback_errors_do_not_stop_scheduler(self):
+        target = _Target()
+
+        def failing():
+            raise RuntimeError("boom")
+
+        self.scheduler.schedule("failing", failing, lifetime=0.05)
+        self.scheduler.schedule("ok", target.refresh, lifetime=0.2)
+        self.assertTrue(target.calls.wait(timeout=2))
+
+    def test_bound_methods_held_weakly(self):
+        target = _Target()
+        calls = target.calls
+        self.scheduler.schedule("key", target.refresh, lifetime=0.1)
+        del target
+        gc.collect()
+        self.assertFalse(calls.wait(timeout=0.3))
+
+    def test_shared_scheduler(self):
+        self.assertIs(get_refresh_scheduler(), get_refresh_scheduler())
+
+
+class TestTokenManagerBackgroundRefresh(unittest.TestCase):
+    def setUp(self):
+        TokenManager.reset_instances()
+        self.scheduler = TokenRefreshScheduler(refresh_fraction=0.5, jitter=0, min_delay=0)
+        TokenManager.enable_background_refresh(self.scheduler)
+        self.manager = TokenManager("user", "client_id", "client_secret", "https://example.com/oauth2/token")
+
+    def tearDown(self):
+        TokenManager.disable_background_refresh()
+        TokenManager.reset_instances()
+        self.scheduler.stop()
+
+    def test_refreshes_before_expiry(self):
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=_token_response("fresh_token")) as mock_post:
+            self.manager.set_tokens({"access_token": "token", "refresh_token": "refresh", "expires_in": 0.2})
+            deadline = time.time() + 2
+            while mock_post.call_count == 0 and time.time() < deadline:
+                time.sleep(0.01)
+
+            self.assertEqual(mock_post.call_count, 1)
+            self.assertEqual(mock_post.call_args[1]["data"]["refresh_token"], "refresh")
+            self.assertEqual(self.manager.get_access_token(), "fresh_token")
+
+    def test_not_scheduled_without_refresh_token(self):
+        self.manager.set_tokens({"access_token": "token", "expires_in": 3600})
+        self.assertFalse(self.scheduler.is_scheduled("user:user"))
+
+    def test_revoke_cancels_refresh(self):
+        self.manager.set_tokens({"access_token": "token", "refresh_token": "refresh", "expires_in": 3600})
+        self.assertTrue(self.scheduler.is_scheduled("user:user"))
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=MagicMock()):
+            self.manager.revoke_token()
+        self.assertFalse(self.scheduler.is_scheduled("user:user"))
+
+    def test_expiry_skew(self):
+        self.manager.EXPIRY_SKEW = 120
+        self.manager.tokens = {"access_token": "token", "refresh_token": "refresh", "expires_at": time.time() + 60}
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=_token_response("fresh_token")):
+            self.assertEqual(self.manager.get_access_token(), "fresh_token")
+
+
+class TestManagementTokenManagerBackgroundRefresh(unittest.TestCase):
+    def setUp(self):
+        ManagementTokenManager.reset_instances()
+        self.scheduler = TokenRefreshScheduler(refresh_fraction=0.5, jitter=0, min_delay=0)
+        ManagementTokenManager.enable_background_refresh(self.scheduler)
+        self.manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
+
+    def tearDown(self):
+        ManagementTokenManager.disable_background_refresh()
+        ManagementTokenManager.reset_instances()
+        self.scheduler.stop()
+
+    key = "m2m:test.kinde.com:client_id"
+
+    def test_requests_new_token_before_expiry(self):
+        responses = [_token_response("m2m_token", expires_in=0.2), _token_response("m2m_fresh", expires_in=3600)]
+        with patch("kinde_sdk.core.http_client.http_client.post", side_effect=responses) as mock_post:
+            self.manager.request_new_token()
+            deadline = time.time() + 2
+            while mock_post.call_count == 1 and time.time() < deadline:
+                time.sleep(0.01)
+
+            self.assertEqual(mock_post.call_count, 2)
+            self.assertEqual(self.manager.tokens["access_token"], "m2m_fresh")
+
+    def test_clear_tokens_cancels_refresh(self):
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=_token_response("m2m_token")):
+            self.manager.request_new_token()
+        self.assertTrue(self.scheduler.is_scheduled(self.key))
+        self.manager.clear_tokens()
+        self.assertFalse(self.scheduler.is_scheduled(self.key))
+
+    def test_validated_user_token_is_not_scheduled(self):
+        introspection = MagicMock()
+        introspection.json.return_value = {"active": True, "exp": int(time.time()) + 3600}
+        with patch.object(self.manager, "get_access_token", return_value="m2m_token"), \
+                patch("kinde_sdk.core.http_client.http_client.post", return_value=introspection):
+            self.manager.validate_and_set_via_introspection("user_bearer_token")
+        self.assertFalse(self.scheduler.is_scheduled(self.key))
+
+
+if __name__ == "__main__":
+    unittest.main()
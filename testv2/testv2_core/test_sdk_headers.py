@@ -0,0 +1,155 @@
+import asyncio
+import http.server
+import sys
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from kinde_sdk._version import __version__
+from kinde_sdk.core.async_http import async_get, close_async_client
+from kinde_sdk.core.http_client import HttpClient
+from kinde_sdk.core.sdk_headers import (
+    FRAMEWORK_DETECTION,
+    SDKHeaders,
+    build_tracking_header,
+    configure_sdk_headers,
+    detect_framework,
+    sdk_headers,
+)
+
+PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
+
+class _EchoHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    headers_seen = []
+
+    def do_GET(self):
+        type(self).headers_seen.append(dict(self.headers))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDetectFramework(unittest.TestCase):
+    def test_uses_imported_modules_only(self):
+        self.assertIsNone(detect_framework({}))
+        self.assertEqual(detect_framework({"flask": Mock()}), "Flask")
+        self.assertIsNone(detect_framework({"flask": None}))
+
+    def test_prefers_the_framework_built_on_another(self):
+        self.assertEqual(detect_framework({"starlette": Mock(), "fastapi": Mock()}), "FastAPI")
+        self.assertEqual(detect_framework({"flask": Mock(), "quart": Mock()}), "Quart")
+
+    def test_build_tracking_header(self):
+        self.assertEqual(build_tracking_header(None, "2.0.0", "3.11.0"), "Python/2.0.0/3.11.0/python")
+        self.assertEqual(build_tracking_header("Flask", "2.0.0", "3.11.0"), "Python-Flask/2.0.0/3.11.0/python")
+        self.assertEqual(build_tracking_header(), f"Python/{__version__}/{PYTHON_VERSION}/python")
+
+
+class TestSDKHeaders(unittest.TestCase):
+    def setUp(self):
+        self.headers = SDKHeaders()
+        self.no_frameworks = patch.dict(sys.modules, {name: None for name in FRAMEWORK_DETECTION})
+        self.no_frameworks.start()
+
+    def tearDown(self):
+        self.no_frameworks.stop()
+
+    def test_computed_once_and_immutable(self):
+        with patch("kinde_sdk.core.sdk_headers.detect_framework", return_value="Flask") as detect:
+            first = self.headers.get()
+            self.assertIs(self.headers.get(), first)
+        detect.assert_called_once()
+        self.assertEqual(dict(first), {"Kinde-SDK": f"Python-Flask/{__version__}/{PYTHON_VERSION}/python"})
+        with self.assertRaises(TypeError):
+            first["Kinde-SDK"] = "changed"
+
+    def test_framework_imported_after_first_request(self):
+        first = self.headers.get()
+        self.assertEqual(dict(first), {"Kinde-SDK": f"Python/{__version__}/{PYTHON_VERSION}/python"})
+        self.assertIs(self.headers.get(), first)
+
+        with patch.dict(sys.modules, {"flask": Mock()}):
+            later = self.headers.get()
+        self.assertEqual(later["Kinde-SDK"], f"Python-Flask/{__version__}/{PYTHON_VERSION}/python")
+        # Frozen once a framework is seen
+        with patch("kinde_sdk.core.sdk_headers.detect_framework") as detect:
+            self.assertIs(self.headers.get(), later)
+        detect.assert_not_called()
+
+    def test_configure_overrides(self):
+        self.headers.configure(framework="Django")
+        self.assertEqual(self.headers.tracking_header, f"Python-Django/{__version__}/{PYTHON_VERSION}/python")
+        self.headers.configure(headers={"Kinde-SDK": "Custom/1.0", "X-App": "billing"})
+        self.assertEqual(dict(self.headers.get()), {"Kinde-SDK": "Custom/1.0", "X-App": "billing"})
+        self.headers.configure(headers={"Kinde-SDK": None})
+        self.assertEqual(dict(self.headers.get()), {})
+        self.headers.reset()
+        self.assertEqual(self.headers.tracking_header, f"Python/{__version__}/{PYTHON_VERSION}/python")
+
+    def test_merge_keeps_request_headers(self):
+        merged = self.headers.merge({"Kinde-SDK": "Request/1.0", "Authorization": "Bearer t"})
+        self.assertEqual(merged, {"Kinde-SDK": "Request/1.0", "Authorization": "Bearer t"})
+        self.assertIn("Kinde-SDK", self.headers.merge(None))
+
+    def test_apply_to_api_client(self):
+        from kinde_sdk.management.api_client import ApiClient
+
+        client = ApiClient()
+        self.headers.apply_to(client)
+        self.assertEqual(client.default_headers["Kinde-SDK"], self.headers.tracking_header)
+
+
+class TestHeadersOnRequests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _EchoHandler.headers_seen = []
+        configure_sdk_headers(headers={"Kinde-SDK": "Test/1.0"})
+
+    def tearDown(self):
+        sdk_headers.reset()
+
+    def test_sync_client_sends_sdk_headers(self):
+        client = HttpClient()
+        client.get(self.url)
+        client.get(self.url, headers={"Kinde-SDK": "Explicit/1.0"})
+        client.close()
+        self.assertEqual([h["Kinde-SDK"] for h in _EchoHandler.headers_seen], ["Test/1.0", "Explicit/1.0"])
+
+    def test_async_client_sends_sdk_headers(self):
+        async def run():
+            await async_get(self.url)
+            await close_async_client()
+
+        asyncio.run(run())
+        self.assertEqual(_EchoHandler.headers_seen[0]["Kinde-SDK"], "Test/1.0")
+
+    def test_management_token_request_uses_shared_headers(self):
+        from kinde_sdk.management.management_token_manager import ManagementTokenManager
+
+        ManagementTokenManager.reset_instances()
+        manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
+        response = Mock()
+        response.json.return_value = {"access_token": "token", "expires_in": 3600}
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=response) as mock_post:
+            manager.request_new_token()
+        ManagementTokenManager.reset_instances()
+        self.assertEqual(mock_post.call_args[1]["headers"]["Kinde-SDK"], "Test/1.0")
+
+
+if __name__ == "__main__":
+    unittest.main()
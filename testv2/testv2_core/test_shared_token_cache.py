@@ -0,0 +1,234 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from kinde_sdk.core.shared_token_cache import FileTokenCache, SQLiteTokenCache
+from kinde_sdk.management.management_token_manager import ManagementTokenManager
+
+
+def _hold_lock(cache_factory, path, log_path, hold):
+    cache = cache_factory(path)
+    with cache.lock("m2m:key"):
+        with open(log_path, "a") as f:
+            f.write(f"start {time.time()}\n")
+        time.sleep(hold)
+        with open(log_path, "a") as f:
+            f.write(f"end {time.time()}\n")
+
+
+class _SharedTokenCacheTests:
+    """Tests run against each SharedTokenCache implementation."""
+
+    def make_cache(self, path):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "tokens")
+        self.cache = self.make_cache(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_get_set_delete(self):
+        token = {"access_token": "abc", "expires_at": 123.5, "token_type": "Bearer"}
+        self.assertIsNone(self.cache.get("m2m:key"))
+        self.cache.set("m2m:key", token)
+        self.assertEqual(self.cache.get("m2m:key"), token)
+        self.assertIsNone(self.cache.get("m2m:other"))
+        self.assertEqual(self.make_cache(self.path).get("m2m:key"), token)
+        self.cache.delete("m2m:key")
+        self.assertIsNone(self.cache.get("m2m:key"))
+        self.cache.delete("m2m:key")
+
+    def test_lock_excludes_threads(self):
+        inside = []
+        overlaps = []
+
+        def worker():
+            with self.cache.lock("m2m:key"):
+                if inside:
+                    overlaps.append(True)
+                inside.append(True)
+                time.sleep(0.02)
+                inside.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(overlaps, [])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_lock_excludes_processes(self):
+        log_path = os.path.join(self.tmp.name, "log")
+        ctx = multiprocessing.get_context("fork")
+        processes = [
+            ctx.Process(target=_hold_lock, args=(type(self).make_cache_factory(), self.path, log_path, 0.1))
+            for _ in range(3)
+        ]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join(10)
+            self.assertEqual(p.exitcode, 0)
+
+        with open(log_path) as f:
+            events = [line.split() for line in f]
+        # Critical sections never interleave: start/end pairs alternate
+        self.assertEqual([e[0] for e in events], ["start", "end"] * 3)
+
+    def test_lock_timeout_runs_without_lock(self):
+        held = threading.Event()
+        release = threading.Event()
+
+        def holder():
+            with self.cache.lock("m2m:key"):
+                held.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        held.wait(5)
+        start = time.monotonic()
+        with self.cache.lock("m2m:key", timeout=0.1):
+            pass
+        self.assertLess(time.monotonic() - start, 2)
+        release.set()
+        thread.join()
+
+
+class TestFileTokenCache(_SharedTokenCacheTests, unittest.TestCase):
+    @staticmethod
+    def make_cache_factory():
+        return FileTokenCache
+
+    def make_cache(self, path):
+        return FileTokenCache(path)
+
+    def test_files_are_private(self):
+        self.cache.set("m2m:key", {"access_token": "abc", "expires_at": 1})
+        for name in os.listdir(self.path):
+            self.assertEqual(os.stat(os.path.join(self.path, name)).st_mode & 0o077, 0)
+
+
+class TestSQLiteTokenCache(_SharedTokenCacheTests, unittest.TestCase):
+    @staticmethod
+    def make_cache_factory():
+        return SQLiteTokenCache
+
+    def make_cache(self, path):
+        return SQLiteTokenCache(path)
+
+    def test_expired_lease_is_released(self):
+        cache = SQLiteTokenCache(self.path, lease=0)
+        self.assertTrue(cache._try_lock("m2m:key", "dead-process"))
+        time.sleep(0.01)
+        with cache.lock("m2m:key", timeout=1):
+            owner = cache._connect().execute("SELECT owner FROM locks").fetchone()[0]
+            self.assertNotEqual(owner, "dead-process")
+
+
+def _token_response(token="shared_token", expires_in=3600):
+    response = Mock()
+    response.json.return_value = {"access_token": token, "expires_in": expires_in, "token_type": "Bearer"}
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestManagementTokenManagerSharedCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = FileTokenCache(self.tmp.name)
+        ManagementTokenManager.reset_instances()
+        ManagementTokenManager.enable_shared_cache(self.cache)
+
+    def tearDown(self):
+        ManagementTokenManager.disable_shared_cache()
+        ManagementTokenManager.reset_instances()
+        self.tmp.cleanup()
+
+    def _new_process_manager(self):
+        """A manager as a freshly started worker process would create it."""
+        ManagementTokenManager.reset_instances()
+        return ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
+
+    @patch("kinde_sdk.core.http_client.http_client.post")
+    def test_workers_reuse_the_shared_token(self, mock_post):
+        mock_post.return_value = _token_response()
+        tokens = [self._new_process_manager().get_access_token() for _ in range(5)]
+        self.assertEqual(tokens, ["shared_token"] * 5)
+        mock_post.assert_called_once()
+
+    @patch("kinde_sdk.core.http_client.http_client.post")
+    def test_concurrent_renewal_requests_one_token(self, mock_post):
+        def slow_post(*args, **kwargs):
+            time.sleep(0.1)
+            return _token_response()
+
+        mock_post.side_effect = slow_post
+        managers = [self._new_process_manager() for _ in range(6)]
+        results = []
+        threads = [threading.Thread(target=lambda m=m: results.append(m.get_access_token())) for m in managers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, ["shared_token"] * 6)
+        mock_post.assert_called_once()
+
+    @patch("kinde_sdk.core.http_client.http_client.post")
+    def test_expiring_shared_token_is_renewed(self, mock_post):
+        self.cache.set("m2m:test.kinde.com:client_id", {
+            "access_token": "old_token",
+            "expires_at": time.time() + ManagementTokenManager.EXPIRY_BUFFER - 1,
+        })
+        mock_post.return_value = _token_response("new_token")
+        self.assertEqual(self._new_process_manager().get_access_token(), "new_token")
+        self.assertEqual(self.cache.get("m2m:test.kinde.com:client_id")["access_token"], "new_token")
+
+    @patch("kinde_sdk.core.http_client.http_client.post")
+    def test_background_refresh_adopts_a_newer_shared_token(self, mock_post):
+        mock_post.return_value = _token_response("first_token")
+        manager = self._new_process_manager()
+        manager.get_access_token()
+        self.cache.set("m2m:test.kinde.com:client_id", {
+            "access_token": "renewed_elsewhere",
+            "expires_at": time.time() + 7200,
+        })
+        manager._background_refresh()
+        self.assertEqual(manager.get_access_token(), "renewed_elsewhere")
+        mock_post.assert_called_once()
+
+    @patch("kinde_sdk.core.http_client.http_client.post")
+    def test_introspected_tokens_are_not_shared(self, mock_post):
+        manager = self._new_process_manager()
+        manager.set_tokens({"access_token": "user_bearer_token", "expires_in": 3600})
+        self.assertIsNone(self.cache.get("m2m:test.kinde.com:client_id"))
+
+    @patch("kinde_sdk.core.http_client.http_client.post")
+    def test_clear_tokens_clears_the_shared_token(self, mock_post):
+        mock_post.return_value = _token_response()
+        manager = self._new_process_manager()
+        manager.get_access_token()
+        manager.clear_tokens()
+        self.assertIsNone(self.cache.get("m2m:test.kinde.com:client_id"))
+
+    def test_unreadable_cache_falls_back_to_requesting(self):
+        broken = Mock()
+        broken.get.side_effect = OSError("disk gone")
+        broken.lock.return_value.__enter__ = Mock(return_value=None)
+        broken.lock.return_value.__exit__ = Mock(return_value=False)
+        ManagementTokenManager.enable_shared_cache(broken)
+        with patch("kinde_sdk.core.http_client.http_client.post", return_value=_token_response()) as mock_post:
+            self.assertEqual(self._new_process_manager().get_access_token(), "shared_token")
+        mock_post.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from kinde_sdk.core.storage import StorageFactory, StorageManager
+from kinde_sdk.core.storage.sqlite_storage import SQLiteStorage, _prefix_upper_bound
+
+
+def _write_from_child(path, key):
+    storage = SQLiteStorage(path)
+    storage.set(key, {"pid": os.getpid()})
+    storage.close()
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sessions.db")
+        self.storage = SQLiteStorage(self.path)
+
+    def tearDown(self):
+        self.storage.close()
+        self.tmp.cleanup()
+
+    def test_get_set_delete(self):
+        self.assertIsNone(self.storage.get("missing"))
+        self.storage.set("user_1", {"user_info": {"email": "a@b.c"}})
+        self.assertEqual(self.storage.get("user_1"), {"user_info": {"email": "a@b.c"}})
+        self.storage.set("user_1", {"user_info": {"email": "d@e.f"}})
+        self.assertEqual(self.storage.get("user_1"), {"user_info": {"email": "d@e.f"}})
+        self.storage.delete("user_1")
+        self.assertIsNone(self.storage.get("user_1"))
+
+    def test_set_flat(self):
+        self.storage.set_flat("access_token")
+        self.assertEqual(self.storage.get("_flat_data"), "access_token")
+
+    def test_wal_mode(self):
+        mode = self.storage._connection().execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_persists_across_instances(self):
+        self.storage.set("user_1", {"v": 1})
+        self.storage.close()
+        self.storage = SQLiteStorage(self.path)
+        self.assertEqual(self.storage.get("user_1"), {"v": 1})
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_shared_between_processes(self):
+        ctx = multiprocessing.get_context("fork")
+        processes = [ctx.Process(target=_write_from_child, args=(self.path, f"worker_{i}")) for i in range(4)]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join(10)
+            self.assertEqual(p.exitcode, 0)
+        values = self.storage.get_many([f"worker_{i}" for i in range(4)])
+        self.assertEqual({v["pid"] for v in values.values()}, {p.pid for p in processes})
+
+    def test_concurrent_threads(self):
+        def worker(n):
+            for i in range(25):
+                self.storage.set(f"w{n}:{i}", {"i": i})
+                self.assertEqual(self.storage.get(f"w{n}:{i}"), {"i": i})
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(self.storage.get_many([f"w{n}:{i}" for n in range(6) for i in range(25)])), 150)
+
+    def test_get_many_and_set_many(self):
+        items = {f"user_{i}": {"i": i} for i in range(1200)}
+        self.storage.set_many(items)
+        result = self.storage.get_many(list(items) + ["missing"])
+        self.assertEqual(result, {**items, "missing": None})
+        self.assertEqual(self.storage.get_many([]), {})
+
+    def test_delete_many(self):
+        self.storage.set_many({f"user_{i}": {"i": i} for i in range(1200)})
+        self.storage.delete_many([f"user_{i}" for i in range(1100)])
+        count = self.storage._connection().execute("SELECT COUNT(*) FROM kinde_storage").fetchone()[0]
+        self.assertEqual(count, 100)
+
+    def test_entries_expire_with_their_tokens(self):
+        self.storage.set("expired", {"tokens": {"access_token": "a", "expires_at": time.time() - 1}})
+        self.storage.set("valid", {"tokens": {"access_token": "a", "expires_at": time.time() + 60}})
+        self.storage.set("refreshable", {"tokens": {"refresh_token": "r", "expires_at": time.time() - 1}})
+        self.storage.set("plain", {"value": 1})
+        self.assertIsNone(self.storage.get("expired"))
+        self.assertIsNone(self.storage.get_many(["expired"])["expired"])
+        self.assertIsNotNone(self.storage.get("valid"))
+        self.assertIsNotNone(self.storage.get("refreshable"))
+        self.assertIsNotNone(self.storage.get("plain"))
+        self.assertEqual(self.storage.purge_expired(), 1)
+
+    def test_purge_and_prefix_delete_use_indexes(self):
+        conn = self.storage._connection()
+        purge_plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN DELETE FROM kinde_storage WHERE expires_at <= ?", (0,)))
+        self.assertIn("kinde_storage_expires_at", purge_plan)
+        prefix_plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN DELETE FROM kinde_storage WHERE key >= ? AND key < ?", ("a", "b")))
+        self.assertIn("INDEX", prefix_plan)
+
+    def test_automatic_purge_on_write(self):
+        storage = SQLiteStorage(self.path, purge_interval=0)
+        storage.set("expired", {"tokens": {"access_token": "a", "expires_at": time.time() - 1}})
+        storage.set("other", {"v": 1})
+        count = storage._connection().execute("SELECT COUNT(*) FROM kinde_storage").fetchone()[0]
+        self.assertEqual(count, 1)
+        storage.close()
+
+    def test_delete_prefix(self):
+        self.storage.set_many({
+            "device:abc:user_1": {},
+            "device:abc:user_2": {},
+            "device:abc": {},
+            "device:abd:user_1": {},
+            "device:ab%:user_1": {},
+        })
+        self.storage.delete_prefix("device:abc:")
+        remaining = self.storage.get_many(["device:abc:user_1", "device:abc:user_2", "device:abc",
+                                           "device:abd:user_1", "device:ab%:user_1"])
+        self.assertEqual([k for k, v in remaining.items() if v is not None],
+                         ["device:abc", "device:abd:user_1", "device:ab%:user_1"])
+
+    def test_prefix_upper_bound(self):
+        self.assertEqual(_prefix_upper_bound("device:"), "device;")
+        self.assertIsNone(_prefix_upper_bound(""))
+        self.assertEqual(_prefix_upper_bound("a\U0010FFFF"), "b")
+
+    def test_rejects_invalid_table_name(self):
+        with self.assertRaises(ValueError):
+            SQLiteStorage(self.path, table="x; DROP TABLE y")
+
+    def test_storage_factory(self):
+        storage = StorageFactory.create_storage({"type": "sqlite", "path": self.path, "options": {"default_ttl": 60}})
+        self.assertIsInstance(storage, SQLiteStorage)
+        self.assertEqual(storage.default_ttl, 60)
+        storage.close()
+
+    def test_clear_device_data(self):
+        manager = StorageManager()
+        try:
+            manager.initialize(storage=self.storage, device_id="device_1")
+            manager.setItems("user_1", {"v": 1})
+            self.storage.set("device:device_2:user_1", {"v": 2})
+            manager.clear_device_data()
+            self.assertIsNone(manager.get("user_1"))
+            self.assertEqual(self.storage.get("device:device_2:user_1"), {"v": 2})
+        finally:
+            manager.initialize({"type": "memory"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import patch
+
+from kinde_sdk.core.storage.local_storage import LocalStorage
+from kinde_sdk.core.storage.memory_storage import MemoryStorage
+from kinde_sdk.core.storage.storage_interface import StorageInterface
+from kinde_sdk.core.storage.storage_manager import StorageManager
+
+
+class CountingStorage(StorageInterface):
+    """Storage implementing only the required single-key methods."""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = []
+
+    def get(self, key):
+        self.calls.append(("get", key))
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.calls.append(("set", key))
+        self.data[key] = value
+
+    def set_flat(self, value):
+        self.data["_flat_data"] = value
+
+    def delete(self, key):
+        self.calls.append(("delete", key))
+        self.data.pop(key, None)
+
+
+class LegacyPrefixStorage(CountingStorage):
+    """Storage written before delete_prefix existed."""
+
+    def clear_prefix(self, prefix):
+        for key in [k for k in self.data if k.startswith(prefix)]:
+            del self.data[key]
+
+
+class DictBackedStorage(CountingStorage):
+    """Storage keeping its data in a ``_storage`` dict, without prefix methods."""
+
+    def __init__(self):
+        super().__init__()
+        self._storage = self.data
+
+
+class TestStorageInterfaceDefaults(unittest.TestCase):
+    def test_batch_defaults_use_single_key_methods(self):
+        storage = CountingStorage()
+        storage.set_many({"a": {"v": 1}, "b": {"v": 2}})
+        self.assertEqual(storage.get_many(["a", "b", "c"]), {"a": {"v": 1}, "b": {"v": 2}, "c": None})
+        storage.delete_many(["a", "c"])
+        self.assertEqual(storage.data, {"b": {"v": 2}})
+        self.assertEqual(
+            storage.calls,
+            [("set", "a"), ("set", "b"), ("get", "a"), ("get", "b"), ("get", "c"), ("delete", "a"), ("delete", "c")],
+        )
+
+    def test_delete_prefix_not_supported_by_default(self):
+        with self.assertRaises(NotImplementedError):
+            CountingStorage().delete_prefix("device:")
+
+    def test_delete_prefix_uses_legacy_clear_prefix(self):
+        storage = LegacyPrefixStorage()
+        storage.set_many({"device:1:a": {}, "device:2:a": {}})
+        storage.delete_prefix("device:1:")
+        self.assertEqual(list(storage.data), ["device:2:a"])
+
+    def test_delete_prefix_scans_storage_dict(self):
+        storage = DictBackedStorage()
+        storage.set_many({"device:1:a": {}, "device:1:b": {}, "device:10:a": {}})
+        storage.calls.clear()
+        storage.delete_prefix("device:1:")
+        self.assertEqual(list(storage.data), ["device:10:a"])
+        self.assertCountEqual(storage.calls, [("delete", "device:1:a"), ("delete", "device:1:b")])
+
+    def test_builtin_storages_delete_prefix(self):
+        for storage in (MemoryStorage(), LocalStorage()):
+            storage.set_many({"device:1:a": {}, "device:1:b": {}, "device:10:a": {}, "user:state": {}})
+            storage.delete_prefix("device:1:")
+            remaining = storage.get_many(["device:1:a", "device:1:b", "device:10:a", "user:state"])
+            self.assertEqual([k for k, v in remaining.items() if v is not None], ["device:10:a", "user:state"])
+
+
+class TestStorageManagerBatchOps(unittest.TestCase):
+    def setUp(self):
+        self.storage = CountingStorage()
+        self.manager = StorageManager()
+        self.manager.initialize(storage=self.storage, device_id="device_1")
+
+    def tearDown(self):
+        self.manager.initialize({"type": "memory"})
+
+    def test_keys_are_namespaced(self):
+        self.manager.set_many({"user_1": {"v": 1}, "user:state": {"value": "s"}})
+        self.assertIn("device:device_1:user_1", self.storage.data)
+        self.assertIn("user:state", self.storage.data)
+        self.assertEqual(
+            self.manager.get_many(["user_1", "user:state", "missing"]),
+            {"user_1": {"v": 1}, "user:state": {"value": "s"}, "missing": None},
+        )
+        self.manager.delete_many(["user_1", "user:state"])
+        self.assertEqual(self.manager.get_many(["user_1", "user:state"]), {"user_1": None, "user:state": None})
+
+    def test_clear_device_data_uses_delete_prefix(self):
+        storage = MemoryStorage()
+        self.manager.initialize(storage=storage, device_id="device_1")
+        self.manager.set_many({"user_1": {"v": 1}, "user_2": {"v": 2}})
+        storage.set("device:device_2:user_1", {"v": 3})
+        with patch.object(storage, "delete_prefix", wraps=storage.delete_prefix) as delete_prefix:
+            self.manager.clear_device_data()
+        delete_prefix.assert_called_once_with("device:device_1:")
+        self.assertEqual(self.manager.get_many(["user_1", "user_2"]), {"user_1": None, "user_2": None})
+        self.assertEqual(storage.get("device:device_2:user_1"), {"v": 3})
+
+    def test_clear_device_data_without_prefix_support(self):
+        self.manager.setItems("user_1", {"v": 1})
+        with self.assertLogs("kinde_sdk.core.storage.storage_manager", level="WARNING"):
+            self.manager.clear_device_data()
+        self.assertEqual(self.manager.get("user_1"), {"v": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch, Mock
+
+from kinde_sdk.auth.token_manager import TokenManager
+from kinde_sdk.core.verified_token_cache import VerifiedTokenCache, verified_token_cache
+from kinde_sdk.management.management_token_manager import ManagementTokenManager
+
+
+class TestVerifiedTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = VerifiedTokenCache(max_size=3, ttl=60)
+
+    def test_set_and_get(self):
+        claims = {"sub": "user", "exp": time.time() + 600}
+        self.cache.set("token", claims)
+        self.assertEqual(self.cache.get("token"), claims)
+        self.assertIsNone(self.cache.get("other"))
+
+    def test_tokens_are_stored_by_hash(self):
+        self.cache.set("raw-token-value", {"exp": time.time() + 600})
+        self.assertNotIn("raw-token-value", self.cache._entries)
+
+    def test_entry_never_outlives_exp(self):
+        now = time.time()
+        self.cache.set("token", {"exp": now + 5})
+        with patch("kinde_sdk.core.verified_token_cache.time.time", return_value=now + 6):
+            self.assertIsNone(self.cache.get("token"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_entry_expires_after_ttl(self):
+        now = time.time()
+        self.cache.set("token", {"exp": now + 600})
+        with patch("kinde_sdk.core.verified_token_cache.time.time", return_value=now + 61):
+            self.assertIsNone(self.cache.get("token"))
+
+    def test_expired_token_not_cached(self):
+        self.cache.set("token", {"exp": time.time() - 1})
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru_eviction(self):
+        exp = time.time() + 600
+        for name in ("a", "b", "c"):
+            self.cache.set(name, {"exp": exp})
+        # Touch "a" so "b" becomes the least recently used
+        self.cache.get("a")
+        self.cache.set("d", {"exp": exp})
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNotNone(self.cache.get("d"))
+
+    def test_context_mismatch_is_a_miss(self):
+        self.cache.set("token", {"exp": time.time() + 600}, context="jwks|a")
+        self.assertIsNone(self.cache.get("token", context="jwks|b"))
+        self.assertIsNotNone(self.cache.get("token", context="jwks|a"))
+
+    def test_invalidate_and_clear(self):
+        exp = time.time() + 600
+        self.cache.set("a", {"exp": exp})
+        self.cache.set("b", {"exp": exp})
+        self.cache.invalidate("a")
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_concurrent_access(self):
+        cache = VerifiedTokenCache(max_size=50)
+        exp = time.time() + 600
+
+        def worker(n):
+            for i in range(200):
+                cache.set(f"token-{n}-{i}", {"exp": exp})
+                cache.get(f"token-{n}-{i}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertLessEqual(len(cache), 50)
+
+
+class TestVerifiedTokenCacheIntegration(unittest.TestCase):
+    def setUp(self):
+        verified_token_cache.clear()
+        TokenManager.reset_instances()
+        ManagementTokenManager.reset_instances()
+
+    def tearDown(self):
+        verified_token_cache.clear()
+        TokenManager.reset_instances()
+        ManagementTokenManager.reset_instances()
+
+    def test_revoke_token_evicts_cached_claims(self):
+        manager = TokenManager("user", "client_id", None, "https://example.com/oauth2/token")
+        manager.tokens = {"access_token": "access"}
+        verified_token_cache.set("access", {"exp": time.time() + 600})
+
+        with patch("kinde_sdk.core.http_client.http_client.post"):
+            manager.revoke_token()
+
+        self.assertIsNone(verified_token_cache.get("access"))
+
+    @patch("kinde_sdk.core.http_client.http_client.post")
+    def test_introspection_result_is_cached(self, mock_post):
+        manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
+
+        token_response = Mock()
+        token_response.json.return_value = {"access_token": "management_token", "expires_in": 3600}
+        introspection_response = Mock()
+        introspection_response.json.return_value = {"active": True, "exp": int(time.time()) + 600, "sub": "user"}
+        mock_post.side_effect = [token_response, introspection_response]
+
+        first = manager.validate_and_set_via_introspection("bearer")
+        second = manager.validate_and_set_via_introspection("bearer")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(manager.tokens["access_token"], "bearer")
+
+    @patch("kinde_sdk.core.http_client.http_client.post")
+    def test_inactive_introspection_result_is_not_cached(self, mock_post):
+        manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
+
+        token_response = Mock()
+        token_response.json.return_value = {"access_token": "management_token", "expires_in": 3600}
+        introspection_response = Mock()
+        introspection_response.json.return_value = {"active": False}
+        mock_post.side_effect = [token_response, introspection_response]
+
+        with self.assertRaises(ValueError):
+            manager.validate_and_set_via_introspection("bearer")
+        self.assertIsNone(verified_token_cache.get("bearer", "introspection|test.kinde.com"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,7 +11,7 @@ def run_async(coro):
     return asyncio.run(coro)
 
 class TestExpectedLogin(unittest.TestCase):
-    @patch('requests.get')
+    @patch('kinde_sdk.core.http_client.http_client.get')
     def setUp(self, mock_get):
         """Set up test fixtures."""
         # Mock the OpenID configuration response
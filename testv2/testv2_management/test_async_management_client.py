@@ -0,0 +1,182 @@
+"""
+Tests for AsyncManagementClient and async M2M token acquisition.
+
+Requests are served by an httpx.MockTransport, so the generated serialization
+and deserialization code runs unmodified.
+"""
+
+import asyncio
+import json
+import time
+import unittest
+
+import httpx
+
+from kinde_sdk.core.async_http import set_async_client
+from kinde_sdk.management import AsyncManagementClient
+from kinde_sdk.management.exceptions import NotFoundException
+from kinde_sdk.management.management_client import ManagementClient
+from kinde_sdk.management.management_token_manager import ManagementTokenManager
+from kinde_sdk.management.models.users_response import UsersResponse
+
+
+class TestAsyncManagementClient(unittest.TestCase):
+    def setUp(self):
+        ManagementTokenManager.reset_instances()
+        self.requests_seen = []
+        self.token_requests = 0
+        self.routes = {}
+
+        def handler(request):
+            if request.url.path == "/oauth2/token":
+                self.token_requests += 1
+                return httpx.Response(200, json={"access_token": "m2m_token", "expires_in": 3600})
+            self.requests_seen.append(request)
+            status, body = self.routes.get((request.method, request.url.path), (404, {"errors": []}))
+            return httpx.Response(status, json=body)
+
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        self.client = AsyncManagementClient("test.kinde.com", "client_id", "client_secret")
+
+    def tearDown(self):
+        set_async_client(None)
+        ManagementTokenManager.reset_instances()
+
+    def test_same_api_attributes_as_sync_client(self):
+        sync_client = ManagementClient("test.kinde.com", "client_id", "client_secret")
+        sync_apis = {name for name in vars(sync_client) if name.endswith("_api")}
+        async_apis = {name for name in vars(self.client) if name.endswith("_api")}
+        self.assertEqual(sync_apis, async_apis)
+
+    def test_methods_are_coroutine_functions(self):
+        self.assertTrue(asyncio.iscoroutinefunction(self.client.users_api.get_users))
+        with self.assertRaises(AttributeError):
+            self.client.users_api.not_a_method
+
+    def test_get_deserializes_response(self):
+        self.routes[("GET", "/api/v1/users")] = (200, {
+            "code": "OK",
+            "users": [{"id": "kp_1", "email": "user@example.com"}],
+            "next_token": "next",
+        })
+
+        result = asyncio.run(self.client.users_api.get_users(page_size=5))
+
+        self.assertIsInstance(result, UsersResponse)
+        self.assertEqual(result.users[0].id, "kp_1")
+        self.assertEqual(result.next_token, "next")
+        request = self.requests_seen[0]
+        self.assertEqual(request.url.params["page_size"], "5")
+        self.assertEqual(request.headers["Authorization"], "Bearer m2m_token")
+
+    def test_post_sends_json_body(self):
+        self.routes[("POST", "/api/v1/organization")] = (200, {"code": "OK", "organization": {"code": "org_1"}})
+
+        result = asyncio.run(self.client.organizations_api.create_organization(
+            create_organization_request={"name": "Acme"}
+        ))
+
+        self.assertEqual(result.organization.code, "org_1")
+        self.assertEqual(json.loads(self.requests_seen[0].content), {"name": "Acme"})
+
+    def test_iter_users(self):
+        pages = {
+            None: {"users": [{"id": "kp_1"}, {"id": "kp_2"}], "next_token": "page_2"},
+            "page_2": {"users": [{"id": "kp_3"}]},
+        }
+
+        def handler(request):
+            if request.url.path == "/oauth2/token":
+                return httpx.Response(200, json={"access_token": "m2m_token", "expires_in": 3600})
+            return httpx.Response(200, json=pages[request.url.params.get("next_token")])
+
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        async def collect():
+            return [user.id async for user in self.client.iter_users(page_size=2, prefetch=True)]
+
+        self.assertEqual(asyncio.run(collect()), ["kp_1", "kp_2", "kp_3"])
+
+    def test_with_http_info(self):
+        self.routes[("GET", "/api/v1/users")] = (200, {"code": "OK", "users": []})
+        response = asyncio.run(self.client.users_api.get_users_with_http_info())
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.data, UsersResponse)
+
+    def test_without_preload_content(self):
+        self.routes[("GET", "/api/v1/users")] = (200, {"code": "OK"})
+        response = asyncio.run(self.client.users_api.get_users_without_preload_content())
+        self.assertIsInstance(response, httpx.Response)
+        self.assertEqual(response.json(), {"code": "OK"})
+
+    def test_error_status_raises_api_exception(self):
+        with self.assertRaises(NotFoundException):
+            asyncio.run(self.client.users_api.get_user_data(id="missing"))
+
+    def test_transport_error_raises_api_exception(self):
+        def refused(request):
+            if request.url.path == "/oauth2/token":
+                return httpx.Response(200, json={"access_token": "m2m_token", "expires_in": 3600})
+            raise httpx.ConnectError("refused", request=request)
+
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(refused)))
+        with self.assertRaises(Exception) as context:
+            asyncio.run(self.client.users_api.get_users())
+        self.assertEqual(context.exception.status, 0)
+
+    def test_validation_happens_before_request(self):
+        with self.assertRaises(Exception):
+            asyncio.run(self.client.users_api.get_users(page_size="not a number"))
+        self.assertEqual(self.requests_seen, [])
+        self.assertEqual(self.token_requests, 0)
+
+
+class TestAsyncManagementToken(unittest.TestCase):
+    def setUp(self):
+        ManagementTokenManager.reset_instances()
+        self.token_requests = []
+
+        async def handler(request):
+            self.token_requests.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"access_token": f"token_{len(self.token_requests)}", "expires_in": 3600})
+
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        self.manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
+
+    def tearDown(self):
+        set_async_client(None)
+        ManagementTokenManager.reset_instances()
+
+    def test_concurrent_callers_share_one_request(self):
+        async def get_tokens():
+            return await asyncio.gather(*(self.manager.get_access_token_async() for _ in range(10)))
+
+        tokens = asyncio.run(get_tokens())
+
+        self.assertEqual(tokens, ["token_1"] * 10)
+        self.assertEqual(len(self.token_requests), 1)
+        body = self.token_requests[0].content.decode()
+        self.assertIn("grant_type=client_credentials", body)
+        self.assertIn("Kinde-SDK", self.token_requests[0].headers)
+
+    def test_cached_token_is_reused(self):
+        self.manager.set_tokens({"access_token": "cached", "expires_in": 3600})
+        self.assertEqual(asyncio.run(self.manager.get_access_token_async()), "cached")
+        self.assertEqual(self.token_requests, [])
+
+    def test_expiring_token_is_replaced(self):
+        self.manager.tokens = {"access_token": "old", "expires_at": time.time() + 10}
+        self.assertEqual(asyncio.run(self.manager.get_access_token_async()), "token_1")
+
+    def test_failed_token_request(self):
+        set_async_client(httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(401, json={"error": "invalid_client"})
+        )))
+        with self.assertRaises(Exception) as context:
+            asyncio.run(self.manager.get_access_token_async())
+        self.assertIn("Token request failed for domain test.kinde.com", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+"""
+Tests for concurrent bulk Management API operations.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from email.utils import formatdate
+from types import SimpleNamespace
+
+from kinde_sdk.management.bulk import BulkExecutor, _retry_after
+from kinde_sdk.management.exceptions import ApiException, BadRequestException
+from kinde_sdk.management.management_client import ManagementClient
+from kinde_sdk.management.management_token_manager import ManagementTokenManager
+
+
+def _throttled(retry_after=None):
+    headers = {"Retry-After": str(retry_after)} if retry_after is not None else {}
+    http_resp = SimpleNamespace(status=429, reason="Too Many Requests", data=b"", headers=headers)
+    return ApiException(http_resp=http_resp)
+
+
+class _Recorder:
+    """Call target that records peak concurrency and fails on demand."""
+
+    def __init__(self, delay=0.01, failures=None):
+        self.delay = delay
+        self.failures = failures or {}
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    def _enter(self, item):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append((item, time.monotonic()))
+            pending = self.failures.get(item)
+            return pending.pop(0) if pending else None
+
+    def _exit(self):
+        with self.lock:
+            self.active -= 1
+
+    def __call__(self, item):
+        error = self._enter(item)
+        try:
+            time.sleep(self.delay)
+            if error is not None:
+                raise error
+            return item * 2
+        finally:
+            self._exit()
+
+    async def call_async(self, item):
+        error = self._enter(item)
+        try:
+            await asyncio.sleep(self.delay)
+            if error is not None:
+                raise error
+            return item * 2
+        finally:
+            self._exit()
+
+
+class TestRetryAfter(unittest.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(_retry_after(_throttled(3)), 3.0)
+
+    def test_http_date(self):
+        delay = _retry_after(_throttled(formatdate(time.time() + 5, usegmt=True)))
+        self.assertTrue(3 <= delay <= 5)
+
+    def test_missing_or_invalid(self):
+        self.assertIsNone(_retry_after(_throttled()))
+        self.assertIsNone(_retry_after(_throttled("soon")))
+        self.assertIsNone(_retry_after(ValueError("no headers")))
+
+
+class TestBulkExecutor(unittest.TestCase):
+
+    def test_results_in_input_order(self):
+        recorder = _Recorder()
+        result = BulkExecutor(max_concurrency=4).run(recorder, range(20))
+
+        self.assertEqual(len(result), 20)
+        self.assertEqual([r.result for r in result], [n * 2 for n in range(20)])
+        self.assertEqual(result.failed, [])
+
+    def test_concurrency_is_bounded(self):
+        recorder = _Recorder(delay=0.03)
+        BulkExecutor(max_concurrency=3).run(recorder, range(12))
+
+        self.assertGreater(recorder.peak, 1)
+        self.assertLessEqual(recorder.peak, 3)
+
+    def test_failure_does_not_abort_run(self):
+        recorder = _Recorder(failures={2: [BadRequestException(status=400, reason="Bad Request")]})
+        result = BulkExecutor(max_concurrency=2).run(recorder, range(5))
+
+        self.assertEqual(len(result.succeeded), 4)
+        self.assertEqual(len(result.failed), 1)
+        failure = result.failed[0]
+        self.assertEqual(failure.item, 2)
+        self.assertEqual(failure.attempts, 1)
+        self.assertIsInstance(failure.error, BadRequestException)
+
+    def test_429_is_retried_after_retry_after(self):
+        recorder = _Recorder(delay=0, failures={0: [_throttled(0.2)]})
+        result = BulkExecutor(max_concurrency=1).run(recorder, [0])
+
+        self.assertTrue(result.results[0].succeeded)
+        self.assertEqual(result.results[0].attempts, 2)
+        first, second = [t for item, t in recorder.calls if item == 0]
+        self.assertGreaterEqual(second - first, 0.15)
+
+    def test_429_pauses_all_workers_and_reduces_concurrency(self):
+        recorder = _Recorder(delay=0.02, failures={0: [_throttled(0.2)]})
+        result = BulkExecutor(max_concurrency=4).run(recorder, range(12))
+
+        self.assertEqual(result.failed, [])
+        # Item 0 is throttled 0.02s after the first calls start; no call starts during the pause
+        started = recorder.calls[0][1]
+        offsets = [t - started for item, t in recorder.calls]
+        self.assertFalse([o for o in offsets if 0.06 < o < 0.2])
+        self.assertGreaterEqual(max(offsets), 0.2)
+
+    def test_server_errors_are_not_retried_by_default(self):
+        recorder = _Recorder(delay=0, failures={1: [ApiException(status=503)]})
+        result = BulkExecutor(max_concurrency=2, base_delay=0.01).run(recorder, range(3))
+
+        self.assertEqual([r.index for r in result.failed], [1])
+        self.assertEqual(result.results[1].attempts, 1)
+        self.assertEqual([item for item, _ in recorder.calls].count(1), 1)
+
+    def test_server_errors_are_retried_with_backoff_when_enabled(self):
+        recorder = _Recorder(delay=0, failures={1: [ApiException(status=503), ApiException(status=502)]})
+        result = BulkExecutor(max_concurrency=2, base_delay=0.01, retry_server_errors=True).run(recorder, range(3))
+
+        self.assertEqual(result.failed, [])
+        self.assertEqual(result.results[1].attempts, 3)
+
+    def test_retries_are_limited(self):
+        recorder = _Recorder(delay=0, failures={0: [ApiException(status=503) for _ in range(5)]})
+        result = BulkExecutor(max_retries=2, base_delay=0.001, retry_server_errors=True).run(recorder, [0])
+
+        self.assertEqual(result.results[0].attempts, 3)
+        self.assertEqual(result.results[0].error.status, 503)
+
+    def test_on_result_callback(self):
+        seen = []
+        lock = threading.Lock()
+
+        def on_result(item_result):
+            with lock:
+                seen.append(item_result.index)
+
+        BulkExecutor(max_concurrency=3).run(_Recorder(delay=0), range(10), on_result=on_result)
+        self.assertEqual(sorted(seen), list(range(10)))
+
+    def test_generator_input(self):
+        result = BulkExecutor(max_concurrency=3).run(_Recorder(delay=0), (n for n in range(7)))
+        self.assertEqual([r.index for r in result], list(range(7)))
+
+    def test_on_result_error_is_raised(self):
+        recorder = _Recorder(delay=0)
+
+        def on_result(item_result):
+            if item_result.index == 2:
+                raise KeyError("callback failed")
+
+        with self.assertRaises(KeyError):
+            BulkExecutor(max_concurrency=1).run(recorder, range(10), on_result=on_result)
+        # No items are started after the error
+        self.assertEqual([item for item, _ in recorder.calls], [0, 1, 2])
+
+    def test_items_error_is_raised(self):
+        def items():
+            yield from range(5)
+            raise IOError("source failed")
+
+        recorder = _Recorder(delay=0)
+        with self.assertRaises(IOError):
+            BulkExecutor(max_concurrency=3).run(recorder, items())
+        self.assertEqual(sorted(item for item, _ in recorder.calls), list(range(5)))
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            BulkExecutor(max_concurrency=0)
+        with self.assertRaises(ValueError):
+            BulkExecutor(max_concurrency=2, min_concurrency=3)
+
+
+class TestAsyncBulkExecutor(unittest.TestCase):
+
+    def test_arun(self):
+        recorder = _Recorder(delay=0.01, failures={
+            3: [_throttled(0.05)],
+            5: [BadRequestException(status=400, reason="Bad Request")],
+        })
+        result = asyncio.run(BulkExecutor(max_concurrency=4).arun(recorder.call_async, range(10)))
+
+        self.assertEqual(len(result), 10)
+        self.assertLessEqual(recorder.peak, 4)
+        self.assertEqual([r.index for r in result.failed], [5])
+        self.assertEqual(result.results[3].attempts, 2)
+        self.assertEqual(result.results[9].result, 18)
+
+    def test_arun_raises_items_and_on_result_errors(self):
+        def items():
+            yield from range(3)
+            raise IOError("source failed")
+
+        with self.assertRaises(IOError):
+            asyncio.run(BulkExecutor(max_concurrency=2).arun(_Recorder(delay=0).call_async, items()))
+
+        def on_result(item_result):
+            raise KeyError("callback failed")
+
+        recorder = _Recorder(delay=0)
+        with self.assertRaises(KeyError):
+            asyncio.run(BulkExecutor(max_concurrency=2).arun(recorder.call_async, range(10), on_result=on_result))
+        self.assertEqual(len(recorder.calls), 2)
+
+
+class TestManagementClientRunBulk(unittest.TestCase):
+
+    def setUp(self):
+        ManagementTokenManager.reset_instances()
+        self.client = ManagementClient("test.kinde.com", "client_id", "client_secret")
+
+    def tearDown(self):
+        ManagementTokenManager.reset_instances()
+
+    def test_run_bulk(self):
+        result = self.client.run_bulk(_Recorder(delay=0), range(5), max_concurrency=2, max_retries=1)
+        self.assertEqual([r.result for r in result], [0, 2, 4, 6, 8])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,7 +50,7 @@ class TestManagementClientDeadlock(unittest.TestCase):
         Before fix: Would hang indefinitely on "with self.lock:" in set_tokens
         After fix: Completes quickly with RLock
         """
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             # Configure mock to return a valid token response
             mock_response = Mock()
             mock_response.json.return_value = {
@@ -91,7 +91,7 @@ class TestManagementClientDeadlock(unittest.TestCase):
         """
         Test that network timeouts are handled properly without hanging.
         """
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             # Simulate network timeout
             mock_post.side_effect = Timeout("Network timeout")
             
@@ -117,7 +117,7 @@ class TestManagementClientDeadlock(unittest.TestCase):
         Test that ManagementClient methods (get_users, get_api_applications) work
         without hanging - reproduces customer's exact usage pattern.
         """
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             # Configure token response
             mock_response = Mock()
             mock_response.json.return_value = {
@@ -184,7 +184,7 @@ class TestManagementClientDeadlock(unittest.TestCase):
         Test concurrent access to ManagementTokenManager from multiple threads
         to ensure no deadlock occurs under load.
         """
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             # Configure mock to return a valid token response
             mock_response = Mock()
             mock_response.json.return_value = {
@@ -240,7 +240,7 @@ class TestManagementClientDeadlock(unittest.TestCase):
         Test concurrent token refresh when multiple threads detect expired tokens.
         This scenario could cause deadlock if not handled properly with RLock.
         """
-        with patch('kinde_sdk.management.management_token_manager.requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             # Configure mock to return new token
             mock_response = Mock()
             mock_response.json.return_value = {
@@ -298,7 +298,7 @@ class TestManagementClientDeadlock(unittest.TestCase):
         Test the singleton pattern behavior with multiple threads
         creating ManagementTokenManager instances.
         """
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             # Configure mock
             mock_response = Mock()
             mock_response.json.return_value = {
@@ -342,7 +342,7 @@ class TestManagementClientDeadlock(unittest.TestCase):
         """
         Test to ensure locks are not held for unreasonably long periods.
         """
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             # Simulate a slow network request
             def slow_response(*args, **kwargs):
                 time.sleep(1)  # 1-second delay
@@ -376,7 +376,7 @@ class TestManagementClientDeadlock(unittest.TestCase):
         Regression test to ensure the deadlock fix doesn't break in the future.
         This test simulates the exact conditions that caused the original deadlock.
         """
-        with patch('requests.post') as mock_post:
+        with patch('kinde_sdk.core.http_client.http_client.post') as mock_post:
             mock_response = Mock()
             mock_response.json.return_value = {
                 "access_token": "regression_test_token",
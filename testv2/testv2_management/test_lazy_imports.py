@@ -0,0 +1,149 @@
+"""
+Tests for lazy loading of the generated management API classes and models.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+import kinde_sdk.management
+from kinde_sdk.management import api, models
+from kinde_sdk.management.management_client import ManagementClient
+from kinde_sdk.management.management_token_manager import ManagementTokenManager
+from _sdk_generator_utils import make_imports_lazy
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _loaded_modules_after(code):
+    """Run code in a fresh interpreter and return the kinde_sdk.management modules it loaded."""
+    script = code + textwrap.dedent("""
+        import json, sys
+        print(json.dumps(sorted(m for m in sys.modules if m.startswith("kinde_sdk.management."))))
+    """)
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestColdImport(unittest.TestCase):
+
+    def test_package_import_loads_no_models_or_apis(self):
+        loaded = _loaded_modules_after("import kinde_sdk.management")
+        self.assertFalse([m for m in loaded if m.startswith("kinde_sdk.management.models.")])
+        self.assertFalse([m for m in loaded if m.startswith("kinde_sdk.management.api.")])
+
+    def test_client_loads_only_the_apis_it_uses(self):
+        loaded = _loaded_modules_after(textwrap.dedent("""
+            from kinde_sdk.management import ManagementClient
+            client = ManagementClient("test.kinde.com", "client_id", "client_secret")
+            client.users_api
+        """))
+        self.assertEqual(
+            [m for m in loaded if m.startswith("kinde_sdk.management.api.")],
+            ["kinde_sdk.management.api.users_api"],
+        )
+        self.assertLess(len([m for m in loaded if m.startswith("kinde_sdk.management.models.")]), 50)
+
+
+class TestLazyAttributes(unittest.TestCase):
+
+    def test_every_export_resolves(self):
+        for name in kinde_sdk.management.__all__:
+            self.assertIsNotNone(getattr(kinde_sdk.management, name), name)
+        for name in models.__all__:
+            self.assertTrue(isinstance(getattr(models, name), type), name)
+
+    def test_same_object_from_every_path(self):
+        from kinde_sdk.management.api.users_api import UsersApi
+        from kinde_sdk.management.models.users_response import UsersResponse
+
+        self.assertIs(kinde_sdk.management.UsersApi, UsersApi)
+        self.assertIs(api.UsersApi, UsersApi)
+        self.assertIs(kinde_sdk.management.UsersResponse, UsersResponse)
+        self.assertIs(models.UsersResponse, UsersResponse)
+
+    def test_dir_lists_lazy_names(self):
+        self.assertIn("UsersApi", dir(api))
+        self.assertIn("UsersResponse", dir(models))
+        self.assertIn("UsersApi", dir(kinde_sdk.management))
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            models.NotAModel
+        with self.assertRaises(ImportError):
+            from kinde_sdk.management import NotAModel  # noqa: F401
+
+
+class TestClientApiAttributes(unittest.TestCase):
+
+    def setUp(self):
+        ManagementTokenManager.reset_instances()
+        self.client = ManagementClient("test.kinde.com", "client_id", "client_secret")
+
+    def tearDown(self):
+        ManagementTokenManager.reset_instances()
+
+    def test_api_created_once_on_first_access(self):
+        self.assertNotIn("users_api", vars(self.client))
+        users_api = self.client.users_api
+        self.assertIs(self.client.users_api, users_api)
+        self.assertIs(users_api.api_client, self.client.api_client)
+        self.assertIn("users_api", vars(self.client))
+
+    def test_dir_lists_api_attributes(self):
+        self.assertIn("feature_flags_api", dir(self.client))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            self.client.not_an_api
+
+
+class TestMakeImportsLazy(unittest.TestCase):
+
+    GENERATED = textwrap.dedent("""\
+        # coding: utf-8
+
+        # import models into model package
+        from json import JSONDecoder
+        from json import JSONEncoder as JSONEncoder
+        from collections import OrderedDict
+    """)
+
+    def _rewrite(self, text):
+        with tempfile.TemporaryDirectory() as tmp:
+            init_file = Path(tmp) / "__init__.py"
+            init_file.write_text(text, encoding="utf-8")
+            make_imports_lazy(init_file, "json")
+            first = init_file.read_text(encoding="utf-8")
+            make_imports_lazy(init_file, "json")
+            self.assertEqual(init_file.read_text(encoding="utf-8"), first)
+            return first
+
+    def test_rewrite(self):
+        rewritten = self._rewrite(self.GENERATED)
+        namespace = {"__name__": "generated"}
+        exec(compile(rewritten, "__init__.py", "exec"), namespace)
+
+        self.assertEqual(namespace["_LAZY_IMPORTS"], {"JSONDecoder": "json", "JSONEncoder": "json"})
+        self.assertNotIn("JSONDecoder", namespace)
+        self.assertIn("OrderedDict", namespace)
+        self.assertEqual(namespace["__all__"], ["JSONDecoder", "JSONEncoder", "OrderedDict"])
+        self.assertIn("    from json import JSONDecoder as JSONDecoder", rewritten)
+        self.assertNotIn("# import models into model package", rewritten)
+
+        import json as json_module
+        self.assertIs(namespace["__getattr__"]("JSONDecoder"), json_module.JSONDecoder)
+
+    def test_existing_all_is_kept(self):
+        rewritten = self._rewrite('__all__ = ["JSONDecoder"]\n' + self.GENERATED)
+        self.assertEqual(rewritten.count("__all__ ="), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
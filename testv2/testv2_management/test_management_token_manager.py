@@ -165,7 +165,7 @@ class TestManagementTokenManager:
     #     assert manager.tokens["access_token"] == "new_access_token"
     #     assert manager.tokens["expires_at"] == 2000 + 3600
 
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_request_new_token_success(self, mock_post):
         """Test successful token request with corrected 4-segment tracking header."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -216,7 +216,7 @@ class TestManagementTokenManager:
         assert manager.tokens["access_token"] == "new_access_token"
         assert manager.tokens["expires_at"] == 2000 + 3600
     
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_request_new_token_http_error(self, mock_post):
         """Test token request with HTTP error."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -234,7 +234,7 @@ class TestManagementTokenManager:
         assert "Token request failed for domain test.kinde.com" in str(exc_info.value)
         assert "401 Unauthorized" in str(exc_info.value)
     
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_get_access_token_with_valid_token(self, mock_post):
         """Test getting access token when valid token exists."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -438,7 +438,7 @@ class TestManagementTokenManager:
             assert result.startswith("new_token_")
 
     # Tests for validate_and_set_via_introspection function
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_validate_and_set_via_introspection_success(self, mock_post):
         """Test successful token introspection and validation."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -492,7 +492,7 @@ class TestManagementTokenManager:
         # Check expires_at instead of expires_in (set_tokens stores absolute timestamp)
         assert manager.tokens["expires_at"] == 1000 + 1800  # current_time + expires_in
 
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_validate_and_set_via_introspection_inactive_token(self, mock_post):
         """Test introspection with inactive token."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -520,7 +520,7 @@ class TestManagementTokenManager:
         with pytest.raises(ValueError, match="Token is inactive or invalid"):
             manager.validate_and_set_via_introspection(bearer_token)
 
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_validate_and_set_via_introspection_no_exp_claim(self, mock_post):
         """Test introspection with token that has no exp claim."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -593,7 +593,7 @@ class TestManagementTokenManager:
                 return mock_introspection_response
             raise RuntimeError(f"Unexpected URL: {url}")
         
-        with patch('kinde_sdk.management.management_token_manager.requests.post', side_effect=post_side_effect):
+        with patch('kinde_sdk.core.http_client.http_client.post', side_effect=post_side_effect):
             with patch('kinde_sdk.management.management_token_manager.time.time', return_value=1000):
                 result = manager.validate_and_set_via_introspection(bearer_token)
         
@@ -602,7 +602,7 @@ class TestManagementTokenManager:
         assert manager.tokens["access_token"] == bearer_token
         assert manager.tokens["expires_at"] == 1000  # current_time + max(0, expired_time - current_time)
 
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_validate_and_set_via_introspection_timeout(self, mock_post):
         """Test introspection timeout handling."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -626,7 +626,7 @@ class TestManagementTokenManager:
         with pytest.raises(Exception, match=f"Introspection request timed out after 30 seconds for domain {manager.domain}"):
             manager.validate_and_set_via_introspection(bearer_token)
 
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_validate_and_set_via_introspection_http_error(self, mock_post):
         """Test introspection HTTP error handling."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -651,7 +651,7 @@ class TestManagementTokenManager:
         with pytest.raises(Exception, match=f"Introspection request failed for domain {manager.domain}"):
             manager.validate_and_set_via_introspection(bearer_token)
 
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_validate_and_set_via_introspection_connection_error(self, mock_post):
         """Test introspection connection error handling."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -676,7 +676,7 @@ class TestManagementTokenManager:
         with pytest.raises(Exception, match=f"Introspection request failed for domain {manager.domain}"):
             manager.validate_and_set_via_introspection(bearer_token)
 
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_validate_and_set_via_introspection_management_token_failure(self, mock_post):
         """Test introspection when management token request fails."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -688,7 +688,7 @@ class TestManagementTokenManager:
         with pytest.raises(Exception, match="Token request failed for domain test.kinde.com"):
             manager.validate_and_set_via_introspection(bearer_token)
 
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_validate_and_set_via_introspection_with_roles_and_scopes(self, mock_post):
         """Test introspection with complex token containing roles and scopes."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
@@ -736,7 +736,7 @@ class TestManagementTokenManager:
         # Check expires_at instead of expires_in (set_tokens stores absolute timestamp)
         assert manager.tokens["expires_at"] == 1000 + 7200  # current_time + expires_in
 
-    @patch('kinde_sdk.management.management_token_manager.requests.post')
+    @patch('kinde_sdk.core.http_client.http_client.post')
     def test_validate_and_set_via_introspection_thread_safety(self, mock_post):
         """Test that introspection is thread-safe."""
         manager = ManagementTokenManager("test.kinde.com", "client_id", "client_secret")
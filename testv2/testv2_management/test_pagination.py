@@ -0,0 +1,171 @@
+"""
+Tests for Management API auto-pagination.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from kinde_sdk.management.management_client import ManagementClient
+from kinde_sdk.management.management_token_manager import ManagementTokenManager
+from kinde_sdk.management.models.users_response import UsersResponse
+from kinde_sdk.management.pagination import apaginate, paginate
+
+
+def _make_pages(count, per_page=3):
+    pages = {}
+    for index in range(count):
+        token = None if index == 0 else f"token_{index}"
+        next_token = f"token_{index + 1}" if index + 1 < count else None
+        users = [{"id": f"kp_{index}_{n}"} for n in range(per_page)]
+        pages[token] = UsersResponse.from_dict({"code": "OK", "users": users, "next_token": next_token})
+    return pages
+
+
+class _FakeEndpoint:
+    def __init__(self, pages, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, page_size=None, next_token=None, **kwargs):
+        with self.lock:
+            self.calls.append((next_token, page_size, kwargs))
+        time.sleep(self.delay)
+        return self.pages[next_token]
+
+
+class TestPaginate(unittest.TestCase):
+    def test_follows_next_token(self):
+        endpoint = _FakeEndpoint(_make_pages(3))
+        ids = [user.id for user in paginate(endpoint, "users", page_size=3, email="a@example.com")]
+
+        self.assertEqual(len(ids), 9)
+        self.assertEqual(ids[0], "kp_0_0")
+        self.assertEqual(ids[-1], "kp_2_2")
+        self.assertEqual([call[0] for call in endpoint.calls], [None, "token_1", "token_2"])
+        self.assertTrue(all(call[1] == 3 and call[2] == {"email": "a@example.com"} for call in endpoint.calls))
+
+    def test_is_lazy(self):
+        endpoint = _FakeEndpoint(_make_pages(3))
+        iterator = paginate(endpoint, "users")
+        self.assertEqual(endpoint.calls, [])
+        next(iterator)
+        self.assertEqual(len(endpoint.calls), 1)
+
+    def test_infers_items_field(self):
+        endpoint = _FakeEndpoint(_make_pages(2))
+        self.assertEqual(len(list(paginate(endpoint))), 6)
+
+    def test_stops_when_token_does_not_advance(self):
+        page = UsersResponse.from_dict({"users": [{"id": "kp_1"}], "next_token": "same"})
+        endpoint = _FakeEndpoint({None: page, "same": page})
+        self.assertEqual(len(list(paginate(endpoint, "users"))), 2)
+
+    def test_stops_on_empty_page(self):
+        page = UsersResponse.from_dict({"users": [], "next_token": "more"})
+        endpoint = _FakeEndpoint({None: page})
+        self.assertEqual(list(paginate(endpoint, "users")), [])
+        self.assertEqual(len(endpoint.calls), 1)
+
+    def test_prefetch_fetches_next_page_while_consuming(self):
+        endpoint = _FakeEndpoint(_make_pages(2))
+        iterator = paginate(endpoint, "users", prefetch=True)
+        next(iterator)
+        deadline = time.time() + 2
+        while len(endpoint.calls) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        # The second page was requested before the first was fully consumed
+        self.assertEqual(len(endpoint.calls), 2)
+        self.assertEqual(len(list(iterator)), 5)
+
+    def test_prefetch_overlaps_requests_with_processing(self):
+        endpoint = _FakeEndpoint(_make_pages(4, per_page=1), delay=0.1)
+        start = time.time()
+        for _ in paginate(endpoint, "users", prefetch=True):
+            time.sleep(0.1)
+        # ~0.1 for the first page then 0.1 per item; without prefetch it would be ~0.8
+        self.assertLess(time.time() - start, 0.7)
+
+    def test_early_close_with_prefetch(self):
+        endpoint = _FakeEndpoint(_make_pages(3))
+        iterator = paginate(endpoint, "users", prefetch=True)
+        next(iterator)
+        iterator.close()
+        self.assertLessEqual(len(endpoint.calls), 2)
+
+
+class TestAsyncPaginate(unittest.TestCase):
+    @staticmethod
+    def _async_endpoint(pages, calls, delay=0.0):
+        async def endpoint(page_size=None, next_token=None, **kwargs):
+            calls.append(next_token)
+            await asyncio.sleep(delay)
+            return pages[next_token]
+        return endpoint
+
+    def test_follows_next_token(self):
+        calls = []
+        endpoint = self._async_endpoint(_make_pages(3), calls)
+
+        async def collect():
+            return [user.id async for user in apaginate(endpoint, "users")]
+
+        ids = asyncio.run(collect())
+        self.assertEqual(len(ids), 9)
+        self.assertEqual(calls, [None, "token_1", "token_2"])
+
+    def test_prefetch(self):
+        calls = []
+        endpoint = self._async_endpoint(_make_pages(4, per_page=1), calls, delay=0.05)
+
+        async def consume():
+            start = time.monotonic()
+            async for _ in apaginate(endpoint, "users", prefetch=True):
+                await asyncio.sleep(0.05)
+            return time.monotonic() - start
+
+        self.assertLess(asyncio.run(consume()), 0.35)
+        self.assertEqual(len(calls), 4)
+
+    def test_early_exit_cancels_prefetch(self):
+        calls = []
+        endpoint = self._async_endpoint(_make_pages(3), calls, delay=0.05)
+
+        async def first_item():
+            iterator = apaginate(endpoint, "users", prefetch=True)
+            item = await iterator.__anext__()
+            await iterator.aclose()
+            return item
+
+        self.assertEqual(asyncio.run(first_item()).id, "kp_0_0")
+
+
+class TestManagementClientIterators(unittest.TestCase):
+    def setUp(self):
+        ManagementTokenManager.reset_instances()
+        self.client = ManagementClient("test.kinde.com", "client_id", "client_secret")
+
+    def tearDown(self):
+        ManagementTokenManager.reset_instances()
+
+    def test_iter_users(self):
+        endpoint = _FakeEndpoint(_make_pages(2))
+        with patch.object(self.client.users_api, "get_users", endpoint):
+            users = list(self.client.iter_users(page_size=3, has_organization=True))
+
+        self.assertEqual(len(users), 6)
+        self.assertEqual(endpoint.calls[0][2], {"has_organization": True})
+
+    def test_iter_organization_users_passes_org_code(self):
+        endpoint = _FakeEndpoint({None: UsersResponse.from_dict({"users": []})})
+        with patch.object(self.client.organizations_api, "get_organization_users", endpoint):
+            list(self.client.iter_organization_users("org_123"))
+        self.assertEqual(endpoint.calls[0][2], {"org_code": "org_123"})
+
+
+if __name__ == "__main__":
+    unittest.main()